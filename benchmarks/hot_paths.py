@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Callable
+
+from zugzwang.analysis.statistics import bootstrap_acpl, bootstrap_distribution, bootstrap_win_rate
+from zugzwang.core.board import BoardManager
+from zugzwang.core.models import GameRecord, GameState, MoveDecision, MoveRecord
+from zugzwang.evaluation.metrics import summarize_experiment
+from zugzwang.experiments.io import load_game_records
+from zugzwang.experiments.tracker import ensure_run_dirs, write_game_record
+from zugzwang.infra.config import DEFAULTS_PATH, load_yaml
+from zugzwang.knowledge.indexer import load_chunks
+from zugzwang.knowledge.retriever import clear_caches, warm_cache
+from zugzwang.knowledge.vectordb import InMemoryVectorDB
+from zugzwang.strategy.context import build_direct_prompt_with_metadata
+from zugzwang.strategy.validator import validate_move_response
+
+
+BASELINE_SCHEMA_VERSION = 1
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "hot_paths.json"
+DEFAULT_REPEATS = 5
+DEFAULT_THRESHOLD = 0.25
+
+GAME_PLIES = 200
+SUMMARY_GAMES = 1_000
+LOADED_GAMES = 200
+BOOTSTRAP_SAMPLES = 100
+BOOTSTRAP_ITERATIONS = 2_000
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    name: str
+    description: str
+    # Called untimed before every repeat; returns the timed callable.
+    prepare: Callable[[], Callable[[], Any]]
+
+
+def fixed_game(plies: int = GAME_PLIES) -> list[str]:
+    """First seeded random game that lasts ``plies`` plies without ending."""
+    seed = 0
+    while True:
+        rng = random.Random(seed)
+        board = BoardManager()
+        moves: list[str] = []
+        while len(moves) < plies and not board.is_terminal():
+            move = rng.choice(sorted(board.legal_moves_uci()))
+            board.apply_move(move)
+            moves.append(move)
+        if len(moves) == plies:
+            return moves
+        seed += 1
+
+
+def game_states(moves: list[str]) -> list[GameState]:
+    board = BoardManager()
+    states: list[GameState] = []
+    for index, move in enumerate(moves):
+        states.append(board.game_state(moves[:index]))
+        board.apply_move(move)
+    return states
+
+
+def build_cases(workdir: Path) -> list[BenchCase]:
+    moves = fixed_game()
+    states = game_states(moves)
+
+    def board_game_state() -> Callable[[], Any]:
+        def run() -> None:
+            board = BoardManager()
+            for index, move in enumerate(moves):
+                board.game_state(moves[:index])
+                board.apply_move(move)
+
+        return run
+
+    strategy = copy.deepcopy(load_yaml(DEFAULTS_PATH)["strategy"])
+    strategy["few_shot"]["enabled"] = True
+    strategy["rag"]["enabled"] = True
+
+    def prompt_build() -> Callable[[], Any]:
+        # Fresh query cache per repeat so retrieval is measured, not cache hits.
+        clear_caches()
+        warm_cache(strategy["rag"])
+        return lambda: [build_direct_prompt_with_metadata(state, strategy) for state in states]
+
+    vectordb = InMemoryVectorDB()
+    vectordb.add_chunks(load_chunks(["eco", "lichess", "endgames"]))
+    queries = [
+        f"phase:{state.phase} fen:{state.fen} active_color:{state.active_color} "
+        f"move_number:{state.move_number} history:{' '.join(moves[max(0, state.ply_number - 8):state.ply_number])}"
+        for state in states
+    ]
+
+    def vectordb_search() -> Callable[[], Any]:
+        return lambda: [
+            vectordb.search(query, top_k=9, min_similarity=0.08, phase_hint=state.phase)
+            for query, state in zip(queries, states)
+        ]
+
+    reasoning = " ".join(
+        f"Considering {candidate}: the position after it looks roughly balanced, with play on both wings."
+        for candidate in ("the knight jump", "a pawn break", "a rook lift", "the quiet king move") * 25
+    )
+    responses = [
+        (f"{reasoning}\nAfter weighing all of that, my move is {move}.", state.legal_moves_uci, state.fen)
+        for state, move in zip(states, moves)
+    ]
+
+    def validate_long() -> Callable[[], Any]:
+        return lambda: [validate_move_response(text, legal, fen=fen) for text, legal, fen in responses]
+
+    records = [_game_record(game_number, moves[:80], states) for game_number in range(1, SUMMARY_GAMES + 1)]
+
+    def summarize() -> Callable[[], Any]:
+        return lambda: summarize_experiment(
+            experiment_id="bench",
+            config_hash="bench",
+            target_games=SUMMARY_GAMES,
+            scheduled_games=SUMMARY_GAMES,
+            game_records=records,
+        )
+
+    games_root = ensure_run_dirs(workdir, "run")
+    for record in records[:LOADED_GAMES]:
+        write_game_record(games_root, record)
+
+    def load_games() -> Callable[[], Any]:
+        return lambda: load_game_records(games_root / "games")
+
+    rng = random.Random(1)
+    outcomes = [rng.choice([0.0, 0.5, 1.0]) for _ in range(BOOTSTRAP_SAMPLES)]
+    acpl_values = [rng.uniform(20.0, 120.0) for _ in range(BOOTSTRAP_SAMPLES)]
+    # The pure-Python engine keeps timings comparable whether or not NumPy is installed.
+    bootstrap_kwargs: dict[str, Any] = {"iterations": BOOTSTRAP_ITERATIONS, "seed": 42, "engine": "python"}
+
+    def bootstrap() -> Callable[[], Any]:
+        def run() -> None:
+            bootstrap_win_rate(outcomes, **bootstrap_kwargs)
+            bootstrap_acpl(acpl_values, **bootstrap_kwargs)
+            bootstrap_distribution(acpl_values, metric_name="acpl", **bootstrap_kwargs)
+
+        return run
+
+    return [
+        BenchCase("board_game_state", f"BoardManager.game_state + apply_move, {GAME_PLIES} plies", board_game_state),
+        BenchCase("prompt_build_rag_few_shot", f"build_direct_prompt_with_metadata x{GAME_PLIES}", prompt_build),
+        BenchCase("vectordb_search", f"InMemoryVectorDB.search x{GAME_PLIES}, all sources", vectordb_search),
+        BenchCase("validate_long_reasoning", f"validate_move_response x{GAME_PLIES}, ~1,500 words", validate_long),
+        BenchCase("summarize_experiment", f"summarize_experiment on {SUMMARY_GAMES} games", summarize),
+        BenchCase("load_game_records", f"load_game_records on {LOADED_GAMES} game files", load_games),
+        BenchCase("bootstrap", f"bootstrap win rate, ACPL and distribution, n={BOOTSTRAP_SAMPLES}", bootstrap),
+    ]
+
+
+def run_suite(repeats: int = DEFAULT_REPEATS, only: list[str] | None = None) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="zugzwang-bench-") as tmp:
+        cases = build_cases(Path(tmp))
+        unknown = sorted(set(only or []) - {case.name for case in cases})
+        if unknown:
+            raise ValueError(f"Unknown benchmark cases: {', '.join(unknown)}")
+        results: dict[str, Any] = {}
+        for case in cases:
+            if only and case.name not in only:
+                continue
+            timings = []
+            for _ in range(max(1, repeats)):
+                func = case.prepare()
+                started = time.perf_counter()
+                func()
+                timings.append(time.perf_counter() - started)
+            results[case.name] = {
+                "description": case.description,
+                "min_seconds": round(min(timings), 6),
+                "median_seconds": round(statistics.median(timings), 6),
+            }
+    return {
+        "schema_version": BASELINE_SCHEMA_VERSION,
+        "created_at_utc": datetime.now(tz=UTC).isoformat().replace("+00:00", "Z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeats": repeats,
+        "cases": results,
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> list[dict[str, Any]]:
+    """Per-case ratio of current to baseline ``min_seconds``; ``regressed`` past ``1 + threshold``."""
+    rows: list[dict[str, Any]] = []
+    for name, entry in current.get("cases", {}).items():
+        reference = baseline.get("cases", {}).get(name)
+        ratio = entry["min_seconds"] / max(reference["min_seconds"], 1e-9) if reference is not None else None
+        rows.append(
+            {
+                "case": name,
+                "baseline_seconds": reference["min_seconds"] if reference is not None else None,
+                "current_seconds": entry["min_seconds"],
+                "ratio": round(ratio, 3) if ratio is not None else None,
+                "regressed": ratio is not None and ratio > 1.0 + threshold,
+            }
+        )
+    return rows
+
+
+def _game_record(game_number: int, moves: list[str], states: list[GameState]) -> GameRecord:
+    move_records = [
+        MoveRecord(
+            ply_number=ply,
+            color=state.active_color,
+            fen_before=state.fen,
+            move_decision=MoveDecision(
+                move_uci=move,
+                move_san=move,
+                raw_response=move,
+                parse_ok=True,
+                is_legal=True,
+                retry_count=int(ply % 3 == 0),
+                tokens_input=420,
+                tokens_output=12,
+                latency_ms=300 + ply,
+                provider_model="mock-1",
+                provider_calls=1,
+                cost_usd=0.0004,
+            ),
+        )
+        for ply, (state, move) in enumerate(zip(states, moves), start=1)
+    ]
+    return GameRecord(
+        experiment_id="bench",
+        game_number=game_number,
+        config_hash="bench",
+        seed=game_number,
+        players={"white": {"type": "random"}, "black": {"type": "llm", "provider": "mock", "model": "mock-1"}},
+        moves=move_records,
+        result=("1-0", "0-1", "1/2-1/2")[game_number % 3],
+        termination="max_plies" if game_number % 7 else "checkmate",
+        token_usage={"input": 420 * len(moves), "output": 12 * len(moves)},
+        cost_usd=0.0004 * len(moves),
+        duration_seconds=30.0,
+        timestamp_utc="2026-01-01T00:00:00Z",
+    )
+
+
+def _load(path: str | Path) -> dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def _write(path: str | Path, payload: dict[str, Any]) -> None:
+    output = Path(path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Hot-path microbenchmarks with JSON baselines.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="time the suite and print or save the results")
+    run_parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    run_parser.add_argument("--case", action="append", dest="cases")
+    run_parser.add_argument("--output", help="write results here, e.g. to refresh the baseline")
+
+    compare_parser = subparsers.add_parser("compare", help="flag cases slower than the baseline")
+    compare_parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    compare_parser.add_argument("--current", help="saved results; the suite is run when omitted")
+    compare_parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    compare_parser.add_argument("--case", action="append", dest="cases")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run_suite(repeats=args.repeats, only=args.cases)
+        if args.output:
+            _write(args.output, results)
+        print(json.dumps(results, indent=2))
+        return 0
+
+    baseline = _load(args.baseline)
+    current = _load(args.current) if args.current else run_suite(repeats=args.repeats, only=args.cases)
+    rows = compare(baseline, current, threshold=args.threshold)
+    regressions = [row["case"] for row in rows if row["regressed"]]
+    print(json.dumps({"threshold": args.threshold, "cases": rows, "regressions": regressions}, indent=2))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
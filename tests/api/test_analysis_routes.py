@@ -65,6 +65,63 @@ def test_analysis_compare_route_and_markdown_download(tmp_path: Path) -> None:
     assert "Run Comparison Report" in markdown_response.text
 
 
+def test_analysis_leaderboard_route_saves_and_reloads_artifact(tmp_path: Path) -> None:
+    runs_root = tmp_path / "runs"
+    run_ids = [
+        "lb_a-20260223T110000Z-aaaaaaaa",
+        "lb_b-20260223T110000Z-bbbbbbbb",
+        "lb_c-20260223T110000Z-cccccccc",
+    ]
+    for run_id, results in zip(run_ids, (["0-1"] * 20, ["1-0"] * 20, ["0-1", "1-0"] * 10)):
+        _write_run(runs_root=runs_root, run_id=run_id, game_results=results, acpl_values=[40.0] * 20)
+
+    app = create_app()
+    app.dependency_overrides[deps.get_artifact_service] = lambda: ArtifactService(root=runs_root)
+    client = TestClient(app)
+
+    response = client.post(
+        "/api/analysis/leaderboard",
+        json={
+            "runs": run_ids,
+            "comparison_id": "lb-1",
+            "bootstrap_iterations": 500,
+            "permutation_iterations": 500,
+            "correction": "bh",
+        },
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert [entry["run"]["run_id"] for entry in payload["entries"]] == [run_ids[0], run_ids[2], run_ids[1]]
+    assert len(payload["pairwise"]["win_rate"]) == 3
+    assert payload["settings"]["correction"] == "bh"
+
+    reloaded = client.get("/api/analysis/leaderboard/lb-1")
+    assert reloaded.status_code == 200
+    assert reloaded.json()["entries"] == payload["entries"]
+    assert client.get("/api/analysis/compare/lb-1").status_code == 404
+    assert client.post("/api/analysis/leaderboard", json={"runs": [run_ids[0]]}).status_code == 422
+
+
+def test_analysis_move_summary_route_groups_dataset_rows(tmp_path: Path) -> None:
+    runs_root = tmp_path / "runs"
+    run_id = "moves-20260223T110000Z-aaaaaaaa"
+    _write_run(runs_root=runs_root, run_id=run_id, game_results=["0-1"] * 3, acpl_values=[30.0, 40.0, 50.0])
+
+    app = create_app()
+    app.dependency_overrides[deps.get_artifact_service] = lambda: ArtifactService(root=runs_root)
+    client = TestClient(app)
+
+    response = client.post("/api/analysis/moves/summary", json={"by": ["color"], "filters": {"run_id": [run_id]}})
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["runs_updated"] == 1
+    assert payload["total_moves"] == sum(row["moves"] for row in payload["rows"]) > 0
+    assert {row["color"] for row in payload["rows"]} <= {"white", "black"}
+
+    bad = client.post("/api/analysis/moves/summary", json={"by": ["raw_response"]})
+    assert bad.status_code == 400
+
+
 def _write_run(
     *,
     runs_root: Path,
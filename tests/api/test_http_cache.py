@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from zugzwang.api import deps
+from zugzwang.api.main import create_app
+from zugzwang.api.services.artifact_service import ArtifactService
+
+
+def _write_run(root: Path, run_id: str = "run-1") -> Path:
+    run_dir = root / run_id
+    run_dir.mkdir(parents=True)
+    report = {"num_games_target": 5, "notes": ["move analysis"] * 200}
+    (run_dir / "experiment_report.json").write_text(json.dumps(report), encoding="utf-8")
+    (run_dir / "resolved_config.yaml").write_text("experiment:\n  name: best_known_start\n", encoding="utf-8")
+    return run_dir
+
+
+def _build_client(service: ArtifactService) -> TestClient:
+    app = create_app()
+    app.dependency_overrides[deps.get_artifact_service] = lambda: service
+    return TestClient(app)
+
+
+def test_report_route_serves_etag_and_honours_if_none_match(tmp_path: Path) -> None:
+    _write_run(tmp_path)
+    client = _build_client(ArtifactService(root=tmp_path))
+
+    response = client.get("/api/runs/run-1/report", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert response.json()["num_games_target"] == 5
+    assert "content-encoding" not in response.headers
+    etag = response.headers["etag"]
+
+    cached = client.get("/api/runs/run-1/report", headers={"Accept-Encoding": "identity", "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+
+def test_report_route_compresses_large_artifacts_with_distinct_etag(tmp_path: Path) -> None:
+    _write_run(tmp_path)
+    client = _build_client(ArtifactService(root=tmp_path))
+
+    plain = client.get("/api/runs/run-1/report", headers={"Accept-Encoding": "identity"})
+    compressed = client.get("/api/runs/run-1/report", headers={"Accept-Encoding": "gzip"})
+
+    assert compressed.status_code == 200
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.json() == plain.json()
+    assert compressed.headers["etag"] != plain.headers["etag"]
+    assert "Accept-Encoding" in compressed.headers["vary"]
+
+
+def test_config_route_etag_changes_when_file_is_rewritten(tmp_path: Path) -> None:
+    run_dir = _write_run(tmp_path)
+    client = _build_client(ArtifactService(root=tmp_path))
+
+    first = client.get("/api/runs/run-1/config")
+    assert first.json() == {"experiment": {"name": "best_known_start"}}
+    etag = first.headers["etag"]
+    assert client.get("/api/runs/run-1/config", headers={"If-None-Match": etag}).status_code == 304
+
+    config_path = run_dir / "resolved_config.yaml"
+    config_path.write_text("experiment:\n  name: rag_variant\n", encoding="utf-8")
+    stat_result = config_path.stat()
+    os.utime(config_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+
+    second = client.get("/api/runs/run-1/config", headers={"If-None-Match": etag})
+    assert second.status_code == 200
+    assert second.json() == {"experiment": {"name": "rag_variant"}}
+
+
+def test_missing_artifact_and_missing_run_return_404(tmp_path: Path) -> None:
+    _write_run(tmp_path)
+    client = _build_client(ArtifactService(root=tmp_path))
+
+    missing_artifact = client.get("/api/runs/run-1/report/evaluated")
+    assert missing_artifact.status_code == 404
+    assert missing_artifact.json()["detail"] == "Evaluated report not found for run: run-1"
+    assert client.get("/api/runs/run-404/report").status_code == 404
+
+
+def test_parsed_artifact_cache_reuses_until_mtime_changes(tmp_path: Path) -> None:
+    run_dir = _write_run(tmp_path)
+    service = ArtifactService(root=tmp_path)
+    report_path = run_dir / "experiment_report.json"
+
+    first = service.load_parsed_artifact(report_path)
+    assert service.load_parsed_artifact(report_path) is first
+
+    report_path.write_text(json.dumps({"num_games_target": 9}), encoding="utf-8")
+    stat_result = report_path.stat()
+    os.utime(report_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+
+    assert service.load_parsed_artifact(report_path) == {"num_games_target": 9}
+    assert service.load_run_summary("run-1").report == {"num_games_target": 9}
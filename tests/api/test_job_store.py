@@ -5,7 +5,7 @@ from pathlib import Path
 
 from zugzwang.infra.ids import timestamp_utc
 from zugzwang.api.services.job_runtime import refresh_job
-from zugzwang.api.state.job_store import create_job, get_job, update_job
+from zugzwang.api.state.job_store import compact_jobs, create_job, get_job, jobs_db_path, list_jobs, update_job
 from zugzwang.api.types import JobHandle
 
 
@@ -66,3 +66,62 @@ def test_refresh_job_reads_exit_payload_and_marks_completed(tmp_path: Path) -> N
     assert refreshed["run_id"] == "sample-run-id"
     assert refreshed["run_dir"] == "results/runs/sample-run-id"
 
+
+
+def _handle(job_id: str, created_at_utc: str, status: str = "running") -> JobHandle:
+    return JobHandle(
+        job_id=job_id,
+        job_type="run",
+        status=status,  # type: ignore[arg-type]
+        pid=None,
+        command=["python", "-m", "zugzwang.cli", "run"],
+        created_at_utc=created_at_utc,
+        stdout_path="stdout.log",
+        stderr_path="stderr.log",
+        run_id=None,
+        run_dir=None,
+        meta={},
+    )
+
+
+def test_job_store_imports_legacy_jsonl_log(tmp_path: Path) -> None:
+    jobs_path = tmp_path / "jobs.jsonl"
+    created = _handle("old", "2026-01-01T00:00:00Z").to_dict()
+    events = [
+        {"ts_utc": "2026-01-01T00:00:00Z", "event_type": "job_created", "payload": created},
+        {
+            "ts_utc": "2026-01-01T00:01:00Z",
+            "event_type": "job_updated",
+            "payload": {"job_id": "old", "status": "completed", "patch": {"exit_code": 0}},
+        },
+        {
+            "ts_utc": "2026-01-01T00:02:00Z",
+            "event_type": "job_updated",
+            "payload": {"job_id": "missing", "status": "failed", "patch": {}},
+        },
+    ]
+    jobs_path.write_text("\n".join(json.dumps(event) for event in events) + "\nnot json\n", encoding="utf-8")
+
+    loaded = get_job("old", jobs_path=jobs_path)
+    assert loaded is not None
+    assert loaded["status"] == "completed"
+    assert loaded["exit_code"] == 0
+    assert loaded["updated_at_utc"] == "2026-01-01T00:01:00Z"
+    assert get_job("missing", jobs_path=jobs_path) is None
+    assert jobs_db_path(jobs_path).exists()
+
+
+def test_job_store_filters_and_compacts(tmp_path: Path) -> None:
+    jobs_path = tmp_path / "jobs.jsonl"
+    create_job(_handle("a", "2026-01-01T00:00:00Z"), jobs_path=jobs_path)
+    create_job(_handle("b", "2026-01-02T00:00:00Z"), jobs_path=jobs_path)
+    create_job(_handle("c", "2026-01-03T00:00:00Z"), jobs_path=jobs_path)
+    update_job("a", "completed", jobs_path=jobs_path)
+
+    assert [job["job_id"] for job in list_jobs(jobs_path)] == ["c", "b", "a"]
+    assert [job["job_id"] for job in list_jobs(jobs_path, status="running")] == ["c", "b"]
+    assert [job["job_id"] for job in list_jobs(jobs_path, created_after_utc="2026-01-02T00:00:00Z", limit=1)] == ["c"]
+
+    assert compact_jobs(jobs_path, finished_before_utc="2000-01-01T00:00:00Z") == 0
+    assert compact_jobs(jobs_path, finished_before_utc="2999-01-01T00:00:00Z") == 1
+    assert [job["job_id"] for job in list_jobs(jobs_path)] == ["c", "b"]
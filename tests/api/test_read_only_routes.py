@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import json
+import tempfile
+from pathlib import Path
+
+import yaml
 from fastapi.testclient import TestClient
 
 from zugzwang.api import deps
@@ -8,6 +13,7 @@ from zugzwang.api.types import (
     BoardStateFrame,
     ConfigTemplate,
     DashboardKpis,
+    DashboardTimelineBucket,
     DashboardTimelinePoint,
     GameMeta,
     GameRecordView,
@@ -211,6 +217,37 @@ class FakeArtifactService:
             game_count=2,
         )
 
+    def artifact_path(self, run_dir: str, artifact_name: str) -> Path | None:
+        if run_dir != "run-1":
+            raise FileNotFoundError(f"Run directory not found: {run_dir}")
+        contents = {
+            "experiment_report.json": json.dumps({"num_games_target": 5}),
+            "resolved_config.yaml": yaml.safe_dump({"experiment": {"name": "best_known_start"}}),
+        }
+        if artifact_name not in contents:
+            return None
+        path = Path(tempfile.mkdtemp()) / artifact_name
+        path.write_text(contents[artifact_name], encoding="utf-8")
+        return path
+
+    def load_parsed_artifact(self, path: Path):
+        text = Path(path).read_text(encoding="utf-8")
+        return yaml.safe_load(text) if Path(path).suffix == ".yaml" else json.loads(text)
+
+    def build_dashboard_timeline(self, max_points: int = 120) -> list[DashboardTimelineBucket]:
+        _ = max_points
+        return [
+            DashboardTimelineBucket(
+                start_date="2026-02-20",
+                end_date="2026-02-22",
+                runs=2,
+                evaluated_runs=1,
+                total_cost_usd=0.5,
+                avg_elo=620.0,
+                avg_acpl=None,
+            )
+        ]
+
     def build_dashboard_kpis(self, timeline_limit: int = 40) -> DashboardKpis:
         runs = self.list_runs({"sort_by": "created_at_utc", "sort_dir": "desc"})
         evaluated = [item for item in runs if item.evaluated_report_exists]
@@ -264,13 +301,17 @@ class FakeArtifactService:
 
 
 class FakeReplayService:
-    def build_board_states(self, game_record):
+    def count_frames(self, game_record):
         _ = game_record
-        return [
+        return 2
+
+    def build_board_states(self, game_record, *, offset=0, limit=None, render_svg=True, size=420):
+        _ = (game_record, size)
+        frames = [
             BoardStateFrame(
                 ply_number=0,
                 fen="start",
-                svg="<svg />",
+                svg="<svg />" if render_svg else None,
                 move_uci=None,
                 move_san=None,
                 color=None,
@@ -279,13 +320,18 @@ class FakeReplayService:
             BoardStateFrame(
                 ply_number=1,
                 fen="after",
-                svg="<svg />",
+                svg="<svg />" if render_svg else None,
                 move_uci="e2e4",
                 move_san="e4",
                 color="white",
                 raw_response="e2e4",
             ),
         ]
+        return frames[offset : None if limit is None else offset + limit]
+
+    def build_frame(self, game_record, index, *, render_svg=True, size=420):
+        frames = self.build_board_states(game_record, render_svg=render_svg, size=size)
+        return frames[index] if 0 <= index < len(frames) else None
 
 
 def _build_client() -> TestClient:
@@ -375,6 +421,16 @@ def test_runs_routes_return_summary_games_and_frames() -> None:
     frames_response = client.get("/api/runs/run-1/games/1/frames")
     assert frames_response.status_code == 200
     assert len(frames_response.json()) == 2
+    assert frames_response.headers["X-Total-Count"] == "2"
+
+    page_response = client.get("/api/runs/run-1/games/1/frames", params={"offset": 1, "limit": 1, "format": "fen"})
+    assert page_response.status_code == 200
+    assert [(item["fen"], item["svg"]) for item in page_response.json()] == [("after", None)]
+
+    frame_response = client.get("/api/runs/run-1/games/1/frames/1")
+    assert frame_response.status_code == 200
+    assert frame_response.json()["move_san"] == "e4"
+    assert client.get("/api/runs/run-1/games/1/frames/5").status_code == 404
 
     inferred = summary_response.json()
     assert inferred["inferred_model_label"] == "zai / glm-5"
@@ -426,9 +482,28 @@ def test_dashboard_kpis_route_returns_aggregates() -> None:
     assert payload["timeline"][0]["run_id"] == "run-1"
 
 
+def test_dashboard_timeline_route_returns_buckets() -> None:
+    client = _build_client()
+    response = client.get("/api/dashboard/timeline", params={"max_points": 10})
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload[0]["runs"] == 2
+    assert payload[0]["avg_elo"] == 620.0
+    assert client.get("/api/dashboard/timeline", params={"max_points": 0}).status_code == 422
+
+
 def test_env_check_route_exposes_provider_statuses() -> None:
     client = _build_client()
     response = client.get("/api/env-check")
     assert response.status_code == 200
     providers = {item["provider"] for item in response.json()}
     assert {"zai", "openai", "anthropic", "google", "mock", "stockfish"}.issubset(providers)
+
+
+def test_healthz_memory_reports_process_rss() -> None:
+    client = _build_client()
+    response = client.get("/healthz/memory")
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["rss_mb"] > 0
+    assert payload["peak_rss_mb"] >= payload["rss_mb"]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from zugzwang.api.services.replay_service import ReplayService
+from zugzwang.api.services.replay_service import ReplayService, render_board_svg
 from zugzwang.api.types import GameRecordView
 
 
@@ -74,3 +74,28 @@ def test_frame_metrics_returns_move_level_metrics() -> None:
     assert metrics.retry_count == 1
     assert metrics.provider_model == "glm-5"
 
+
+
+def test_build_board_states_pages_and_fen_only_mode() -> None:
+    replay = ReplayService()
+    all_frames = replay.build_board_states(_sample_game())
+    page = replay.build_board_states(_sample_game(), offset=1, limit=1, render_svg=False)
+
+    assert replay.count_frames(_sample_game()) == 3
+    assert [frame.ply_number for frame in page] == [1]
+    assert page[0].svg is None
+    assert page[0].fen == all_frames[1].fen
+
+
+def test_build_frame_matches_full_replay_and_caches_svg() -> None:
+    replay = ReplayService()
+    all_frames = replay.build_board_states(_sample_game())
+    render_board_svg.cache_clear()
+
+    frame = replay.build_frame(_sample_game(), 2)
+    again = replay.build_frame(_sample_game(), 2)
+
+    assert frame == all_frames[2]
+    assert again == frame
+    assert render_board_svg.cache_info().hits == 1
+    assert replay.build_frame(_sample_game(), 3) is None
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import yaml
+
+from zugzwang.api.services.artifact_service import ArtifactService
+from zugzwang.experiments.tracker import mark_run_changed
+
+
+def _write_run(
+    root: Path,
+    run_id: str,
+    *,
+    model: str,
+    report: dict[str, object] | None = None,
+    evaluated: dict[str, object] | None = None,
+) -> Path:
+    run_dir = root / run_id
+    run_dir.mkdir(parents=True)
+    config = {
+        "experiment": {"name": run_id.split("-")[0]},
+        "players": {
+            "white": {"type": "engine", "level": 1},
+            "black": {"type": "llm", "provider": "zai", "model": model},
+        },
+    }
+    (run_dir / "resolved_config.yaml").write_text(yaml.safe_dump(config), encoding="utf-8")
+    if report is not None:
+        (run_dir / "experiment_report.json").write_text(json.dumps(report), encoding="utf-8")
+    if evaluated is not None:
+        (run_dir / "experiment_report_evaluated.json").write_text(json.dumps(evaluated), encoding="utf-8")
+    return run_dir
+
+
+def test_list_runs_queries_catalog_with_filters_sort_and_paging(tmp_path: Path) -> None:
+    root = tmp_path / "runs"
+    _write_run(root, "a-20260101T000000Z-aaaaaaaa", model="glm-5", report={"total_cost_usd": 1.0})
+    _write_run(
+        root,
+        "b-20260102T000000Z-bbbbbbbb",
+        model="glm-4.5",
+        report={"total_cost_usd": 3.0},
+        evaluated={"elo_estimate": 900, "total_cost_usd": 3.0},
+    )
+    _write_run(root, "c-20260103T000000Z-cccccccc", model="glm-5")
+    service = ArtifactService(root=root)
+
+    assert [meta.run_id[0] for meta in service.list_runs()] == ["c", "b", "a"]
+    assert [meta.run_id[0] for meta in service.list_runs({"sort_dir": "asc", "offset": 1, "limit": 1})] == ["b"]
+    assert [meta.run_id[0] for meta in service.list_runs({"model": "GLM-5"})] == ["c", "a"]
+    assert [meta.run_id[0] for meta in service.list_runs({"query": "4.5"})] == ["b"]
+    assert [meta.run_id[0] for meta in service.list_runs({"status": "needs_eval"})] == ["a"]
+    assert [meta.run_id[0] for meta in service.list_runs({"status": "running"})] == ["c"]
+    assert [meta.run_id[0] for meta in service.list_runs({"evaluated_only": True})] == ["b"]
+    assert [meta.run_id[0] for meta in service.list_runs({"date_from": "2026-01-02", "date_to": "2026-01-02"})] == ["b"]
+    # Missing values sort last in both directions.
+    assert [meta.run_id[0] for meta in service.list_runs({"sort_by": "cost", "sort_dir": "desc"})] == ["b", "a", "c"]
+    assert [meta.run_id[0] for meta in service.list_runs({"sort_by": "cost", "sort_dir": "asc"})] == ["a", "b", "c"]
+
+    listed = service.list_runs({"query": "b-2026"})[0]
+    assert listed == service.load_run_summary(listed.run_id).run_meta
+
+
+def test_run_catalog_sync_only_rebuilds_changed_runs(tmp_path: Path) -> None:
+    root = tmp_path / "runs"
+    _write_run(root, "a-20260101T000000Z-aaaaaaaa", model="glm-5")
+    stale = _write_run(root, "b-20260102T000000Z-bbbbbbbb", model="glm-5")
+    service = ArtifactService(root=root)
+
+    assert service.catalog.sync() == {"total": 2, "updated": 2, "removed": 0, "full_scan": 1}
+    assert service.catalog.sync() == {"total": 2, "updated": 0, "removed": 0, "full_scan": 0}
+
+    report_path = root / "a-20260101T000000Z-aaaaaaaa" / "experiment_report.json"
+    report_path.write_text(json.dumps({"num_games_valid": 4}), encoding="utf-8")
+    shutil.rmtree(stale)
+    # Removing a run directory changes the root's mtime, which forces a full scan.
+    assert service.catalog.sync() == {"total": 1, "updated": 1, "removed": 1, "full_scan": 1}
+
+    runs = service.list_runs()
+    assert [meta.run_id for meta in runs] == ["a-20260101T000000Z-aaaaaaaa"]
+    assert runs[0].num_games_valid == 4
+    assert runs[0].inferred_eval_status == "needs_eval"
+
+
+def test_dashboard_aggregates_follow_catalog_changes(tmp_path: Path) -> None:
+    root = tmp_path / "runs"
+    _write_run(root, "a-20260101T000000Z-aaaaaaaa", model="glm-5", report={"total_cost_usd": 1.0})
+    _write_run(
+        root,
+        "b-20260110T000000Z-bbbbbbbb",
+        model="glm-5",
+        report={"total_cost_usd": 2.0},
+        evaluated={"elo_estimate": 800, "acpl_overall": 60, "total_cost_usd": 2.0},
+    )
+    service = ArtifactService(root=root)
+
+    kpis = service.build_dashboard_kpis(timeline_limit=1)
+    assert (kpis.total_runs, kpis.runs_with_reports, kpis.evaluated_runs) == (2, 2, 1)
+    assert (kpis.best_elo, kpis.avg_acpl, kpis.total_cost_usd) == (800, 60, 3.0)
+    assert kpis.last_run_id == "b-20260110T000000Z-bbbbbbbb"
+    assert [point.run_id for point in kpis.timeline] == ["b-20260110T000000Z-bbbbbbbb"]
+
+    # A report rewritten in place is picked up through the tracker's change marker,
+    # without waiting for the next full scan.
+    service.catalog.full_scan_seconds = 3600
+    run_a = root / "a-20260101T000000Z-aaaaaaaa"
+    (run_a / "experiment_report_evaluated.json").write_text(
+        json.dumps({"elo_estimate": 1200, "acpl_overall": 40, "total_cost_usd": 1.0}),
+        encoding="utf-8",
+    )
+    assert service.catalog.sync() == {"total": 2, "updated": 0, "removed": 0, "full_scan": 0}
+    mark_run_changed(run_a)
+    assert service.catalog.sync() == {"total": 2, "updated": 1, "removed": 0, "full_scan": 0}
+
+    kpis = service.build_dashboard_kpis()
+    assert (kpis.evaluated_runs, kpis.best_elo, kpis.avg_acpl) == (2, 1200, 50)
+
+    buckets = service.build_dashboard_timeline(max_points=2)
+    assert [(bucket.start_date, bucket.end_date, bucket.runs) for bucket in buckets] == [
+        ("2026-01-01", "2026-01-05", 1),
+        ("2026-01-06", "2026-01-10", 1),
+    ]
+    assert buckets[0].avg_elo == 1200
+    assert len(service.build_dashboard_timeline(max_points=100)) == 2
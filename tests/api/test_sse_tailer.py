@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+from zugzwang.api.services.file_watch import try_inotify
+from zugzwang.api.sse import JobLogHub, JobLogTailer, iter_job_log_events
+
+
+class FakeRequest:
+    async def is_disconnected(self) -> bool:
+        return False
+
+
+class CountingRunService:
+    def __init__(self, stdout_path: Path, stderr_path: Path) -> None:
+        self.status = "running"
+        self.calls = 0
+        self.job = {
+            "job_id": "job-1",
+            "status": "running",
+            "stdout_path": str(stdout_path),
+            "stderr_path": str(stderr_path),
+        }
+
+    def get_job(self, job_id: str, refresh: bool = True):  # type: ignore[no-untyped-def]
+        _ = (job_id, refresh)
+        self.calls += 1
+        return {**self.job, "status": self.status}
+
+
+async def _collect(hub: JobLogHub, run_service: CountingRunService, last_event_id: str | None = None) -> list[dict]:
+    events = []
+    async for event in iter_job_log_events(
+        job_id="job-1",
+        request=FakeRequest(),  # type: ignore[arg-type]
+        run_service=run_service,
+        job=run_service.job,
+        last_event_id=last_event_id,
+        hub=hub,
+    ):
+        events.append(event)
+    return events
+
+
+def test_subscribers_share_one_tailer_and_resume_from_last_event_id(tmp_path: Path) -> None:
+    stdout_path = tmp_path / "job.stdout.log"
+    stderr_path = tmp_path / "job.stderr.log"
+    stdout_path.write_text("out-1\n", encoding="utf-8")
+    stderr_path.write_text("err-1\n", encoding="utf-8")
+    run_service = CountingRunService(stdout_path, stderr_path)
+
+    async def scenario() -> tuple[list[dict], list[dict], list[dict], int]:
+        hub = JobLogHub(poll_interval_seconds=0.02, status_interval_seconds=0.1)
+        first = asyncio.create_task(_collect(hub, run_service))
+        second = asyncio.create_task(_collect(hub, run_service))
+        await asyncio.sleep(0.15)
+        assert hub.active_jobs() == ["job-1"]
+
+        with stdout_path.open("a", encoding="utf-8") as fp:
+            fp.write("out-2\nout-3 partial")
+        await asyncio.sleep(0.15)
+        run_service.status = "completed"
+        first_events, second_events = await asyncio.gather(first, second)
+        calls_while_shared = run_service.calls
+
+        resume_id = next(event["id"] for event in first_events if event["data"] == "out-2")
+        resumed = await _collect(hub, run_service, last_event_id=resume_id)
+        return first_events, second_events, resumed, calls_while_shared
+
+    first_events, second_events, resumed, calls_while_shared = asyncio.run(scenario())
+
+    assert first_events == second_events
+    assert [(event["event"], event["data"]) for event in first_events] == [
+        ("stdout", "out-1"),
+        ("stderr", "err-1"),
+        ("stdout", "out-2"),
+        ("stdout", "out-3 partial"),
+        ("done", {"status": "completed"}),
+    ]
+    # One status check per interval for both clients, not one per client per tick.
+    assert calls_while_shared <= 6
+    assert [(event["event"], event["data"]) for event in resumed] == [
+        ("stdout", "out-3 partial"),
+        ("done", {"status": "completed"}),
+    ]
+
+
+def test_tailer_ignores_other_jobs_logs_and_refreshes_off_the_event_loop(tmp_path: Path, monkeypatch) -> None:
+    if try_inotify(tmp_path) is None:
+        pytest.skip("inotify not available")
+    stdout_path = tmp_path / "job.stdout.log"
+    stderr_path = tmp_path / "job.stderr.log"
+    stdout_path.write_text("", encoding="utf-8")
+    stderr_path.write_text("", encoding="utf-8")
+    run_service = CountingRunService(stdout_path, stderr_path)
+    refresh_threads: list[int] = []
+    get_job = run_service.get_job
+
+    def _get_job(job_id: str, refresh: bool = True):  # type: ignore[no-untyped-def]
+        refresh_threads.append(threading.get_ident())
+        return get_job(job_id, refresh=refresh)
+
+    run_service.get_job = _get_job  # type: ignore[method-assign]
+    reads: list[bool] = []
+    publish = JobLogTailer._publish_new_lines
+
+    def _counting_publish(self, final: bool = False):  # type: ignore[no-untyped-def]
+        reads.append(final)
+        return publish(self, final=final)
+
+    monkeypatch.setattr(JobLogTailer, "_publish_new_lines", _counting_publish)
+
+    async def scenario() -> int:
+        hub = JobLogHub(status_interval_seconds=30.0)
+        collector = asyncio.create_task(_collect(hub, run_service))
+        await asyncio.sleep(0.1)
+        with (tmp_path / "other.stdout.log").open("a", encoding="utf-8") as fp:
+            for index in range(20):
+                fp.write(f"noise-{index}\n")
+                fp.flush()
+        await asyncio.sleep(0.2)
+        reads_after_noise = len(reads)
+        with stdout_path.open("a", encoding="utf-8") as fp:
+            fp.write("out-1\n")
+        await asyncio.sleep(0.2)
+        collector.cancel()
+        return reads_after_noise
+
+    loop_thread = threading.get_ident()
+    reads_after_noise = asyncio.run(scenario())
+
+    assert reads_after_noise == 1
+    assert len(reads) == 2
+    assert refresh_threads and loop_thread not in refresh_threads
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from zugzwang.api.services import job_runtime
+from zugzwang.api.services.worker_pool import WorkerPool, pool_size_from_env, set_active_pool
+
+
+PROBE_MODULE = """
+import json
+import os
+import sys
+import time
+
+
+def main(argv):
+    if argv and argv[0] == "sleep":
+        print("sleeping", flush=True)
+        time.sleep(60)
+    print("probe stderr", file=sys.stderr)
+    print(json.dumps({"run_id": "run-probe", "pid": os.getpid(), "cwd": os.getcwd(), "argv": argv}))
+    return 3 if argv and argv[0] == "fail" else 0
+"""
+
+
+@pytest.fixture
+def pool(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    module_dir = tmp_path / "modules"
+    module_dir.mkdir()
+    (module_dir / "pool_probe.py").write_text(PROBE_MODULE, encoding="utf-8")
+    monkeypatch.setenv("PYTHONPATH", str(module_dir))
+    monkeypatch.setattr(job_runtime, "ui_jobs_root", lambda: tmp_path / "ui_jobs")
+
+    worker_pool = WorkerPool(1, modules=("pool_probe",), warm_knowledge=False, workdir=tmp_path)
+    worker_pool.start()
+    yield worker_pool
+    worker_pool.stop()
+    set_active_pool(None)
+
+
+def _wait_for(predicate, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return
+        time.sleep(0.05)
+    raise AssertionError("condition not met in time")
+
+
+def test_pool_runs_job_in_prewarmed_worker_and_writes_logs_and_exit_file(pool: WorkerPool, tmp_path: Path) -> None:
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+    stdout_path = tmp_path / "logs" / "job.stdout.log"
+    stderr_path = tmp_path / "logs" / "job.stderr.log"
+    exit_path = tmp_path / "status" / "job.json"
+
+    pid = pool.submit(
+        command=[sys.executable, "-m", "pool_probe", "fail"],
+        stdout_path=stdout_path,
+        stderr_path=stderr_path,
+        exit_code_path=exit_path,
+        workdir=workdir,
+    )
+    assert pid is not None
+    _wait_for(exit_path.exists)
+
+    status = json.loads(exit_path.read_text(encoding="utf-8"))
+    assert status["exit_code"] == 3
+    assert status["payload"]["pid"] == pid
+    assert status["payload"]["cwd"] == str(workdir)
+    assert status["payload"]["argv"] == ["fail"]
+    assert "probe stderr" in stderr_path.read_text(encoding="utf-8")
+    # The used worker is replaced so the next job also starts warm.
+    assert pool.idle_count == 1
+
+
+def test_pool_declines_commands_it_has_not_preloaded(pool: WorkerPool, tmp_path: Path) -> None:
+    assert not pool.accepts([sys.executable, "-m", "zugzwang.cli", "run"])
+    assert not pool.accepts(["other-python", "-m", "pool_probe"])
+    pid = pool.submit(
+        command=[sys.executable, "-m", "zugzwang.cli", "run"],
+        stdout_path=tmp_path / "out.log",
+        stderr_path=tmp_path / "err.log",
+        exit_code_path=tmp_path / "exit.json",
+        workdir=tmp_path,
+    )
+    assert pid is None
+
+
+def test_start_job_uses_active_pool_and_cancel_terminates_worker(pool: WorkerPool, tmp_path: Path) -> None:
+    set_active_pool(pool)
+    jobs_path = tmp_path / "jobs.jsonl"
+
+    handle = job_runtime.start_job(
+        job_type="run",
+        command=[sys.executable, "-m", "pool_probe", "sleep"],
+        jobs_path=jobs_path,
+        working_dir=tmp_path,
+    )
+    assert handle.meta["launcher"] == "pool"
+    _wait_for(lambda: "sleeping" in Path(handle.stdout_path).read_text(encoding="utf-8"))
+
+    result = job_runtime.cancel_job(handle.job_id, jobs_path=jobs_path)
+    assert result.ok is True
+    _wait_for(lambda: not job_runtime.is_pid_running(int(handle.pid or 0)))
+    assert job_runtime.refresh_job(handle.job_id, jobs_path=jobs_path)["status"] == "canceled"
+
+
+def test_pool_size_from_env() -> None:
+    assert pool_size_from_env(None) == 2
+    assert pool_size_from_env("0") == 0
+    assert pool_size_from_env("4") == 4
+    assert pool_size_from_env("many") == 2
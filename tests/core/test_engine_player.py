@@ -7,17 +7,20 @@ import chess.engine
 
 from zugzwang.core.board import BoardManager
 from zugzwang.core.players import EnginePlayer
+from zugzwang.core.resources import EnginePool
 
 
 class _StubEngine:
     def __init__(self) -> None:
         self.configure_calls: list[dict[str, object]] = []
+        self.games: list[object] = []
 
     def configure(self, options):  # type: ignore[no-untyped-def]
         self.configure_calls.append(options)
         return None
 
-    def play(self, board: chess.Board, limit):  # type: ignore[no-untyped-def]
+    def play(self, board: chess.Board, limit, game=None):  # type: ignore[no-untyped-def]
+        self.games.append(game)
         move = next(iter(board.legal_moves))
         return type("Result", (), {"move": move})()
 
@@ -85,3 +88,30 @@ def test_engine_player_configures_native_uci_elo(monkeypatch) -> None:
 
     assert {"UCI_LimitStrength": True} in stub_engine.configure_calls
     assert {"UCI_Elo": 1200} in stub_engine.configure_calls
+
+
+def test_engine_players_reuse_pooled_engine(monkeypatch) -> None:
+    started: list[_StubEngine] = []
+
+    def _popen(_):  # type: ignore[no-untyped-def]
+        engine = _StubEngine()
+        started.append(engine)
+        return engine
+
+    monkeypatch.setattr("zugzwang.core.players.chess.engine.SimpleEngine.popen_uci", _popen)
+    board = BoardManager()
+    state = board.game_state([])
+    pool = EnginePool()
+
+    for seed in range(3):
+        player = EnginePlayer(name="stockfish", path="stub-engine", rng=random.Random(seed), engine_pool=pool)
+        _ = player.choose_move(state)
+        player.close()
+    pool.close()
+
+    assert len(started) == 1
+    assert pool.started == 1
+    assert pool.reused == 2
+    # Each game hands the reused engine a new game token, so python-chess sends ucinewgame.
+    games = started[0].games
+    assert len(games) == 3 and None not in games and len({id(game) for game in games}) == 3
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+
+from zugzwang.providers.base import ProviderError, should_retry_provider_error
+from zugzwang.providers.registry import create_provider
+from zugzwang.providers.sim import SimProvider
+
+
+MESSAGES = [{"role": "user", "content": "Legal moves (UCI): e2e4 d2d4 g1f3\nReturn one move."}]
+
+
+def test_sim_provider_answers_like_mock_with_simulated_usage() -> None:
+    provider = create_provider("sim")
+    assert isinstance(provider, SimProvider)
+
+    response = provider.complete(
+        MESSAGES,
+        {"model": "sim-1", "sim": {"latency_distribution": "fixed", "latency_ms": 1, "output_tokens": 40}},
+    )
+    assert response.text == "e2e4"
+    assert response.latency_ms == 1
+    assert response.output_tokens == 40
+    assert response.input_tokens == len(MESSAGES[0]["content"]) // 4
+    assert provider.stats()["calls"] == 1
+    assert provider.stats()["wasted_calls"] == 0
+
+
+def test_sim_provider_injects_faults_and_bad_moves_deterministically() -> None:
+    settings = {"latency_ms": 0, "seed": 7, "rate_429": 0.2, "rate_5xx": 0.1, "rate_malformed": 0.2, "rate_illegal": 0.1}
+
+    def run() -> tuple[list[str], dict]:
+        provider = SimProvider()
+        outcomes: list[str] = []
+        for _ in range(200):
+            try:
+                outcomes.append(provider.complete(MESSAGES, {"sim": settings}).text)
+            except ProviderError as exc:
+                assert should_retry_provider_error(exc)
+                outcomes.append(f"error:{exc.status_code}")
+        return outcomes, provider.stats()
+
+    outcomes, stats = run()
+    assert outcomes == run()[0]
+    assert stats["calls"] == 200
+    assert stats["faults"]["rate_limit"] == outcomes.count("error:429")
+    assert stats["faults"]["server"] == outcomes.count("error:503")
+    assert stats["rejected"]["illegal"] == outcomes.count("a1a8")
+    assert 0.45 < stats["wasted_calls"] / stats["calls"] < 0.75
+    assert stats["ok"] == outcomes.count("e2e4")
+
+
+def test_sim_provider_rejects_unknown_latency_distribution() -> None:
+    with pytest.raises(ProviderError, match="latency_distribution"):
+        SimProvider().complete(MESSAGES, {"sim": {"latency_distribution": "pareto"}})
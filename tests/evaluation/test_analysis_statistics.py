@@ -1,6 +1,18 @@
 ﻿from __future__ import annotations
 
-from zugzwang.analysis.statistics import bootstrap_win_rate, compare_acpl, compare_win_rates
+import pytest
+
+from zugzwang.analysis import statistics
+from zugzwang.analysis.statistics import (
+    adjust_p_values,
+    bootstrap_acpl,
+    bootstrap_distribution,
+    bootstrap_win_rate,
+    compare_acpl,
+    compare_distributions,
+    compare_win_rates,
+    resolve_engine,
+)
 
 
 def test_bootstrap_win_rate_ci_contains_expected_center() -> None:
@@ -67,3 +79,75 @@ def test_compare_acpl_detects_large_gap() -> None:
     assert comparison.significant is True
     assert comparison.delta < 0
     assert comparison.p_value < 0.01
+
+
+def test_python_engine_reproduces_historical_random_stream() -> None:
+    run_a = [20.0 + (i % 7) * 3 for i in range(25)]
+    run_b = [25.0 + (i % 5) * 4 for i in range(30)]
+
+    comparison = compare_acpl(run_a, run_b, iterations=500, permutations=500, seed=5, engine="python")
+
+    assert comparison.engine == "python"
+    assert comparison.ci_low == pytest.approx(-7.614)
+    assert comparison.ci_high == pytest.approx(-1.9066666666666698)
+    assert comparison.p_value == pytest.approx(5 / 501)
+
+
+def test_resolve_engine_falls_back_to_python_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(statistics, "np", None)
+
+    assert resolve_engine("auto") == "python"
+    assert bootstrap_win_rate([1.0, 0.0] * 10, iterations=200, seed=1).engine == "python"
+    with pytest.raises(ValueError, match="requires numpy"):
+        resolve_engine("numpy")
+    with pytest.raises(ValueError, match="engine must be one of"):
+        resolve_engine("fortran")  # type: ignore[arg-type]
+
+
+def test_numpy_engine_is_seeded_chunk_independent_and_close_to_python(monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("numpy")
+    run_a = [20.0 + (i % 7) * 3 for i in range(25)]
+    run_b = [25.0 + (i % 5) * 4 for i in range(30)]
+
+    vectorized = compare_acpl(run_a, run_b, iterations=4_000, permutations=4_000, seed=5, engine="numpy")
+    reference = compare_acpl(run_a, run_b, iterations=4_000, permutations=4_000, seed=5, engine="python")
+    monkeypatch.setattr(statistics, "_MAX_CHUNK_ELEMENTS", 64)
+    chunked = compare_acpl(run_a, run_b, iterations=4_000, permutations=4_000, seed=5, engine="numpy")
+
+    assert vectorized.engine == "numpy"
+    assert chunked == vectorized
+    assert vectorized.ci_low == pytest.approx(reference.ci_low, abs=0.5)
+    assert vectorized.ci_high == pytest.approx(reference.ci_high, abs=0.5)
+    assert vectorized.p_value == pytest.approx(reference.p_value, abs=0.01)
+
+
+def test_bootstrap_distribution_matches_direct_bootstrap_for_same_seed() -> None:
+    values = [30.0 + (i % 9) * 2 for i in range(40)]
+
+    distribution = bootstrap_distribution(values, metric_name="acpl", iterations=1_000, seed=21, engine="python")
+    direct = bootstrap_acpl(values, iterations=1_000, seed=21, engine="python")
+
+    assert distribution.ci(0.95) == direct
+
+
+def test_compare_distributions_reuses_cached_draws() -> None:
+    run_a = [20.0 + (i % 3) for i in range(30)]
+    run_b = [120.0 + (i % 5) for i in range(30)]
+    dist_a = bootstrap_distribution(run_a, metric_name="acpl", iterations=1_000, seed=1, engine="python")
+    dist_b = bootstrap_distribution(run_b, metric_name="acpl", iterations=1_000, seed=2, engine="python")
+
+    comparison = compare_distributions(dist_a, dist_b, permutations=1_000, seed=17)
+
+    assert comparison.significant is True
+    assert comparison.ci_low <= comparison.delta <= comparison.ci_high
+    assert comparison.effect_size_name == "cliffs_delta"
+    with pytest.raises(ValueError, match="different metrics"):
+        compare_distributions(dist_a, bootstrap_distribution(run_b, metric_name="win_rate", iterations=1_000))
+
+
+def test_adjust_p_values_holm_and_benjamini_hochberg() -> None:
+    p_values = [0.01, 0.04, 0.03, 0.005]
+
+    assert adjust_p_values(p_values, "holm") == pytest.approx([0.03, 0.06, 0.06, 0.02])
+    assert adjust_p_values(p_values, "bh") == pytest.approx([0.02, 0.04, 0.04, 0.02])
+    assert adjust_p_values(p_values, "none") == p_values
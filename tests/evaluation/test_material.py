@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from zugzwang.evaluation.material import MaterialEvaluator
+
+
+def test_material_evaluator_scores_captures() -> None:
+    fen = "4k3/8/8/3q4/4P3/8/8/4K3 w - - 0 1"
+    evaluator = MaterialEvaluator()
+    best = evaluator.evaluate_move(fen, "e4d5")
+    assert best.best_move_uci == "e4d5"
+    assert best.centipawn_loss == 0
+    quiet = evaluator.evaluate_move(fen, "e1f1")
+    assert quiet.centipawn_loss == 900
@@ -94,3 +94,43 @@ def test_summarize_experiment_includes_retrieval_and_moa_metrics() -> None:
     assert report.retrieval_hit_rate_by_phase["opening"] == 0.5
     assert report.retrieval_hit_rate_by_phase["endgame"] == 1.0
     assert report.moa_move_share == 2 / 3
+
+
+def test_summarize_experiment_reports_duplicate_move_sequences() -> None:
+    def record(game_number: int, opening: dict | None = None) -> GameRecord:
+        return GameRecord(
+            experiment_id="exp",
+            game_number=game_number,
+            config_hash="hash",
+            seed=game_number,
+            players={"white": {"type": "random"}, "black": {"type": "llm"}},
+            moves=[
+                _move(
+                    ply=1,
+                    retrieval_enabled=False,
+                    retrieval_hit_count=0,
+                    retrieval_latency_ms=0,
+                    retrieval_phase="opening",
+                    decision_mode="single_agent",
+                )
+            ],
+            result="*",
+            termination="max_moves",
+            token_usage={"input": 1, "output": 1},
+            cost_usd=0.0,
+            duration_seconds=0.1,
+            timestamp_utc="2026-02-22T00:00:00Z",
+            opening=opening,
+        )
+
+    swapped = {"opening_id": "o1", "fen": None, "moves_uci": [], "colors_swapped": True}
+    report = summarize_experiment(
+        experiment_id="exp",
+        config_hash="hash",
+        target_games=4,
+        scheduled_games=4,
+        game_records=[record(1), record(2), record(3), record(4, opening=swapped)],
+    )
+
+    assert report.duplicate_game_count == 2
+    assert report.duplicate_game_groups == [[1, 2, 3]]
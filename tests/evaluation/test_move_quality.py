@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from zugzwang.evaluation.move_quality import classify_centipawn_loss
+from zugzwang.evaluation.move_quality import classify_centipawn_loss, phase_from_fen
 
 
 def test_classify_centipawn_loss_boundaries() -> None:
@@ -10,3 +10,9 @@ def test_classify_centipawn_loss_boundaries() -> None:
     assert classify_centipawn_loss(100) == "inaccuracy"
     assert classify_centipawn_loss(200) == "mistake"
     assert classify_centipawn_loss(201) == "blunder"
+
+
+def test_phase_from_fen_uses_piece_count_then_move_number() -> None:
+    assert phase_from_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1") == "opening"
+    assert phase_from_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 13") == "middlegame"
+    assert phase_from_fen("8/5k2/8/8/3R4/8/5PPP/6K1 w - - 0 40") == "endgame"
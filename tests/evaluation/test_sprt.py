@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import math
+
+from zugzwang.evaluation.sprt import SprtState, sprt_bounds, sprt_config_from_dict, sprt_llr
+
+
+def test_sprt_bounds_match_wald_thresholds() -> None:
+    lower, upper = sprt_bounds(0.05, 0.05)
+    assert math.isclose(lower, math.log(0.05 / 0.95))
+    assert math.isclose(upper, math.log(0.95 / 0.05))
+
+
+def test_sprt_llr_sign_follows_score() -> None:
+    assert sprt_llr(0, 0, 0, elo0=0.0, elo1=50.0) == 0.0
+    assert sprt_llr(12, 4, 2, elo0=0.0, elo1=50.0) > 0
+    assert sprt_llr(2, 4, 12, elo0=0.0, elo1=50.0) < 0
+    assert sprt_llr(0, 0, 3, elo0=0.0, elo1=50.0) < sprt_llr(0, 0, 1, elo0=0.0, elo1=50.0)
+
+
+def test_sprt_state_accepts_h0_on_losing_streak_and_records_trajectory() -> None:
+    config = sprt_config_from_dict({"enabled": True, "elo0": 0, "elo1": 50, "min_games": 4})
+    state = SprtState(config=config, player_color="black")
+
+    statuses = [state.update("1-0", game_number) for game_number in range(1, 12)]
+
+    assert statuses[0] == "continue"
+    assert state.status == "accept_h0"
+    assert state.losses == state.games
+    assert len(state.llr_trajectory) == 11
+    assert state.llr_trajectory[-1]["llr"] <= state.bounds[0]
+
+
+def test_sprt_elo_mode_uses_opponent_relative_bounds() -> None:
+    config = sprt_config_from_dict(
+        {"enabled": True, "mode": "elo", "elo0": 1400, "elo1": 1450, "opponent_elo": 1400}
+    )
+    assert config.elo_diff0 == 0.0
+    assert config.elo_diff1 == 50.0
@@ -257,3 +257,28 @@ def test_config_rejects_enabled_config_source_without_examples() -> None:
                 "strategy.few_shot.source=config",
             ],
         )
+
+
+def test_config_accepts_runtime_sprt_block() -> None:
+    config_path = ROOT / "configs" / "baselines" / "best_known_start.yaml"
+    resolved = resolve_config(
+        experiment_config_path=config_path,
+        cli_overrides=[
+            "runtime.sprt.enabled=true",
+            "runtime.sprt.mode=elo",
+            "runtime.sprt.elo0=1200",
+            "runtime.sprt.elo1=1300",
+            "runtime.sprt.opponent_elo=1250",
+        ],
+    )
+    assert resolved["runtime"]["sprt"]["enabled"] is True
+    assert resolved["runtime"]["sprt"]["opponent_elo"] == 1250
+
+
+def test_config_rejects_sprt_elo_mode_without_opponent_elo() -> None:
+    config_path = ROOT / "configs" / "baselines" / "best_known_start.yaml"
+    with pytest.raises(ValueError, match="runtime.sprt.opponent_elo"):
+        resolve_config(
+            experiment_config_path=config_path,
+            cli_overrides=["runtime.sprt.enabled=true", "runtime.sprt.mode=elo"],
+        )
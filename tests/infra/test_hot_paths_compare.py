@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _load_benchmarks():  # type: ignore[no-untyped-def]
+    path = ROOT / "benchmarks" / "hot_paths.py"
+    spec = importlib.util.spec_from_file_location("hot_paths", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    # Dataclasses look their module up in sys.modules while the class is created.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _cases(**seconds: float) -> dict:
+    return {"cases": {name: {"min_seconds": value} for name, value in seconds.items()}}
+
+
+def test_compare_flags_only_cases_past_the_threshold() -> None:
+    hot_paths = _load_benchmarks()
+    baseline = _cases(at_limit=1.0, past_limit=1.0, faster=2.0)
+    current = _cases(at_limit=1.25, past_limit=1.26, faster=1.0, new_case=5.0)
+
+    rows = {row["case"]: row for row in hot_paths.compare(baseline, current, threshold=0.25)}
+
+    assert rows["at_limit"]["ratio"] == 1.25 and rows["at_limit"]["regressed"] is False
+    assert rows["past_limit"]["ratio"] == 1.26 and rows["past_limit"]["regressed"] is True
+    assert rows["faster"]["ratio"] == 0.5 and rows["faster"]["regressed"] is False
+    assert rows["new_case"] == {
+        "case": "new_case",
+        "baseline_seconds": None,
+        "current_seconds": 5.0,
+        "ratio": None,
+        "regressed": False,
+    }
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from zugzwang.evaluation.material import MaterialEvaluator
+from zugzwang.evaluation.pipeline import evaluate_run_dir
+from zugzwang.experiments.runner import ExperimentRunner, RunSession
+from zugzwang.infra.memory import MemoryMonitor, current_memory, monitor_from_config
+from zugzwang.infra.tracing import Tracer
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_current_memory_reports_rss_and_peak() -> None:
+    payload = current_memory()
+    assert payload["rss_mb"] > 0
+    assert payload["peak_rss_mb"] >= payload["rss_mb"]
+    assert payload["threads"] >= 1
+
+
+def test_monitor_samples_and_groups_allocations_by_module() -> None:
+    tracer = Tracer()
+    assert not tracemalloc.is_tracing()
+    with MemoryMonitor(interval_seconds=0.01, top_allocators=5, tracer=tracer) as monitor:
+        blocks = [bytearray(1024) for _ in range(2_000)]
+        time.sleep(0.05)
+    summary = monitor.stop()
+    assert blocks
+    assert not tracemalloc.is_tracing()
+    assert summary["sample_count"] >= 3
+    assert summary["timeline"][0][0] == 0.0
+    assert summary["peak_rss_mb"] >= summary["start_rss_mb"]
+    top = summary["tracemalloc"]["top_modules"]
+    assert len(top) <= 5
+    assert top[0]["module"] == "test_memory"
+    assert top[0]["size_kb"] >= 2_000
+    counters = [event for event in tracer.to_chrome_trace()["traceEvents"] if event["ph"] == "C"]
+    assert len(counters) == summary["sample_count"]
+    assert tracer.stage_summary() == {}
+
+
+def test_overlapping_monitors_share_tracemalloc_until_the_last_stops() -> None:
+    first = MemoryMonitor(interval_seconds=0.01, top_allocators=3).start()
+    second = MemoryMonitor(interval_seconds=0.01, top_allocators=3).start()
+    assert first.stop()["tracemalloc"] is not None
+    assert tracemalloc.is_tracing()
+    assert second.stop()["tracemalloc"] is not None
+    assert not tracemalloc.is_tracing()
+
+
+def test_failed_run_stops_its_memory_monitor(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def crash(self: RunSession, game_number: int) -> None:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(RunSession, "play_game", crash)
+    runner = ExperimentRunner(
+        config_path=ROOT / "configs" / "baselines" / "best_known_start.yaml",
+        overrides=[
+            "experiment.target_valid_games=1",
+            "experiment.max_games=1",
+            f"runtime.output_dir={tmp_path.as_posix()}",
+            "tracking.memory_profile=true",
+            "tracking.memory_interval_seconds=0.01",
+            "tracking.memory_top_allocators=3",
+        ],
+    )
+    with pytest.raises(RuntimeError, match="boom"):
+        runner.run()
+    assert not tracemalloc.is_tracing()
+    assert not any(thread.name == "zugzwang-memory" for thread in threading.enumerate())
+
+
+def test_monitor_from_config_is_opt_in() -> None:
+    assert monitor_from_config({"tracking": {}}) is None
+    monitor = monitor_from_config(
+        {"tracking": {"memory_profile": True, "memory_interval_seconds": 0.5, "memory_top_allocators": 0}}
+    )
+    assert monitor is not None and monitor.interval_seconds == 0.5
+    assert monitor.start().stop()["tracemalloc"] is None
+    with pytest.raises(ValueError):
+        MemoryMonitor(interval_seconds=0)
+
+
+def test_evaluate_run_dir_records_evaluation_memory(tmp_path: Path) -> None:
+    runner = ExperimentRunner(
+        config_path=ROOT / "configs" / "baselines" / "best_known_start.yaml",
+        overrides=[
+            "experiment.target_valid_games=1",
+            "experiment.max_games=1",
+            "runtime.max_plies=12",
+            f"runtime.output_dir={tmp_path.as_posix()}",
+            "tracking.memory_profile=true",
+            "tracking.memory_top_allocators=0",
+        ],
+    )
+    run_dir = Path(runner.run()["run_dir"])
+    payload = evaluate_run_dir(run_dir, evaluator=MaterialEvaluator())
+    assert payload["peak_rss_mb"] > 0
+
+    report = json.loads(Path(payload["output_report"]).read_text(encoding="utf-8"))
+    assert report["memory"]["peak_rss_mb"] == payload["peak_rss_mb"]
+    metadata = json.loads((run_dir / "_run.json").read_text(encoding="utf-8"))
+    assert metadata["evaluation_memory"]["sample_count"] >= 2
+    assert metadata["memory"]["tracemalloc"] is None
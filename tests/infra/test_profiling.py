@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import pstats
+import threading
+from collections import Counter
+from pathlib import Path
+
+import chess
+
+from zugzwang.cli import main
+from zugzwang.infra.profiling import (
+    SamplingProfiler,
+    hotspots_from_stacks,
+    profile_call,
+)
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _busy(iterations: int = 30_000) -> int:
+    board = chess.Board()
+    total = 0
+    for _ in range(iterations // 20):
+        total += sum(1 for _ in board.legal_moves)
+    return total
+
+
+def test_sampling_profiler_covers_worker_threads(tmp_path: Path) -> None:
+    def run_on_worker() -> None:
+        worker = threading.Thread(target=_busy, args=(200_000,))
+        worker.start()
+        worker.join()
+
+    with SamplingProfiler(interval_ms=0.5) as sampler:
+        run_on_worker()
+
+    assert sampler.sample_count > 0
+    assert any("test_profiling:_busy" in stack for stack in sampler.stacks)
+    # The parked main thread is skipped rather than counted as hot.
+    assert not any(stack[-1] == "threading:Thread.join" for stack in sampler.stacks)
+
+
+def test_hotspots_split_self_and_inclusive_share() -> None:
+    stacks = Counter(
+        {
+            ("app:main", "lib:parse", "lib:scan"): 3,
+            ("app:main", "app:render"): 1,
+        }
+    )
+    hotspots = hotspots_from_stacks(stacks, top=5)
+    assert hotspots[0] == {"module": "lib", "self_samples": 3, "self_pct": 75.0, "inclusive_pct": 75.0}
+    assert hotspots[1] == {"module": "app", "self_samples": 1, "self_pct": 25.0, "inclusive_pct": 100.0}
+
+
+def test_profile_call_writes_collapsed_and_pstats(tmp_path: Path) -> None:
+    sampled = profile_call(_busy, output_dir=tmp_path / "sampling", interval_ms=0.5, top=3)
+    assert sampled.result > 0
+    collapsed = (tmp_path / "sampling" / "profile.collapsed").read_text(encoding="utf-8").splitlines()
+    assert collapsed and all(line.rsplit(" ", 1)[1].isdigit() for line in collapsed)
+    assert len(sampled.hotspots) <= 3
+
+    profiled = profile_call(_busy, output_dir=tmp_path / "cprofile", profiler="cprofile")
+    stats = pstats.Stats(str(tmp_path / "cprofile" / "profile.pstats"))
+    assert stats.total_calls > 0
+    assert "chess" in {row["module"] for row in profiled.hotspots}
+    rebuilt = (tmp_path / "cprofile" / "profile.collapsed").read_text(encoding="utf-8").splitlines()
+    assert profiled.files["collapsed"].endswith("profile.collapsed")
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in rebuilt)
+    assert any(line.startswith("test_profiling:_busy;") and "chess:" in line for line in rebuilt)
+    summary = json.loads((tmp_path / "cprofile" / "profile_summary.json").read_text(encoding="utf-8"))
+    assert summary["profiler"] == "cprofile"
+
+
+def test_cli_profile_run_and_evaluate_offline(tmp_path: Path, capsys) -> None:
+    run_output = tmp_path / "profile-run"
+    code = main(
+        [
+            "profile",
+            "run",
+            "--config",
+            str(ROOT / "configs" / "baselines" / "best_known_start.yaml"),
+            "--games",
+            "1",
+            "--max-plies",
+            "12",
+            "--output-dir",
+            str(run_output),
+        ]
+    )
+    assert code == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["profiler"] == "sampling"
+    assert (run_output / "profile.collapsed").exists()
+    run_dirs = [path for path in (run_output / "runs").iterdir() if not path.name.startswith("_")]
+    assert len(run_dirs) == 1
+    game = json.loads(next((run_dirs[0] / "games").glob("game_*.json")).read_text(encoding="utf-8"))
+    assert {player.get("provider") for player in game["players"].values()} <= {None, "mock"}
+
+    eval_output = tmp_path / "profile-eval"
+    code = main(
+        ["profile", "evaluate", "--run-dir", str(run_dirs[0]), "--profiler", "cprofile", "--output-dir", str(eval_output)]
+    )
+    assert code == 0
+    assert json.loads(capsys.readouterr().out)["files"]["pstats"].endswith("profile.pstats")
+    assert (eval_output / "run" / run_dirs[0].name / "experiment_report_evaluated.json").exists()
+    assert not (run_dirs[0] / "experiment_report_evaluated.json").exists()
@@ -5,7 +5,7 @@ import os
 import time
 from pathlib import Path
 
-from zugzwang.experiments.resume import count_valid_games, load_existing_game_records
+from zugzwang.experiments.resume import count_valid_games, find_completed_run, load_existing_game_records
 
 
 def _game_payload(game_number: int, termination: str) -> dict[str, object]:
@@ -46,3 +46,32 @@ def test_load_existing_game_records_deduplicates_by_game_number_using_latest_fil
     assert records[0].game_number == 1
     assert records[0].termination == "checkmate"
     assert count_valid_games(records) == 1
+
+
+def _write_run(root: Path, name: str, config_hash: str, report: dict[str, object] | None) -> Path:
+    run_dir = root / name
+    run_dir.mkdir(parents=True)
+    (run_dir / "config_hash.txt").write_text(config_hash, encoding="utf-8")
+    if report is not None:
+        (run_dir / "experiment_report.json").write_text(json.dumps(report), encoding="utf-8")
+    return run_dir
+
+
+def test_find_completed_run_requires_matching_hash_and_finished_report(tmp_path: Path) -> None:
+    _write_run(tmp_path, "exp-partial", "hash", {"num_games_target": 4, "num_games_valid": 2})
+    _write_run(tmp_path, "exp-running", "hash", None)
+    _write_run(tmp_path, "exp-other", "other", {"num_games_target": 4, "num_games_valid": 4})
+    assert find_completed_run(tmp_path, "hash") is None
+
+    done = _write_run(tmp_path, "exp-done", "hash", {"num_games_target": 4, "num_games_valid": 4})
+    assert find_completed_run(tmp_path, "hash") == done
+
+    sprt = _write_run(
+        tmp_path,
+        "exp-sprt",
+        "hash",
+        {"num_games_target": 40, "num_games_valid": 12, "stopped_due_to_sprt": True},
+    )
+    os.utime(sprt, (time.time() + 10, time.time() + 10))
+    assert find_completed_run(tmp_path, "hash") == sprt
+    assert find_completed_run(tmp_path / "missing", "hash") is None
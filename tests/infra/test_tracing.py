@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+from zugzwang.infra.tracing import Tracer, current_tracer, span, traced, use_tracer
+
+
+def test_span_is_shared_noop_without_active_tracer() -> None:
+    assert current_tracer() is None
+    assert span("a") is span("b", ply=3)
+    with span("noop"):
+        pass
+
+
+def test_tracer_records_nested_spans_and_exports_chrome_trace(tmp_path: Path) -> None:
+    tracer = Tracer(label="run-x")
+
+    @traced("retrieval", category="retrieval")
+    def lookup() -> int:
+        return 7
+
+    with use_tracer(tracer):
+        with span("choose_move", ply=1):
+            assert lookup() == 7
+            with span("provider_call", category="provider", attempt=0):
+                pass
+        try:
+            with span("validation"):
+                raise ValueError("bad move")
+        except ValueError:
+            pass
+    assert current_tracer() is None
+
+    thread = threading.Thread(target=lambda: span("ignored").__enter__())
+    thread.start()
+    thread.join()
+    assert len(tracer) == 4
+
+    trace = json.loads(tracer.write(tmp_path / "trace.json").read_text(encoding="utf-8"))
+    events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    by_name = {event["name"]: event for event in events}
+    assert set(by_name) == {"choose_move", "retrieval", "provider_call", "validation"}
+    outer, inner = by_name["choose_move"], by_name["provider_call"]
+    assert outer["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert by_name["validation"]["args"] == {"error": "ValueError"}
+    assert any(event["ph"] == "M" and event["args"]["name"] == "run-x" for event in trace["traceEvents"])
+
+    summary = tracer.stage_summary()
+    assert summary["provider_call"]["count"] == 1
+    assert summary["choose_move"]["p95_ms"] >= summary["choose_move"]["p50_ms"] >= 0.0
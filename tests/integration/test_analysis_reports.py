@@ -3,9 +3,12 @@
 import json
 from pathlib import Path
 
+import pytest
 import yaml
 
+from zugzwang.analysis.leaderboard import compare_many, generate_leaderboard_markdown
 from zugzwang.analysis.reports import compare_runs, generate_markdown_report
+from zugzwang.cli import main as cli_main
 
 
 def test_compare_runs_and_generate_markdown(tmp_path: Path) -> None:
@@ -52,6 +55,87 @@ def test_compare_runs_and_generate_markdown(tmp_path: Path) -> None:
     assert "## ACPL" in markdown
 
 
+def _write_leaderboard_runs(runs_root: Path) -> list[str]:
+    run_ids = [
+        "weak-20260223T100000Z-cccccccc",
+        "strong-20260223T100000Z-aaaaaaaa",
+        "middle-20260223T100000Z-bbbbbbbb",
+    ]
+    _write_run(
+        runs_root=runs_root,
+        run_id=run_ids[0],
+        game_results=["1-0"] * 20,
+        acpl_values=[95.0 + idx % 4 for idx in range(20)],
+    )
+    _write_run(
+        runs_root=runs_root,
+        run_id=run_ids[1],
+        game_results=["0-1"] * 20,
+        acpl_values=[20.0 + idx % 3 for idx in range(20)],
+    )
+    _write_run(
+        runs_root=runs_root,
+        run_id=run_ids[2],
+        game_results=["0-1", "1-0"] * 10,
+        acpl_values=[55.0 + idx % 5 for idx in range(20)],
+    )
+    return run_ids
+
+
+def test_compare_many_ranks_runs_with_corrected_pairwise_matrix(tmp_path: Path) -> None:
+    runs_root = tmp_path / "runs"
+    weak, strong, middle = _write_leaderboard_runs(runs_root)
+
+    report = compare_many(
+        [weak, strong, middle],
+        runs_root=runs_root,
+        iterations=1_000,
+        permutations=1_000,
+        seed=3,
+        correction="holm",
+    )
+
+    assert [entry.run.run_id for entry in report.entries] == [strong, middle, weak]
+    assert report.entries[0].win_rate_wins == 2
+    assert report.entries[-1].acpl_losses == 2
+    assert len(report.win_rate_pairs) == 3
+    assert len(report.acpl_pairs) == 3
+    for pair in report.win_rate_pairs + report.acpl_pairs:
+        assert pair.p_adjusted >= pair.test.p_value
+        assert pair.significant is True
+
+    payload = report.to_dict()
+    assert payload["kind"] == "leaderboard"
+    assert payload["settings"]["correction"] == "holm"
+    markdown = generate_leaderboard_markdown(report)
+    assert "# Run Leaderboard" in markdown
+    assert f"| 1 | `{strong}`" in markdown
+
+    with pytest.raises(ValueError, match="more than once"):
+        compare_many([weak, weak], runs_root=runs_root, iterations=200, permutations=200)
+    with pytest.raises(ValueError, match="at least two runs"):
+        compare_many([weak], runs_root=runs_root)
+
+
+def test_leaderboard_cli_writes_single_artifact(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    runs_root = tmp_path / "runs"
+    run_ids = _write_leaderboard_runs(runs_root)
+    argv = ["leaderboard", "--runs-root", str(runs_root), "--comparison-id", "ablations"]
+    for run_id in run_ids:
+        argv.extend(["--run", run_id])
+    argv.extend(["--iterations", "500", "--permutations", "500"])
+
+    assert cli_main(argv) == 0
+    output = json.loads(capsys.readouterr().out)
+
+    assert output["comparison_id"] == "ablations"
+    assert output["ranking"][0]["run_id"] == run_ids[1]
+    saved = json.loads(Path(output["artifacts"]["json_path"]).read_text(encoding="utf-8"))
+    assert saved["kind"] == "leaderboard"
+    assert len(saved["entries"]) == 3
+    assert Path(output["artifacts"]["markdown_path"]).exists()
+
+
 def _write_run(
     *,
     runs_root: Path,
@@ -7,6 +7,7 @@ from pathlib import Path
 
 import pytest
 
+from zugzwang.api.services import job_runtime
 from zugzwang.api.services.evaluation_service import EvaluationService
 from zugzwang.api.services.run_service import RunService
 
@@ -14,6 +15,12 @@ from zugzwang.api.services.run_service import RunService
 ROOT = Path(__file__).resolve().parents[2]
 
 
+@pytest.fixture(autouse=True)
+def _isolated_ui_jobs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Job logs and status files would otherwise land in the repo's results/ui_jobs.
+    monkeypatch.setattr(job_runtime, "ui_jobs_root", lambda: tmp_path / "ui_jobs")
+
+
 def _wait_for_terminal_status(service: RunService | EvaluationService, job_id: str, timeout_seconds: float = 60.0) -> dict:
     deadline = time.time() + timeout_seconds
     while time.time() < deadline:
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from zugzwang.cli import main
+from zugzwang.experiments.bench import run_bench
+
+
+ROOT = Path(__file__).resolve().parents[2]
+CONFIG = ROOT / "configs" / "baselines" / "best_known_start.yaml"
+
+
+def test_bench_reports_throughput_and_wasted_calls(tmp_path: Path) -> None:
+    result = run_bench(
+        CONFIG,
+        overrides=[
+            "runtime.max_plies=16",
+            "players.black.sim.latency_ms=1",
+            "players.black.sim.rate_429=0.2",
+            "players.black.sim.rate_malformed=0.2",
+            "strategy.validation.provider_backoff_seconds=0",
+        ],
+        games=3,
+        concurrency=2,
+        output_dir=tmp_path,
+    )
+
+    assert result["games"] == 3
+    assert result["llm_moves"] == 24
+    assert result["provider_calls"] > result["llm_moves"]
+    assert result["wasted_calls"] == result["faults"]["rate_limit"] + result["rejected_responses"]["malformed"]
+    assert result["move_latency_ms"]["p95"] >= result["move_latency_ms"]["p50"] > 0
+    assert result["games_per_hour"] > 0
+
+    run_dir = Path(result["run_dir"])
+    game = json.loads((run_dir / "games" / "game_0001.json").read_text(encoding="utf-8"))
+    assert game["players"]["black"]["provider"] == "sim"
+    assert (run_dir / "trace.json").exists()
+
+
+def test_bench_cli_requires_an_llm_player(capsys: pytest.CaptureFixture[str]) -> None:
+    code = main(["bench", "--config", str(ROOT / "configs" / "baselines" / "random_legal.yaml")])
+    assert code == 2
+    assert "llm player" in capsys.readouterr().out
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+from zugzwang.experiments.distributed import (
+    DistributedCoordinator,
+    DistributedWorker,
+    LeaseQueue,
+    read_stop,
+)
+from zugzwang.experiments.resume import load_existing_game_records
+from zugzwang.infra.ids import game_seed
+
+
+ROOT = Path(__file__).resolve().parents[2]
+CONFIG = ROOT / "configs" / "baselines" / "best_known_start.yaml"
+
+
+def test_lease_claim_is_exclusive_until_expiry(tmp_path: Path) -> None:
+    first = LeaseQueue(tmp_path, worker_id="a", lease_seconds=0.2)
+    second = LeaseQueue(tmp_path, worker_id="b", lease_seconds=0.2)
+
+    assert first.claim(1) is True
+    assert second.claim(1) is False
+    assert second.claim_next(completed=set(), max_game_number=3) == 2
+
+    time.sleep(0.3)
+    assert second.claim(1) is True
+    assert second.steals == 1
+    assert first.owns(1) is False
+    assert first.renew(1) is False
+
+    second.release(1)
+    assert second.read(1) is None
+
+
+def test_worker_finishes_run_and_coordinator_writes_report(tmp_path: Path) -> None:
+    coordinator = DistributedCoordinator(
+        config_path=CONFIG,
+        overrides=[
+            "experiment.target_valid_games=3",
+            "experiment.max_games=3",
+            "runtime.max_plies=6",
+            f"runtime.output_dir={tmp_path.as_posix()}",
+        ],
+        run_id="distributed-inline",
+        lease_seconds=30,
+        poll_seconds=0.05,
+    )
+    session = coordinator.prepare()
+
+    # A dead worker's lease on game 2 has already expired.
+    stale = LeaseQueue(session.run_dir, worker_id="dead", lease_seconds=0.01)
+    assert stale.claim(2) is True
+    time.sleep(0.05)
+
+    summary = DistributedWorker(session.run_dir, worker_id="w1").run()
+    payload = coordinator.finalize(session)
+
+    assert sorted(summary["games_played"]) == [1, 2, 3]
+    assert summary["lease_steals"] == 1
+    assert payload["valid_games"] == 3
+    assert payload["distributed"]["stop"]["reason"] == "target_valid_games_reached"
+    records = load_existing_game_records(session.run_dir)
+    assert [record.seed for record in records] == [game_seed(42, n) for n in (1, 2, 3)]
+    report = json.loads((session.run_dir / "experiment_report.json").read_text(encoding="utf-8"))
+    assert report["num_games_valid"] == 3
+
+
+def test_local_worker_processes_share_one_run(tmp_path: Path) -> None:
+    coordinator = DistributedCoordinator(
+        config_path=CONFIG,
+        overrides=[
+            "experiment.target_valid_games=4",
+            "experiment.max_games=4",
+            "runtime.max_plies=6",
+            f"runtime.output_dir={tmp_path.as_posix()}",
+        ],
+        run_id="distributed-procs",
+        lease_seconds=30,
+        poll_seconds=0.1,
+    )
+
+    payload = coordinator.run(local_workers=2, max_wait_seconds=120)
+
+    run_dir = Path(payload["run_dir"])
+    records = load_existing_game_records(run_dir)
+    assert [record.game_number for record in records] == [1, 2, 3, 4]
+    assert payload["valid_games"] == 4
+    assert payload["distributed"]["local_workers"] == 2
+    assert read_stop(run_dir) is not None
+    assert not list((run_dir / "leases").glob("game_*.lease"))
+
+
+def test_worker_saves_its_memory_summary_and_stops_sampling(tmp_path: Path) -> None:
+    coordinator = DistributedCoordinator(
+        config_path=CONFIG,
+        overrides=[
+            "experiment.target_valid_games=1",
+            "experiment.max_games=1",
+            "runtime.max_plies=6",
+            f"runtime.output_dir={tmp_path.as_posix()}",
+            "tracking.memory_profile=true",
+            "tracking.memory_interval_seconds=0.01",
+            "tracking.memory_top_allocators=3",
+        ],
+        run_id="distributed-memory",
+        poll_seconds=0.05,
+    )
+    session = coordinator.prepare()
+    DistributedWorker(session.run_dir, worker_id="w1").run()
+    coordinator.finalize(session)
+
+    metadata = json.loads((session.run_dir / "_run.json").read_text(encoding="utf-8"))
+    assert metadata["memory_w1"]["sample_count"] >= 2
+    assert metadata["memory_w1"]["tracemalloc"] is not None
+    assert metadata["memory"]["sample_count"] >= 2
+    assert not tracemalloc.is_tracing()
+    assert not any(thread.name == "zugzwang-memory" for thread in threading.enumerate())
+
+
+def test_coordinator_merges_worker_traces_into_stage_timings(tmp_path: Path) -> None:
+    coordinator = DistributedCoordinator(
+        config_path=CONFIG,
+        overrides=[
+            "experiment.target_valid_games=2",
+            "experiment.max_games=2",
+            "runtime.max_plies=6",
+            f"runtime.output_dir={tmp_path.as_posix()}",
+            "tracking.trace_spans=true",
+        ],
+        run_id="distributed-trace",
+        poll_seconds=0.05,
+    )
+    session = coordinator.prepare()
+    DistributedWorker(session.run_dir, worker_id="w1").run()
+    coordinator.finalize(session)
+
+    assert (session.run_dir / "trace.w1.json").exists()
+    report = json.loads((session.run_dir / "experiment_report.json").read_text(encoding="utf-8"))
+    assert report["stage_timings"]["choose_move"]["count"] == 12
+    trace = json.loads((session.run_dir / "trace.json").read_text(encoding="utf-8"))
+    names = [event["args"]["name"] for event in trace["traceEvents"] if event["name"] == "process_name"]
+    assert "worker w1" in names
+    assert sum(1 for event in trace["traceEvents"] if event["name"] == "choose_move") == 12
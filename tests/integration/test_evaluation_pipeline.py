@@ -61,6 +61,14 @@ def test_evaluate_run_dir_with_stubbed_stockfish(tmp_path: Path, monkeypatch) ->
     assert report["acpl_overall"] == 12.0
     assert report["best_move_agreement"] == 1.0
 
+    move_rows = [
+        json.loads(line)
+        for line in (run_dir / "move_evaluations.jsonl").read_text(encoding="utf-8").splitlines()
+    ]
+    assert len(move_rows) == payload["evaluated_move_count"]
+    assert {row["game_number"] for row in move_rows} == {1}
+    assert all(row["cp_loss"] == 12 and row["classification"] == "good" for row in move_rows)
+
 
 def test_evaluate_run_dir_auto_infers_white_when_white_is_llm(tmp_path: Path, monkeypatch) -> None:
     run_dir = tmp_path / "run_auto_color"
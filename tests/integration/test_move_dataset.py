@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import json
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+import yaml
+
+from zugzwang.analysis.dataset import MoveDataset, aggregate, query_moves, summarize_moves
+from zugzwang.cli import main as cli_main
+
+
+OPENING_FENS = [
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+    "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1",
+]
+ENDGAME_FEN = "8/5k2/8/8/3R4/8/5PPP/6K1 b - - 0 40"
+
+
+def test_sync_is_incremental_and_drops_deleted_runs(tmp_path: Path) -> None:
+    runs_root = tmp_path / "runs"
+    _write_run(runs_root, "glm_rag-20260301T100000Z-aaaaaaaa", provider="zai", rag=True, games=2)
+    _write_run(runs_root, "gpt_plain-20260301T100000Z-bbbbbbbb", provider="openai", rag=False, games=1)
+    dataset = MoveDataset(runs_root)
+
+    first = dataset.sync()
+    assert len(first.updated) == 2
+    assert first.unchanged == 0
+
+    second = dataset.sync()
+    assert second.updated == []
+    assert second.unchanged == 2
+
+    _write_game(runs_root / "gpt_plain-20260301T100000Z-bbbbbbbb", game_number=2, provider="openai")
+    third = dataset.sync()
+    assert third.updated == ["gpt_plain-20260301T100000Z-bbbbbbbb"]
+
+    shutil.rmtree(runs_root / "glm_rag-20260301T100000Z-aaaaaaaa")
+    fourth = dataset.sync()
+    assert fourth.removed == ["glm_rag-20260301T100000Z-aaaaaaaa"]
+    assert dataset.run_ids() == ["gpt_plain-20260301T100000Z-bbbbbbbb"]
+    assert len(dataset.read(columns=["ply_number"])["ply_number"]) == 6
+
+
+def test_concurrent_full_syncs_do_not_clobber_each_other(tmp_path: Path) -> None:
+    runs_root = tmp_path / "runs"
+    _write_run(runs_root, "glm_rag-20260301T100000Z-aaaaaaaa", provider="zai", rag=True, games=3)
+    errors: list[BaseException] = []
+
+    def _sync() -> None:
+        try:
+            for _ in range(5):
+                MoveDataset(runs_root).sync(full=True)
+        except BaseException as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=_sync) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    partition = runs_root / "_dataset" / "moves" / "glm_rag-20260301T100000Z-aaaaaaaa"
+    assert not list(partition.glob(".*.tmp"))
+    assert len(MoveDataset(runs_root).read(columns=["ply_number"])["ply_number"]) == 9
+
+
+def test_query_filters_run_and_move_columns_and_joins_evaluations(tmp_path: Path) -> None:
+    runs_root = tmp_path / "runs"
+    glm_run = runs_root / "glm_rag-20260301T100000Z-aaaaaaaa"
+    _write_run(runs_root, glm_run.name, provider="zai", rag=True, games=2)
+    _write_run(runs_root, "gpt_plain-20260301T100000Z-bbbbbbbb", provider="openai", rag=False, games=2)
+    evaluations = [
+        {
+            "game_number": game_number,
+            "ply_number": 2,
+            "cp_loss": cp_loss,
+            "best_move_uci": "d7d5",
+            "classification": classification,
+            "is_best": False,
+            "is_blunder": classification == "blunder",
+        }
+        for game_number, cp_loss, classification in ((1, 30, "good"), (2, 250, "blunder"))
+    ]
+    (glm_run / "move_evaluations.jsonl").write_text(
+        "\n".join(json.dumps(row) for row in evaluations) + "\n", encoding="utf-8"
+    )
+
+    table = query_moves(
+        runs_root,
+        columns=["run_id", "game_number", "ply_number", "phase", "cp_loss", "is_blunder"],
+        filters={"rag_enabled": True, "provider": "zai", "color": "black"},
+    )
+    assert set(table["run_id"]) == {glm_run.name}
+    assert table["phase"] == ["opening", "endgame", "opening", "endgame"]
+    assert table["cp_loss"] == [30, None, 250, None]
+
+    rows = aggregate(table, by=["phase"], metrics={"acpl": ("cp_loss", "mean"), "blunders": ("is_blunder", "sum")})
+    assert rows == [
+        {"phase": "endgame", "moves": 2, "acpl": None, "blunders": None},
+        {"phase": "opening", "moves": 2, "acpl": 140.0, "blunders": 1},
+    ]
+
+    summary = summarize_moves(MoveDataset(runs_root), by=["provider"], filters={"color": ("white", "black")})
+    assert [row["provider"] for row in summary] == ["openai", "zai", None]
+    assert summary[1]["blunder_rate"] == 0.5
+
+    with pytest.raises(ValueError, match="Unknown dataset columns"):
+        query_moves(runs_root, columns=["raw_response"])
+
+
+def test_export_moves_cli_reports_sync_and_summary(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    runs_root = tmp_path / "runs"
+    _write_run(runs_root, "glm_rag-20260301T100000Z-aaaaaaaa", provider="zai", rag=True, games=1)
+
+    assert cli_main(["export-moves", "--runs-root", str(runs_root), "--by", "phase"]) == 0
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["runs_updated"] == ["glm_rag-20260301T100000Z-aaaaaaaa"]
+    assert {row["phase"]: row["moves"] for row in payload["summary"]} == {"endgame": 1, "opening": 2}
+
+    assert cli_main(["export-moves", "--runs-root", str(runs_root)]) == 0
+    assert json.loads(capsys.readouterr().out)["runs_unchanged"] == 1
+
+
+def _write_run(runs_root: Path, run_id: str, *, provider: str, rag: bool, games: int) -> Path:
+    run_dir = runs_root / run_id
+    (run_dir / "games").mkdir(parents=True, exist_ok=True)
+    config = {
+        "experiment": {"name": run_id.split("-", 1)[0]},
+        "players": _players(provider),
+        "protocol": {"mode": "direct"},
+        "strategy": {"board_format": "fen", "rag": {"enabled": rag}, "system_prompt_id": "default"},
+    }
+    (run_dir / "resolved_config.yaml").write_text(yaml.safe_dump(config), encoding="utf-8")
+    for game_number in range(1, games + 1):
+        _write_game(run_dir, game_number=game_number, provider=provider)
+    return run_dir
+
+
+def _write_game(run_dir: Path, *, game_number: int, provider: str) -> None:
+    moves = []
+    for ply, (fen, color, uci) in enumerate(
+        [(OPENING_FENS[0], "white", "e2e4"), (OPENING_FENS[1], "black", "e7e5"), (ENDGAME_FEN, "black", "f7f6")],
+        start=1,
+    ):
+        moves.append(
+            {
+                "ply_number": ply,
+                "color": color,
+                "fen_before": fen,
+                "move_decision": {
+                    "move_uci": uci,
+                    "move_san": uci,
+                    "raw_response": "long raw text",
+                    "parse_ok": True,
+                    "is_legal": True,
+                    "retry_count": 0,
+                    "tokens_input": 10,
+                    "tokens_output": 2,
+                    "latency_ms": 100 * ply,
+                    "provider_model": f"{provider}-model" if color == "black" else "random",
+                    "cost_usd": 0.001,
+                },
+            }
+        )
+    payload = {
+        "experiment_id": run_dir.name,
+        "game_number": game_number,
+        "config_hash": "hash",
+        "seed": game_number,
+        "players": _players(provider),
+        "moves": moves,
+        "result": "0-1",
+        "termination": "checkmate",
+        "token_usage": {"input": 30, "output": 6},
+        "cost_usd": 0.003,
+        "duration_seconds": 1.0,
+        "timestamp_utc": "2026-03-01T10:00:00Z",
+    }
+    (run_dir / "games" / f"game_{game_number:04d}.json").write_text(json.dumps(payload), encoding="utf-8")
+
+
+def _players(provider: str) -> dict[str, dict[str, str]]:
+    return {
+        "white": {"type": "random", "name": "random_white"},
+        "black": {"type": "llm", "name": "llm_black", "provider": provider, "model": f"{provider}-model"},
+    }
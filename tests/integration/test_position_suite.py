@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from zugzwang.experiments.position_suite import PositionSuiteRunner, load_position_suite
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_load_position_suite_reads_builtin_tactics_and_epd(tmp_path: Path) -> None:
+    tactics = load_position_suite("tactics")
+    fork = next(case for case in tactics if case.position_id == "tact-fork-knight")
+    assert fork.best_moves_uci == ("h5f7",)
+
+    epd_path = tmp_path / "suite.epd"
+    epd_path.write_text(
+        "\n".join(
+            [
+                "# comment",
+                'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - bm e4; id "start";',
+                "8/8/4k3/8/2K1P3/8/8/8 w - - bm Kd4;",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    cases = load_position_suite(str(epd_path), max_positions=5)
+    assert [case.position_id for case in cases] == ["start", "suite-003"]
+    assert cases[0].best_moves_uci == ("e2e4",)
+    assert cases[1].best_moves_uci == ("c4d4",)
+
+
+def test_position_suite_runner_scores_stored_best_moves(tmp_path: Path) -> None:
+    epd_path = tmp_path / "suite.epd"
+    epd_path.write_text(
+        "\n".join(
+            [
+                'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - bm e4; id "start";',
+                'rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - bm e5; id "e4";',
+            ]
+        ),
+        encoding="utf-8",
+    )
+    runner = PositionSuiteRunner(
+        config_path=ROOT / "configs" / "baselines" / "best_known_start.yaml",
+        overrides=[
+            f"runtime.output_dir={tmp_path.as_posix()}",
+            f"position_suite.source={epd_path.as_posix()}",
+            "position_suite.concurrency=2",
+            "position_suite.scoring=stored",
+        ],
+    )
+    payload = runner.run()
+
+    assert payload["positions"] == 2
+    assert payload["scored"] == 2
+    assert payload["throughput"]["concurrency"] == 2
+
+    lines = Path(payload["positions_path"]).read_text(encoding="utf-8").splitlines()
+    rows = [json.loads(line) for line in lines]
+    assert [row["position_id"] for row in rows] == ["start", "e4"]
+    assert all(row["scoring"] == "stored" for row in rows)
+    assert all(row["is_legal"] for row in rows)
+
+    report = json.loads(Path(payload["report_path"]).read_text(encoding="utf-8"))
+    assert report["solved"] == sum(1 for row in rows if row["correct"])
+    run_meta = json.loads((Path(payload["run_dir"]) / "_run.json").read_text(encoding="utf-8"))
+    assert run_meta["run_mode"] == "position_suite"
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+from zugzwang.evaluation.material import MaterialEvaluator
+from zugzwang.evaluation.pipeline import evaluate_run_dir
+from zugzwang.experiments.runner import ExperimentRunner
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def _load_tool():  # type: ignore[no-untyped-def]
+    path = ROOT / "tools" / "generate_results_index.py"
+    spec = importlib.util.spec_from_file_location("generate_results_index", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    # Dataclasses look their module up in sys.modules while the class is created.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_catalog_and_files_sources_give_identical_entries(tmp_path: Path) -> None:
+    tool = _load_tool()
+    runs_root = tmp_path / "runs"
+    for config_name in ("best_known_start.yaml", "random_legal.yaml"):
+        runner = ExperimentRunner(
+            config_path=ROOT / "configs" / "baselines" / config_name,
+            overrides=[
+                "experiment.target_valid_games=1",
+                "experiment.max_games=1",
+                "runtime.max_plies=10",
+                f"runtime.output_dir={runs_root.as_posix()}",
+            ],
+        )
+        payload = runner.run()
+    evaluate_run_dir(payload["run_dir"], evaluator=MaterialEvaluator())
+
+    from_files = tool.build_index(runs_root=runs_root, limit=10)
+    from_catalog = tool.build_index_from_catalog(runs_root=runs_root, limit=10)
+
+    assert len(from_files) == 2
+    assert from_catalog == from_files
+    assert {entry.template_path.rsplit("/", 1)[-1] for entry in from_catalog} == {
+        "best_known_start.yaml",
+        "random_legal.yaml",
+    }
@@ -152,3 +152,54 @@ def test_mock_llm_direct_mode_with_hybrid_phase_router_enabled(tmp_path: Path) -
     assert payload["games_written"] == 1
     assert black_move["decision_mode"] == "hybrid_phase_router"
     assert roles[-1] == "aggregator"
+
+
+def test_trace_spans_write_chrome_trace_and_stage_timings(tmp_path: Path) -> None:
+    payload = _run_once(
+        "best_known_start.yaml",
+        tmp_path,
+        extra_overrides=["tracking.trace_spans=true", "strategy.rag.enabled=true"],
+    )
+    run_dir = Path(payload["run_dir"])
+    trace = json.loads((run_dir / "trace.json").read_text(encoding="utf-8"))
+    names = {event["name"] for event in trace["traceEvents"] if event["ph"] == "X"}
+    assert {"game", "choose_move", "prompt_build", "retrieval", "provider_call", "validation"} <= names
+    assert {"board_state", "board_update", "artifact_write"} <= names
+
+    report = json.loads((run_dir / "experiment_report.json").read_text(encoding="utf-8"))
+    provider_timing = report["stage_timings"]["provider_call"]
+    assert provider_timing["count"] > 0
+    assert provider_timing["p95_ms"] >= provider_timing["p50_ms"]
+
+
+def test_trace_spans_disabled_by_default(tmp_path: Path) -> None:
+    payload = _run_once("best_known_start.yaml", tmp_path)
+    run_dir = Path(payload["run_dir"])
+    assert not (run_dir / "trace.json").exists()
+    report = json.loads((run_dir / "experiment_report.json").read_text(encoding="utf-8"))
+    assert report["stage_timings"] == {}
+
+
+def test_memory_profile_writes_run_metadata_and_trace_counters(tmp_path: Path) -> None:
+    payload = _run_once(
+        "best_known_start.yaml",
+        tmp_path,
+        extra_overrides=[
+            "tracking.memory_profile=true",
+            "tracking.memory_interval_seconds=0.05",
+            "tracking.trace_spans=true",
+        ],
+    )
+    run_dir = Path(payload["run_dir"])
+    metadata = json.loads((run_dir / "_run.json").read_text(encoding="utf-8"))
+    memory = metadata["memory"]
+    assert memory["sample_count"] >= 2
+    assert memory["peak_rss_mb"] >= memory["start_rss_mb"] > 0
+    assert payload["peak_rss_mb"] == memory["peak_rss_mb"]
+    assert memory["tracemalloc"]["top_modules"]
+
+    trace = json.loads((run_dir / "trace.json").read_text(encoding="utf-8"))
+    counters = [event for event in trace["traceEvents"] if event["ph"] == "C"]
+    assert counters and all(event["args"]["rss_mb"] > 0 for event in counters)
+    report = json.loads((run_dir / "experiment_report.json").read_text(encoding="utf-8"))
+    assert "memory" not in report["stage_timings"]
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import chess
+import yaml
+
+from zugzwang.experiments.openings import assign_opening, load_opening_suite, parse_move_line
+from zugzwang.experiments.runner import ExperimentRunner
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_parse_move_line_accepts_numbered_san_and_uci() -> None:
+    assert parse_move_line("1.e4 e5 2.Nf3") == ["e2e4", "e7e5", "g1f3"]
+    assert parse_move_line("d2d4 d7d5") == ["d2d4", "d7d5"]
+
+
+def test_assign_opening_is_deterministic_and_color_balanced() -> None:
+    openings = load_opening_suite({"enabled": True, "positions": ["1.e4 c5", "1.d4 d5"]})
+
+    assignments = [assign_opening(openings, game_number) for game_number in range(1, 6)]
+
+    assert [item.opening_id for item in assignments] == [
+        "opening-001",
+        "opening-001",
+        "opening-002",
+        "opening-002",
+        "opening-001",
+    ]
+    assert [item.colors_swapped for item in assignments] == [False, True, False, True, False]
+    assert assign_opening(openings, 3) == assignments[2]
+
+
+def test_runner_starts_games_from_opening_suite(tmp_path: Path) -> None:
+    sicilian_fen = "rnbqkbnr/pp1ppppp/8/2p5/4P3/8/PPPP1PPP/RNBQKBNR w KQkq c6 0 2"
+    base = yaml.safe_load(
+        (ROOT / "configs" / "baselines" / "best_known_start.yaml").read_text(encoding="utf-8")
+    )
+    base["experiment"]["openings"] = {"enabled": True, "positions": [sicilian_fen]}
+    config_path = tmp_path / "openings.yaml"
+    config_path.write_text(yaml.safe_dump(base), encoding="utf-8")
+
+    runner = ExperimentRunner(
+        config_path=config_path,
+        overrides=[
+            "experiment.target_valid_games=2",
+            "experiment.max_games=2",
+            "runtime.max_plies=2",
+            f"runtime.output_dir={(tmp_path / 'runs').as_posix()}",
+        ],
+    )
+    payload = runner.run()
+
+    games_dir = Path(payload["run_dir"]) / "games"
+    first = json.loads((games_dir / "game_0001.json").read_text(encoding="utf-8"))
+    second = json.loads((games_dir / "game_0002.json").read_text(encoding="utf-8"))
+
+    assert first["moves"][0]["fen_before"] == chess.Board(sicilian_fen).fen()
+    assert first["opening"]["colors_swapped"] is False
+    assert second["opening"]["colors_swapped"] is True
+    assert first["players"]["black"]["type"] == "llm"
+    assert second["players"]["white"]["type"] == "llm"
+    report = json.loads((Path(payload["run_dir"]) / "experiment_report.json").read_text(encoding="utf-8"))
+    assert "duplicate_game_count" in report
+
+
+def test_opening_line_plies_match_prompt_transcripts(tmp_path: Path) -> None:
+    base = yaml.safe_load(
+        (ROOT / "configs" / "baselines" / "best_known_start.yaml").read_text(encoding="utf-8")
+    )
+    base["experiment"]["openings"] = {"enabled": True, "positions": ["1.e4 c5"]}
+    config_path = tmp_path / "openings.yaml"
+    config_path.write_text(yaml.safe_dump(base), encoding="utf-8")
+
+    runner = ExperimentRunner(
+        config_path=config_path,
+        overrides=[
+            "experiment.target_valid_games=1",
+            "experiment.max_games=1",
+            "runtime.max_plies=2",
+            "tracking.persist_prompt_transcripts=true",
+            f"runtime.output_dir={(tmp_path / 'runs').as_posix()}",
+        ],
+    )
+    payload = runner.run()
+
+    games_dir = Path(payload["run_dir"]) / "games"
+    game = json.loads((games_dir / "game_0001.json").read_text(encoding="utf-8"))
+    # Two opening plies were pre-played, so the first recorded move is ply 3.
+    assert [move["ply_number"] for move in game["moves"]] == [3, 4]
+    llm_plies = [move["ply_number"] for move in game["moves"] if move["color"] == "black"]
+    transcripts = sorted((games_dir / "game_0001" / "transcripts").glob("*.json"))
+    assert {int(path.name.split("_")[0]) for path in transcripts} == set(llm_plies)
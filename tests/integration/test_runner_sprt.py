@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from zugzwang.core.game import play_game as real_play_game
+from zugzwang.experiments.runner import ExperimentRunner
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_runner_stops_early_when_sprt_accepts_h0(tmp_path: Path, monkeypatch) -> None:
+    def losing_play_game(*args, **kwargs):  # type: ignore[no-untyped-def]
+        record = real_play_game(*args, **kwargs)
+        record.result = "1-0"
+        record.termination = "checkmate"
+        return record
+
+    monkeypatch.setattr("zugzwang.experiments.runner.play_game", losing_play_game)
+
+    config_path = ROOT / "configs" / "baselines" / "best_known_start.yaml"
+    runner = ExperimentRunner(
+        config_path=config_path,
+        overrides=[
+            "experiment.target_valid_games=40",
+            "experiment.max_games=40",
+            "runtime.max_plies=2",
+            f"runtime.output_dir={tmp_path.as_posix()}",
+            "runtime.sprt.enabled=true",
+            "runtime.sprt.player_color=black",
+            "runtime.sprt.min_games=4",
+        ],
+    )
+    payload = runner.run()
+
+    assert payload["stopped_due_to_sprt"] is True
+    assert payload["sprt_stop_reason"] == "sprt_accept_h0"
+    assert payload["games_written"] < 40
+
+    run_dir = Path(payload["run_dir"])
+    report = json.loads((run_dir / "experiment_report.json").read_text(encoding="utf-8"))
+    assert report["stopped_due_to_sprt"] is True
+    assert report["sprt_stop_reason"] == "sprt_accept_h0"
+    trajectory = report["sprt"]["llr_trajectory"]
+    assert len(trajectory) == payload["games_written"]
+    assert trajectory[-1]["llr"] <= report["sprt"]["lower_bound"]
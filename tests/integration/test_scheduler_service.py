@@ -1,9 +1,14 @@
 ﻿from __future__ import annotations
 
+import threading
+import time
 from pathlib import Path
 
+from zugzwang.api.services.file_watch import PollingWatcher
+from zugzwang.api.services.scheduler_daemon import SchedulerDaemon
 from zugzwang.api.services.scheduler_service import SchedulerService
 from zugzwang.api.types import ConfigTemplate, JobHandle, ResolvedConfigPreview
+from zugzwang.experiments.scheduler import infer_step_resources
 from zugzwang.infra.ids import timestamp_utc
 
 
@@ -39,6 +44,7 @@ class FakeRunService:
         self.counter = 0
         self.jobs: dict[str, dict] = {}
         self.started_steps: list[str] = []
+        self.completed_runs: dict[str, dict] = {}
 
     def start_run(self, config_path: str, model_profile=None, overrides=None, mode="run") -> JobHandle:  # type: ignore[no-untyped-def]
         self.counter += 1
@@ -68,6 +74,10 @@ class FakeRunService:
         self.started_steps.append(config_path)
         return handle
 
+    def find_completed_run(self, config_path: str, model_profile=None, overrides=None, mode="run"):  # type: ignore[no-untyped-def]
+        _ = (model_profile, overrides, mode)
+        return self.completed_runs.get(config_path)
+
     def get_job(self, job_id: str, refresh: bool = True):  # type: ignore[no-untyped-def]
         _ = refresh
         return self.jobs.get(job_id)
@@ -224,3 +234,216 @@ def test_scheduler_service_dry_run_does_not_start_jobs(tmp_path: Path) -> None:
     assert _step_status(batch, "b") == "dry_run"
     assert len(run_service.started_steps) == 0
     assert len(config_service.calls) == 2
+
+
+def test_scheduler_service_runs_independent_steps_in_parallel_within_limits(tmp_path: Path) -> None:
+    run_service = FakeRunService()
+    service = SchedulerService(
+        store_root=tmp_path / "scheduler",
+        run_service=run_service,
+        config_service=FakeConfigService(),
+    )
+
+    batch = service.create_batch(
+        steps=[
+            {"step_id": "a", "config_path": "configs/ablations/rag_off.yaml", "providers": ["openai"]},
+            {"step_id": "b", "config_path": "configs/ablations/rag_variants.yaml", "providers": ["openai"]},
+            {"step_id": "c", "config_path": "configs/ablations/protocol_direct.yaml", "providers": ["anthropic"]},
+            {"step_id": "d", "config_path": "configs/ablations/moa_capability.yaml", "engine_cores": 4},
+            {"step_id": "e", "config_path": "configs/ablations/context_history_on.yaml", "depends_on": ["a"]},
+        ],
+        fail_fast=False,
+        max_parallel_steps=3,
+        provider_limits={"openai": 1},
+    )
+
+    assert batch["max_parallel_steps"] == 3
+    assert [_step_status(batch, step_id) for step_id in "abcde"] == [
+        "running",
+        "pending",
+        "running",
+        "running",
+        "pending",
+    ]
+
+    run_service.set_status(_step_job_id(batch, "a"), "completed")
+    batch = service.get_batch(batch["batch_id"], refresh=True)
+    assert _step_status(batch, "b") == "running"
+    assert _step_status(batch, "e") == "pending"
+
+    run_service.set_status(_step_job_id(batch, "c"), "completed")
+    batch = service.get_batch(batch["batch_id"], refresh=True)
+    assert _step_status(batch, "e") == "running"
+
+
+def test_scheduler_engine_core_budget_limits_parallel_steps(tmp_path: Path) -> None:
+    run_service = FakeRunService()
+    service = SchedulerService(
+        store_root=tmp_path / "scheduler",
+        run_service=run_service,
+        config_service=FakeConfigService(),
+    )
+
+    batch = service.create_batch(
+        steps=[
+            {"step_id": "a", "config_path": "configs/ablations/rag_off.yaml", "engine_cores": 3},
+            {"step_id": "b", "config_path": "configs/ablations/rag_variants.yaml", "engine_cores": 2},
+            {"step_id": "c", "config_path": "configs/ablations/protocol_direct.yaml", "engine_cores": 1},
+        ],
+        max_parallel_steps=4,
+        max_engine_cores=4,
+    )
+
+    assert [_step_status(batch, step_id) for step_id in "abc"] == ["running", "pending", "running"]
+
+
+def test_infer_step_resources_reads_players() -> None:
+    providers, cores = infer_step_resources(
+        {
+            "players": {
+                "white": {"type": "engine", "threads": 2},
+                "black": {"type": "llm", "provider": "Kimi", "model": "kimi-k2.5"},
+            }
+        }
+    )
+
+    assert providers == ["kimicode"]
+    assert cores == 2
+
+
+def test_scheduler_daemon_advances_batches_on_exit_events(tmp_path: Path) -> None:
+    run_service = FakeRunService()
+    service = SchedulerService(
+        store_root=tmp_path / "scheduler",
+        run_service=run_service,
+        config_service=FakeConfigService(),
+    )
+    batch = service.create_batch(
+        steps=[
+            {"step_id": "a", "config_path": "configs/baselines/best_known_start.yaml"},
+            {"step_id": "b", "config_path": "configs/baselines/llm_vs_random_legal.yaml", "depends_on": ["a"]},
+        ],
+    )
+    status_dir = tmp_path / "status"
+    daemon = SchedulerDaemon(service, status_dir=status_dir, poll_seconds=30.0)
+    daemon.start()
+    try:
+        assert service.background_refresh is True
+        job_a = _step_job_id(batch, "a")
+        run_service.set_status(job_a, "completed")
+        # Reads are cheap while the daemon runs: nothing advances on GET.
+        assert _step_status(service.get_batch(batch["batch_id"]), "b") == "pending"
+
+        (status_dir / f"{job_a}.json").write_text('{"exit_code": 0}', encoding="utf-8")
+        deadline = time.monotonic() + 10.0
+        while time.monotonic() < deadline:
+            if _step_status(service.get_batch(batch["batch_id"]), "b") == "running":
+                break
+            time.sleep(0.05)
+    finally:
+        daemon.stop()
+
+    assert _step_status(service.get_batch(batch["batch_id"], refresh=False), "b") == "running"
+    assert service.background_refresh is False
+
+
+def test_polling_watcher_reports_written_files(tmp_path: Path) -> None:
+    watcher = PollingWatcher(tmp_path)
+    (tmp_path / "job-1.json").write_text("{}", encoding="utf-8")
+
+    assert watcher.wait(0.0) == ["job-1.json"]
+    assert watcher.wait(0.0) == []
+
+
+def test_scheduler_reuses_completed_run_unless_forced(tmp_path: Path) -> None:
+    run_service = FakeRunService()
+    run_service.completed_runs["configs/ablations/rag_off.yaml"] = {
+        "run_id": "rag_off-old",
+        "run_dir": "results/runs/rag_off-old",
+        "config_hash": "abc",
+    }
+    service = SchedulerService(
+        store_root=tmp_path / "scheduler",
+        run_service=run_service,
+        config_service=FakeConfigService(),
+    )
+
+    batch = service.create_batch(
+        steps=[
+            {"step_id": "a", "config_path": "configs/ablations/rag_off.yaml"},
+            {"step_id": "b", "config_path": "configs/ablations/rag_variants.yaml", "depends_on": ["a"]},
+        ],
+    )
+
+    assert _step_status(batch, "a") == "completed"
+    assert batch["steps"][0]["run_id"] == "rag_off-old"
+    assert batch["steps"][0]["job_id"] is None
+    assert batch["steps"][0]["message"] == "reused_completed_run:rag_off-old"
+    assert _step_status(batch, "b") == "running"
+    assert run_service.started_steps == ["configs/ablations/rag_variants.yaml"]
+
+    forced = service.create_batch(
+        steps=[{"step_id": "a", "config_path": "configs/ablations/rag_off.yaml", "force": True}],
+    )
+    assert _step_status(forced, "a") == "running"
+    assert run_service.started_steps[-1] == "configs/ablations/rag_off.yaml"
+
+
+def test_scheduler_starts_dependent_listed_before_cached_step(tmp_path: Path) -> None:
+    run_service = FakeRunService()
+    run_service.completed_runs["configs/ablations/rag_off.yaml"] = {
+        "run_id": "rag_off-old",
+        "run_dir": "results/runs/rag_off-old",
+    }
+    service = SchedulerService(
+        store_root=tmp_path / "scheduler",
+        run_service=run_service,
+        config_service=FakeConfigService(),
+    )
+
+    batch = service.create_batch(
+        steps=[
+            {"step_id": "b", "config_path": "configs/ablations/rag_variants.yaml", "depends_on": ["a"]},
+            {"step_id": "a", "config_path": "configs/ablations/rag_off.yaml"},
+        ],
+    )
+
+    assert _step_status(batch, "a") == "completed"
+    assert _step_status(batch, "b") == "running"
+    assert batch["status"] == "running"
+    assert run_service.started_steps == ["configs/ablations/rag_variants.yaml"]
+
+
+class SlowStartRunService(FakeRunService):
+    def start_run(self, config_path: str, model_profile=None, overrides=None, mode="run") -> JobHandle:  # type: ignore[no-untyped-def]
+        time.sleep(0.05)
+        return super().start_run(config_path, model_profile=model_profile, overrides=overrides, mode=mode)
+
+
+def test_scheduler_services_sharing_a_store_start_each_step_once(tmp_path: Path) -> None:
+    # Two services with separate in-process locks stand in for the API and an
+    # external `zugzwang scheduler` process; only the store's file lock is shared.
+    run_service = SlowStartRunService()
+    services = [
+        SchedulerService(store_root=tmp_path / "scheduler", run_service=run_service, config_service=FakeConfigService())
+        for _ in range(2)
+    ]
+    batch = services[0].create_batch(
+        steps=[
+            {"step_id": "a", "config_path": "configs/ablations/rag_off.yaml"},
+            {"step_id": "b", "config_path": "configs/ablations/rag_variants.yaml"},
+        ],
+        max_parallel_steps=1,
+    )
+    run_service.set_status(_step_job_id(batch, "a"), "completed")
+
+    threads = [
+        threading.Thread(target=service.get_batch, args=(batch["batch_id"],), kwargs={"refresh": True})
+        for service in services
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert run_service.started_steps == ["configs/ablations/rag_off.yaml", "configs/ablations/rag_variants.yaml"]
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from urllib.request import Request, urlopen
+
+import pytest
+
+from zugzwang.experiments.runner import ExperimentRunner
+from zugzwang.providers.anthropic import AnthropicProvider
+from zugzwang.providers.base import ProviderError, should_retry_provider_error
+from zugzwang.providers.openai import OpenAIProvider
+from zugzwang.providers.sim_server import SimServer
+
+
+ROOT = Path(__file__).resolve().parents[2]
+MESSAGES = [
+    {"role": "system", "content": "You play chess."},
+    {"role": "user", "content": "Legal moves (UCI): g1f3 e2e4\nReturn one move."},
+]
+FAST = {"latency_distribution": "fixed", "latency_ms": 0}
+
+
+def test_openai_and_anthropic_providers_round_trip_through_sim_server() -> None:
+    with SimServer(port=0, settings=FAST) as server:
+        openai = OpenAIProvider(base_url=f"{server.url}/v1", timeout_seconds=5)
+        response = openai.complete(MESSAGES, {"model": "gpt-test", "api_key": "test"})
+        assert response.text == "g1f3"
+        assert response.input_tokens > 0
+
+        anthropic = AnthropicProvider(base_url=server.url, timeout_seconds=5)
+        response = anthropic.complete(MESSAGES, {"model": "claude-test", "api_key": "test"})
+        assert response.text == "g1f3"
+        assert response.output_tokens > 0
+
+        assert server.stats()["requests"] == 2
+
+
+def test_injected_faults_are_classified_by_real_providers() -> None:
+    with SimServer(port=0, settings={**FAST, "retry_after_seconds": 3}) as server:
+        provider = OpenAIProvider(base_url=f"{server.url}/v1", timeout_seconds=5)
+
+        server.configure(rate_429=1.0)
+        with pytest.raises(ProviderError) as rate_limited:
+            provider.complete(MESSAGES, {"model": "gpt-test", "api_key": "test"})
+        assert rate_limited.value.status_code == 429
+        assert rate_limited.value.category == "rate_limit"
+        assert should_retry_provider_error(rate_limited.value)
+
+        server.configure(rate_429=0.0, rate_timeout=1.0, timeout_ms=300)
+        slow_client = OpenAIProvider(base_url=f"{server.url}/v1", timeout_seconds=0.1)
+        with pytest.raises(ProviderError) as timed_out:
+            slow_client.complete(MESSAGES, {"model": "gpt-test", "api_key": "test"})
+        assert timed_out.value.category in {"timeout", "network"}
+
+        server.configure(rate_timeout=0.0)
+        request = _post(server.url + "/v1/chat/completions", {"model": "m", "messages": MESSAGES}, outcome="timeout")
+        with pytest.raises(Exception) as raw_error:
+            urlopen(request, timeout=5)
+        assert raw_error.value.code == 504  # type: ignore[attr-defined]
+
+        rate_request = _post(server.url + "/v1/messages", {"model": "m", "messages": MESSAGES}, outcome="rate_limit")
+        with pytest.raises(Exception) as anthropic_error:
+            urlopen(rate_request, timeout=5)
+        assert anthropic_error.value.code == 429  # type: ignore[attr-defined]
+        assert anthropic_error.value.headers["Retry-After"] == "3"  # type: ignore[attr-defined]
+        body = json.loads(anthropic_error.value.read())  # type: ignore[attr-defined]
+        assert body["error"]["type"] == "rate_limit_error"
+
+
+def test_streaming_speaks_both_wire_formats() -> None:
+    with SimServer(port=0, settings=FAST) as server:
+        payload = {"model": "m", "messages": MESSAGES, "stream": True, "stream_options": {"include_usage": True}}
+        with urlopen(_post(server.url + "/v1/chat/completions", payload), timeout=5) as response:
+            lines = [line for line in response.read().decode("utf-8").splitlines() if line.startswith("data: ")]
+        assert lines[-1] == "data: [DONE]"
+        chunks = [json.loads(line[6:]) for line in lines[:-1]]
+        text = "".join(choice["delta"].get("content", "") for chunk in chunks for choice in chunk["choices"])
+        assert text == "g1f3"
+        assert chunks[-1]["usage"]["completion_tokens"] > 0
+
+        with urlopen(_post(server.url + "/v1/messages", {**payload, "max_tokens": 64}), timeout=5) as response:
+            body = response.read().decode("utf-8")
+        events = [line[7:] for line in body.splitlines() if line.startswith("event: ")]
+        assert events[0] == "message_start"
+        assert events[-1] == "message_stop"
+        deltas = [
+            json.loads(line[6:])["delta"]["text"]
+            for line in body.splitlines()
+            if line.startswith("data: ") and '"text_delta"' in line
+        ]
+        assert "".join(deltas) == "g1f3"
+
+
+def test_runner_plays_against_sim_server_through_zai_provider(tmp_path: Path, monkeypatch) -> None:
+    with SimServer(port=0, settings={**FAST, "rate_5xx": 0.5, "seed": 3}) as server:
+        for name, value in server.provider_env().items():
+            monkeypatch.setenv(name, value)
+        monkeypatch.setenv("ZAI_API_KEY", "test-zai-key")
+
+        runner = ExperimentRunner(
+            config_path=ROOT / "configs" / "baselines" / "best_known_start_zai_glm5.yaml",
+            overrides=[
+                "experiment.target_valid_games=1",
+                "experiment.max_games=1",
+                "runtime.max_plies=8",
+                "strategy.validation.provider_backoff_seconds=0",
+                "evaluation.auto.enabled=false",
+                f"runtime.output_dir={tmp_path.as_posix()}",
+            ],
+        )
+        payload = runner.run()
+        stats = server.stats()
+
+    assert payload["valid_games"] == 1
+    assert stats["faults"]["server"] > 0
+    assert stats["ok"] >= 4
+
+
+def _post(url: str, payload: dict, outcome: str | None = None) -> Request:
+    headers = {"Content-Type": "application/json"}
+    if outcome:
+        headers["X-Sim-Outcome"] = outcome
+    return Request(url, data=json.dumps(payload).encode("utf-8"), headers=headers, method="POST")
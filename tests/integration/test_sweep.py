@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from zugzwang.experiments.runner import RunSession
+from zugzwang.experiments.sweep import SweepRunner, expand_config_paths
+
+
+ROOT = Path(__file__).resolve().parents[2]
+CONFIGS = [
+    ROOT / "configs" / "ablations" / "context_history_off.yaml",
+    ROOT / "configs" / "ablations" / "context_history_on.yaml",
+]
+
+
+def test_expand_config_paths_resolves_globs_and_deduplicates() -> None:
+    pattern = (ROOT / "configs" / "ablations" / "context_history_o*.yaml").as_posix()
+
+    paths = expand_config_paths([pattern, CONFIGS[0]])
+
+    assert [path.name for path in paths] == ["context_history_off.yaml", "context_history_on.yaml"]
+
+
+def test_sweep_writes_one_run_dir_per_config(tmp_path: Path) -> None:
+    runner = SweepRunner(
+        config_paths=CONFIGS,
+        overrides=[
+            "runtime.max_plies=6",
+            f"runtime.output_dir={tmp_path.as_posix()}",
+        ],
+        max_concurrency=2,
+    )
+
+    payload = runner.run()
+
+    assert payload["configs"] == 2
+    assert payload["stopped_due_to_budget"] is False
+    run_dirs = {run["run_dir"] for run in payload["runs"]}
+    assert len(run_dirs) == 2
+    for run in payload["runs"]:
+        assert run["valid_games"] == 2
+        run_dir = Path(run["run_dir"])
+        assert len(list((run_dir / "games").glob("game_*.json"))) == 2
+        report = json.loads((run_dir / "experiment_report.json").read_text(encoding="utf-8"))
+        assert report["num_games_valid"] == 2
+
+
+def test_sweep_global_budget_stops_every_config(tmp_path: Path) -> None:
+    runner = SweepRunner(
+        config_paths=CONFIGS,
+        overrides=[
+            "runtime.max_plies=6",
+            f"runtime.output_dir={tmp_path.as_posix()}",
+        ],
+        budget_usd=0.0,
+    )
+
+    payload = runner.run()
+
+    assert payload["stopped_due_to_budget"] is True
+    for run in payload["runs"]:
+        assert run["games_written"] == 0
+        assert run["stopped_due_to_budget"] is True
+        assert run["budget_stop_reason"] == "sweep_budget_reached"
+
+
+def test_sweep_does_not_finalize_failed_runs(tmp_path: Path, monkeypatch) -> None:
+    play_game = RunSession.play_game
+
+    def _play_or_crash(session: RunSession, game_number: int):  # type: ignore[no-untyped-def]
+        if "history_off" in str(session.runner.config_path):
+            raise RuntimeError("engine crashed")
+        return play_game(session, game_number)
+
+    monkeypatch.setattr(RunSession, "play_game", _play_or_crash)
+    runner = SweepRunner(
+        config_paths=CONFIGS,
+        overrides=[
+            "runtime.max_plies=6",
+            f"runtime.output_dir={tmp_path.as_posix()}",
+        ],
+    )
+
+    failed, completed = runner.run()["runs"]
+
+    assert failed["status"] == "failed"
+    assert failed["error"] == "engine crashed"
+    assert not (Path(failed["run_dir"]) / "experiment_report.json").exists()
+    assert completed["valid_games"] == 2
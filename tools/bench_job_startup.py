@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from zugzwang.api.services.job_runtime import refresh_job
+from zugzwang.api.services.run_service import RunService
+from zugzwang.api.services.worker_pool import WorkerPool, set_active_pool
+
+
+DEFAULT_CONFIG = "configs/baselines/random_legal.yaml"
+
+
+def _launch_and_time(service: RunService, config_path: str, output_dir: Path, timeout: float) -> dict[str, Any]:
+    overrides = [
+        f"runtime.output_dir={output_dir.as_posix()}",
+        "evaluation.auto.enabled=false",
+        "experiment.target_valid_games=1",
+        "experiment.max_games=1",
+    ]
+    started = time.perf_counter()
+    handle = service.start_run(config_path=config_path, overrides=overrides, mode="run")
+    first_game = Path(handle.run_dir or "") / "games" / "game_0001.json"
+
+    first_move_seconds: float | None = None
+    deadline = started + timeout
+    while time.perf_counter() < deadline:
+        if first_move_seconds is None and first_game.exists():
+            first_move_seconds = time.perf_counter() - started
+        job = refresh_job(handle.job_id, jobs_path=service.jobs_path)
+        if job is not None and job.get("status") in {"completed", "failed", "canceled"}:
+            return {
+                "launcher": handle.meta.get("launcher"),
+                "status": job.get("status"),
+                "first_game_seconds": first_move_seconds,
+                "total_seconds": time.perf_counter() - started,
+            }
+        time.sleep(0.01)
+    raise TimeoutError(f"job {handle.job_id} did not finish within {timeout}s")
+
+
+def _summary(samples: list[dict[str, Any]]) -> dict[str, Any]:
+    first = [item["first_game_seconds"] for item in samples if item["first_game_seconds"] is not None]
+    total = [item["total_seconds"] for item in samples]
+    return {
+        "samples": len(samples),
+        "failed": sum(1 for item in samples if item["status"] != "completed"),
+        "first_game_median_seconds": round(statistics.median(first), 4) if first else None,
+        "total_median_seconds": round(statistics.median(total), 4) if total else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare cold-start vs pre-warmed worker pool latency for API-launched runs."
+    )
+    parser.add_argument("--config", default=DEFAULT_CONFIG)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--timeout-seconds", type=float, default=120.0)
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="zugzwang-bench-") as tmp:
+        tmp_path = Path(tmp)
+        service = RunService(jobs_path=tmp_path / "jobs.jsonl")
+
+        cold = [
+            _launch_and_time(service, args.config, tmp_path / "cold", args.timeout_seconds)
+            for _ in range(args.iterations)
+        ]
+        results["cold"] = _summary(cold)
+
+        pool = WorkerPool(1)
+        pool.start()
+        set_active_pool(pool)
+        try:
+            warm = []
+            for _ in range(args.iterations):
+                # Let the replacement worker finish importing, as it would between UI launches.
+                deadline = time.perf_counter() + args.timeout_seconds
+                while pool.idle_count < 1 and time.perf_counter() < deadline:
+                    time.sleep(0.05)
+                time.sleep(2.0)
+                warm.append(_launch_and_time(service, args.config, tmp_path / "warm", args.timeout_seconds))
+        finally:
+            set_active_pool(None)
+            pool.stop()
+        results["pool"] = _summary(warm)
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
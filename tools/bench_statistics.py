@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from typing import Any, Callable
+
+from zugzwang.analysis.statistics import bootstrap_acpl, compare_acpl, compare_win_rates, resolve_engine
+
+
+def _time(fn: Callable[[], Any], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the python and numpy statistics engines.")
+    parser.add_argument("--games", type=int, default=100, help="samples per run")
+    parser.add_argument("--iterations", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    wins_a = [rng.choice([0.0, 0.5, 1.0]) for _ in range(args.games)]
+    wins_b = [rng.choice([0.0, 0.0, 0.5, 1.0]) for _ in range(args.games)]
+    acpl_a = [rng.uniform(20.0, 90.0) for _ in range(args.games)]
+    acpl_b = [rng.uniform(30.0, 110.0) for _ in range(args.games)]
+
+    engines = ["python"]
+    if resolve_engine("auto") == "numpy":
+        engines.append("numpy")
+
+    results: dict[str, Any] = {"games": args.games, "iterations": args.iterations, "engines": {}}
+    for engine in engines:
+        kwargs = {"iterations": args.iterations, "seed": 42, "engine": engine}
+        compare_kwargs = {**kwargs, "permutations": args.iterations}
+        results["engines"][engine] = {
+            "bootstrap_acpl_seconds": round(_time(lambda: bootstrap_acpl(acpl_a, **kwargs), args.repeats), 4),
+            "compare_win_rates_seconds": round(
+                _time(lambda: compare_win_rates(wins_a, wins_b, **compare_kwargs), args.repeats), 4
+            ),
+            "compare_acpl_seconds": round(_time(lambda: compare_acpl(acpl_a, acpl_b, **compare_kwargs), args.repeats), 4),
+        }
+    if "numpy" in results["engines"]:
+        python_total = sum(results["engines"]["python"].values())
+        numpy_total = sum(results["engines"]["numpy"].values())
+        results["speedup"] = round(python_total / max(numpy_total, 1e-9), 1)
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
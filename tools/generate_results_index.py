@@ -2,10 +2,21 @@ from __future__ import annotations
 
 import argparse
 import json
-from dataclasses import dataclass
+import os
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
+
+
+# Files an entry is extracted from; their mtimes and sizes key the per-run cache.
+SOURCE_FILES: tuple[str, ...] = ("_run.json", "experiment_report.json", "experiment_report_evaluated.json")
+CACHE_FILENAME = "_results_index_cache.json"
+# Bump when RunIndexEntry or _extract_entry changes so cached entries are rebuilt.
+CACHE_VERSION = 1
+CATALOG_DB_RELATIVE = Path("_catalog") / "runs.sqlite3"
+
+IndexSource = Literal["auto", "catalog", "files"]
 
 
 @dataclass
@@ -89,14 +100,9 @@ def _parse_timestamp(value: str) -> datetime:
         return datetime.fromtimestamp(0, tz=timezone.utc)
 
 
-def _extract_entry(run_dir: Path) -> RunIndexEntry:
-    run_meta = _load_json(run_dir / "_run.json")
-    report = _load_json(run_dir / "experiment_report.json")
-    evaluated_report = _load_json(run_dir / "experiment_report_evaluated.json")
-
-    run_id = str(run_meta.get("run_id") or report.get("experiment_id") or run_dir.name)
+def _run_identity(run_meta: dict[str, Any]) -> tuple[str, str, str, str]:
+    """Created timestamp, config path and black provider/model from ``_run.json``."""
     created_at_utc = str(run_meta.get("created_at_utc") or "--")
-    config_hash = str(run_meta.get("config_hash") or report.get("config_hash") or "--")
 
     paths = run_meta.get("paths")
     config_path = "--"
@@ -113,6 +119,17 @@ def _extract_entry(run_dir: Path) -> RunIndexEntry:
             if isinstance(black, dict):
                 provider = str(black.get("provider") or "--")
                 model = str(black.get("model") or "--")
+    return created_at_utc, config_path, provider, model
+
+
+def _extract_entry(run_dir: Path) -> RunIndexEntry:
+    run_meta = _load_json(run_dir / "_run.json")
+    report = _load_json(run_dir / "experiment_report.json")
+    evaluated_report = _load_json(run_dir / "experiment_report_evaluated.json")
+
+    run_id = str(run_meta.get("run_id") or report.get("experiment_id") or run_dir.name)
+    config_hash = str(run_meta.get("config_hash") or report.get("config_hash") or "--")
+    created_at_utc, config_path, provider, model = _run_identity(run_meta)
 
     elo_estimate = _as_float(evaluated_report.get("elo_estimate")) or _as_float(report.get("elo_estimate"))
     acpl_overall = _as_float(evaluated_report.get("acpl_overall")) or _as_float(report.get("acpl_overall"))
@@ -134,22 +151,134 @@ def _extract_entry(run_dir: Path) -> RunIndexEntry:
     )
 
 
-def build_index(runs_root: Path, limit: int) -> list[RunIndexEntry]:
+def _source_signature(run_dir: Path) -> list[list[int] | None]:
+    signature: list[list[int] | None] = []
+    for name in SOURCE_FILES:
+        try:
+            file_stat = os.stat(run_dir / name)
+        except OSError:
+            signature.append(None)
+            continue
+        signature.append([file_stat.st_mtime_ns, file_stat.st_size])
+    return signature
+
+
+def _load_cache(cache_path: Path) -> dict[str, Any]:
+    cache = _load_json(cache_path)
+    if cache.get("version") != CACHE_VERSION or not isinstance(cache.get("runs"), dict):
+        return {}
+    return cache["runs"]
+
+
+def _save_cache(cache_path: Path, runs: dict[str, Any]) -> None:
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp_path.write_text(json.dumps({"version": CACHE_VERSION, "runs": runs}), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # A read-only results volume still gets an index, just without the cache.
+        tmp_path.unlink(missing_ok=True)
+
+
+def _entry_from_cache(item: Any) -> RunIndexEntry | None:
+    if not isinstance(item, dict) or not isinstance(item.get("entry"), dict):
+        return None
+    try:
+        return RunIndexEntry(**item["entry"])
+    except TypeError:
+        return None
+
+
+def build_index(
+    runs_root: Path,
+    limit: int,
+    cache_path: Path | None = None,
+    stats: dict[str, int] | None = None,
+) -> list[RunIndexEntry]:
+    """Entries for every run directory, newest first.
+
+    With ``cache_path`` an entry is only re-extracted when one of its
+    ``SOURCE_FILES`` changed (by mtime and size) since the previous build;
+    runs that no longer exist are dropped from the cache.
+    """
     if not runs_root.exists():
         return []
 
+    cached = _load_cache(cache_path) if cache_path is not None else {}
+    fresh: dict[str, Any] = {}
     entries: list[RunIndexEntry] = []
+    extracted = 0
     for run_dir in runs_root.iterdir():
         if not run_dir.is_dir():
             continue
         if run_dir.name.startswith("_"):
             continue
-        entries.append(_extract_entry(run_dir))
+        signature = _source_signature(run_dir)
+        previous = cached.get(run_dir.name)
+        entry = None
+        if isinstance(previous, dict) and previous.get("signature") == signature:
+            entry = _entry_from_cache(previous)
+        if entry is None:
+            entry = _extract_entry(run_dir)
+            extracted += 1
+        fresh[run_dir.name] = {"signature": signature, "entry": asdict(entry)}
+        entries.append(entry)
+
+    if cache_path is not None and (extracted or fresh.keys() != cached.keys()):
+        _save_cache(cache_path, fresh)
+    if stats is not None:
+        stats.update({"runs": len(entries), "extracted": extracted, "cached": len(entries) - extracted})
 
     entries.sort(key=lambda item: _parse_timestamp(item.created_at_utc), reverse=True)
     return entries[:limit]
 
 
+def build_index_from_catalog(runs_root: Path, limit: int) -> list[RunIndexEntry]:
+    """Entries from the API's run catalog, which is synced incrementally first.
+
+    Report metrics come from the catalog. Run identity (timestamp, config path,
+    black provider/model) comes from ``_run.json``, as in ``_extract_entry``, so
+    both sources render the same rows.
+    """
+    from zugzwang.api.services.artifact_service import ArtifactService
+
+    catalog = ArtifactService(root=runs_root).catalog
+    catalog.sync()
+    entries: list[RunIndexEntry] = []
+    for meta in catalog.query(sort_by="created_at_utc", sort_dir="desc", limit=limit):
+        run_meta = _load_json(Path(meta.run_dir) / "_run.json")
+        created_at_utc, config_path, provider, model = _run_identity(run_meta)
+        entries.append(
+            RunIndexEntry(
+                run_id=str(run_meta.get("run_id") or meta.run_id),
+                created_at_utc=created_at_utc,
+                config_hash=str(run_meta.get("config_hash") or meta.config_hash or "--"),
+                template_path=config_path,
+                provider=provider,
+                model=model,
+                games_valid=meta.num_games_valid,
+                games_target=meta.num_games_target,
+                completion_rate=meta.completion_rate,
+                acpl_overall=meta.acpl_overall,
+                elo_estimate=meta.elo_estimate,
+                total_cost_usd=meta.total_cost_usd,
+                evaluated_report_exists=meta.evaluated_report_exists,
+            )
+        )
+    entries.sort(key=lambda item: _parse_timestamp(item.created_at_utc), reverse=True)
+    return entries
+
+
+def _catalog_available(runs_root: Path) -> bool:
+    if not (runs_root / CATALOG_DB_RELATIVE).exists():
+        return False
+    try:
+        import zugzwang.api.services.artifact_service  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
 def build_markdown(entries: list[RunIndexEntry], runs_root: Path) -> str:
     generated_at = datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
     evaluated_count = sum(1 for item in entries if item.evaluated_report_exists)
@@ -230,6 +359,22 @@ def parse_args() -> argparse.Namespace:
         default=200,
         help="Maximum number of latest runs to include (default: 200).",
     )
+    parser.add_argument(
+        "--source",
+        choices=["auto", "catalog", "files"],
+        default="files",
+        help="Read run metadata from run files or the API run catalog (auto: catalog when present; default: files).",
+    )
+    parser.add_argument(
+        "--cache",
+        default=None,
+        help=f"Per-run entry cache for the files source (default: <runs-root>/{CACHE_FILENAME}).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-extract every run from its files.",
+    )
     return parser.parse_args()
 
 
@@ -239,12 +384,26 @@ def main() -> None:
     runs_root = (project_root / args.runs_root).resolve()
     output_path = (project_root / args.output).resolve()
 
-    entries = build_index(runs_root=runs_root, limit=max(1, args.limit))
+    limit = max(1, args.limit)
+    source: IndexSource = args.source
+    if source == "auto":
+        source = "catalog" if _catalog_available(runs_root) else "files"
+
+    if source == "catalog":
+        entries = build_index_from_catalog(runs_root=runs_root, limit=limit)
+        detail = "from run catalog"
+    else:
+        cache_path = None
+        if not args.no_cache:
+            cache_path = Path(args.cache).resolve() if args.cache else runs_root / CACHE_FILENAME
+        stats: dict[str, int] = {}
+        entries = build_index(runs_root=runs_root, limit=limit, cache_path=cache_path, stats=stats)
+        detail = f"{stats.get('extracted', 0)} re-extracted, {stats.get('cached', 0)} cached"
     markdown = build_markdown(entries=entries, runs_root=runs_root)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(markdown, encoding="utf-8")
-    print(f"Wrote {len(entries)} entries to {output_path}")
+    print(f"Wrote {len(entries)} entries to {output_path} ({detail})")
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import asdict, dataclass
 from typing import Callable
 
+from zugzwang.infra.tracing import span
 from zugzwang.providers.base import ProviderResponse
 from zugzwang.strategy.validator import validate_move_response
 
@@ -76,10 +77,11 @@ class CapabilityMoaOrchestrator:
         last_model = self._default_model
 
         for role in proposer_roles:
-            response = self._call_provider(
-                [{"role": "user", "content": _build_proposer_prompt(base_prompt, role)}],
-                role,
-            )
+            with span("moa_proposer", role=role):
+                response = self._call_provider(
+                    [{"role": "user", "content": _build_proposer_prompt(base_prompt, role)}],
+                    role,
+                )
             totals["provider_calls"] += 1
             totals["tokens_input"] += response.input_tokens
             totals["tokens_output"] += response.output_tokens
@@ -112,10 +114,11 @@ class CapabilityMoaOrchestrator:
             legal_moves_uci=legal_moves_uci,
             include_legal_moves=include_legal_moves_in_aggregator,
         )
-        response = self._call_provider(
-            [{"role": "user", "content": aggregator_prompt}],
-            "aggregator",
-        )
+        with span("moa_aggregator"):
+            response = self._call_provider(
+                [{"role": "user", "content": aggregator_prompt}],
+                "aggregator",
+            )
         totals["provider_calls"] += 1
         totals["tokens_input"] += response.input_tokens
         totals["tokens_output"] += response.output_tokens
@@ -1,4 +1,6 @@
-﻿from zugzwang.analysis.plots import ascii_histogram, format_ci_line
+﻿from zugzwang.analysis.dataset import MoveDataset, aggregate, query_moves, summarize_moves
+from zugzwang.analysis.leaderboard import LeaderboardReport, compare_many, generate_leaderboard_markdown
+from zugzwang.analysis.plots import ascii_histogram, format_ci_line
 from zugzwang.analysis.reports import RunComparisonReport, compare_runs, generate_markdown_report
 from zugzwang.analysis.statistics import (
     BootstrapCI,
@@ -12,13 +14,20 @@ from zugzwang.analysis.statistics import (
 __all__ = [
     "BootstrapCI",
     "ComparisonTest",
+    "LeaderboardReport",
+    "MoveDataset",
     "RunComparisonReport",
+    "aggregate",
     "ascii_histogram",
     "bootstrap_acpl",
     "bootstrap_win_rate",
     "compare_acpl",
+    "compare_many",
     "compare_runs",
     "compare_win_rates",
     "format_ci_line",
+    "generate_leaderboard_markdown",
     "generate_markdown_report",
+    "query_moves",
+    "summarize_moves",
 ]
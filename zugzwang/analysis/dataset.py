@@ -0,0 +1,477 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import gzip
+import json
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Iterable, Literal, Mapping
+
+import yaml
+
+from zugzwang.evaluation.move_quality import phase_from_fen
+from zugzwang.evaluation.pipeline import MOVE_EVALUATIONS_FILENAME
+from zugzwang.evaluation.player_color import infer_evaluation_player_color
+from zugzwang.experiments.io import load_game_records
+from zugzwang.infra.locks import file_lock
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+
+DATASET_DIRNAME = "_dataset"
+DATASET_SCHEMA_VERSION = 1
+META_FILENAME = "_meta.json"
+# Held for a whole sync; API requests and the CLI may sync the same store at once.
+SYNC_LOCK_FILENAME = ".sync.lock"
+
+DatasetFormat = Literal["parquet", "json.gz"]
+AggregateOp = Literal["mean", "sum", "count", "min", "max"]
+
+# Constant for every move of a run; stored once per partition and broadcast on read.
+RUN_COLUMNS: tuple[str, ...] = (
+    "run_id",
+    "experiment_name",
+    "config_hash",
+    "prompt_id",
+    "rag_enabled",
+    "protocol_mode",
+    "board_format",
+    "multi_agent_enabled",
+    "eval_player_color",
+)
+MOVE_COLUMNS: tuple[str, ...] = (
+    "game_number",
+    "ply_number",
+    "color",
+    "player_type",
+    "provider",
+    "model",
+    "provider_model",
+    "move_uci",
+    "move_san",
+    "parse_ok",
+    "is_legal",
+    "retry_count",
+    "tokens_input",
+    "tokens_output",
+    "latency_ms",
+    "provider_calls",
+    "feedback_level",
+    "error",
+    "cost_usd",
+    "retrieval_enabled",
+    "retrieval_hit_count",
+    "retrieval_latency_ms",
+    "retrieval_phase",
+    "decision_mode",
+    "phase",
+    "result",
+    "termination",
+)
+# Joined from ``move_evaluations.jsonl``; None for moves that were not evaluated.
+EVAL_COLUMNS: tuple[str, ...] = (
+    "cp_loss",
+    "best_move_uci",
+    "classification",
+    "is_best",
+    "is_blunder",
+)
+COLUMNS: tuple[str, ...] = RUN_COLUMNS + MOVE_COLUMNS + EVAL_COLUMNS
+
+SUMMARY_METRICS: dict[str, tuple[str, AggregateOp]] = {
+    "legal_rate": ("is_legal", "mean"),
+    "acpl": ("cp_loss", "mean"),
+    "blunder_rate": ("is_blunder", "mean"),
+    "best_move_rate": ("is_best", "mean"),
+    "avg_latency_ms": ("latency_ms", "mean"),
+    "cost_usd": ("cost_usd", "sum"),
+}
+
+Filter = Any | list[Any] | tuple[Any, ...] | set[Any] | Callable[[Any], bool]
+
+
+@dataclass
+class SyncResult:
+    updated: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+
+class MoveDataset:
+    """Columnar store of every move across runs, one partition per run.
+
+    Partitions live under ``<runs_root>/_dataset/moves/<run_id>/`` and are
+    rebuilt only when a run's games, config or move evaluations change, so a
+    sync after a run finishes re-reads that run alone. Data is written as
+    Parquet when ``pyarrow`` is installed and as gzipped JSON columns otherwise.
+    """
+
+    def __init__(self, runs_root: str | Path = "results/runs", store_dir: str | Path | None = None) -> None:
+        self.runs_root = Path(runs_root)
+        self.store_dir = Path(store_dir) if store_dir is not None else self.runs_root / DATASET_DIRNAME / "moves"
+
+    def sync(self, *, full: bool = False) -> SyncResult:
+        with file_lock(self.store_dir / SYNC_LOCK_FILENAME):
+            return self._sync(full=full)
+
+    def _sync(self, *, full: bool) -> SyncResult:
+        runs = {run_dir.name: run_dir for run_dir in _iter_run_dirs(self.runs_root)}
+        result = SyncResult()
+        for run_id, run_dir in sorted(runs.items()):
+            fingerprint = _run_fingerprint(run_dir)
+            meta = self._read_meta(run_id)
+            if not full and meta is not None and _is_current(meta, fingerprint):
+                result.unchanged += 1
+                continue
+            self._write_partition(run_id, run_dir, fingerprint)
+            result.updated.append(run_id)
+
+        if self.store_dir.exists():
+            for partition in sorted(self.store_dir.iterdir()):
+                if partition.is_dir() and partition.name not in runs:
+                    shutil.rmtree(partition, ignore_errors=True)
+                    result.removed.append(partition.name)
+        return result
+
+    def run_ids(self) -> list[str]:
+        if not self.store_dir.exists():
+            return []
+        return sorted(path.name for path in self.store_dir.iterdir() if (path / META_FILENAME).exists())
+
+    def read(
+        self,
+        columns: Iterable[str] | None = None,
+        filters: Mapping[str, Filter] | None = None,
+    ) -> dict[str, list[Any]]:
+        """Return ``{column: values}`` for matching moves across all partitions."""
+        selected = list(columns) if columns is not None else list(COLUMNS)
+        filters = dict(filters or {})
+        unknown = sorted((set(selected) | set(filters)) - set(COLUMNS))
+        if unknown:
+            raise ValueError(f"Unknown dataset columns: {', '.join(unknown)}")
+
+        run_filters = {name: value for name, value in filters.items() if name in RUN_COLUMNS}
+        move_filters = {name: value for name, value in filters.items() if name not in RUN_COLUMNS}
+        needed = [name for name in dict.fromkeys(selected + list(move_filters)) if name not in RUN_COLUMNS]
+
+        output: dict[str, list[Any]] = {name: [] for name in selected}
+        for run_id in self.run_ids():
+            meta = self._read_meta(run_id)
+            if meta is None:
+                continue
+            constants = meta["run"]
+            # Run-level filters prune whole partitions without touching their data.
+            if not all(_matches(constants.get(name), value) for name, value in run_filters.items()):
+                continue
+            data = self._read_data(run_id, meta, needed)
+            mask = [True] * int(meta["row_count"])
+            for name, value in move_filters.items():
+                mask = [keep and _matches(item, value) for keep, item in zip(mask, data[name])]
+            count = sum(mask)
+            if not count:
+                continue
+            for name in selected:
+                if name in RUN_COLUMNS:
+                    output[name].extend([constants.get(name)] * count)
+                else:
+                    output[name].extend(item for keep, item in zip(mask, data[name]) if keep)
+        return output
+
+    def _partition_dir(self, run_id: str) -> Path:
+        return self.store_dir / run_id
+
+    def _read_meta(self, run_id: str) -> dict[str, Any] | None:
+        path = self._partition_dir(run_id) / META_FILENAME
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        return payload if isinstance(payload, dict) else None
+
+    def _write_partition(self, run_id: str, run_dir: Path, fingerprint: list[Any]) -> None:
+        constants, columns = _build_run_columns(run_id, run_dir)
+        partition = self._partition_dir(run_id)
+        partition.mkdir(parents=True, exist_ok=True)
+        (partition / META_FILENAME).unlink(missing_ok=True)
+        # Temp files are dot-prefixed, so "moves.*" only matches finished data files;
+        # temp files left by an interrupted sync are cleared as well.
+        for stale in [*partition.glob("moves.*"), *partition.glob(".*.tmp")]:
+            stale.unlink(missing_ok=True)
+
+        data_format: DatasetFormat = "parquet" if pq is not None else "json.gz"
+        data_path = partition / f"moves.{data_format}"
+        tmp_path = _unique_tmp_path(data_path)
+        if data_format == "parquet":
+            pq.write_table(pa.table(columns), tmp_path)
+        else:
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as handle:
+                json.dump(columns, handle, separators=(",", ":"))
+        os.replace(tmp_path, data_path)
+
+        meta = {
+            "schema_version": DATASET_SCHEMA_VERSION,
+            "run_id": run_id,
+            "format": data_format,
+            "fingerprint": fingerprint,
+            "row_count": len(columns["game_number"]),
+            "run": constants,
+        }
+        # Meta goes last: a partition without it is treated as missing.
+        meta_path = partition / META_FILENAME
+        tmp_meta_path = _unique_tmp_path(meta_path)
+        tmp_meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        os.replace(tmp_meta_path, meta_path)
+
+    def _read_data(self, run_id: str, meta: dict[str, Any], columns: list[str]) -> dict[str, list[Any]]:
+        data_path = self._partition_dir(run_id) / f"moves.{meta['format']}"
+        if meta["format"] == "parquet":
+            return pq.read_table(data_path, columns=columns).to_pydict()
+        with gzip.open(data_path, "rt", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        return {name: payload[name] for name in columns}
+
+
+def query_moves(
+    runs_root: str | Path = "results/runs",
+    *,
+    columns: Iterable[str] | None = None,
+    filters: Mapping[str, Filter] | None = None,
+    sync: bool = True,
+) -> dict[str, list[Any]]:
+    """Columns of every matching move across runs, syncing changed runs first.
+
+    Filters map a column to a value, a collection of allowed values or a
+    predicate, e.g. ``{"provider": "zai", "rag_enabled": True}``.
+    """
+    dataset = MoveDataset(runs_root)
+    if sync:
+        dataset.sync()
+    return dataset.read(columns=columns, filters=filters)
+
+
+def aggregate(
+    table: Mapping[str, list[Any]],
+    by: Iterable[str],
+    metrics: Mapping[str, tuple[str, AggregateOp]],
+) -> list[dict[str, Any]]:
+    """Group a column table and reduce columns, ignoring None values.
+
+    ``metrics`` maps an output name to ``(column, op)``; for example
+    ``{"blunder_rate": ("is_blunder", "mean")}`` over ``by=["phase"]``.
+    """
+    keys = list(by)
+    missing = sorted({*keys, *(column for column, _ in metrics.values())} - set(table))
+    if missing:
+        raise ValueError(f"Columns missing from table: {', '.join(missing)}")
+    row_count = len(next(iter(table.values()))) if table else 0
+
+    groups: dict[tuple[Any, ...], list[int]] = {}
+    for index in range(row_count):
+        groups.setdefault(tuple(table[key][index] for key in keys), []).append(index)
+
+    rows: list[dict[str, Any]] = []
+    for group_key in sorted(groups, key=lambda item: tuple((value is None, str(value)) for value in item)):
+        indices = groups[group_key]
+        row: dict[str, Any] = dict(zip(keys, group_key))
+        row["moves"] = len(indices)
+        for name, (column, op) in metrics.items():
+            values = [table[column][index] for index in indices if table[column][index] is not None]
+            row[name] = _reduce(values, op)
+        rows.append(row)
+    return rows
+
+
+def summarize_moves(
+    dataset: MoveDataset,
+    by: Iterable[str],
+    filters: Mapping[str, Filter] | None = None,
+) -> list[dict[str, Any]]:
+    """Move-quality and cost summary per group, e.g. ``by=["provider", "phase"]``."""
+    keys = list(by)
+    columns = dict.fromkeys([*keys, *(column for column, _ in SUMMARY_METRICS.values())])
+    return aggregate(dataset.read(columns=list(columns), filters=filters), keys, SUMMARY_METRICS)
+
+
+def _reduce(values: list[Any], op: AggregateOp) -> Any:
+    if op == "count":
+        return len(values)
+    if not values:
+        return None
+    if op == "mean":
+        return float(sum(values) / len(values))
+    if op == "sum":
+        return sum(values)
+    if op == "min":
+        return min(values)
+    if op == "max":
+        return max(values)
+    raise ValueError(f"Unsupported aggregate op: {op}")
+
+
+def _matches(value: Any, expected: Filter) -> bool:
+    if callable(expected):
+        return bool(expected(value))
+    if isinstance(expected, (list, tuple, set, frozenset)):
+        return value in expected
+    return value == expected
+
+
+def _unique_tmp_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp")
+
+
+def _iter_run_dirs(runs_root: Path) -> list[Path]:
+    if not runs_root.exists():
+        return []
+    return [
+        path
+        for path in sorted(runs_root.iterdir())
+        if path.is_dir() and not path.name.startswith(("_", ".")) and (path / "games").is_dir()
+    ]
+
+
+def _run_fingerprint(run_dir: Path) -> list[Any]:
+    # Stat-only so an unchanged run costs a directory listing, not a parse.
+    game_count = 0
+    newest_game = 0
+    total_size = 0
+    for path in (run_dir / "games").glob("game_*.json"):
+        stat = path.stat()
+        game_count += 1
+        newest_game = max(newest_game, stat.st_mtime_ns)
+        total_size += stat.st_size
+    extras = []
+    for name in ("resolved_config.yaml", MOVE_EVALUATIONS_FILENAME):
+        try:
+            stat = (run_dir / name).stat()
+        except OSError:
+            extras.append(None)
+            continue
+        extras.append([stat.st_mtime_ns, stat.st_size])
+    return [game_count, newest_game, total_size, *extras]
+
+
+def _is_current(meta: dict[str, Any], fingerprint: list[Any]) -> bool:
+    if meta.get("schema_version") != DATASET_SCHEMA_VERSION or meta.get("fingerprint") != fingerprint:
+        return False
+    # Parquet partitions written elsewhere are unreadable without pyarrow; rebuild them.
+    return meta.get("format") != "parquet" or pq is not None
+
+
+def _build_run_columns(run_id: str, run_dir: Path) -> tuple[dict[str, Any], dict[str, list[Any]]]:
+    records = load_game_records(run_dir / "games")
+    config = _load_yaml(run_dir / "resolved_config.yaml")
+    constants = _run_constants(run_id, config, config_hash=records[0].config_hash if records else None)
+    evaluations = _load_move_evaluations(run_dir / MOVE_EVALUATIONS_FILENAME)
+
+    columns: dict[str, list[Any]] = {name: [] for name in MOVE_COLUMNS + EVAL_COLUMNS}
+    for record in records:
+        for move in record.moves:
+            decision = move.move_decision
+            player = record.players.get(move.color) if isinstance(record.players, dict) else None
+            player = player if isinstance(player, dict) else {}
+            evaluation = evaluations.get((record.game_number, move.ply_number), {})
+            row = {
+                "game_number": record.game_number,
+                "ply_number": move.ply_number,
+                "color": move.color,
+                "player_type": _as_str(player.get("type")),
+                "provider": _as_str(player.get("provider")),
+                "model": _as_str(player.get("model")),
+                "provider_model": decision.provider_model,
+                "move_uci": decision.move_uci,
+                "move_san": decision.move_san,
+                "parse_ok": decision.parse_ok,
+                "is_legal": decision.is_legal,
+                "retry_count": decision.retry_count,
+                "tokens_input": decision.tokens_input,
+                "tokens_output": decision.tokens_output,
+                "latency_ms": decision.latency_ms,
+                "provider_calls": decision.provider_calls,
+                "feedback_level": decision.feedback_level,
+                "error": decision.error,
+                "cost_usd": decision.cost_usd,
+                "retrieval_enabled": decision.retrieval_enabled,
+                "retrieval_hit_count": decision.retrieval_hit_count,
+                "retrieval_latency_ms": decision.retrieval_latency_ms,
+                "retrieval_phase": decision.retrieval_phase,
+                "decision_mode": decision.decision_mode,
+                "phase": _safe_phase(move.fen_before),
+                "result": record.result,
+                "termination": record.termination,
+            }
+            for name in EVAL_COLUMNS:
+                row[name] = evaluation.get(name)
+            for name, values in columns.items():
+                values.append(row[name])
+    return constants, columns
+
+
+def _run_constants(run_id: str, config: dict[str, Any] | None, *, config_hash: str | None) -> dict[str, Any]:
+    config = config or {}
+    experiment = _as_dict(config.get("experiment"))
+    strategy = _as_dict(config.get("strategy"))
+    protocol = _as_dict(config.get("protocol"))
+    requested_color = _as_str(_as_dict(_as_dict(config.get("evaluation")).get("auto")).get("player_color")) or "auto"
+    try:
+        eval_player_color: str | None = infer_evaluation_player_color(config, requested_color)[0] if config else None
+    except ValueError:
+        eval_player_color = None
+    return {
+        "run_id": run_id,
+        "experiment_name": _as_str(experiment.get("name")),
+        "config_hash": _as_str(config_hash),
+        "prompt_id": _as_str(strategy.get("system_prompt_id_effective")) or _as_str(strategy.get("system_prompt_id")),
+        "rag_enabled": bool(_as_dict(strategy.get("rag")).get("enabled", False)),
+        "protocol_mode": _as_str(protocol.get("mode")),
+        "board_format": _as_str(strategy.get("board_format")),
+        "multi_agent_enabled": bool(_as_dict(strategy.get("multi_agent")).get("enabled", False)),
+        "eval_player_color": eval_player_color,
+    }
+
+
+def _load_move_evaluations(path: Path) -> dict[tuple[int, int], dict[str, Any]]:
+    if not path.exists():
+        return {}
+    rows: dict[tuple[int, int], dict[str, Any]] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if not line.strip():
+            continue
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(payload, dict) and "game_number" in payload and "ply_number" in payload:
+            rows[(int(payload["game_number"]), int(payload["ply_number"]))] = payload
+    return rows
+
+
+def _safe_phase(fen: str) -> str | None:
+    try:
+        return phase_from_fen(fen)
+    except ValueError:
+        return None
+
+
+def _load_yaml(path: Path) -> dict[str, Any] | None:
+    if not path.exists():
+        return None
+    raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+    return raw if isinstance(raw, dict) else None
+
+
+def _as_dict(value: Any) -> dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+def _as_str(value: Any) -> str | None:
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return None
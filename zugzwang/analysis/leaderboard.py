@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Sequence
+import zlib
+
+from zugzwang.analysis.reports import RunSample, load_run_sample, run_sample_to_dict
+from zugzwang.analysis.statistics import (
+    DEFAULT_ENGINE,
+    BootstrapCI,
+    BootstrapDistribution,
+    ComparisonTest,
+    PValueCorrection,
+    StatsEngine,
+    adjust_p_values,
+    bootstrap_distribution,
+    compare_distributions,
+    resolve_engine,
+)
+
+
+@dataclass(frozen=True)
+class PairwiseComparison:
+    run_a: str
+    run_b: str
+    test: ComparisonTest
+    p_adjusted: float
+    significant: bool
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "run_a": self.run_a,
+            "run_b": self.run_b,
+            "mean_a": self.test.mean_a,
+            "mean_b": self.test.mean_b,
+            "delta": self.test.delta,
+            "ci_low": self.test.ci_low,
+            "ci_high": self.test.ci_high,
+            "p_value": self.test.p_value,
+            "p_adjusted": self.p_adjusted,
+            "effect_size": self.test.effect_size,
+            "effect_size_name": self.test.effect_size_name,
+            "effect_size_magnitude": self.test.effect_size_magnitude,
+            "significant": self.significant,
+        }
+
+
+@dataclass(frozen=True)
+class LeaderboardEntry:
+    rank: int
+    run: RunSample
+    win_rate: BootstrapCI
+    acpl: BootstrapCI | None
+    win_rate_wins: int
+    win_rate_losses: int
+    acpl_wins: int
+    acpl_losses: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "rank": self.rank,
+            "run": run_sample_to_dict(self.run),
+            "win_rate": _ci_to_dict(self.win_rate),
+            "acpl": _ci_to_dict(self.acpl) if self.acpl is not None else None,
+            "win_rate_wins": self.win_rate_wins,
+            "win_rate_losses": self.win_rate_losses,
+            "acpl_wins": self.acpl_wins,
+            "acpl_losses": self.acpl_losses,
+        }
+
+
+@dataclass(frozen=True)
+class LeaderboardReport:
+    comparison_id: str
+    created_at_utc: str
+    entries: list[LeaderboardEntry]
+    win_rate_pairs: list[PairwiseComparison]
+    acpl_pairs: list[PairwiseComparison]
+    correction: str
+    alpha: float
+    confidence: float
+    iterations: int
+    permutations: int
+    seed: int
+    engine: str
+    notes: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "kind": "leaderboard",
+            "comparison_id": self.comparison_id,
+            "created_at_utc": self.created_at_utc,
+            "settings": {
+                "correction": self.correction,
+                "alpha": self.alpha,
+                "confidence": self.confidence,
+                "iterations": self.iterations,
+                "permutations": self.permutations,
+                "seed": self.seed,
+                "engine": self.engine,
+            },
+            "entries": [entry.to_dict() for entry in self.entries],
+            "pairwise": {
+                "win_rate": [pair.to_dict() for pair in self.win_rate_pairs],
+                "acpl": [pair.to_dict() for pair in self.acpl_pairs],
+            },
+            "notes": list(self.notes),
+        }
+
+
+def compare_many(
+    runs: Sequence[str | Path],
+    *,
+    runs_root: str | Path = "results/runs",
+    comparison_id: str | None = None,
+    iterations: int = 10_000,
+    permutations: int = 10_000,
+    confidence: float = 0.95,
+    alpha: float = 0.05,
+    seed: int = 42,
+    correction: PValueCorrection = "holm",
+    engine: StatsEngine = DEFAULT_ENGINE,
+) -> LeaderboardReport:
+    """Rank runs by pairwise significance, loading and bootstrapping each run once.
+
+    Every run's bootstrap distribution is drawn once with its own seed (derived
+    from ``seed`` and the run id) and reused for all of its pairs; p-values are
+    corrected across the pairwise family of each metric.
+    """
+    if len(runs) < 2:
+        raise ValueError("leaderboard needs at least two runs")
+    root = Path(runs_root)
+    engine_name = resolve_engine(engine)
+
+    samples: list[RunSample] = []
+    for run_ref in runs:
+        sample = load_run_sample(run_ref, runs_root=root)
+        if any(existing.run_id == sample.run_id for existing in samples):
+            raise ValueError(f"Run listed more than once: {sample.run_id}")
+        samples.append(sample)
+
+    win_dists: dict[str, BootstrapDistribution] = {}
+    acpl_dists: dict[str, BootstrapDistribution] = {}
+    for sample in samples:
+        run_seed = _run_seed(seed, sample.run_id)
+        win_dists[sample.run_id] = bootstrap_distribution(
+            sample.win_scores, metric_name="win_rate", iterations=iterations, seed=run_seed, engine=engine_name
+        )
+        if sample.acpl_values:
+            acpl_dists[sample.run_id] = bootstrap_distribution(
+                sample.acpl_values, metric_name="acpl", iterations=iterations, seed=run_seed, engine=engine_name
+            )
+
+    common: dict[str, Any] = {
+        "permutations": permutations,
+        "confidence": confidence,
+        "alpha": alpha,
+        "seed": seed,
+        "correction": correction,
+    }
+    win_rate_pairs = _pairwise(win_dists, **common)
+    acpl_pairs = _pairwise(acpl_dists, **common)
+
+    records = {sample.run_id: [0, 0, 0, 0] for sample in samples}
+    for pair in win_rate_pairs:
+        if pair.significant:
+            winner, loser = (pair.run_a, pair.run_b) if pair.test.delta > 0 else (pair.run_b, pair.run_a)
+            records[winner][0] += 1
+            records[loser][1] += 1
+    for pair in acpl_pairs:
+        if pair.significant:
+            winner, loser = (pair.run_a, pair.run_b) if pair.test.delta < 0 else (pair.run_b, pair.run_a)
+            records[winner][2] += 1
+            records[loser][3] += 1
+
+    def sort_key(sample: RunSample) -> tuple[float, ...]:
+        wins, losses, acpl_wins, acpl_losses = records[sample.run_id]
+        acpl = acpl_dists.get(sample.run_id)
+        return (
+            -(wins - losses),
+            -(acpl_wins - acpl_losses),
+            -win_dists[sample.run_id].mean,
+            acpl.mean if acpl is not None else float("inf"),
+        )
+
+    entries = [
+        LeaderboardEntry(
+            rank=rank,
+            run=sample,
+            win_rate=win_dists[sample.run_id].ci(confidence),
+            acpl=acpl_dists[sample.run_id].ci(confidence) if sample.run_id in acpl_dists else None,
+            win_rate_wins=records[sample.run_id][0],
+            win_rate_losses=records[sample.run_id][1],
+            acpl_wins=records[sample.run_id][2],
+            acpl_losses=records[sample.run_id][3],
+        )
+        for rank, sample in enumerate(sorted(samples, key=sort_key), start=1)
+    ]
+
+    notes: list[str] = []
+    small = [sample.run_id for sample in samples if sample.valid_games < 10]
+    if small:
+        notes.append(f"Low game count (<10 valid games) for: {', '.join(small)}.")
+    missing_acpl = [sample.run_id for sample in samples if sample.run_id not in acpl_dists]
+    if missing_acpl:
+        notes.append(f"ACPL unavailable (no evaluated report) for: {', '.join(missing_acpl)}.")
+
+    created_at_utc = datetime.now(tz=UTC).isoformat().replace("+00:00", "Z")
+    return LeaderboardReport(
+        comparison_id=comparison_id or _default_leaderboard_id(len(samples)),
+        created_at_utc=created_at_utc,
+        entries=entries,
+        win_rate_pairs=win_rate_pairs,
+        acpl_pairs=acpl_pairs,
+        correction=correction,
+        alpha=alpha,
+        confidence=confidence,
+        iterations=iterations,
+        permutations=permutations,
+        seed=seed,
+        engine=engine_name,
+        notes=notes,
+    )
+
+
+def generate_leaderboard_markdown(report: LeaderboardReport) -> str:
+    lines: list[str] = [
+        "# Run Leaderboard",
+        "",
+        f"- Comparison ID: `{report.comparison_id}`",
+        f"- Generated at (UTC): `{report.created_at_utc}`",
+        f"- Runs: {len(report.entries)}",
+        f"- Correction: {report.correction} at alpha={report.alpha}",
+    ]
+    if report.notes:
+        lines.append("- Notes:")
+        for note in report.notes:
+            lines.append(f"  - {note}")
+
+    lines.extend(
+        [
+            "",
+            "## Ranking",
+            "",
+            "| Rank | Run | Valid games | Win rate [CI] | ACPL [CI] | Win-rate W/L | ACPL W/L |",
+            "|---:|---|---:|---|---|---|---|",
+        ]
+    )
+    for entry in report.entries:
+        acpl = (
+            f"{entry.acpl.mean:.1f} [{entry.acpl.ci_low:.1f}, {entry.acpl.ci_high:.1f}]"
+            if entry.acpl is not None
+            else "n/a"
+        )
+        lines.append(
+            f"| {entry.rank} | `{entry.run.run_id}` | {entry.run.valid_games} | "
+            f"{entry.win_rate.mean:.3f} [{entry.win_rate.ci_low:.3f}, {entry.win_rate.ci_high:.3f}] | {acpl} | "
+            f"{entry.win_rate_wins}/{entry.win_rate_losses} | {entry.acpl_wins}/{entry.acpl_losses} |"
+        )
+
+    for title, pairs in (("Win rate", report.win_rate_pairs), ("ACPL", report.acpl_pairs)):
+        significant = [pair for pair in pairs if pair.significant]
+        lines.extend(["", f"## Significant {title} Differences", ""])
+        if not significant:
+            lines.append("None after correction.")
+            continue
+        for pair in significant:
+            lines.append(
+                f"- `{pair.run_a}` vs `{pair.run_b}`: delta={pair.test.delta:.4f}, "
+                f"CI=[{pair.test.ci_low:.4f}, {pair.test.ci_high:.4f}], "
+                f"p={pair.test.p_value:.4f}, adjusted p={pair.p_adjusted:.4f}"
+            )
+    return "\n".join(lines).strip() + "\n"
+
+
+def _pairwise(
+    dists: dict[str, BootstrapDistribution],
+    *,
+    permutations: int,
+    confidence: float,
+    alpha: float,
+    seed: int,
+    correction: PValueCorrection,
+) -> list[PairwiseComparison]:
+    run_ids = list(dists)
+    tests: list[tuple[str, str, ComparisonTest]] = []
+    for index, run_a in enumerate(run_ids):
+        for run_b in run_ids[index + 1 :]:
+            test = compare_distributions(
+                dists[run_a],
+                dists[run_b],
+                permutations=permutations,
+                confidence=confidence,
+                alpha=alpha,
+                seed=seed,
+            )
+            tests.append((run_a, run_b, test))
+
+    adjusted = adjust_p_values([test.p_value for _, _, test in tests], correction)
+    return [
+        PairwiseComparison(run_a=run_a, run_b=run_b, test=test, p_adjusted=p_adj, significant=bool(p_adj < alpha))
+        for (run_a, run_b, test), p_adj in zip(tests, adjusted)
+    ]
+
+
+def _run_seed(seed: int, run_id: str) -> int:
+    # Distinct per run so paired draws from two distributions stay independent.
+    return (seed * 1_000_003 + zlib.crc32(run_id.encode("utf-8"))) % (2**32)
+
+
+def _ci_to_dict(ci: BootstrapCI) -> dict[str, Any]:
+    return {
+        "mean": ci.mean,
+        "ci_low": ci.ci_low,
+        "ci_high": ci.ci_high,
+        "confidence": ci.confidence,
+        "sample_size": ci.sample_size,
+    }
+
+
+def _default_leaderboard_id(run_count: int) -> str:
+    stamp = datetime.now(tz=UTC).strftime("%Y%m%dT%H%M%SZ")
+    return f"leaderboard-{run_count}runs-{stamp}"
@@ -10,8 +10,10 @@ import yaml
 
 from zugzwang.analysis.plots import ascii_histogram, format_ci_line
 from zugzwang.analysis.statistics import (
+    DEFAULT_ENGINE,
     BootstrapCI,
     ComparisonTest,
+    StatsEngine,
     bootstrap_acpl,
     bootstrap_win_rate,
     compare_acpl,
@@ -54,8 +56,8 @@ class RunComparisonReport:
             "comparison_id": self.comparison_id,
             "created_at_utc": self.created_at_utc,
             "runs": {
-                "a": _run_sample_to_dict(self.run_a),
-                "b": _run_sample_to_dict(self.run_b),
+                "a": run_sample_to_dict(self.run_a),
+                "b": run_sample_to_dict(self.run_b),
             },
             "metrics": {
                 "win_rate": _metric_to_dict(self.win_rate_a, self.win_rate_b, self.win_rate_test),
@@ -83,22 +85,25 @@ def compare_runs(
     confidence: float = 0.95,
     alpha: float = 0.05,
     seed: int = 42,
+    engine: StatsEngine = DEFAULT_ENGINE,
 ) -> RunComparisonReport:
     root = Path(runs_root)
-    sample_a = _load_run_sample(run_a, runs_root=root)
-    sample_b = _load_run_sample(run_b, runs_root=root)
+    sample_a = load_run_sample(run_a, runs_root=root)
+    sample_b = load_run_sample(run_b, runs_root=root)
 
     win_rate_a = bootstrap_win_rate(
         sample_a.win_scores,
         iterations=iterations,
         confidence=confidence,
         seed=seed,
+        engine=engine,
     )
     win_rate_b = bootstrap_win_rate(
         sample_b.win_scores,
         iterations=iterations,
         confidence=confidence,
         seed=seed,
+        engine=engine,
     )
     win_rate_test = compare_win_rates(
         sample_a.win_scores,
@@ -108,6 +113,7 @@ def compare_runs(
         confidence=confidence,
         alpha=alpha,
         seed=seed,
+        engine=engine,
     )
 
     acpl_a: BootstrapCI | None = None
@@ -119,12 +125,14 @@ def compare_runs(
             iterations=iterations,
             confidence=confidence,
             seed=seed,
+            engine=engine,
         )
         acpl_b = bootstrap_acpl(
             sample_b.acpl_values,
             iterations=iterations,
             confidence=confidence,
             seed=seed,
+            engine=engine,
         )
         acpl_test = compare_acpl(
             sample_a.acpl_values,
@@ -134,6 +142,7 @@ def compare_runs(
             confidence=confidence,
             alpha=alpha,
             seed=seed,
+            engine=engine,
         )
 
     notes: list[str] = []
@@ -251,7 +260,7 @@ def generate_markdown_report(report: RunComparisonReport) -> str:
     return "\n".join(lines).strip() + "\n"
 
 
-def _load_run_sample(run_ref: str | Path, *, runs_root: Path) -> RunSample:
+def load_run_sample(run_ref: str | Path, *, runs_root: Path) -> RunSample:
     run_dir = _resolve_run_dir(run_ref, runs_root=runs_root)
     run_id = run_dir.name
     player_color = _infer_player_color(run_dir)
@@ -373,7 +382,7 @@ def _as_float(value: Any) -> float | None:
     return None
 
 
-def _run_sample_to_dict(sample: RunSample) -> dict[str, Any]:
+def run_sample_to_dict(sample: RunSample) -> dict[str, Any]:
     return {
         "run_id": sample.run_id,
         "run_dir": sample.run_dir,
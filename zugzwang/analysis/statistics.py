@@ -1,12 +1,31 @@
 ﻿from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import math
 import random
-from typing import Sequence
+from typing import Any, Literal, Sequence
 
+try:  # optional: vectorized resampling engine
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+
+StatsEngine = Literal["auto", "numpy", "python"]
+PValueCorrection = Literal["holm", "bh", "none"]
+
+# Seed compatibility: the "python" engine reproduces the historical
+# ``random.Random(seed)`` draws exactly. The "numpy" engine seeds
+# ``numpy.random.default_rng(seed)`` and is reproducible for a given seed and
+# NumPy version (independent of chunking), but draws a different stream, so its
+# intervals and p-values differ from the "python" engine within Monte Carlo
+# error. "auto" uses NumPy when installed; every result records the engine
+# that produced it.
+DEFAULT_ENGINE: StatsEngine = "auto"
 
 _EPSILON = 1e-12
+# Upper bound on resample matrix cells held at once by the NumPy engine.
+_MAX_CHUNK_ELEMENTS = 1_000_000
 
 
 @dataclass(frozen=True)
@@ -19,6 +38,7 @@ class BootstrapCI:
     sample_size: int
     iterations: int
     seed: int
+    engine: str = "python"
 
 
 @dataclass(frozen=True)
@@ -40,6 +60,36 @@ class ComparisonTest:
     iterations: int
     permutations: int
     seed: int
+    engine: str = "python"
+
+
+@dataclass(frozen=True)
+class BootstrapDistribution:
+    """Resampled means of one sample, kept so several comparisons can reuse them."""
+
+    metric_name: str
+    values: tuple[float, ...]
+    mean: float
+    iterations: int
+    seed: int
+    engine: str
+    means: Any = field(repr=False, compare=False)
+
+    def ci(self, confidence: float) -> BootstrapCI:
+        _validate_common_params(iterations=self.iterations, confidence=confidence)
+        lower_q = (1.0 - confidence) / 2.0
+        ordered = sorted(self.means) if self.engine == "python" else np.sort(self.means)
+        return BootstrapCI(
+            metric_name=self.metric_name,
+            mean=self.mean,
+            ci_low=_percentile(ordered, lower_q),
+            ci_high=_percentile(ordered, 1.0 - lower_q),
+            confidence=confidence,
+            sample_size=len(self.values),
+            iterations=self.iterations,
+            seed=self.seed,
+            engine=self.engine,
+        )
 
 
 def bootstrap_win_rate(
@@ -48,12 +98,16 @@ def bootstrap_win_rate(
     iterations: int = 10_000,
     confidence: float = 0.95,
     seed: int = 42,
+    engine: StatsEngine = DEFAULT_ENGINE,
 ) -> BootstrapCI:
     values = _validate_samples(outcomes, name="outcomes")
     for value in values:
         if value < 0.0 or value > 1.0:
             raise ValueError("outcomes values must be in [0.0, 1.0]")
-    mean, ci_low, ci_high = _bootstrap_mean_ci(values, iterations=iterations, confidence=confidence, seed=seed)
+    engine_name = resolve_engine(engine)
+    mean, ci_low, ci_high = _bootstrap_mean_ci(
+        values, iterations=iterations, confidence=confidence, seed=seed, engine=engine_name
+    )
     return BootstrapCI(
         metric_name="win_rate",
         mean=mean,
@@ -63,6 +117,7 @@ def bootstrap_win_rate(
         sample_size=len(values),
         iterations=iterations,
         seed=seed,
+        engine=engine_name,
     )
 
 
@@ -72,9 +127,13 @@ def bootstrap_acpl(
     iterations: int = 10_000,
     confidence: float = 0.95,
     seed: int = 42,
+    engine: StatsEngine = DEFAULT_ENGINE,
 ) -> BootstrapCI:
     values = _validate_samples(acpl_values, name="acpl_values")
-    mean, ci_low, ci_high = _bootstrap_mean_ci(values, iterations=iterations, confidence=confidence, seed=seed)
+    engine_name = resolve_engine(engine)
+    mean, ci_low, ci_high = _bootstrap_mean_ci(
+        values, iterations=iterations, confidence=confidence, seed=seed, engine=engine_name
+    )
     return BootstrapCI(
         metric_name="acpl",
         mean=mean,
@@ -84,6 +143,7 @@ def bootstrap_acpl(
         sample_size=len(values),
         iterations=iterations,
         seed=seed,
+        engine=engine_name,
     )
 
 
@@ -96,6 +156,7 @@ def compare_win_rates(
     confidence: float = 0.95,
     alpha: float = 0.05,
     seed: int = 42,
+    engine: StatsEngine = DEFAULT_ENGINE,
 ) -> ComparisonTest:
     values_a = _validate_samples(outcomes_a, name="outcomes_a")
     values_b = _validate_samples(outcomes_b, name="outcomes_b")
@@ -103,6 +164,7 @@ def compare_win_rates(
         if value < 0.0 or value > 1.0:
             raise ValueError("win-rate samples must be in [0.0, 1.0]")
 
+    engine_name = resolve_engine(engine)
     mean_a = _mean(values_a)
     mean_b = _mean(values_b)
     delta = mean_a - mean_b
@@ -112,12 +174,14 @@ def compare_win_rates(
         iterations=iterations,
         confidence=confidence,
         seed=seed,
+        engine=engine_name,
     )
     p_value = _permutation_p_value(
         values_a,
         values_b,
         permutations=permutations,
         seed=seed,
+        engine=engine_name,
     )
     effect_size = _cohen_h(mean_a, mean_b)
     effect_size_magnitude = _cohen_h_magnitude(effect_size)
@@ -139,6 +203,7 @@ def compare_win_rates(
         iterations=iterations,
         permutations=permutations,
         seed=seed,
+        engine=engine_name,
     )
 
 
@@ -151,10 +216,12 @@ def compare_acpl(
     confidence: float = 0.95,
     alpha: float = 0.05,
     seed: int = 42,
+    engine: StatsEngine = DEFAULT_ENGINE,
 ) -> ComparisonTest:
     values_a = _validate_samples(acpl_a, name="acpl_a")
     values_b = _validate_samples(acpl_b, name="acpl_b")
 
+    engine_name = resolve_engine(engine)
     mean_a = _mean(values_a)
     mean_b = _mean(values_b)
     delta = mean_a - mean_b
@@ -164,12 +231,14 @@ def compare_acpl(
         iterations=iterations,
         confidence=confidence,
         seed=seed,
+        engine=engine_name,
     )
     p_value = _permutation_p_value(
         values_a,
         values_b,
         permutations=permutations,
         seed=seed,
+        engine=engine_name,
     )
     effect_size = _cliffs_delta(values_a, values_b)
     effect_size_magnitude = _cliffs_delta_magnitude(effect_size)
@@ -191,9 +260,141 @@ def compare_acpl(
         iterations=iterations,
         permutations=permutations,
         seed=seed,
+        engine=engine_name,
+    )
+
+
+def bootstrap_distribution(
+    values: Sequence[float],
+    *,
+    metric_name: str,
+    iterations: int = 10_000,
+    seed: int = 42,
+    engine: StatsEngine = DEFAULT_ENGINE,
+) -> BootstrapDistribution:
+    """Bootstrap means for one sample, in draw order.
+
+    Pairing two distributions index by index gives the same delta bootstrap as
+    ``compare_*`` as long as the two were drawn with different seeds.
+    """
+    sample = _validate_samples(values, name="values")
+    _validate_common_params(iterations=iterations, confidence=0.5)
+    engine_name = resolve_engine(engine)
+    if engine_name == "numpy":
+        rng = np.random.default_rng(seed)
+        means: Any = _np_resampled_means(rng, np.asarray(sample), iterations)
+    else:
+        rng = random.Random(seed)
+        sample_size = len(sample)
+        means = [_mean([sample[rng.randrange(sample_size)] for _ in range(sample_size)]) for _ in range(iterations)]
+    return BootstrapDistribution(
+        metric_name=metric_name,
+        values=tuple(sample),
+        mean=_mean(sample),
+        iterations=iterations,
+        seed=seed,
+        engine=engine_name,
+        means=means,
+    )
+
+
+def compare_distributions(
+    dist_a: BootstrapDistribution,
+    dist_b: BootstrapDistribution,
+    *,
+    permutations: int = 10_000,
+    confidence: float = 0.95,
+    alpha: float = 0.05,
+    seed: int = 42,
+) -> ComparisonTest:
+    """Two-sample test reusing cached bootstrap distributions for the delta CI.
+
+    Effect size follows the metric: Cohen's h for ``win_rate``, Cliff's delta otherwise.
+    """
+    if dist_a.metric_name != dist_b.metric_name:
+        raise ValueError("cannot compare distributions of different metrics")
+    if dist_a.iterations != dist_b.iterations or dist_a.engine != dist_b.engine:
+        raise ValueError("distributions must share iterations and engine")
+    _validate_common_params(iterations=dist_a.iterations, confidence=confidence)
+
+    values_a = list(dist_a.values)
+    values_b = list(dist_b.values)
+    delta = dist_a.mean - dist_b.mean
+    if len(values_a) == 1 and len(values_b) == 1:
+        ci_low = ci_high = delta
+    else:
+        lower_q = (1.0 - confidence) / 2.0
+        if dist_a.engine == "numpy":
+            deltas: Any = np.sort(dist_a.means - dist_b.means)
+        else:
+            deltas = sorted(a - b for a, b in zip(dist_a.means, dist_b.means))
+        ci_low, ci_high = _percentile(deltas, lower_q), _percentile(deltas, 1.0 - lower_q)
+    p_value = _permutation_p_value(values_a, values_b, permutations=permutations, seed=seed, engine=dist_a.engine)
+
+    if dist_a.metric_name == "win_rate":
+        effect_size = _cohen_h(dist_a.mean, dist_b.mean)
+        effect_size_name, effect_size_magnitude = "cohen_h", _cohen_h_magnitude(effect_size)
+    else:
+        effect_size = _cliffs_delta(values_a, values_b)
+        effect_size_name, effect_size_magnitude = "cliffs_delta", _cliffs_delta_magnitude(effect_size)
+    return ComparisonTest(
+        metric_name=dist_a.metric_name,
+        mean_a=dist_a.mean,
+        mean_b=dist_b.mean,
+        delta=delta,
+        ci_low=ci_low,
+        ci_high=ci_high,
+        p_value=p_value,
+        effect_size=effect_size,
+        effect_size_name=effect_size_name,
+        effect_size_magnitude=effect_size_magnitude,
+        significant=bool(p_value < alpha),
+        confidence=confidence,
+        sample_size_a=len(values_a),
+        sample_size_b=len(values_b),
+        iterations=dist_a.iterations,
+        permutations=permutations,
+        seed=seed,
+        engine=dist_a.engine,
     )
 
 
+def adjust_p_values(p_values: Sequence[float], method: PValueCorrection = "holm") -> list[float]:
+    """Family-wise (Holm) or false-discovery-rate (Benjamini-Hochberg) adjusted p-values."""
+    count = len(p_values)
+    if method == "none" or count == 0:
+        return [float(value) for value in p_values]
+    order = sorted(range(count), key=lambda index: p_values[index])
+    adjusted = [0.0] * count
+    if method == "holm":
+        running = 0.0
+        for rank, index in enumerate(order):
+            running = max(running, min(1.0, (count - rank) * p_values[index]))
+            adjusted[index] = running
+        return adjusted
+    if method == "bh":
+        running = 1.0
+        for rank in range(count - 1, -1, -1):
+            index = order[rank]
+            running = min(running, count * p_values[index] / (rank + 1))
+            adjusted[index] = min(1.0, running)
+        return adjusted
+    raise ValueError(f"method must be one of 'holm', 'bh', 'none', got {method!r}")
+
+
+def resolve_engine(engine: StatsEngine = DEFAULT_ENGINE) -> str:
+    """Concrete engine name ("numpy" or "python") for an engine setting."""
+    if engine == "auto":
+        return "numpy" if np is not None else "python"
+    if engine == "numpy":
+        if np is None:
+            raise ValueError("engine='numpy' requires numpy; install with: python -m pip install -e .[stats]")
+        return "numpy"
+    if engine == "python":
+        return "python"
+    raise ValueError(f"engine must be one of 'auto', 'numpy', 'python', got {engine!r}")
+
+
 def _validate_samples(values: Sequence[float], *, name: str) -> list[float]:
     if not isinstance(values, Sequence):
         raise TypeError(f"{name} must be a sequence of numeric values")
@@ -216,6 +417,7 @@ def _bootstrap_mean_ci(
     iterations: int,
     confidence: float,
     seed: int,
+    engine: str = "python",
 ) -> tuple[float, float, float]:
     _validate_common_params(iterations=iterations, confidence=confidence)
     sample = list(values)
@@ -223,13 +425,17 @@ def _bootstrap_mean_ci(
     if len(sample) == 1:
         return mean, mean, mean
 
-    rng = random.Random(seed)
-    sample_size = len(sample)
-    means: list[float] = []
-    for _ in range(iterations):
-        draw = [sample[rng.randrange(sample_size)] for _ in range(sample_size)]
-        means.append(_mean(draw))
-    means.sort()
+    if engine == "numpy":
+        rng = np.random.default_rng(seed)
+        means = np.sort(_np_resampled_means(rng, np.asarray(sample), iterations))
+    else:
+        rng = random.Random(seed)
+        sample_size = len(sample)
+        means = []
+        for _ in range(iterations):
+            draw = [sample[rng.randrange(sample_size)] for _ in range(sample_size)]
+            means.append(_mean(draw))
+        means.sort()
     lower_q = (1.0 - confidence) / 2.0
     upper_q = 1.0 - lower_q
     return mean, _percentile(means, lower_q), _percentile(means, upper_q)
@@ -242,6 +448,7 @@ def _bootstrap_delta_ci(
     iterations: int,
     confidence: float,
     seed: int,
+    engine: str = "python",
 ) -> tuple[float, float]:
     _validate_common_params(iterations=iterations, confidence=confidence)
     sample_a = list(values_a)
@@ -250,15 +457,21 @@ def _bootstrap_delta_ci(
         delta = sample_a[0] - sample_b[0]
         return delta, delta
 
-    rng = random.Random(seed)
-    n_a = len(sample_a)
-    n_b = len(sample_b)
-    deltas: list[float] = []
-    for _ in range(iterations):
-        draw_a = [sample_a[rng.randrange(n_a)] for _ in range(n_a)]
-        draw_b = [sample_b[rng.randrange(n_b)] for _ in range(n_b)]
-        deltas.append(_mean(draw_a) - _mean(draw_b))
-    deltas.sort()
+    if engine == "numpy":
+        rng = np.random.default_rng(seed)
+        means_a = _np_resampled_means(rng, np.asarray(sample_a), iterations)
+        means_b = _np_resampled_means(rng, np.asarray(sample_b), iterations)
+        deltas = np.sort(means_a - means_b)
+    else:
+        rng = random.Random(seed)
+        n_a = len(sample_a)
+        n_b = len(sample_b)
+        deltas = []
+        for _ in range(iterations):
+            draw_a = [sample_a[rng.randrange(n_a)] for _ in range(n_a)]
+            draw_b = [sample_b[rng.randrange(n_b)] for _ in range(n_b)]
+            deltas.append(_mean(draw_a) - _mean(draw_b))
+        deltas.sort()
     lower_q = (1.0 - confidence) / 2.0
     upper_q = 1.0 - lower_q
     return _percentile(deltas, lower_q), _percentile(deltas, upper_q)
@@ -270,6 +483,7 @@ def _permutation_p_value(
     *,
     permutations: int,
     seed: int,
+    engine: str = "python",
 ) -> float:
     if permutations <= 0:
         raise ValueError("permutations must be > 0")
@@ -284,10 +498,16 @@ def _permutation_p_value(
         return 1.0
 
     n_a = len(sample_a)
+    observed_abs = abs(observed)
+    if engine == "numpy":
+        extreme = _np_permutation_extreme_count(
+            np.random.default_rng(seed), np.asarray(combined), n_a, permutations, observed_abs
+        )
+        return (extreme + 1) / (permutations + 1)
+
     rng = random.Random(seed)
     extreme = 0
     pool = list(combined)
-    observed_abs = abs(observed)
     for _ in range(permutations):
         rng.shuffle(pool)
         perm_delta = _mean(pool[:n_a]) - _mean(pool[n_a:])
@@ -296,6 +516,39 @@ def _permutation_p_value(
     return (extreme + 1) / (permutations + 1)
 
 
+def _np_chunk_rows(columns: int) -> int:
+    return max(1, _MAX_CHUNK_ELEMENTS // max(1, columns))
+
+
+def _np_resampled_means(rng: np.random.Generator, sample: np.ndarray, iterations: int) -> np.ndarray:
+    """Means of ``iterations`` bootstrap resamples, drawn in bounded chunks."""
+    size = sample.shape[0]
+    means = np.empty(iterations, dtype=np.float64)
+    step = _np_chunk_rows(size)
+    for start in range(0, iterations, step):
+        stop = min(iterations, start + step)
+        indices = rng.integers(0, size, size=(stop - start, size))
+        means[start:stop] = sample[indices].mean(axis=1)
+    return means
+
+
+def _np_permutation_extreme_count(
+    rng: np.random.Generator,
+    combined: np.ndarray,
+    n_a: int,
+    permutations: int,
+    observed_abs: float,
+) -> int:
+    extreme = 0
+    step = _np_chunk_rows(combined.shape[0])
+    for start in range(0, permutations, step):
+        rows = min(permutations, start + step) - start
+        shuffled = rng.permuted(np.broadcast_to(combined, (rows, combined.shape[0])), axis=1)
+        deltas = shuffled[:, :n_a].mean(axis=1) - shuffled[:, n_a:].mean(axis=1)
+        extreme += int(np.count_nonzero(np.abs(deltas) >= observed_abs - _EPSILON))
+    return extreme
+
+
 def _validate_common_params(*, iterations: int, confidence: float) -> None:
     if iterations <= 0:
         raise ValueError("iterations must be > 0")
@@ -308,7 +561,7 @@ def _mean(values: Sequence[float]) -> float:
 
 
 def _percentile(sorted_values: Sequence[float], percentile: float) -> float:
-    if not sorted_values:
+    if len(sorted_values) == 0:
         raise ValueError("cannot compute percentile of empty values")
     if percentile <= 0.0:
         return float(sorted_values[0])
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response
+
+try:  # optional: brotli is preferred over gzip when installed and accepted
+    import brotli  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+
+# Small artifacts are sent as-is; compression overhead outweighs the savings.
+MIN_COMPRESS_BYTES = 1024
+COMPRESSED_CACHE_SIZE = 128
+CACHE_CONTROL = "no-cache"
+
+_compressed: OrderedDict[tuple[str, int, int, str], bytes] = OrderedDict()
+_compressed_lock = threading.Lock()
+
+
+def file_etag(stat_result: os.stat_result) -> str:
+    """Strong validator from mtime and size; changes whenever the file is rewritten."""
+    return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {item.strip().removeprefix("W/") for item in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def artifact_file_response(request: Request, path: Path, media_type: str) -> Response:
+    """Serve a file from disk with ETag/304 handling and gzip/brotli negotiation.
+
+    Uncompressed responses go through ``FileResponse`` (sendfile where the
+    server supports it); compressed bodies are cached per file version.
+    """
+    stat_result = path.stat()
+    encoding = _negotiate_encoding(request) if stat_result.st_size >= MIN_COMPRESS_BYTES else None
+    etag = file_etag(stat_result)
+    if encoding is not None:
+        etag = f'{etag[:-1]}-{encoding}"'
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Accept-Encoding"}
+
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    if encoding is None:
+        return FileResponse(path, media_type=media_type, headers=headers, stat_result=stat_result)
+
+    body = _compressed_body(path, stat_result, encoding)
+    headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+def cached_json_response(request: Request, payload: Any, etag: str) -> Response:
+    """JSON body for a derived payload whose freshness follows ``etag``."""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=json.dumps(payload), media_type="application/json", headers=headers)
+
+
+def _negotiate_encoding(request: Request) -> str | None:
+    accepted: dict[str, float] = {}
+    for part in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    if brotli is not None and accepted.get("br", 0.0) > 0:
+        return "br"
+    if accepted.get("gzip", 0.0) > 0:
+        return "gzip"
+    return None
+
+
+def _compressed_body(path: Path, stat_result: os.stat_result, encoding: str) -> bytes:
+    key = (str(path), stat_result.st_mtime_ns, stat_result.st_size, encoding)
+    with _compressed_lock:
+        cached = _compressed.get(key)
+        if cached is not None:
+            _compressed.move_to_end(key)
+            return cached
+
+    raw = path.read_bytes()
+    body = brotli.compress(raw) if encoding == "br" else gzip.compress(raw, compresslevel=6)
+    with _compressed_lock:
+        _compressed[key] = body
+        _compressed.move_to_end(key)
+        while len(_compressed) > COMPRESSED_CACHE_SIZE:
+            _compressed.popitem(last=False)
+    return body
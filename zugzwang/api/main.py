@@ -1,14 +1,44 @@
 from __future__ import annotations
 
+import os
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any, AsyncIterator
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from zugzwang.api import deps
 from zugzwang.api.routes import analysis, configs, dashboard, env, jobs, runs, scheduler
 from zugzwang.api.services.paths import project_root
+from zugzwang.api.services.scheduler_daemon import SchedulerDaemon
+from zugzwang.api.services.worker_pool import WorkerPool, pool_size_from_env, set_active_pool
+from zugzwang.infra.memory import current_memory
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    pool: WorkerPool | None = None
+    pool_size = pool_size_from_env(os.environ.get("ZUGZWANG_WORKER_POOL_SIZE"))
+    if pool_size > 0:
+        pool = WorkerPool(pool_size)
+        pool.start()
+        set_active_pool(pool)
+
+    daemon: SchedulerDaemon | None = None
+    if os.environ.get("ZUGZWANG_SCHEDULER_DAEMON", "1").strip().lower() not in {"0", "false", "no"}:
+        daemon = SchedulerDaemon(deps.get_scheduler_service())
+        daemon.start()
+    try:
+        yield
+    finally:
+        if daemon is not None:
+            daemon.stop()
+        if pool is not None:
+            set_active_pool(None)
+            pool.stop()
 
 
 def create_app() -> FastAPI:
@@ -16,6 +46,7 @@ def create_app() -> FastAPI:
         title="Zugzwang API",
         version="0.1.0",
         description="HTTP adapter over Zugzwang engine services.",
+        lifespan=_lifespan,
     )
     _configure_cors(app)
 
@@ -23,6 +54,10 @@ def create_app() -> FastAPI:
     def healthz() -> dict[str, bool]:
         return {"ok": True}
 
+    @app.get("/healthz/memory")
+    def healthz_memory() -> dict[str, Any]:
+        return current_memory()
+
     app.include_router(configs.router, prefix="/api")
     app.include_router(env.router, prefix="/api")
     app.include_router(jobs.router, prefix="/api")
@@ -3,9 +3,23 @@
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import PlainTextResponse
 
-from zugzwang.analysis import compare_runs, generate_markdown_report
+from zugzwang.analysis import (
+    MoveDataset,
+    compare_many,
+    compare_runs,
+    generate_leaderboard_markdown,
+    generate_markdown_report,
+    summarize_moves,
+)
 from zugzwang.api import deps
-from zugzwang.api.schemas import AnalysisCompareRequest, AnalysisCompareResponse
+from zugzwang.api.schemas import (
+    AnalysisCompareRequest,
+    AnalysisCompareResponse,
+    AnalysisLeaderboardRequest,
+    AnalysisLeaderboardResponse,
+    AnalysisMoveSummaryRequest,
+    AnalysisMoveSummaryResponse,
+)
 from zugzwang.api.services import ArtifactService
 
 
@@ -54,9 +68,77 @@ def get_run_comparison_payload(
         payload = artifact_service.load_comparison_payload(comparison_id)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    if payload.get("kind") == "leaderboard":
+        raise HTTPException(status_code=404, detail=f"Comparison is a leaderboard: {comparison_id}")
     return AnalysisCompareResponse.model_validate(payload)
 
 
+@router.post("/leaderboard", response_model=AnalysisLeaderboardResponse)
+def create_leaderboard(
+    request: AnalysisLeaderboardRequest,
+    artifact_service: ArtifactService = Depends(deps.get_artifact_service),
+) -> AnalysisLeaderboardResponse:
+    try:
+        leaderboard = compare_many(
+            request.runs,
+            runs_root=artifact_service.root,
+            comparison_id=request.comparison_id,
+            iterations=request.bootstrap_iterations,
+            permutations=request.permutation_iterations,
+            confidence=request.confidence,
+            alpha=request.alpha,
+            seed=request.seed,
+            correction=request.correction,
+        )
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    payload = leaderboard.to_dict()
+    artifacts = artifact_service.save_comparison_artifacts(
+        comparison_id=leaderboard.comparison_id,
+        payload=payload,
+        markdown_report=generate_leaderboard_markdown(leaderboard),
+    )
+    payload["artifacts"] = artifacts
+    return AnalysisLeaderboardResponse.model_validate(payload)
+
+
+@router.get("/leaderboard/{comparison_id}", response_model=AnalysisLeaderboardResponse)
+def get_leaderboard_payload(
+    comparison_id: str,
+    artifact_service: ArtifactService = Depends(deps.get_artifact_service),
+) -> AnalysisLeaderboardResponse:
+    try:
+        payload = artifact_service.load_comparison_payload(comparison_id)
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    if payload.get("kind") != "leaderboard":
+        raise HTTPException(status_code=404, detail=f"Leaderboard not found: {comparison_id}")
+    return AnalysisLeaderboardResponse.model_validate(payload)
+
+
+@router.post("/moves/summary", response_model=AnalysisMoveSummaryResponse)
+def summarize_move_dataset(
+    request: AnalysisMoveSummaryRequest,
+    artifact_service: ArtifactService = Depends(deps.get_artifact_service),
+) -> AnalysisMoveSummaryResponse:
+    dataset = MoveDataset(artifact_service.root)
+    sync = dataset.sync()
+    filters = {name: tuple(value) if isinstance(value, list) else value for name, value in request.filters.items()}
+    try:
+        rows = summarize_moves(dataset, by=request.by, filters=filters)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return AnalysisMoveSummaryResponse(
+        by=request.by,
+        rows=rows,
+        runs_updated=len(sync.updated),
+        total_moves=sum(row["moves"] for row in rows),
+    )
+
+
 @router.get("/compare/{comparison_id}/report.md", response_class=PlainTextResponse)
 def get_run_comparison_markdown(
     comparison_id: str,
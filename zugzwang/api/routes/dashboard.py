@@ -5,7 +5,11 @@ from dataclasses import asdict
 from fastapi import APIRouter, Depends, Query
 
 from zugzwang.api import deps
-from zugzwang.api.schemas import DashboardKpisResponse, DashboardTimelinePointResponse
+from zugzwang.api.schemas import (
+    DashboardKpisResponse,
+    DashboardTimelineBucketResponse,
+    DashboardTimelinePointResponse,
+)
 from zugzwang.api.services import ArtifactService
 
 
@@ -28,3 +32,12 @@ def get_dashboard_kpis(
         last_run_id=kpis.last_run_id,
         timeline=[DashboardTimelinePointResponse.model_validate(asdict(item)) for item in kpis.timeline],
     )
+
+
+@router.get("/timeline", response_model=list[DashboardTimelineBucketResponse])
+def get_dashboard_timeline(
+    max_points: int = Query(default=120, ge=1, le=1000),
+    artifact_service: ArtifactService = Depends(deps.get_artifact_service),
+) -> list[DashboardTimelineBucketResponse]:
+    buckets = artifact_service.build_dashboard_timeline(max_points=max_points)
+    return [DashboardTimelineBucketResponse.model_validate(asdict(item)) for item in buckets]
@@ -104,7 +104,15 @@ async def stream_job_logs(
     job = run_service.get_job(job_id, refresh=True)
     if job is None:
         raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
-    return EventSourceResponse(iter_job_log_events(job_id=job_id, request=request, run_service=run_service))
+    return EventSourceResponse(
+        iter_job_log_events(
+            job_id=job_id,
+            request=request,
+            run_service=run_service,
+            job=job,
+            last_event_id=request.headers.get("last-event-id"),
+        )
+    )
 
 
 def _progress_response(progress: RunProgress) -> RunProgressResponse:
@@ -2,13 +2,16 @@ from __future__ import annotations
 
 from dataclasses import asdict
 from datetime import date
+from pathlib import Path
 from typing import Any, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
 from zugzwang.api import deps
+from zugzwang.api.http_cache import artifact_file_response, cached_json_response, file_etag
 from zugzwang.api.schemas import BoardFrameResponse, GameDetailResponse, GameListItem, RunListItem, RunSummaryResponse
 from zugzwang.api.services import ArtifactService, ReplayService
+from zugzwang.api.services.replay_service import DEFAULT_BOARD_SIZE
 
 
 router = APIRouter(prefix="/runs", tags=["runs"])
@@ -84,23 +87,21 @@ def get_run_summary(
 @router.get("/{run_id}/report", response_model=dict[str, Any])
 def get_run_report(
     run_id: str,
+    request: Request,
     artifact_service: ArtifactService = Depends(deps.get_artifact_service),
-) -> dict[str, Any]:
-    summary = _load_summary_or_404(artifact_service, run_id)
-    if summary.report is None:
-        raise HTTPException(status_code=404, detail=f"Report not found for run: {run_id}")
-    return summary.report
+) -> Response:
+    path = _artifact_path_or_404(artifact_service, run_id, "experiment_report.json", "Report")
+    return artifact_file_response(request, path, "application/json")
 
 
 @router.get("/{run_id}/report/evaluated", response_model=dict[str, Any])
 def get_run_report_evaluated(
     run_id: str,
+    request: Request,
     artifact_service: ArtifactService = Depends(deps.get_artifact_service),
-) -> dict[str, Any]:
-    summary = _load_summary_or_404(artifact_service, run_id)
-    if summary.evaluated_report is None:
-        raise HTTPException(status_code=404, detail=f"Evaluated report not found for run: {run_id}")
-    return summary.evaluated_report
+) -> Response:
+    path = _artifact_path_or_404(artifact_service, run_id, "experiment_report_evaluated.json", "Evaluated report")
+    return artifact_file_response(request, path, "application/json")
 
 
 @router.get("/{run_id}/games", response_model=list[GameListItem])
@@ -132,31 +133,70 @@ def get_game(
 def get_game_frames(
     run_id: str,
     game_number: int,
+    response: Response,
+    offset: int = Query(default=0, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=500),
+    format: Literal["svg", "fen"] = Query(default="svg"),
+    size: int = Query(default=DEFAULT_BOARD_SIZE, ge=64, le=1024),
     artifact_service: ArtifactService = Depends(deps.get_artifact_service),
     replay_service: ReplayService = Depends(deps.get_replay_service),
 ) -> list[BoardFrameResponse]:
-    try:
-        game = artifact_service.load_game(run_id, game_number)
-    except FileNotFoundError as exc:
-        raise HTTPException(status_code=404, detail=str(exc)) from exc
-    frames = replay_service.build_board_states(game)
+    game = _load_game_or_404(artifact_service, run_id, game_number)
+    response.headers["X-Total-Count"] = str(replay_service.count_frames(game))
+    frames = replay_service.build_board_states(
+        game,
+        offset=offset,
+        limit=limit,
+        render_svg=format == "svg",
+        size=size,
+    )
     return [BoardFrameResponse.model_validate(asdict(frame)) for frame in frames]
 
 
+@router.get("/{run_id}/games/{game_number}/frames/{index}", response_model=BoardFrameResponse)
+def get_game_frame(
+    run_id: str,
+    game_number: int,
+    index: int,
+    format: Literal["svg", "fen"] = Query(default="svg"),
+    size: int = Query(default=DEFAULT_BOARD_SIZE, ge=64, le=1024),
+    artifact_service: ArtifactService = Depends(deps.get_artifact_service),
+    replay_service: ReplayService = Depends(deps.get_replay_service),
+) -> BoardFrameResponse:
+    game = _load_game_or_404(artifact_service, run_id, game_number)
+    frame = replay_service.build_frame(game, index, render_svg=format == "svg", size=size)
+    if frame is None:
+        raise HTTPException(status_code=404, detail=f"Frame not found: {index}")
+    return BoardFrameResponse.model_validate(asdict(frame))
+
+
 @router.get("/{run_id}/config", response_model=dict[str, Any])
 def get_run_config(
     run_id: str,
+    request: Request,
     artifact_service: ArtifactService = Depends(deps.get_artifact_service),
-) -> dict[str, Any]:
-    summary = _load_summary_or_404(artifact_service, run_id)
-    if summary.resolved_config is None:
+) -> Response:
+    path = _artifact_path_or_404(artifact_service, run_id, "resolved_config.yaml", "Resolved config")
+    # Stat before parsing so a concurrent rewrite yields a stale ETag, never a stale body under a fresh one.
+    etag = file_etag(path.stat())
+    resolved_config = artifact_service.load_parsed_artifact(path)
+    if resolved_config is None:
         raise HTTPException(status_code=404, detail=f"Resolved config not found for run: {run_id}")
-    return summary.resolved_config
+    return cached_json_response(request, resolved_config, etag)
 
 
-def _load_summary_or_404(artifact_service: ArtifactService, run_id: str):
+def _artifact_path_or_404(artifact_service: ArtifactService, run_id: str, artifact_name: str, label: str) -> Path:
     try:
-        return artifact_service.load_run_summary(run_id)
+        path = artifact_service.artifact_path(run_id, artifact_name)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    if path is None:
+        raise HTTPException(status_code=404, detail=f"{label} not found for run: {run_id}")
+    return path
 
+
+def _load_game_or_404(artifact_service: ArtifactService, run_id: str, game_number: int):
+    try:
+        return artifact_service.load_game(run_id, game_number)
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -21,6 +21,10 @@ def create_batch(
             fail_fast=payload.fail_fast,
             dry_run=payload.dry_run,
             batch_id=payload.batch_id,
+            max_parallel_steps=payload.max_parallel_steps,
+            provider_limits=payload.provider_limits,
+            max_engine_cores=payload.max_engine_cores,
+            force=payload.force,
         )
     except Exception as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -30,7 +34,7 @@ def create_batch(
 @router.get("/batches", response_model=list[SchedulerBatchResponse])
 def list_batches(
     limit: int = Query(default=50, ge=1, le=200),
-    refresh: bool = Query(default=True),
+    refresh: bool | None = Query(default=None),
     scheduler_service: SchedulerService = Depends(deps.get_scheduler_service),
 ) -> list[SchedulerBatchResponse]:
     batches = scheduler_service.list_batches(limit=limit, refresh=refresh)
@@ -40,7 +44,7 @@ def list_batches(
 @router.get("/batches/{batch_id}", response_model=SchedulerBatchResponse)
 def get_batch(
     batch_id: str,
-    refresh: bool = Query(default=True),
+    refresh: bool | None = Query(default=None),
     scheduler_service: SchedulerService = Depends(deps.get_scheduler_service),
 ) -> SchedulerBatchResponse:
     try:
@@ -157,6 +157,16 @@ class DashboardTimelinePointResponse(ApiModel):
     evaluated_report_exists: bool
 
 
+class DashboardTimelineBucketResponse(ApiModel):
+    start_date: str
+    end_date: str
+    runs: int
+    evaluated_runs: int
+    total_cost_usd: float
+    avg_elo: float | None = None
+    avg_acpl: float | None = None
+
+
 class DashboardKpisResponse(ApiModel):
     total_runs: int
     runs_with_reports: int
@@ -186,7 +196,7 @@ class GameDetailResponse(ApiModel):
 class BoardFrameResponse(ApiModel):
     ply_number: int
     fen: str
-    svg: str
+    svg: str | None = None
     move_uci: str | None = None
     move_san: str | None = None
     color: str | None = None
@@ -269,6 +279,81 @@ class AnalysisCompareResponse(ApiModel):
     artifacts: AnalysisArtifactsResponse
 
 
+class AnalysisLeaderboardRequest(ApiModel):
+    runs: list[str] = Field(min_length=2, max_length=100)
+    comparison_id: str | None = None
+    confidence: float = Field(default=0.95, gt=0.0, lt=1.0)
+    alpha: float = Field(default=0.05, gt=0.0, lt=1.0)
+    bootstrap_iterations: int = Field(default=10_000, ge=100, le=200_000)
+    permutation_iterations: int = Field(default=10_000, ge=100, le=200_000)
+    seed: int = 42
+    correction: Literal["holm", "bh", "none"] = "holm"
+
+
+class AnalysisLeaderboardEntryResponse(ApiModel):
+    rank: int
+    run: AnalysisRunSampleResponse
+    win_rate: AnalysisMetricRunSideResponse
+    acpl: AnalysisMetricRunSideResponse | None = None
+    win_rate_wins: int
+    win_rate_losses: int
+    acpl_wins: int
+    acpl_losses: int
+
+
+class AnalysisPairwiseResponse(ApiModel):
+    run_a: str
+    run_b: str
+    mean_a: float
+    mean_b: float
+    delta: float
+    ci_low: float
+    ci_high: float
+    p_value: float
+    p_adjusted: float
+    effect_size: float
+    effect_size_name: str
+    effect_size_magnitude: str
+    significant: bool
+
+
+class AnalysisPairwiseMatrixResponse(ApiModel):
+    win_rate: list[AnalysisPairwiseResponse] = Field(default_factory=list)
+    acpl: list[AnalysisPairwiseResponse] = Field(default_factory=list)
+
+
+class AnalysisLeaderboardSettingsResponse(ApiModel):
+    correction: str
+    alpha: float
+    confidence: float
+    iterations: int
+    permutations: int
+    seed: int
+    engine: str
+
+
+class AnalysisLeaderboardResponse(ApiModel):
+    comparison_id: str
+    created_at_utc: str
+    settings: AnalysisLeaderboardSettingsResponse
+    entries: list[AnalysisLeaderboardEntryResponse]
+    pairwise: AnalysisPairwiseMatrixResponse
+    notes: list[str] = Field(default_factory=list)
+    artifacts: AnalysisArtifactsResponse
+
+
+class AnalysisMoveSummaryRequest(ApiModel):
+    by: list[str] = Field(min_length=1, max_length=4)
+    filters: dict[str, Any] = Field(default_factory=dict)
+
+
+class AnalysisMoveSummaryResponse(ApiModel):
+    by: list[str]
+    rows: list[dict[str, Any]]
+    runs_updated: int
+    total_moves: int
+
+
 class SchedulerStepRequest(ApiModel):
     step_id: str | None = None
     config_path: str
@@ -276,6 +361,9 @@ class SchedulerStepRequest(ApiModel):
     model_profile: str | None = None
     overrides: list[str] = Field(default_factory=list)
     depends_on: list[str] = Field(default_factory=list)
+    providers: list[str] | None = None
+    engine_cores: int | None = Field(default=None, ge=0)
+    force: bool = False
 
 
 class SchedulerBatchCreateRequest(ApiModel):
@@ -283,6 +371,10 @@ class SchedulerBatchCreateRequest(ApiModel):
     fail_fast: bool = True
     dry_run: bool = False
     batch_id: str | None = None
+    max_parallel_steps: int = Field(default=1, ge=1)
+    provider_limits: dict[str, int] = Field(default_factory=dict)
+    max_engine_cores: int | None = Field(default=None, ge=1)
+    force: bool = False
 
 
 class SchedulerStepResponse(ApiModel):
@@ -300,6 +392,9 @@ class SchedulerStepResponse(ApiModel):
     started_at_utc: str | None = None
     finished_at_utc: str | None = None
     preview: dict[str, Any] | None = None
+    providers: list[str] = Field(default_factory=list)
+    engine_cores: int = 0
+    force: bool = False
 
 
 class SchedulerBatchResponse(ApiModel):
@@ -310,3 +405,6 @@ class SchedulerBatchResponse(ApiModel):
     created_at_utc: str
     updated_at_utc: str
     steps: list[SchedulerStepResponse] = Field(default_factory=list)
+    max_parallel_steps: int = 1
+    provider_limits: dict[str, int] = Field(default_factory=dict)
+    max_engine_cores: int | None = None
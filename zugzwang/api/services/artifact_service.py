@@ -2,88 +2,78 @@ from __future__ import annotations
 
 import json
 import re
-from datetime import UTC, date, datetime, time
+import threading
+from collections import OrderedDict
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 import yaml
 
 from zugzwang.api.services.paths import runs_root
-from zugzwang.api.types import DashboardKpis, DashboardTimelinePoint, GameMeta, GameRecordView, RunMeta, RunSummary
+from zugzwang.api.state.run_catalog import RunCatalog
+from zugzwang.api.types import (
+    DashboardKpis,
+    DashboardTimelineBucket,
+    DashboardTimelinePoint,
+    GameMeta,
+    GameRecordView,
+    RunMeta,
+    RunSummary,
+)
 from zugzwang.evaluation.player_color import infer_evaluation_player_color
 from zugzwang.providers.model_routing import resolve_provider_and_model
 
 
+PARSED_CACHE_SIZE = 512
 RUN_TS_PATTERN = re.compile(r"-(\d{8}T\d{6}Z)-")
+_DAILY_SUM_KEYS = ("runs", "evaluated_runs", "cost_sum", "elo_sum", "elo_count", "acpl_sum", "acpl_count")
 RUN_ID_PATTERN = re.compile(r"^(?P<experiment>.+)-(?P<stamp>\d{8}T\d{6}Z)-(?P<short_hash>[0-9a-fA-F]{8,64})$")
 
 
 class ArtifactService:
     def __init__(self, root: str | Path | None = None) -> None:
         self.root = Path(root) if root else runs_root()
+        self.catalog = RunCatalog(self.root, build_meta=self._build_run_meta)
+        self._parsed: OrderedDict[Path, tuple[int, int, dict[str, Any] | None]] = OrderedDict()
+        self._parsed_lock = threading.Lock()
 
     def list_runs(self, filters: dict[str, Any] | None = None) -> list[RunMeta]:
         filters = filters or {}
-        query = str(filters.get("query", "")).strip().lower()
-        evaluated_only = bool(filters.get("evaluated_only", False))
-        provider = _as_str(filters.get("provider"))
-        model = _as_str(filters.get("model"))
-        status = _as_str(filters.get("status"))
-        sort_by = _as_str(filters.get("sort_by")) or "created_at_utc"
-        sort_dir = (_as_str(filters.get("sort_dir")) or "desc").lower()
-        offset = _coerce_int(filters.get("offset"), default=0, minimum=0) or 0
-        limit = _coerce_int(filters.get("limit"), default=None, minimum=1)
-        date_from = _coerce_date(filters.get("date_from"))
-        date_to = _coerce_date(filters.get("date_to"))
-
         if not self.root.exists():
             return []
 
-        metas: list[RunMeta] = []
-        for run_dir in self.root.iterdir():
-            if not run_dir.is_dir():
-                continue
-            if run_dir.name.startswith("_"):
-                continue
-            meta = self._build_run_meta(run_dir)
-            if query:
-                haystack = " ".join(
-                    value
-                    for value in (
-                        meta.run_id,
-                        meta.inferred_provider,
-                        meta.inferred_model,
-                        meta.inferred_model_label,
-                    )
-                    if value
-                ).lower()
-                if query not in haystack:
-                    continue
-            if provider and (meta.inferred_provider or "").lower() != provider.lower():
-                continue
-            if model and (meta.inferred_model or "").lower() != model.lower():
-                continue
-            if status and not _matches_status(meta, status):
-                continue
-            if not _matches_date_range(meta.created_at_utc, date_from=date_from, date_to=date_to):
-                continue
-            if evaluated_only and not meta.evaluated_report_exists:
-                continue
-            metas.append(meta)
-
-        sort_desc = sort_dir != "asc"
-        metas.sort(key=lambda item: _sort_key(item, sort_by, sort_desc), reverse=sort_desc)
-        if offset:
-            metas = metas[offset:]
-        if limit is not None:
-            metas = metas[:limit]
-        return metas
+        self.catalog.sync()
+        return self.catalog.query(
+            query=str(filters.get("query", "")).strip().lower() or None,
+            provider=_as_str(filters.get("provider")),
+            model=_as_str(filters.get("model")),
+            status=_as_str(filters.get("status")),
+            evaluated_only=bool(filters.get("evaluated_only", False)),
+            date_from=_coerce_date(filters.get("date_from")),
+            date_to=_coerce_date(filters.get("date_to")),
+            sort_by=_as_str(filters.get("sort_by")) or "created_at_utc",
+            sort_dir=(_as_str(filters.get("sort_dir")) or "desc").lower(),
+            offset=_coerce_int(filters.get("offset"), default=0, minimum=0) or 0,
+            limit=_coerce_int(filters.get("limit"), default=None, minimum=1),
+        )
 
     def build_dashboard_kpis(self, timeline_limit: int = 40) -> DashboardKpis:
-        runs = self.list_runs(filters={"sort_by": "created_at_utc", "sort_dir": "desc"})
-        evaluated_runs = [item for item in runs if item.evaluated_report_exists]
-        elo_values = [item.elo_estimate for item in evaluated_runs if item.elo_estimate is not None]
-        acpl_values = [item.acpl_overall for item in evaluated_runs if item.acpl_overall is not None]
+        if not self.root.exists():
+            return DashboardKpis(
+                total_runs=0,
+                runs_with_reports=0,
+                evaluated_runs=0,
+                best_elo=None,
+                avg_acpl=None,
+                total_cost_usd=0.0,
+                last_run_id=None,
+                timeline=[],
+            )
+
+        self.catalog.sync()
+        totals = self.catalog.totals()
+        latest = self.catalog.query(sort_by="created_at_utc", sort_dir="desc", limit=max(1, timeline_limit))
         timeline = [
             DashboardTimelinePoint(
                 run_id=item.run_id,
@@ -94,27 +84,34 @@ class ArtifactService:
                 acpl_overall=item.acpl_overall,
                 evaluated_report_exists=item.evaluated_report_exists,
             )
-            for item in runs[: max(0, timeline_limit)]
+            for item in latest[: max(0, timeline_limit)]
         ]
 
         return DashboardKpis(
-            total_runs=len(runs),
-            runs_with_reports=sum(1 for item in runs if item.report_exists),
-            evaluated_runs=len(evaluated_runs),
-            best_elo=max(elo_values) if elo_values else None,
-            avg_acpl=(sum(acpl_values) / len(acpl_values)) if acpl_values else None,
-            total_cost_usd=float(sum(item.total_cost_usd or 0.0 for item in runs)),
-            last_run_id=runs[0].run_id if runs else None,
+            total_runs=totals["total_runs"],
+            runs_with_reports=totals["runs_with_reports"],
+            evaluated_runs=totals["evaluated_runs"],
+            best_elo=totals["best_elo"],
+            avg_acpl=totals["avg_acpl"],
+            total_cost_usd=totals["total_cost_usd"],
+            last_run_id=latest[0].run_id if latest else None,
             timeline=timeline,
         )
 
+    def build_dashboard_timeline(self, max_points: int = 120) -> list[DashboardTimelineBucket]:
+        """Run history bucketed into at most ``max_points`` equal spans of UTC days."""
+        if not self.root.exists():
+            return []
+        self.catalog.sync()
+        return _downsample_daily(self.catalog.daily_series(), max_points=max_points)
+
     def load_run_summary(self, run_dir: str | Path) -> RunSummary:
         path = self._resolve_run_dir(run_dir)
         run_meta = self._build_run_meta(path)
 
-        resolved_config = _load_yaml(path / "resolved_config.yaml")
-        report = _load_json(path / "experiment_report.json")
-        evaluated_report = _load_json(path / "experiment_report_evaluated.json")
+        resolved_config = self.load_parsed_artifact(path / "resolved_config.yaml")
+        report = self.load_parsed_artifact(path / "experiment_report.json")
+        evaluated_report = self.load_parsed_artifact(path / "experiment_report_evaluated.json")
         game_count = len(list((path / "games").glob("game_*.json"))) if (path / "games").exists() else 0
 
         return RunSummary(
@@ -143,7 +140,7 @@ class ArtifactService:
     def load_game(self, run_dir: str | Path, game_number: int) -> GameRecordView:
         run_path = self._resolve_run_dir(run_dir)
         game_path = run_path / "games" / f"game_{game_number:04d}.json"
-        payload = _load_json(game_path)
+        payload = self.load_parsed_artifact(game_path)
         if not isinstance(payload, dict):
             raise FileNotFoundError(f"Game file not found or invalid: {game_path}")
 
@@ -173,6 +170,36 @@ class ArtifactService:
             moves=moves,
         )
 
+    def artifact_path(self, run_dir: str | Path, artifact_name: str) -> Path | None:
+        """Path of an artifact inside a run; None when the run exists but the file does not."""
+        path = self._resolve_run_dir(run_dir) / artifact_name
+        return path if path.is_file() else None
+
+    def load_parsed_artifact(self, path: str | Path) -> dict[str, Any] | None:
+        """Parsed JSON/YAML mapping, cached until the file's mtime or size changes.
+
+        Cached objects are shared between callers and must not be mutated.
+        """
+        path = Path(path)
+        try:
+            stat_result = path.stat()
+        except OSError:
+            return None
+        version = (stat_result.st_mtime_ns, stat_result.st_size)
+        with self._parsed_lock:
+            cached = self._parsed.get(path)
+            if cached is not None and cached[:2] == version:
+                self._parsed.move_to_end(path)
+                return cached[2]
+
+        payload = _load_yaml(path) if path.suffix in {".yaml", ".yml"} else _load_json(path)
+        with self._parsed_lock:
+            self._parsed[path] = (*version, payload)
+            self._parsed.move_to_end(path)
+            while len(self._parsed) > PARSED_CACHE_SIZE:
+                self._parsed.popitem(last=False)
+        return payload
+
     def load_artifact_text(self, run_dir: str | Path, artifact_name: str) -> str:
         path = self._resolve_run_dir(run_dir) / artifact_name
         if not path.exists():
@@ -285,9 +312,9 @@ class ArtifactService:
         if config_hash_path.exists():
             config_hash = config_hash_path.read_text(encoding="utf-8").strip() or None
 
-        resolved_config = _load_yaml(run_dir / "resolved_config.yaml")
-        report = _load_json(run_dir / "experiment_report.json")
-        evaluated_report = _load_json(run_dir / "experiment_report_evaluated.json")
+        resolved_config = self.load_parsed_artifact(run_dir / "resolved_config.yaml")
+        report = self.load_parsed_artifact(run_dir / "experiment_report.json")
+        evaluated_report = self.load_parsed_artifact(run_dir / "experiment_report_evaluated.json")
 
         report_exists = report is not None
         evaluated_exists = evaluated_report is not None
@@ -655,73 +682,35 @@ def _infer_eval_status(report_exists: bool, evaluated_exists: bool) -> str:
     return "pending_report"
 
 
-def _parse_iso_utc(value: str | None) -> datetime | None:
-    if not value:
-        return None
-    normalized = value.strip()
-    if not normalized:
-        return None
-    if normalized.endswith("Z"):
-        normalized = normalized[:-1] + "+00:00"
-    try:
-        parsed = datetime.fromisoformat(normalized)
-    except ValueError:
-        return None
-    if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=UTC)
-    return parsed.astimezone(UTC)
-
-
-def _matches_date_range(created_at_utc: str | None, date_from: date | None, date_to: date | None) -> bool:
-    if date_from is None and date_to is None:
-        return True
-    created = _parse_iso_utc(created_at_utc)
-    if created is None:
-        return False
-
-    if date_from is not None:
-        lower = datetime.combine(date_from, time.min, tzinfo=UTC)
-        if created < lower:
-            return False
-    if date_to is not None:
-        upper = datetime.combine(date_to, time.max, tzinfo=UTC)
-        if created > upper:
-            return False
-    return True
-
-
-def _matches_status(meta: RunMeta, status: str) -> bool:
-    normalized = status.strip().lower()
-    if normalized in {"all", ""}:
-        return True
-    if normalized in {"evaluated", "completed_evaluated"}:
-        return meta.evaluated_report_exists
-    if normalized in {"needs_eval", "pending_evaluation"}:
-        return meta.report_exists and not meta.evaluated_report_exists
-    if normalized in {"pending_report", "running", "queued"}:
-        return not meta.report_exists
-    return meta.inferred_eval_status == normalized
-
-
-def _sort_key(meta: RunMeta, sort_by: str, descending: bool) -> Any:
-    normalized = sort_by.strip().lower()
-    if normalized in {"run_id", "id"}:
-        return meta.run_id.lower()
-    if normalized in {"elo", "elo_estimate"}:
-        return _numeric_sort_value(meta.elo_estimate, descending)
-    if normalized in {"acpl", "acpl_overall"}:
-        return _numeric_sort_value(meta.acpl_overall, descending)
-    if normalized in {"cost", "total_cost_usd"}:
-        return _numeric_sort_value(meta.total_cost_usd, descending)
-
-    created = _parse_iso_utc(meta.created_at_utc)
-    if created is None:
-        return _numeric_sort_value(None, descending)
-    return created.timestamp()
-
-
-def _numeric_sort_value(value: float | None, descending: bool) -> float:
-    if value is None:
-        return float("-inf") if descending else float("inf")
-    return float(value)
-
+def _downsample_daily(days: list[dict[str, Any]], max_points: int) -> list[DashboardTimelineBucket]:
+    if not days:
+        return []
+    first = date.fromisoformat(days[0]["day"])
+    last = date.fromisoformat(days[-1]["day"])
+    span_days = (last - first).days + 1
+    width = max(1, -(-span_days // max(1, max_points)))
+
+    buckets: dict[int, dict[str, Any]] = {}
+    for day in days:
+        index = (date.fromisoformat(day["day"]) - first).days // width
+        bucket = buckets.setdefault(index, dict.fromkeys(_DAILY_SUM_KEYS, 0))
+        for key in _DAILY_SUM_KEYS:
+            bucket[key] += day[key]
+
+    series: list[DashboardTimelineBucket] = []
+    for index in sorted(buckets):
+        bucket = buckets[index]
+        start = first + timedelta(days=index * width)
+        end = min(last, start + timedelta(days=width - 1))
+        series.append(
+            DashboardTimelineBucket(
+                start_date=start.isoformat(),
+                end_date=end.isoformat(),
+                runs=int(bucket["runs"]),
+                evaluated_runs=int(bucket["evaluated_runs"]),
+                total_cost_usd=float(bucket["cost_sum"]),
+                avg_elo=(bucket["elo_sum"] / bucket["elo_count"]) if bucket["elo_count"] else None,
+                avg_acpl=(bucket["acpl_sum"] / bucket["acpl_count"]) if bucket["acpl_count"] else None,
+            )
+        )
+    return series
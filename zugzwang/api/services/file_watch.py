@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Protocol
+
+
+LOGGER = logging.getLogger(__name__)
+
+# <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+_IN_EVENT_HEADER = struct.Struct("iIII")
+
+
+class DirectoryWatcher(Protocol):
+    def wait(self, timeout: float) -> list[str]:
+        """Block up to ``timeout`` seconds; return names of files changed meanwhile."""
+
+    def close(self) -> None: ...
+
+
+class InotifyWatcher:
+    """Linux inotify on one directory; non-recursive."""
+
+    def __init__(self, directory: str | Path, mask: int = IN_CLOSE_WRITE | IN_MOVED_TO) -> None:
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        watch = libc.inotify_add_watch(fd, os.fsencode(str(directory)), mask)
+        if watch < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}")
+        self._fd = fd
+
+    def fileno(self) -> int:
+        return self._fd
+
+    def wait(self, timeout: float) -> list[str]:
+        ready, _, _ = select.select([self._fd], [], [], max(0.0, timeout))
+        if not ready:
+            return []
+        return self.drain()
+
+    def drain(self) -> list[str]:
+        """Read pending events without blocking."""
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        names: list[str] = []
+        offset = 0
+        while offset + _IN_EVENT_HEADER.size <= len(data):
+            _, _, _, name_len = _IN_EVENT_HEADER.unpack_from(data, offset)
+            offset += _IN_EVENT_HEADER.size
+            raw_name = data[offset : offset + name_len].rstrip(b"\0")
+            offset += name_len
+            if raw_name:
+                names.append(os.fsdecode(raw_name))
+        return names
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingWatcher:
+    """Portable fallback: diff directory mtimes every ``wait`` call."""
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self._snapshot = self._scan()
+
+    def wait(self, timeout: float) -> list[str]:
+        time.sleep(max(0.0, timeout))
+        current = self._scan()
+        changed = [name for name, mtime in current.items() if self._snapshot.get(name) != mtime]
+        self._snapshot = current
+        return sorted(changed)
+
+    def close(self) -> None:
+        return None
+
+    def _scan(self) -> dict[str, int]:
+        snapshot: dict[str, int] = {}
+        try:
+            entries = list(os.scandir(self.directory))
+        except OSError:
+            return snapshot
+        for entry in entries:
+            try:
+                snapshot[entry.name] = entry.stat().st_mtime_ns
+            except OSError:
+                continue
+        return snapshot
+
+
+def try_inotify(directory: str | Path, mask: int = IN_CLOSE_WRITE | IN_MOVED_TO) -> InotifyWatcher | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return InotifyWatcher(directory, mask=mask)
+    except (OSError, AttributeError) as exc:
+        LOGGER.info("inotify unavailable (%s); falling back to polling", exc)
+        return None
+
+
+def watch_directory(directory: str | Path, mask: int = IN_CLOSE_WRITE | IN_MOVED_TO) -> DirectoryWatcher:
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    return try_inotify(directory, mask=mask) or PollingWatcher(directory)
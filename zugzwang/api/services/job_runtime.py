@@ -9,11 +9,20 @@ from typing import Any
 from zugzwang.infra.ids import timestamp_utc
 from zugzwang.api.services.paths import project_root, ui_jobs_root
 from zugzwang.api.services.process_utils import is_pid_running, python_executable, tail_text, terminate_pid
-from zugzwang.api.state.job_store import DEFAULT_JOBS_PATH, create_job, get_job, list_jobs, update_job
+from zugzwang.api.services.worker_pool import active_pool
+from zugzwang.api.state.job_store import (
+    DEFAULT_JOBS_PATH,
+    TERMINAL_JOB_STATES,
+    create_job,
+    get_job,
+    list_jobs,
+    update_job,
+)
 from zugzwang.api.types import CancelResult, JobHandle, JobStatus, JobType
 
 
-TERMINAL_STATES: set[str] = {"completed", "failed", "canceled"}
+TERMINAL_STATES: set[str] = set(TERMINAL_JOB_STATES)
+ACTIVE_STATES: tuple[str, ...] = ("queued", "running")
 
 
 def _make_job_id(job_type: JobType) -> str:
@@ -63,6 +72,40 @@ def start_job(
         meta=merged_meta,
     )
     create_job(handle, jobs_path=jobs_path)
+    workdir = Path(working_dir or project_root())
+    pool = active_pool()
+    pid = (
+        pool.submit(
+            command=command,
+            stdout_path=stdout_path,
+            stderr_path=stderr_path,
+            exit_code_path=status_path,
+            workdir=workdir,
+        )
+        if pool is not None
+        else None
+    )
+    merged_meta["launcher"] = "pool" if pid is not None else "process"
+    if pid is None:
+        pid = _spawn_job_worker(command, stdout_path, stderr_path, status_path, workdir)
+    update_job(
+        job_id,
+        "running",
+        patch={"pid": pid, "meta": merged_meta},
+        jobs_path=jobs_path,
+    )
+    handle.status = "running"
+    handle.pid = pid
+    return handle
+
+
+def _spawn_job_worker(
+    command: list[str],
+    stdout_path: Path,
+    stderr_path: Path,
+    status_path: Path,
+    workdir: Path,
+) -> int:
     wrapper_cmd = [
         python_executable(),
         "-m",
@@ -74,20 +117,12 @@ def start_job(
         "--exit-code-path",
         str(status_path),
         "--workdir",
-        str(Path(working_dir or project_root())),
+        str(workdir),
         "--",
         *command,
     ]
     process = subprocess.Popen(wrapper_cmd, cwd=str(project_root()))
-    update_job(
-        job_id,
-        "running",
-        patch={"pid": int(process.pid)},
-        jobs_path=jobs_path,
-    )
-    handle.status = "running"
-    handle.pid = int(process.pid)
-    return handle
+    return int(process.pid)
 
 
 def _read_exit_payload(status_path: str | Path) -> dict[str, Any] | None:
@@ -112,14 +147,16 @@ def refresh_job(job_id: str, jobs_path: str | Path = DEFAULT_JOBS_PATH) -> dict[
     if status in TERMINAL_STATES:
         return job
 
-    pid = int(job.get("pid") or 0)
-    if pid > 0 and is_pid_running(pid):
-        return job
-
     meta = dict(job.get("meta") or {})
     status_path = meta.get("exit_code_path")
     exit_payload = _read_exit_payload(status_path) if status_path else None
 
+    # The worker writes its exit-code file right before exiting, so the file is
+    # authoritative even while the pid still looks alive (e.g. an unreaped child).
+    pid = int(job.get("pid") or 0)
+    if exit_payload is None and pid > 0 and is_pid_running(pid):
+        return job
+
     patch: dict[str, Any] = {}
     new_status: JobStatus = "failed"
 
@@ -148,8 +185,7 @@ def refresh_job(job_id: str, jobs_path: str | Path = DEFAULT_JOBS_PATH) -> dict[
 
 
 def refresh_all_jobs(jobs_path: str | Path = DEFAULT_JOBS_PATH) -> list[dict[str, Any]]:
-    current = list_jobs(jobs_path=jobs_path)
-    for job in current:
+    for job in list_jobs(jobs_path=jobs_path, status=ACTIVE_STATES):
         identifier = job.get("job_id")
         if isinstance(identifier, str):
             refresh_job(identifier, jobs_path=jobs_path)
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
 import argparse
+import importlib
 import json
+import logging
+import os
 import subprocess
+import sys
+import traceback
 from pathlib import Path
 from typing import Any
 
 from zugzwang.infra.ids import timestamp_utc
 
 
+LOGGER = logging.getLogger(__name__)
+
+
 def _extract_last_json_object(text: str) -> dict[str, Any] | None:
     decoder = json.JSONDecoder()
     candidate = text.strip()
@@ -79,6 +87,91 @@ def _run_child(
     return exit_code, payload, None
 
 
+def _run_in_process(
+    command: list[str],
+    stdout_path: Path,
+    stderr_path: Path,
+    workdir: Path,
+) -> tuple[int, dict[str, Any] | None, str | None]:
+    """Run ``python -m <module> args...`` by calling ``<module>.main(args)`` in this process."""
+    stdout_path.parent.mkdir(parents=True, exist_ok=True)
+    stderr_path.parent.mkdir(parents=True, exist_ok=True)
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    with stdout_path.open("ab") as out_fp, stderr_path.open("ab") as err_fp:
+        os.dup2(out_fp.fileno(), 1)
+        os.dup2(err_fp.fileno(), 2)
+    os.chdir(workdir)
+
+    module_name, args = command[2], command[3:]
+    sys.argv = [module_name, *args]
+    try:
+        module = importlib.import_module(module_name)
+        exit_code = module.main(args)
+    except SystemExit as exc:
+        exit_code = exc.code
+    except Exception:
+        traceback.print_exc()
+        exit_code = 1
+    if exit_code is None:
+        exit_code = 0
+    elif not isinstance(exit_code, int):
+        print(exit_code, file=sys.stderr)
+        exit_code = 1
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    payload = _extract_last_json_object(stdout_path.read_text(encoding="utf-8", errors="replace"))
+    return exit_code, payload, None
+
+
+def _warm(modules: list[str], warm_knowledge: bool) -> None:
+    for module_name in modules:
+        importlib.import_module(module_name)
+    if not warm_knowledge:
+        return
+    try:
+        from zugzwang.knowledge.retriever import warm_cache
+
+        warm_cache({"enabled": True})
+    except Exception:  # pragma: no cover - a cold index is only slower, not wrong
+        LOGGER.warning("knowledge index warm-up failed", exc_info=True)
+
+
+def _serve_pool_job(argv: list[str]) -> int:
+    """Pre-import, then block on stdin for a single job spec (EOF means shut down)."""
+    parser = argparse.ArgumentParser(prog="zugzwang-api-job-worker --pool")
+    parser.add_argument("--preload", action="append", default=[])
+    parser.add_argument("--no-warm-knowledge", action="store_true")
+    args = parser.parse_args(argv)
+
+    _warm(args.preload, warm_knowledge=not args.no_warm_knowledge)
+    line = sys.stdin.buffer.readline()
+    if not line.strip():
+        return 0
+
+    spec = json.loads(line)
+    command = [str(part) for part in spec["command"]]
+    exit_code_path = Path(spec["exit_code_path"])
+    started_at_utc = timestamp_utc()
+    exit_code, payload, error = _run_in_process(
+        command,
+        Path(spec["stdout_path"]),
+        Path(spec["stderr_path"]),
+        Path(spec["workdir"]),
+    )
+    _write_status(
+        exit_code_path=exit_code_path,
+        command=command,
+        exit_code=exit_code,
+        started_at_utc=started_at_utc,
+        payload=payload,
+        error=error,
+    )
+    return exit_code
+
+
 def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(prog="zugzwang-api-job-worker")
     parser.add_argument("--stdout-path", required=True)
@@ -96,6 +189,10 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
 
 
 def main(argv: list[str] | None = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv[:1] == ["--pool"]:
+        return _serve_pool_job(argv[1:])
+
     args = _parse_args(argv)
     command = [str(part) for part in args.command]
     stdout_path = Path(args.stdout_path)
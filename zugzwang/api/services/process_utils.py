@@ -21,6 +21,14 @@ def is_pid_running(pid: int) -> bool:
             check=False,
         )
         return str(pid) in proc.stdout
+    try:
+        # Reap our own exited children; otherwise they linger as zombies that
+        # still answer signal 0.
+        reaped_pid, _ = os.waitpid(pid, os.WNOHANG)
+        if reaped_pid == pid:
+            return False
+    except OSError:
+        pass
     try:
         os.kill(pid, 0)
     except OSError:
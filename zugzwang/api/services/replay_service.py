@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 import chess
@@ -8,72 +9,48 @@ import chess.svg
 from zugzwang.api.types import BoardStateFrame, GameRecordView, PlyMetrics
 
 
-class ReplayService:
-    def build_board_states(self, game_record: GameRecordView | dict[str, Any]) -> list[BoardStateFrame]:
-        moves = _extract_moves(game_record)
-        if not moves:
-            board = chess.Board()
-            return [
-                BoardStateFrame(
-                    ply_number=0,
-                    fen=board.fen(),
-                    svg=chess.svg.board(board=board, size=420),
-                    move_uci=None,
-                    move_san=None,
-                    color=None,
-                    raw_response=None,
-                )
-            ]
-
-        first_fen = str(moves[0].get("fen_before") or chess.STARTING_FEN)
-        start_board = chess.Board(first_fen)
-        frames: list[BoardStateFrame] = [
-            BoardStateFrame(
-                ply_number=0,
-                fen=start_board.fen(),
-                svg=chess.svg.board(board=start_board, size=420),
-                move_uci=None,
-                move_san=None,
-                color=None,
-                raw_response=None,
-            )
-        ]
-
-        for move in moves:
-            ply_number = int(move.get("ply_number", len(frames)))
-            color = _as_string(move.get("color"))
-            fen_before = str(move.get("fen_before") or frames[-1].fen)
-            decision = move.get("move_decision") if isinstance(move.get("move_decision"), dict) else {}
-            move_uci = _as_string(decision.get("move_uci"))
-            move_san = _as_string(decision.get("move_san"))
-            raw_response = _as_string(decision.get("raw_response"))
-
-            board = chess.Board(fen_before)
-            parsed_move: chess.Move | None = None
-            if move_uci:
-                try:
-                    parsed_move = chess.Move.from_uci(move_uci)
-                except ValueError:
-                    parsed_move = None
-
-            if parsed_move and parsed_move in board.legal_moves:
-                board.push(parsed_move)
-            else:
-                parsed_move = None
+DEFAULT_BOARD_SIZE = 420
+SVG_CACHE_SIZE = 2048
 
-            frames.append(
-                BoardStateFrame(
-                    ply_number=ply_number,
-                    fen=board.fen(),
-                    svg=chess.svg.board(board=board, lastmove=parsed_move, size=420),
-                    move_uci=move_uci,
-                    move_san=move_san,
-                    color=color,
-                    raw_response=raw_response,
-                )
-            )
 
-        return frames
+class ReplayService:
+    def build_board_states(
+        self,
+        game_record: GameRecordView | dict[str, Any],
+        *,
+        offset: int = 0,
+        limit: int | None = None,
+        render_svg: bool = True,
+        size: int = DEFAULT_BOARD_SIZE,
+    ) -> list[BoardStateFrame]:
+        """Frames for plies ``offset .. offset + limit``; SVGs only for that page.
+
+        With ``render_svg=False`` frames carry the FEN only and the client draws
+        the board.
+        """
+        positions = _replay_positions(_extract_moves(game_record))
+        end = None if limit is None else offset + max(0, limit)
+        return [_to_frame(position, render_svg=render_svg, size=size) for position in positions[offset:end]]
+
+    def count_frames(self, game_record: GameRecordView | dict[str, Any]) -> int:
+        return len(_extract_moves(game_record)) + 1
+
+    def build_frame(
+        self,
+        game_record: GameRecordView | dict[str, Any],
+        index: int,
+        *,
+        render_svg: bool = True,
+        size: int = DEFAULT_BOARD_SIZE,
+    ) -> BoardStateFrame | None:
+        """Single frame by position in the replay (0 is the start position)."""
+        if index < 0:
+            return None
+        moves = _extract_moves(game_record)
+        if index > len(moves):
+            return None
+        position = _replay_positions(moves[:index])[index]
+        return _to_frame(position, render_svg=render_svg, size=size)
 
     def frame_metrics(self, game_record: GameRecordView | dict[str, Any], ply: int) -> PlyMetrics:
         if ply <= 0:
@@ -104,6 +81,77 @@ class ReplayService:
         )
 
 
+def _replay_positions(moves: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Replay moves into per-ply positions (FEN and last move) without rendering."""
+    first_fen = str(moves[0].get("fen_before") or chess.STARTING_FEN) if moves else chess.STARTING_FEN
+    start_board = chess.Board(first_fen)
+    positions: list[dict[str, Any]] = [
+        {
+            "ply_number": 0,
+            "fen": start_board.fen(),
+            "lastmove": None,
+            "move_uci": None,
+            "move_san": None,
+            "color": None,
+            "raw_response": None,
+        }
+    ]
+
+    for move in moves:
+        ply_number = int(move.get("ply_number", len(positions)))
+        fen_before = str(move.get("fen_before") or positions[-1]["fen"])
+        decision = move.get("move_decision") if isinstance(move.get("move_decision"), dict) else {}
+        move_uci = _as_string(decision.get("move_uci"))
+
+        board = chess.Board(fen_before)
+        parsed_move: chess.Move | None = None
+        if move_uci:
+            try:
+                parsed_move = chess.Move.from_uci(move_uci)
+            except ValueError:
+                parsed_move = None
+
+        if parsed_move and parsed_move in board.legal_moves:
+            board.push(parsed_move)
+        else:
+            parsed_move = None
+
+        positions.append(
+            {
+                "ply_number": ply_number,
+                "fen": board.fen(),
+                "lastmove": parsed_move.uci() if parsed_move else None,
+                "move_uci": move_uci,
+                "move_san": _as_string(decision.get("move_san")),
+                "color": _as_string(move.get("color")),
+                "raw_response": _as_string(decision.get("raw_response")),
+            }
+        )
+    return positions
+
+
+def _to_frame(position: dict[str, Any], render_svg: bool, size: int) -> BoardStateFrame:
+    return BoardStateFrame(
+        ply_number=position["ply_number"],
+        fen=position["fen"],
+        svg=render_board_svg(position["fen"], position["lastmove"], size) if render_svg else None,
+        move_uci=position["move_uci"],
+        move_san=position["move_san"],
+        color=position["color"],
+        raw_response=position["raw_response"],
+    )
+
+
+@lru_cache(maxsize=SVG_CACHE_SIZE)
+def render_board_svg(fen: str, lastmove: str | None = None, size: int = DEFAULT_BOARD_SIZE) -> str:
+    """Board SVG, memoized on (fen, lastmove, size); positions repeat across games."""
+    return chess.svg.board(
+        board=chess.Board(fen),
+        lastmove=chess.Move.from_uci(lastmove) if lastmove else None,
+        size=size,
+    )
+
+
 def _extract_moves(game_record: GameRecordView | dict[str, Any]) -> list[dict[str, Any]]:
     if isinstance(game_record, GameRecordView):
         return [move for move in game_record.moves if isinstance(move, dict)]
@@ -7,7 +7,8 @@ from typing import Any, Literal
 
 import yaml
 
-from zugzwang.experiments.runner import ExperimentRunner
+from zugzwang.experiments.resume import find_completed_run
+from zugzwang.experiments.runner import ExperimentRunner, PreparedRun
 from zugzwang.api.services.config_service import ConfigService
 from zugzwang.api.services.job_runtime import cancel_job, job_log_tail, refresh_all_jobs, refresh_job, start_job
 from zugzwang.api.services.paths import project_root
@@ -37,24 +38,7 @@ class RunService:
         config_arg = str(config_path_resolved)
         resolved_profile = self.config_service.resolve_optional_path(model_profile)
 
-        preview_overrides = list(parsed_overrides)
-        if mode == "play":
-            preview_overrides.extend(
-                [
-                    "experiment.target_valid_games=1",
-                    "experiment.max_games=1",
-                ]
-            )
-        prepared = ExperimentRunner(
-            config_path=config_path_resolved,
-            model_profile_path=resolved_profile,
-            overrides=preview_overrides,
-        ).prepare()
-        runtime_cfg = prepared.config.get("runtime", {}) if isinstance(prepared.config, dict) else {}
-        output_root = runtime_cfg.get("output_dir", "results/runs")
-        output_root_path = Path(output_root)
-        if not output_root_path.is_absolute():
-            output_root_path = project_root() / output_root_path
+        prepared, output_root_path = self._prepare(config_path_resolved, resolved_profile, parsed_overrides, mode)
         run_dir = str(output_root_path / prepared.run_id)
 
         cmd: list[str] = [
@@ -99,6 +83,57 @@ class RunService:
             working_dir=project_root(),
         )
 
+    def find_completed_run(
+        self,
+        config_path: str,
+        model_profile: str | None = None,
+        overrides: str | list[str] | None = None,
+        mode: RunMode = "run",
+    ) -> dict[str, Any] | None:
+        """Existing finished run for the config hash this launch would produce."""
+        parsed_overrides = _normalize_run_overrides(self.config_service.parse_overrides(overrides), mode)
+        prepared, output_root_path = self._prepare(
+            self.config_service.resolve_path(config_path),
+            self.config_service.resolve_optional_path(model_profile),
+            parsed_overrides,
+            mode,
+        )
+        run_dir = find_completed_run(output_root_path, prepared.config_hash)
+        if run_dir is None:
+            return None
+        return {
+            "run_id": run_dir.name,
+            "run_dir": str(run_dir),
+            "config_hash": prepared.config_hash,
+        }
+
+    def _prepare(
+        self,
+        config_path: Path,
+        model_profile: Path | None,
+        overrides: list[str],
+        mode: RunMode,
+    ) -> tuple[PreparedRun, Path]:
+        preview_overrides = list(overrides)
+        if mode == "play":
+            preview_overrides.extend(
+                [
+                    "experiment.target_valid_games=1",
+                    "experiment.max_games=1",
+                ]
+            )
+        prepared = ExperimentRunner(
+            config_path=config_path,
+            model_profile_path=model_profile,
+            overrides=preview_overrides,
+        ).prepare()
+        runtime_cfg = prepared.config.get("runtime", {}) if isinstance(prepared.config, dict) else {}
+        output_root = runtime_cfg.get("output_dir", "results/runs")
+        output_root_path = Path(output_root)
+        if not output_root_path.is_absolute():
+            output_root_path = project_root() / output_root_path
+        return prepared, output_root_path
+
     def get_run_progress(self, job_id: str) -> RunProgress:
         job = refresh_job(job_id, jobs_path=self.jobs_path) or get_job(job_id, jobs_path=self.jobs_path)
         if not job:
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Iterable
+
+from zugzwang.api.services.file_watch import DirectoryWatcher, watch_directory
+from zugzwang.api.services.paths import ui_jobs_root
+from zugzwang.api.services.scheduler_service import SchedulerService
+
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_POLL_SECONDS = 5.0
+_STOP_CHECK_SECONDS = 0.5
+
+ExitEventWatcher = DirectoryWatcher
+
+
+def watch_exit_events(directory: str | Path) -> ExitEventWatcher:
+    """Watch for ``job_worker`` exit-code files (written then closed, or renamed in)."""
+    return watch_directory(directory)
+
+
+class SchedulerDaemon:
+    """Advances scheduler batches as soon as a job's exit-code file appears.
+
+    Runs as a background thread inside the API process or in the foreground via
+    ``zugzwang scheduler``. Besides events, every ``poll_seconds`` it advances all
+    active batches as a safety net (e.g. a job wrapper that was killed).
+    """
+
+    def __init__(
+        self,
+        scheduler_service: SchedulerService | None = None,
+        *,
+        status_dir: str | Path | None = None,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+        watcher: ExitEventWatcher | None = None,
+    ) -> None:
+        self.scheduler_service = scheduler_service or SchedulerService()
+        self.status_dir = Path(status_dir) if status_dir else ui_jobs_root() / "status"
+        self.poll_seconds = float(poll_seconds)
+        self._watcher = watcher
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def tick(self, job_ids: Iterable[str] = ()) -> int:
+        run_service = self.scheduler_service.run_service
+        for job_id in job_ids:
+            run_service.get_job(job_id, refresh=True)
+        return self.scheduler_service.advance_active_batches()
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self.scheduler_service.background_refresh = True
+        # Watch before returning so exit files written right after start() are seen.
+        watcher = self._watcher or watch_exit_events(self.status_dir)
+        self._thread = threading.Thread(
+            target=self.run_forever,
+            kwargs={"watcher": watcher},
+            name="zugzwang-scheduler",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.scheduler_service.background_refresh = False
+
+    def run_forever(self, watcher: ExitEventWatcher | None = None) -> None:
+        watcher = watcher or self._watcher or watch_exit_events(self.status_dir)
+        try:
+            self._safe_tick(())
+            last_tick = time.monotonic()
+            while not self._stop.is_set():
+                # Short slices keep stop() responsive with long poll intervals.
+                changed = watcher.wait(min(self.poll_seconds, _STOP_CHECK_SECONDS))
+                if self._stop.is_set():
+                    break
+                job_ids = [name[: -len(".json")] for name in changed if name.endswith(".json")]
+                if job_ids or time.monotonic() - last_tick >= self.poll_seconds:
+                    self._safe_tick(job_ids)
+                    last_tick = time.monotonic()
+        finally:
+            watcher.close()
+
+    def _safe_tick(self, job_ids: Iterable[str]) -> None:
+        try:
+            self.tick(job_ids)
+        except Exception:  # pragma: no cover - keep the loop alive
+            LOGGER.exception("scheduler tick failed")
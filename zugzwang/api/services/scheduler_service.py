@@ -3,6 +3,7 @@
 from dataclasses import asdict, is_dataclass
 import json
 from pathlib import Path
+import threading
 from typing import Any
 import uuid
 
@@ -17,10 +18,18 @@ from zugzwang.experiments.scheduler import (
     batch_from_dict,
     build_batch_state,
     cancel_batch,
+    infer_step_resources,
     is_batch_terminal,
+    normalize_concurrency_limits,
     normalize_step_definitions,
 )
 from zugzwang.infra.ids import timestamp_utc
+from zugzwang.infra.locks import file_lock
+
+
+# Held around every load/advance/save so an API process and a separate
+# `zugzwang scheduler` process never start the same pending step twice.
+LOCK_FILENAME = ".scheduler.lock"
 
 
 class SchedulerService:
@@ -35,6 +44,10 @@ class SchedulerService:
         self.store_root.mkdir(parents=True, exist_ok=True)
         self.run_service = run_service or RunService()
         self.config_service = config_service or ConfigService()
+        # Set while a SchedulerDaemon advances batches; reads then skip refreshing.
+        self.background_refresh = False
+        self._lock = threading.RLock()
+        self._lock_path = self.store_root / LOCK_FILENAME
 
     def create_batch(
         self,
@@ -43,9 +56,21 @@ class SchedulerService:
         fail_fast: bool = True,
         dry_run: bool = False,
         batch_id: str | None = None,
+        max_parallel_steps: int = 1,
+        provider_limits: dict[str, int] | None = None,
+        max_engine_cores: int | None = None,
+        force: bool = False,
     ) -> dict[str, Any]:
         definitions = normalize_step_definitions(steps)
-        previews = self._build_step_previews(definitions)
+        if force:
+            for definition in definitions:
+                definition.force = True
+        parallel, limits, cores = normalize_concurrency_limits(
+            max_parallel_steps=max_parallel_steps,
+            provider_limits=provider_limits,
+            max_engine_cores=max_engine_cores,
+        )
+        previews, inferred_resources = self._build_step_previews(definitions)
 
         resolved_batch_id = _normalize_batch_id(batch_id) or self._make_batch_id()
         batch = build_batch_state(
@@ -54,14 +79,19 @@ class SchedulerService:
             fail_fast=fail_fast,
             dry_run=dry_run,
             previews=previews,
+            inferred_resources=inferred_resources,
+            max_parallel_steps=parallel,
+            provider_limits=limits,
+            max_engine_cores=cores,
         )
 
-        if not dry_run:
-            batch = self._advance_batch(batch)
-        self._save_batch(batch)
+        with self._lock, file_lock(self._lock_path):
+            if not dry_run:
+                batch = self._advance_batch(batch)
+            self._save_batch(batch)
         return batch.to_dict()
 
-    def list_batches(self, *, limit: int = 50, refresh: bool = True) -> list[dict[str, Any]]:
+    def list_batches(self, *, limit: int = 50, refresh: bool | None = None) -> list[dict[str, Any]]:
         paths = sorted(
             self.store_root.glob("*.json"),
             key=lambda item: item.stat().st_mtime,
@@ -69,32 +99,56 @@ class SchedulerService:
         )
         items: list[dict[str, Any]] = []
         for path in paths[: max(1, limit)]:
-            batch = self._load_batch(path.stem)
-            if refresh:
-                batch = self._advance_batch(batch)
-                self._save_batch(batch)
-            items.append(batch.to_dict())
+            items.append(self.get_batch(path.stem, refresh=refresh))
         return items
 
-    def get_batch(self, batch_id: str, *, refresh: bool = True) -> dict[str, Any]:
-        batch = self._load_batch(batch_id)
-        if refresh:
+    def get_batch(self, batch_id: str, *, refresh: bool | None = None) -> dict[str, Any]:
+        """Load a batch; ``refresh=None`` advances it only when no daemon is running."""
+        if refresh is None:
+            refresh = not self.background_refresh
+        if not refresh:
+            return self._load_batch(batch_id).to_dict()
+        with self._lock, file_lock(self._lock_path):
+            batch = self._load_batch(batch_id)
             batch = self._advance_batch(batch)
             self._save_batch(batch)
         return batch.to_dict()
 
+    def advance_active_batches(self) -> int:
+        """Advance every non-terminal batch; returns how many changed."""
+        changed = 0
+        with self._lock, file_lock(self._lock_path):
+            for path in sorted(self.store_root.glob("*.json")):
+                try:
+                    batch = self._load_batch(path.stem)
+                except (OSError, ValueError):
+                    continue
+                if is_batch_terminal(batch):
+                    continue
+                before = _without_timestamp(batch.to_dict())
+                batch = self._advance_batch(batch)
+                if _without_timestamp(batch.to_dict()) != before:
+                    self._save_batch(batch)
+                    changed += 1
+        return changed
+
     def cancel_batch(self, batch_id: str) -> dict[str, Any]:
-        batch = self._load_batch(batch_id)
-        if not is_batch_terminal(batch):
-            for step in batch.steps:
-                if step.status == "running" and step.job_id:
-                    self.run_service.cancel_run(step.job_id)
-            batch = cancel_batch(batch)
-            self._save_batch(batch)
+        with self._lock, file_lock(self._lock_path):
+            batch = self._load_batch(batch_id)
+            if not is_batch_terminal(batch):
+                for step in batch.steps:
+                    if step.status == "running" and step.job_id:
+                        self.run_service.cancel_run(step.job_id)
+                batch = cancel_batch(batch)
+                self._save_batch(batch)
         return batch.to_dict()
 
-    def _build_step_previews(self, definitions: list[BatchStepDefinition]) -> dict[str, dict[str, Any]]:
+    def _build_step_previews(
+        self,
+        definitions: list[BatchStepDefinition],
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, tuple[list[str], int]]]:
         previews: dict[str, dict[str, Any]] = {}
+        inferred_resources: dict[str, tuple[list[str], int]] = {}
         for definition in definitions:
             effective_overrides = list(definition.overrides)
             if definition.mode == "play":
@@ -111,7 +165,8 @@ class SchedulerService:
                 "scheduled_games": preview.scheduled_games,
                 "estimated_total_cost_usd": preview.estimated_total_cost_usd,
             }
-        return previews
+            inferred_resources[definition.step_id] = infer_step_resources(preview.resolved_config)
+        return previews, inferred_resources
 
     def _advance_batch(self, batch: BatchState) -> BatchState:
         if is_batch_terminal(batch):
@@ -126,6 +181,21 @@ class SchedulerService:
 
     def _start_step(self, step: Any) -> dict[str, Any]:
         overrides = list(step.overrides or [])
+        if not step.force:
+            cached = self.run_service.find_completed_run(
+                config_path=step.config_path,
+                model_profile=step.model_profile,
+                overrides=overrides,
+                mode=step.mode,
+            )
+            if cached is not None:
+                return {
+                    "job_id": None,
+                    "run_id": cached.get("run_id"),
+                    "run_dir": cached.get("run_dir"),
+                    "status": "completed",
+                    "message": f"reused_completed_run:{cached.get('run_id')}",
+                }
         handle = self.run_service.start_run(
             config_path=step.config_path,
             model_profile=step.model_profile,
@@ -158,6 +228,10 @@ class SchedulerService:
         path.write_text(json.dumps(batch.to_dict(), indent=2), encoding="utf-8")
 
 
+def _without_timestamp(payload: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in payload.items() if key != "updated_at_utc"}
+
+
 def _normalize_batch_id(value: Any) -> str | None:
     if not isinstance(value, str):
         return None
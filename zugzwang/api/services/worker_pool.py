@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import logging
+import subprocess
+import threading
+from pathlib import Path
+from typing import Any
+
+from zugzwang.api.services.paths import project_root
+from zugzwang.api.services.process_utils import python_executable
+
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_POOL_MODULES: tuple[str, ...] = ("zugzwang.cli",)
+
+
+class WorkerPool:
+    """Idle ``job_worker --pool`` processes that have already imported the CLI.
+
+    Each worker runs exactly one job in-process and then exits, so jobs never
+    share interpreter state; the pool spawns a replacement as soon as a worker
+    is handed a job. The job's pid is the worker's pid, so cancellation and
+    liveness checks work exactly as for cold-started jobs.
+    """
+
+    def __init__(
+        self,
+        size: int = DEFAULT_POOL_SIZE,
+        *,
+        modules: tuple[str, ...] = DEFAULT_POOL_MODULES,
+        warm_knowledge: bool = True,
+        workdir: str | Path | None = None,
+    ) -> None:
+        self.size = max(0, int(size))
+        self.modules = tuple(modules)
+        self.warm_knowledge = bool(warm_knowledge)
+        self.workdir = Path(workdir or project_root())
+        self._idle: list[subprocess.Popen[bytes]] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def start(self) -> None:
+        with self._lock:
+            self._closed = False
+            self._fill()
+
+    def stop(self) -> None:
+        """Release idle workers; workers already running a job are left alone."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for process in idle:
+            _close_stdin(process)
+        for process in idle:
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    @property
+    def idle_count(self) -> int:
+        with self._lock:
+            self._idle = [process for process in self._idle if process.poll() is None]
+            return len(self._idle)
+
+    def accepts(self, command: list[str]) -> bool:
+        """Only ``<this python> -m <preloaded module> ...`` can run inside a worker."""
+        return (
+            len(command) >= 3
+            and command[0] == python_executable()
+            and command[1] == "-m"
+            and command[2] in self.modules
+        )
+
+    def submit(
+        self,
+        *,
+        command: list[str],
+        stdout_path: str | Path,
+        stderr_path: str | Path,
+        exit_code_path: str | Path,
+        workdir: str | Path,
+    ) -> int | None:
+        """Hand a job to an idle worker and return its pid, or None if none is ready."""
+        if not self.accepts(command):
+            return None
+        spec = {
+            "command": [str(part) for part in command],
+            "stdout_path": str(stdout_path),
+            "stderr_path": str(stderr_path),
+            "exit_code_path": str(exit_code_path),
+            "workdir": str(workdir),
+        }
+        line = (json.dumps(spec) + "\n").encode("utf-8")
+
+        with self._lock:
+            if self._closed:
+                return None
+            while self._idle:
+                process = self._idle.pop(0)
+                if process.poll() is not None or process.stdin is None:
+                    continue
+                try:
+                    process.stdin.write(line)
+                    process.stdin.close()
+                except OSError:
+                    LOGGER.warning("pool worker %s died before taking a job", process.pid)
+                    continue
+                self._fill()
+                return int(process.pid)
+            self._fill()
+        return None
+
+    def _fill(self) -> None:
+        self._idle = [process for process in self._idle if process.poll() is None]
+        while not self._closed and len(self._idle) < self.size:
+            self._idle.append(self._spawn())
+
+    def _spawn(self) -> subprocess.Popen[bytes]:
+        command = [python_executable(), "-m", "zugzwang.api.services.job_worker", "--pool"]
+        for module in self.modules:
+            command.extend(["--preload", module])
+        if not self.warm_knowledge:
+            command.append("--no-warm-knowledge")
+        return subprocess.Popen(command, cwd=str(self.workdir), stdin=subprocess.PIPE)
+
+
+_active_pool: WorkerPool | None = None
+
+
+def active_pool() -> WorkerPool | None:
+    return _active_pool
+
+
+def set_active_pool(pool: WorkerPool | None) -> None:
+    global _active_pool
+    _active_pool = pool
+
+
+def pool_size_from_env(value: str | None) -> int:
+    if value is None or not value.strip():
+        return DEFAULT_POOL_SIZE
+    try:
+        return max(0, int(value))
+    except ValueError:
+        return DEFAULT_POOL_SIZE
+
+
+def _close_stdin(process: subprocess.Popen[Any]) -> None:
+    if process.stdin is None:
+        return
+    try:
+        process.stdin.close()
+    except OSError:
+        pass
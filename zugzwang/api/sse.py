@@ -1,93 +1,346 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import weakref
 from pathlib import Path
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Callable
 
 from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
 
+from zugzwang.api.services.file_watch import (
+    IN_CLOSE_WRITE,
+    IN_CREATE,
+    IN_MODIFY,
+    IN_MOVED_TO,
+    InotifyWatcher,
+    try_inotify,
+)
+
+
+LOGGER = logging.getLogger(__name__)
 
 TERMINAL_JOB_STATES: set[str] = {"completed", "failed", "canceled"}
+STREAMS: tuple[str, str] = ("stdout", "stderr")
 
+_LOG_EVENT_MASK = IN_MODIFY | IN_CREATE | IN_CLOSE_WRITE | IN_MOVED_TO
+_FINAL_EVENTS = {"done", "error"}
+_DISCONNECT_CHECK_SECONDS = 5.0
 
-def build_sse_event(event: str, data: Any) -> dict[str, Any]:
-    return {"event": event, "data": data}
 
+def build_sse_event(event: str, data: Any, event_id: str | None = None) -> dict[str, Any]:
+    payload: dict[str, Any] = {"event": event, "data": data}
+    if event_id is not None:
+        payload["id"] = event_id
+    return payload
 
-async def iter_job_log_events(
-    *,
-    job_id: str,
-    request: Request,
-    run_service: Any,
-    poll_interval_seconds: float = 0.2,
-) -> AsyncIterator[dict[str, Any]]:
-    stdout_offset = 0
-    stderr_offset = 0
-    stdout_carry = ""
-    stderr_carry = ""
 
-    while True:
-        if await request.is_disconnected():
-            break
+def format_event_id(offsets: dict[str, int]) -> str:
+    """Event ids are the stdout/stderr byte offsets after the event, ``"<out>:<err>"``."""
+    return f"{offsets.get('stdout', 0)}:{offsets.get('stderr', 0)}"
+
+
+def parse_last_event_id(value: str | None) -> dict[str, int]:
+    offsets = {stream: 0 for stream in STREAMS}
+    if not value:
+        return offsets
+    parts = value.strip().split(":")
+    if len(parts) != len(STREAMS):
+        return offsets
+    try:
+        parsed = [max(0, int(part)) for part in parts]
+    except ValueError:
+        return offsets
+    return dict(zip(STREAMS, parsed))
+
+
+class _LogStream:
+    """Byte offset of complete lines read so far, plus the trailing partial line."""
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.offset = 0
+        self._partial = b""
+
+    def read_lines(self, final: bool = False) -> list[tuple[str, int]]:
+        if self.path is None:
+            return []
+        try:
+            size = self.path.stat().st_size
+        except OSError:
+            return []
+
+        position = self.offset + len(self._partial)
+        if size < position:
+            # Truncated or replaced: start over.
+            self.offset = 0
+            self._partial = b""
+            position = 0
+
+        chunk = b""
+        if size > position:
+            with self.path.open("rb") as fp:
+                fp.seek(position)
+                chunk = fp.read(size - position)
+
+        lines: list[tuple[str, int]] = []
+        data = self._partial + chunk
+        start = 0
+        while True:
+            newline = data.find(b"\n", start)
+            if newline < 0:
+                break
+            self.offset += newline + 1 - start
+            lines.append((_decode_line(data[start:newline]), self.offset))
+            start = newline + 1
+        self._partial = data[start:]
+
+        if final and self._partial:
+            self.offset += len(self._partial)
+            lines.append((_decode_line(self._partial), self.offset))
+            self._partial = b""
+        return lines
+
+
+class JobLogTailer:
+    """Tails one job's stdout/stderr once and fans new lines out to every subscriber.
+
+    Wakes on inotify events for this job's log files (polling elsewhere) and
+    checks the job status every ``status_interval_seconds``, independent of how
+    many SSE clients are connected. The status refresh runs in the threadpool
+    so it never blocks the event loop.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        job: dict[str, Any],
+        run_service: Any,
+        *,
+        poll_interval_seconds: float = 0.2,
+        status_interval_seconds: float = 1.0,
+    ) -> None:
+        self.job_id = job_id
+        self.run_service = run_service
+        self.poll_interval_seconds = float(poll_interval_seconds)
+        self.status_interval_seconds = float(status_interval_seconds)
+        self.streams = {
+            "stdout": _LogStream(_as_path(job.get("stdout_path"))),
+            "stderr": _LogStream(_as_path(job.get("stderr_path"))),
+        }
+        self.closed = False
+        self._subscribers: set[asyncio.Queue[dict[str, Any]]] = set()
+        self._task: asyncio.Task[None] | None = None
+
+    def offsets(self) -> dict[str, int]:
+        return {name: stream.offset for name, stream in self.streams.items()}
 
-        job = run_service.get_job(job_id, refresh=True)
-        if job is None:
-            yield build_sse_event("error", f"Job not found: {job_id}")
-            break
+    def subscribe(self, after: dict[str, int] | None = None) -> asyncio.Queue[dict[str, Any]]:
+        """Queue pre-filled with lines between ``after`` and the shared tail position."""
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        position = dict(after or {})
+        for name in STREAMS:
+            stream = self.streams[name]
+            start = position.get(name, 0)
+            for line, end in _read_complete_lines(stream.path, start, stream.offset):
+                position[name] = end
+                queue.put_nowait(build_sse_event(name, line, format_event_id(position)))
+            position[name] = stream.offset
+        self._subscribers.add(queue)
+        return queue
 
-        stdout_path = _as_path(job.get("stdout_path"))
-        stderr_path = _as_path(job.get("stderr_path"))
+    def unsubscribe(self, queue: asyncio.Queue[dict[str, Any]]) -> None:
+        self._subscribers.discard(queue)
+        if not self._subscribers and self._task is not None and not self._task.done():
+            # Mark closed now so a client arriving before the cancel lands gets a fresh tailer.
+            self.closed = True
+            self._task.cancel()
 
-        stdout_offset, stdout_lines, stdout_carry = _read_new_lines(stdout_path, stdout_offset, stdout_carry)
-        stderr_offset, stderr_lines, stderr_carry = _read_new_lines(stderr_path, stderr_offset, stderr_carry)
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
 
-        for line in stdout_lines:
-            yield build_sse_event("stdout", line)
-        for line in stderr_lines:
-            yield build_sse_event("stderr", line)
+    def start(self, on_close: Callable[[JobLogTailer], None] | None = None) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run(on_close))
 
-        status = str(job.get("status", "queued"))
-        if status in TERMINAL_JOB_STATES:
-            if stdout_carry:
-                yield build_sse_event("stdout", stdout_carry)
-            if stderr_carry:
-                yield build_sse_event("stderr", stderr_carry)
-            yield build_sse_event("done", {"status": status})
-            break
+    async def _run(self, on_close: Callable[[JobLogTailer], None] | None) -> None:
+        loop = asyncio.get_running_loop()
+        wake = asyncio.Event()
+        watcher = self._open_watcher()
+        if watcher is not None:
+            # The watch covers the whole logs directory; only this job's files wake us.
+            log_names = {stream.path.name for stream in self.streams.values() if stream.path is not None}
 
-        await asyncio.sleep(poll_interval_seconds)
+            def _on_events() -> None:
+                if log_names.intersection(watcher.drain()):
+                    wake.set()
 
+            loop.add_reader(watcher.fileno(), _on_events)
+        try:
+            last_status_check = float("-inf")
+            while True:
+                self._publish_new_lines()
+                now = loop.time()
+                if now - last_status_check >= self.status_interval_seconds:
+                    last_status_check = now
+                    job = await run_in_threadpool(self.run_service.get_job, self.job_id, refresh=True)
+                    if job is None:
+                        self._finish(build_sse_event("error", f"Job not found: {self.job_id}"))
+                        return
+                    status = str(job.get("status", "queued"))
+                    if status in TERMINAL_JOB_STATES:
+                        self._publish_new_lines(final=True)
+                        self._finish(build_sse_event("done", {"status": status}, format_event_id(self.offsets())))
+                        return
 
-def _read_new_lines(path: Path | None, offset: int, carry: str) -> tuple[int, list[str], str]:
-    if path is None or not path.exists():
-        return offset, [], carry
+                timeout = self.status_interval_seconds if watcher is not None else self.poll_interval_seconds
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=timeout)
+                except TimeoutError:
+                    pass
+                wake.clear()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pragma: no cover - surface to clients instead of hanging them
+            LOGGER.exception("log tailer failed for %s", self.job_id)
+            self._finish(build_sse_event("error", str(exc)))
+        finally:
+            self.closed = True
+            if watcher is not None:
+                loop.remove_reader(watcher.fileno())
+                watcher.close()
+            if on_close is not None:
+                on_close(self)
 
-    if offset < 0:
-        offset = 0
+    def _open_watcher(self) -> InotifyWatcher | None:
+        path = self.streams["stdout"].path or self.streams["stderr"].path
+        if path is None or not path.parent.exists():
+            return None
+        return try_inotify(path.parent, mask=_LOG_EVENT_MASK)
+
+    def _publish_new_lines(self, final: bool = False) -> None:
+        for name in STREAMS:
+            position = self.offsets()
+            for line, end in self.streams[name].read_lines(final=final):
+                position[name] = end
+                self._broadcast(build_sse_event(name, line, format_event_id(position)))
+
+    def _broadcast(self, event: dict[str, Any]) -> None:
+        for queue in self._subscribers:
+            queue.put_nowait(event)
+
+    def _finish(self, event: dict[str, Any]) -> None:
+        self.closed = True
+        self._broadcast(event)
+        self._subscribers.clear()
+
+
+class JobLogHub:
+    """One :class:`JobLogTailer` per job, shared by all SSE clients on an event loop."""
+
+    def __init__(self, **tailer_kwargs: Any) -> None:
+        self.tailer_kwargs = tailer_kwargs
+        self._tailers: dict[str, JobLogTailer] = {}
+
+    def subscribe(
+        self,
+        job_id: str,
+        job: dict[str, Any],
+        run_service: Any,
+        after: dict[str, int] | None = None,
+    ) -> tuple[JobLogTailer, asyncio.Queue[dict[str, Any]]]:
+        tailer = self._tailers.get(job_id)
+        if tailer is not None and not tailer.closed:
+            return tailer, tailer.subscribe(after)
+
+        tailer = JobLogTailer(job_id, job, run_service, **self.tailer_kwargs)
+        self._tailers[job_id] = tailer
+        queue = tailer.subscribe(after)
+        tailer.start(on_close=self._discard)
+        return tailer, queue
+
+    def active_jobs(self) -> list[str]:
+        return sorted(job_id for job_id, tailer in self._tailers.items() if not tailer.closed)
+
+    def _discard(self, tailer: JobLogTailer) -> None:
+        if self._tailers.get(tailer.job_id) is tailer:
+            del self._tailers[tailer.job_id]
+
+
+_hubs: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, JobLogHub] = weakref.WeakKeyDictionary()
+
+
+def get_job_log_hub() -> JobLogHub:
+    loop = asyncio.get_running_loop()
+    hub = _hubs.get(loop)
+    if hub is None:
+        hub = JobLogHub()
+        _hubs[loop] = hub
+    return hub
+
+
+async def iter_job_log_events(
+    *,
+    job_id: str,
+    request: Request,
+    run_service: Any,
+    job: dict[str, Any] | None = None,
+    last_event_id: str | None = None,
+    hub: JobLogHub | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    if job is None:
+        job = await run_in_threadpool(run_service.get_job, job_id, refresh=True)
+    if job is None:
+        yield build_sse_event("error", f"Job not found: {job_id}")
+        return
 
-    file_size = path.stat().st_size
-    if offset > file_size:
-        offset = 0
-        carry = ""
+    hub = hub or get_job_log_hub()
+    after = parse_last_event_id(last_event_id)
+    tailer, queue = hub.subscribe(job_id, job, run_service, after=after)
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=_DISCONNECT_CHECK_SECONDS)
+            except TimeoutError:
+                if await request.is_disconnected():
+                    break
+                continue
+            name = event["event"]
+            # A fresh tailer replays from the start; skip what this client already has.
+            if name in after and parse_last_event_id(event.get("id"))[name] <= after[name]:
+                continue
+            yield event
+            if name in _FINAL_EVENTS:
+                break
+    finally:
+        tailer.unsubscribe(queue)
 
-    with path.open("rb") as fp:
-        fp.seek(offset)
-        chunk = fp.read()
 
-    if not chunk:
-        return offset, [], carry
+def _read_complete_lines(path: Path | None, start: int, end: int) -> list[tuple[str, int]]:
+    if path is None or end <= start:
+        return []
+    try:
+        with path.open("rb") as fp:
+            fp.seek(start)
+            data = fp.read(end - start)
+    except OSError:
+        return []
 
-    text = chunk.decode("utf-8", errors="replace")
-    combined = carry + text
-    lines = combined.splitlines()
+    lines: list[tuple[str, int]] = []
+    position = start
+    *complete, tail = data.split(b"\n")
+    for raw in complete:
+        position += len(raw) + 1
+        lines.append((_decode_line(raw), position))
+    if tail:
+        # Partial last line already flushed by a finished tailer.
+        lines.append((_decode_line(tail), end))
+    return lines
 
-    ends_with_newline = combined.endswith("\n") or combined.endswith("\r")
-    if ends_with_newline:
-        new_carry = ""
-    else:
-        new_carry = lines.pop() if lines else combined
 
-    return offset + len(chunk), lines, new_carry
+def _decode_line(raw: bytes) -> str:
+    return raw.decode("utf-8", errors="replace").rstrip("\r")
 
 
 def _as_path(value: Any) -> Path | None:
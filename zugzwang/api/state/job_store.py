@@ -1,20 +1,183 @@
 from __future__ import annotations
 
 import json
+import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from zugzwang.infra.ids import timestamp_utc
 from zugzwang.api.types import JobHandle, JobStatus
 
 
+# The legacy append-only event log. Jobs now live in a SQLite database next to it
+# (``jobs.sqlite3``); existing jsonl events are imported on first use.
 DEFAULT_JOBS_PATH = Path("results/ui_jobs/jobs.jsonl")
 
+TERMINAL_JOB_STATES: tuple[str, ...] = ("completed", "failed", "canceled")
 
-def _ensure_parent(path: Path) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    if not path.exists():
-        path.touch()
+_SQLITE_SUFFIXES = {".sqlite3", ".sqlite", ".db"}
+_BUSY_TIMEOUT_SECONDS = 30.0
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    job_type TEXT,
+    status TEXT,
+    created_at_utc TEXT,
+    updated_at_utc TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_idx ON jobs (status, created_at_utc);
+CREATE INDEX IF NOT EXISTS jobs_created_idx ON jobs (created_at_utc);
+CREATE TABLE IF NOT EXISTS store_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_initialized: set[str] = set()
+_init_lock = threading.Lock()
+
+
+def jobs_db_path(jobs_path: str | Path = DEFAULT_JOBS_PATH) -> Path:
+    path = Path(jobs_path)
+    if path.suffix in _SQLITE_SUFFIXES:
+        return path
+    return path.with_suffix(".sqlite3")
+
+
+@contextmanager
+def _connect(jobs_path: str | Path) -> Iterator[sqlite3.Connection]:
+    db_path = jobs_db_path(jobs_path)
+    key = str(db_path.resolve())
+    if key not in _initialized:
+        with _init_lock:
+            if key not in _initialized:
+                _initialize(db_path, Path(jobs_path))
+                _initialized.add(key)
+
+    conn = sqlite3.connect(db_path, timeout=_BUSY_TIMEOUT_SECONDS, isolation_level=None)
+    try:
+        conn.execute("PRAGMA synchronous=NORMAL")
+        yield conn
+    finally:
+        conn.close()
+
+
+@contextmanager
+def _write_transaction(conn: sqlite3.Connection) -> Iterator[None]:
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _initialize(db_path: Path, jobs_path: Path) -> None:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=_BUSY_TIMEOUT_SECONDS, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        if jobs_path != db_path:
+            _import_jsonl(conn, jobs_path)
+    finally:
+        conn.close()
+
+
+def _import_jsonl(conn: sqlite3.Connection, jobs_path: Path) -> int:
+    """Replay legacy jsonl events not yet imported; returns the number applied.
+
+    The byte offset of the last imported line is kept in ``store_meta``, so lines
+    appended later by an older checkout are picked up on the next start.
+    """
+    if not jobs_path.exists():
+        return 0
+
+    applied = 0
+    with _write_transaction(conn):
+        row = conn.execute("SELECT value FROM store_meta WHERE key = 'jsonl_offset'").fetchone()
+        offset = int(row[0]) if row else 0
+        if offset > jobs_path.stat().st_size:
+            offset = 0
+        with jobs_path.open("rb") as fp:
+            fp.seek(offset)
+            for raw in fp:
+                if not raw.endswith(b"\n"):
+                    break
+                offset += len(raw)
+                try:
+                    event = json.loads(raw.decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    continue
+                if not isinstance(event, dict):
+                    continue
+                payload = event.get("payload", {})
+                if not isinstance(payload, dict):
+                    continue
+                if _apply_event(conn, str(event.get("event_type", "")), payload, event.get("ts_utc")):
+                    applied += 1
+        conn.execute(
+            "INSERT OR REPLACE INTO store_meta (key, value) VALUES ('jsonl_offset', ?)",
+            (str(offset),),
+        )
+    return applied
+
+
+def _apply_event(
+    conn: sqlite3.Connection,
+    event_type: str,
+    payload: dict[str, Any],
+    ts_utc: Any,
+) -> bool:
+    job_id = payload.get("job_id")
+    if not job_id:
+        return False
+
+    if event_type == "job_created":
+        job = dict(payload)
+        job["updated_at_utc"] = ts_utc
+        _write_job(conn, job)
+        return True
+
+    if event_type == "job_updated":
+        job = _read_job(conn, str(job_id))
+        if job is None:
+            return False
+        job["status"] = payload.get("status", job.get("status"))
+        patch = payload.get("patch", {})
+        if isinstance(patch, dict):
+            job.update(patch)
+        job["updated_at_utc"] = ts_utc
+        _write_job(conn, job)
+        return True
+
+    return False
+
+
+def _read_job(conn: sqlite3.Connection, job_id: str) -> dict[str, Any] | None:
+    row = conn.execute("SELECT payload FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+    if row is None:
+        return None
+    return json.loads(row[0])
+
+
+def _write_job(conn: sqlite3.Connection, job: dict[str, Any]) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO jobs (job_id, job_type, status, created_at_utc, updated_at_utc, payload) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            str(job["job_id"]),
+            job.get("job_type"),
+            job.get("status"),
+            job.get("created_at_utc"),
+            job.get("updated_at_utc"),
+            json.dumps(job),
+        ),
+    )
 
 
 def append_event(
@@ -22,15 +185,8 @@ def append_event(
     payload: dict[str, Any],
     jobs_path: str | Path = DEFAULT_JOBS_PATH,
 ) -> None:
-    path = Path(jobs_path)
-    _ensure_parent(path)
-    event = {
-        "ts_utc": timestamp_utc(),
-        "event_type": event_type,
-        "payload": payload,
-    }
-    with path.open("a", encoding="utf-8") as fp:
-        fp.write(json.dumps(event) + "\n")
+    with _connect(jobs_path) as conn, _write_transaction(conn):
+        _apply_event(conn, event_type, payload, timestamp_utc())
 
 
 def create_job(job: JobHandle, jobs_path: str | Path = DEFAULT_JOBS_PATH) -> None:
@@ -47,45 +203,73 @@ def update_job(
     append_event("job_updated", payload, jobs_path=jobs_path)
 
 
-def list_jobs(jobs_path: str | Path = DEFAULT_JOBS_PATH) -> list[dict[str, Any]]:
-    path = Path(jobs_path)
-    if not path.exists():
-        return []
-
-    jobs: dict[str, dict[str, Any]] = {}
-    with path.open("r", encoding="utf-8") as fp:
-        for line in fp:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                event = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            event_type = event.get("event_type")
-            payload = event.get("payload", {})
-            if event_type == "job_created":
-                job_id = payload.get("job_id")
-                if not job_id:
-                    continue
-                jobs[job_id] = payload
-                jobs[job_id]["updated_at_utc"] = event.get("ts_utc")
-            elif event_type == "job_updated":
-                job_id = payload.get("job_id")
-                if not job_id or job_id not in jobs:
-                    continue
-                jobs[job_id]["status"] = payload.get("status", jobs[job_id].get("status"))
-                patch = payload.get("patch", {})
-                if isinstance(patch, dict):
-                    jobs[job_id].update(patch)
-                jobs[job_id]["updated_at_utc"] = event.get("ts_utc")
-    return sorted(jobs.values(), key=lambda x: x.get("created_at_utc", ""), reverse=True)
+def list_jobs(
+    jobs_path: str | Path = DEFAULT_JOBS_PATH,
+    *,
+    status: str | Iterable[str] | None = None,
+    job_type: str | None = None,
+    created_after_utc: str | None = None,
+    created_before_utc: str | None = None,
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    """Jobs newest first, optionally filtered by status, type and creation time."""
+    clauses: list[str] = []
+    params: list[Any] = []
+    if status is not None:
+        statuses = [status] if isinstance(status, str) else list(status)
+        if not statuses:
+            return []
+        clauses.append(f"status IN ({', '.join('?' for _ in statuses)})")
+        params.extend(statuses)
+    if job_type is not None:
+        clauses.append("job_type = ?")
+        params.append(job_type)
+    if created_after_utc is not None:
+        clauses.append("created_at_utc >= ?")
+        params.append(created_after_utc)
+    if created_before_utc is not None:
+        clauses.append("created_at_utc < ?")
+        params.append(created_before_utc)
+
+    query = "SELECT payload FROM jobs"
+    if clauses:
+        query += " WHERE " + " AND ".join(clauses)
+    query += " ORDER BY created_at_utc DESC"
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(max(0, int(limit)))
+
+    with _connect(jobs_path) as conn:
+        return [json.loads(row[0]) for row in conn.execute(query, params)]
 
 
 def get_job(job_id: str, jobs_path: str | Path = DEFAULT_JOBS_PATH) -> dict[str, Any] | None:
-    jobs = list_jobs(jobs_path=jobs_path)
-    for job in jobs:
-        if job.get("job_id") == job_id:
-            return job
-    return None
+    with _connect(jobs_path) as conn:
+        return _read_job(conn, job_id)
+
+
+def compact_jobs(
+    jobs_path: str | Path = DEFAULT_JOBS_PATH,
+    *,
+    finished_before_utc: str | None = None,
+    vacuum: bool = True,
+) -> int:
+    """Drop terminal jobs last updated before ``finished_before_utc``.
 
+    Without a cutoff nothing is deleted, but the WAL is still checkpointed and
+    the database vacuumed. Returns the number of jobs removed.
+    """
+    removed = 0
+    with _connect(jobs_path) as conn:
+        if finished_before_utc is not None:
+            with _write_transaction(conn):
+                cursor = conn.execute(
+                    f"DELETE FROM jobs WHERE status IN ({', '.join('?' for _ in TERMINAL_JOB_STATES)}) "
+                    "AND updated_at_utc < ?",
+                    (*TERMINAL_JOB_STATES, finished_before_utc),
+                )
+                removed = int(cursor.rowcount)
+        if vacuum:
+            conn.execute("VACUUM")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return removed
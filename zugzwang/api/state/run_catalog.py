@@ -0,0 +1,452 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import stat
+import threading
+import time as time_module
+from contextlib import contextmanager
+from dataclasses import asdict, fields
+from datetime import UTC, date, datetime, time
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from zugzwang.api.types import RunMeta
+from zugzwang.experiments.tracker import CATALOG_DIRNAME, CATALOG_DIRTY_DIRNAME
+
+
+CATALOG_FILENAME = "runs.sqlite3"
+# Bump when RunMeta extraction or the schema changes so cached rows are rebuilt.
+CATALOG_VERSION = "2"
+DEFAULT_FULL_SCAN_SECONDS = 60.0
+
+# Files whose mtimes, together with the directory's, decide whether a row is stale.
+TRACKED_FILES: tuple[str, ...] = (
+    "config_hash.txt",
+    "resolved_config.yaml",
+    "experiment_report.json",
+    "experiment_report_evaluated.json",
+)
+
+_BUSY_TIMEOUT_SECONDS = 30.0
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    signature TEXT NOT NULL,
+    created_ts REAL,
+    search_text TEXT NOT NULL,
+    inferred_provider TEXT COLLATE NOCASE,
+    inferred_model TEXT COLLATE NOCASE,
+    inferred_eval_status TEXT,
+    report_exists INTEGER NOT NULL,
+    evaluated_report_exists INTEGER NOT NULL,
+    elo_estimate REAL,
+    acpl_overall REAL,
+    total_cost_usd REAL,
+    meta TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_created_idx ON runs (created_ts);
+CREATE INDEX IF NOT EXISTS runs_provider_idx ON runs (inferred_provider, inferred_model);
+CREATE INDEX IF NOT EXISTS runs_status_idx ON runs (report_exists, evaluated_report_exists);
+CREATE INDEX IF NOT EXISTS runs_elo_idx ON runs (elo_estimate);
+CREATE INDEX IF NOT EXISTS runs_evaluated_elo_idx ON runs (evaluated_report_exists, elo_estimate);
+CREATE INDEX IF NOT EXISTS runs_acpl_idx ON runs (acpl_overall);
+CREATE INDEX IF NOT EXISTS runs_cost_idx ON runs (total_cost_usd);
+CREATE TABLE IF NOT EXISTS catalog_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+-- Aggregates below are kept current by triggers; sync replaces a row with
+-- DELETE + INSERT so both triggers fire.
+CREATE TABLE IF NOT EXISTS run_totals (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    total_runs INTEGER NOT NULL,
+    runs_with_reports INTEGER NOT NULL,
+    evaluated_runs INTEGER NOT NULL,
+    cost_sum REAL NOT NULL,
+    evaluated_acpl_sum REAL NOT NULL,
+    evaluated_acpl_count INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO run_totals VALUES (1, 0, 0, 0, 0.0, 0.0, 0);
+CREATE TABLE IF NOT EXISTS run_daily (
+    day TEXT PRIMARY KEY,
+    runs INTEGER NOT NULL,
+    evaluated_runs INTEGER NOT NULL,
+    cost_sum REAL NOT NULL,
+    elo_sum REAL NOT NULL,
+    elo_count INTEGER NOT NULL,
+    acpl_sum REAL NOT NULL,
+    acpl_count INTEGER NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS runs_totals_insert AFTER INSERT ON runs BEGIN
+    UPDATE run_totals SET
+        total_runs = total_runs + 1,
+        runs_with_reports = runs_with_reports + NEW.report_exists,
+        evaluated_runs = evaluated_runs + NEW.evaluated_report_exists,
+        cost_sum = cost_sum + coalesce(NEW.total_cost_usd, 0),
+        evaluated_acpl_sum = evaluated_acpl_sum
+            + iif(NEW.evaluated_report_exists = 1, coalesce(NEW.acpl_overall, 0), 0),
+        evaluated_acpl_count = evaluated_acpl_count
+            + iif(NEW.evaluated_report_exists = 1 AND NEW.acpl_overall IS NOT NULL, 1, 0)
+    WHERE id = 1;
+    INSERT INTO run_daily (day, runs, evaluated_runs, cost_sum, elo_sum, elo_count, acpl_sum, acpl_count)
+    SELECT
+        date(NEW.created_ts, 'unixepoch'), 1, NEW.evaluated_report_exists,
+        coalesce(NEW.total_cost_usd, 0),
+        coalesce(NEW.elo_estimate, 0), iif(NEW.elo_estimate IS NULL, 0, 1),
+        coalesce(NEW.acpl_overall, 0), iif(NEW.acpl_overall IS NULL, 0, 1)
+    WHERE NEW.created_ts IS NOT NULL
+    ON CONFLICT (day) DO UPDATE SET
+        runs = runs + excluded.runs,
+        evaluated_runs = evaluated_runs + excluded.evaluated_runs,
+        cost_sum = cost_sum + excluded.cost_sum,
+        elo_sum = elo_sum + excluded.elo_sum,
+        elo_count = elo_count + excluded.elo_count,
+        acpl_sum = acpl_sum + excluded.acpl_sum,
+        acpl_count = acpl_count + excluded.acpl_count;
+END;
+
+CREATE TRIGGER IF NOT EXISTS runs_totals_delete AFTER DELETE ON runs BEGIN
+    UPDATE run_totals SET
+        total_runs = total_runs - 1,
+        runs_with_reports = runs_with_reports - OLD.report_exists,
+        evaluated_runs = evaluated_runs - OLD.evaluated_report_exists,
+        cost_sum = cost_sum - coalesce(OLD.total_cost_usd, 0),
+        evaluated_acpl_sum = evaluated_acpl_sum
+            - iif(OLD.evaluated_report_exists = 1, coalesce(OLD.acpl_overall, 0), 0),
+        evaluated_acpl_count = evaluated_acpl_count
+            - iif(OLD.evaluated_report_exists = 1 AND OLD.acpl_overall IS NOT NULL, 1, 0)
+    WHERE id = 1;
+    UPDATE run_daily SET
+        runs = runs - 1,
+        evaluated_runs = evaluated_runs - OLD.evaluated_report_exists,
+        cost_sum = cost_sum - coalesce(OLD.total_cost_usd, 0),
+        elo_sum = elo_sum - coalesce(OLD.elo_estimate, 0),
+        elo_count = elo_count - iif(OLD.elo_estimate IS NULL, 0, 1),
+        acpl_sum = acpl_sum - coalesce(OLD.acpl_overall, 0),
+        acpl_count = acpl_count - iif(OLD.acpl_overall IS NULL, 0, 1)
+    WHERE day = date(OLD.created_ts, 'unixepoch');
+    DELETE FROM run_daily WHERE day = date(OLD.created_ts, 'unixepoch') AND runs <= 0;
+END;
+"""
+
+_SORT_COLUMNS: dict[str, str] = {
+    "run_id": "lower(run_id)",
+    "id": "lower(run_id)",
+    "elo": "elo_estimate",
+    "elo_estimate": "elo_estimate",
+    "acpl": "acpl_overall",
+    "acpl_overall": "acpl_overall",
+    "cost": "total_cost_usd",
+    "total_cost_usd": "total_cost_usd",
+}
+_RUN_META_FIELDS = {item.name for item in fields(RunMeta)}
+_INSERT_RUN = (
+    "INSERT INTO runs (run_id, signature, created_ts, search_text, inferred_provider, inferred_model, "
+    "inferred_eval_status, report_exists, evaluated_report_exists, elo_estimate, acpl_overall, "
+    "total_cost_usd, meta) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+class RunCatalog:
+    """SQLite index of ``RunMeta`` rows for every run directory under ``root``.
+
+    A full ``sync`` stats every run directory and its tracked files and only
+    rebuilds rows whose mtimes changed. Between full scans (first call, new or
+    removed run directories, or every ``full_scan_seconds``) only runs flagged
+    by :func:`zugzwang.experiments.tracker.mark_run_changed` are re-checked.
+    ``query`` pushes filters, sorting and paging into SQL; ``totals`` and
+    ``daily_series`` read trigger-maintained aggregates.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        build_meta: Callable[[Path], RunMeta],
+        db_path: str | Path | None = None,
+        full_scan_seconds: float = DEFAULT_FULL_SCAN_SECONDS,
+    ) -> None:
+        self.root = Path(root)
+        self.db_path = Path(db_path) if db_path else self.root / CATALOG_DIRNAME / CATALOG_FILENAME
+        self.dirty_dir = self.root / CATALOG_DIRNAME / CATALOG_DIRTY_DIRNAME
+        self.build_meta = build_meta
+        self.full_scan_seconds = float(full_scan_seconds)
+        self._sync_lock = threading.Lock()
+        self._initialized = False
+        self._root_mtime_ns: int | None = None
+        self._last_full_scan = float("-inf")
+
+    def sync(self, full: bool = False) -> dict[str, int]:
+        """Bring the catalog in line with the run directories on disk."""
+        with self._sync_lock, self._connect() as conn:
+            try:
+                root_mtime_ns = self.root.stat().st_mtime_ns
+            except OSError:
+                root_mtime_ns = None
+            now = time_module.monotonic()
+            full = (
+                full
+                or root_mtime_ns != self._root_mtime_ns
+                or now - self._last_full_scan >= self.full_scan_seconds
+            )
+
+            flagged = self._take_dirty_markers()
+            known = dict(conn.execute("SELECT run_id, signature FROM runs").fetchall())
+            if full:
+                scanned = list(_scan_runs(self.root))
+                removed = [run_id for run_id in known if run_id not in {path.name for path, _ in scanned}]
+            else:
+                scanned = [item for item in (_signature(self.root / run_id) for run_id in flagged) if item]
+                removed = [run_id for run_id in flagged if run_id in known and not (self.root / run_id).is_dir()]
+            changed = [(run_dir, signature) for run_dir, signature in scanned if known.get(run_dir.name) != signature]
+
+            if changed or removed:
+                rows = [_row(self.build_meta(run_dir), signature) for run_dir, signature in changed]
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    stale = [(run_id,) for run_id in removed] + [(run_dir.name,) for run_dir, _ in changed]
+                    conn.executemany("DELETE FROM runs WHERE run_id = ?", stale)
+                    conn.executemany(_INSERT_RUN, rows)
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+
+            if full:
+                self._root_mtime_ns = root_mtime_ns
+                self._last_full_scan = now
+            total = conn.execute("SELECT total_runs FROM run_totals WHERE id = 1").fetchone()[0]
+        return {"total": int(total), "updated": len(changed), "removed": len(removed), "full_scan": int(full)}
+
+    def query(
+        self,
+        *,
+        query: str | None = None,
+        provider: str | None = None,
+        model: str | None = None,
+        status: str | None = None,
+        evaluated_only: bool = False,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        sort_by: str = "created_at_utc",
+        sort_dir: str = "desc",
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[RunMeta]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if query:
+            clauses.append("instr(search_text, ?) > 0")
+            params.append(query.lower())
+        if provider:
+            clauses.append("inferred_provider = ?")
+            params.append(provider)
+        if model:
+            clauses.append("inferred_model = ?")
+            params.append(model)
+        if status:
+            status_clause = _status_clause(status)
+            if status_clause is not None:
+                clauses.append(status_clause[0])
+                params.extend(status_clause[1])
+        if date_from is not None:
+            clauses.append("created_ts >= ?")
+            params.append(datetime.combine(date_from, time.min, tzinfo=UTC).timestamp())
+        if date_to is not None:
+            clauses.append("created_ts <= ?")
+            params.append(datetime.combine(date_to, time.max, tzinfo=UTC).timestamp())
+        if evaluated_only:
+            clauses.append("evaluated_report_exists = 1")
+
+        direction = "ASC" if sort_dir.lower() == "asc" else "DESC"
+        column = _SORT_COLUMNS.get(sort_by.strip().lower(), "created_ts")
+        # RunMeta without a value sorts last in both directions, as the in-memory sort did.
+        sql = "SELECT meta FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {column} {direction} NULLS LAST, run_id {direction}"
+        sql += " LIMIT ? OFFSET ?"
+        params.extend([-1 if limit is None else int(limit), max(0, int(offset))])
+
+        with self._connect() as conn:
+            return [_meta_from_json(row[0]) for row in conn.execute(sql, params)]
+
+    def totals(self) -> dict[str, Any]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT total_runs, runs_with_reports, evaluated_runs, cost_sum, "
+                "evaluated_acpl_sum, evaluated_acpl_count FROM run_totals WHERE id = 1"
+            ).fetchone()
+            best_elo = conn.execute(
+                "SELECT max(elo_estimate) FROM runs WHERE evaluated_report_exists = 1"
+            ).fetchone()[0]
+        total_runs, with_reports, evaluated, cost_sum, acpl_sum, acpl_count = row
+        return {
+            "total_runs": int(total_runs),
+            "runs_with_reports": int(with_reports),
+            "evaluated_runs": int(evaluated),
+            "best_elo": best_elo,
+            "avg_acpl": (acpl_sum / acpl_count) if acpl_count > 0 else None,
+            "total_cost_usd": float(cost_sum),
+        }
+
+    def daily_series(self) -> list[dict[str, Any]]:
+        """Per-UTC-day aggregates, oldest first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT day, runs, evaluated_runs, cost_sum, elo_sum, elo_count, acpl_sum, acpl_count "
+                "FROM run_daily ORDER BY day"
+            ).fetchall()
+        keys = ("day", "runs", "evaluated_runs", "cost_sum", "elo_sum", "elo_count", "acpl_sum", "acpl_count")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def _take_dirty_markers(self) -> list[str]:
+        try:
+            names = os.listdir(self.dirty_dir)
+        except OSError:
+            return []
+        taken: list[str] = []
+        for name in names:
+            # Remove before re-reading the run so a write landing meanwhile re-flags it.
+            try:
+                os.unlink(self.dirty_dir / name)
+            except OSError:
+                continue
+            taken.append(name)
+        return taken
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        if not self._initialized:
+            self._initialize()
+        conn = sqlite3.connect(self.db_path, timeout=_BUSY_TIMEOUT_SECONDS, isolation_level=None)
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            yield conn
+        finally:
+            conn.close()
+
+    def _initialize(self) -> None:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=_BUSY_TIMEOUT_SECONDS, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            stored_version = None
+            if conn.execute("SELECT name FROM sqlite_master WHERE name = 'catalog_meta'").fetchone():
+                row = conn.execute("SELECT value FROM catalog_meta WHERE key = 'version'").fetchone()
+                stored_version = row[0] if row else None
+            if stored_version not in {None, CATALOG_VERSION}:
+                conn.executescript(
+                    "DROP TABLE IF EXISTS runs; DROP TABLE IF EXISTS run_totals; "
+                    "DROP TABLE IF EXISTS run_daily; DELETE FROM catalog_meta;"
+                )
+            conn.executescript(_SCHEMA)
+            # Rows embed absolute run_dir paths, so a moved root invalidates them too.
+            expected = {"version": CATALOG_VERSION, "root": str(self.root)}
+            stored = dict(conn.execute("SELECT key, value FROM catalog_meta").fetchall())
+            if any(stored.get(key) != value for key, value in expected.items()):
+                conn.execute("DELETE FROM runs")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO catalog_meta (key, value) VALUES (?, ?)",
+                    list(expected.items()),
+                )
+        finally:
+            conn.close()
+        self._initialized = True
+
+
+def _scan_runs(root: Path) -> Iterator[tuple[Path, str]]:
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.name.startswith("_"):
+            continue
+        try:
+            if not entry.is_dir():
+                continue
+        except OSError:
+            continue
+        item = _signature(Path(entry.path))
+        if item is not None:
+            yield item
+
+
+def _signature(run_dir: Path) -> tuple[Path, str] | None:
+    if run_dir.name.startswith("_"):
+        return None
+    try:
+        dir_stat = run_dir.stat()
+    except OSError:
+        return None
+    if not stat.S_ISDIR(dir_stat.st_mode):
+        return None
+    parts = [str(dir_stat.st_mtime_ns)]
+    for name in TRACKED_FILES:
+        try:
+            file_stat = os.stat(run_dir / name)
+        except OSError:
+            parts.append("-")
+            continue
+        parts.append(f"{file_stat.st_mtime_ns}:{file_stat.st_size}")
+    return run_dir, "|".join(parts)
+
+
+def _row(meta: RunMeta, signature: str) -> tuple[Any, ...]:
+    search_text = " ".join(
+        value
+        for value in (meta.run_id, meta.inferred_provider, meta.inferred_model, meta.inferred_model_label)
+        if value
+    ).lower()
+    return (
+        meta.run_id,
+        signature,
+        _created_ts(meta.created_at_utc),
+        search_text,
+        meta.inferred_provider,
+        meta.inferred_model,
+        meta.inferred_eval_status,
+        int(meta.report_exists),
+        int(meta.evaluated_report_exists),
+        meta.elo_estimate,
+        meta.acpl_overall,
+        meta.total_cost_usd,
+        json.dumps(asdict(meta)),
+    )
+
+
+def _meta_from_json(raw: str) -> RunMeta:
+    payload = json.loads(raw)
+    return RunMeta(**{key: value for key, value in payload.items() if key in _RUN_META_FIELDS})
+
+
+def _created_ts(value: str | None) -> float | None:
+    if not value:
+        return None
+    normalized = value.strip()
+    if normalized.endswith("Z"):
+        normalized = normalized[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(normalized)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed.timestamp()
+
+
+def _status_clause(status: str) -> tuple[str, list[Any]] | None:
+    normalized = status.strip().lower()
+    if normalized in {"all", ""}:
+        return None
+    if normalized in {"evaluated", "completed_evaluated"}:
+        return "evaluated_report_exists = 1", []
+    if normalized in {"needs_eval", "pending_evaluation"}:
+        return "report_exists = 1 AND evaluated_report_exists = 0", []
+    if normalized in {"pending_report", "running", "queued"}:
+        return "report_exists = 0", []
+    return "inferred_eval_status = ?", [normalized]
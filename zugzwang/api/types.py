@@ -121,6 +121,17 @@ class DashboardTimelinePoint:
     evaluated_report_exists: bool
 
 
+@dataclass
+class DashboardTimelineBucket:
+    start_date: str
+    end_date: str
+    runs: int
+    evaluated_runs: int
+    total_cost_usd: float
+    avg_elo: float | None
+    avg_acpl: float | None
+
+
 @dataclass
 class DashboardKpis:
     total_runs: int
@@ -143,7 +154,7 @@ class GameMeta:
 class BoardStateFrame:
     ply_number: int
     fen: str
-    svg: str
+    svg: str | None
     move_uci: str | None
     move_san: str | None
     color: str | None
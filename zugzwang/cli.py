@@ -2,15 +2,39 @@ from __future__ import annotations
 
 import argparse
 import json
+import shutil
 import sys
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable
 
+from zugzwang.analysis.dataset import MoveDataset, summarize_moves
+from zugzwang.analysis.leaderboard import compare_many, generate_leaderboard_markdown
+from zugzwang.api.services.artifact_service import ArtifactService
+from zugzwang.api.services.scheduler_daemon import DEFAULT_POLL_SECONDS as DEFAULT_SCHEDULER_POLL_SECONDS
+from zugzwang.api.services.scheduler_daemon import SchedulerDaemon
+from zugzwang.api.state.job_store import DEFAULT_JOBS_PATH, compact_jobs
+from zugzwang.evaluation.material import MaterialEvaluator
 from zugzwang.evaluation.pipeline import evaluate_run_dir
+from zugzwang.experiments.bench import run_bench
+from zugzwang.experiments.distributed import (
+    DEFAULT_LEASE_SECONDS,
+    DEFAULT_POLL_SECONDS,
+    DistributedCoordinator,
+    DistributedWorker,
+)
+from zugzwang.experiments.position_suite import PositionSuiteRunner
 from zugzwang.experiments.runner import ExperimentRunner
-from zugzwang.infra.config import resolve_config
+from zugzwang.experiments.sweep import SweepRunner
+from zugzwang.infra.config import load_yaml, parse_override_value, resolve_config
 from zugzwang.infra.env import load_dotenv, validate_environment
 from zugzwang.infra.logging import configure_logging
+from zugzwang.infra.profiling import DEFAULT_INTERVAL_MS, DEFAULT_TOP, profile_call
 from zugzwang.knowledge.indexer import build_index
 from zugzwang.knowledge.retriever import clear_caches as clear_retrieval_caches
+from zugzwang.providers.sim_server import DEFAULT_HOST as DEFAULT_SIM_HOST
+from zugzwang.providers.sim_server import DEFAULT_PORT as DEFAULT_SIM_PORT
+from zugzwang.providers.sim_server import SimServer
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -33,6 +57,65 @@ def _build_parser() -> argparse.ArgumentParser:
     play_parser.add_argument("--set", action="append", dest="overrides")
     play_parser.add_argument("--run-id")
 
+    positions_parser = subparsers.add_parser("positions")
+    positions_parser.add_argument("--config", required=True)
+    positions_parser.add_argument("--model-profile")
+    positions_parser.add_argument("--set", action="append", dest="overrides")
+    positions_parser.add_argument("--suite")
+    positions_parser.add_argument("--max-positions", type=int)
+    positions_parser.add_argument("--concurrency", type=int)
+    positions_parser.add_argument("--run-id")
+
+    sweep_parser = subparsers.add_parser("sweep")
+    sweep_parser.add_argument("--config", required=True, action="append", dest="configs")
+    sweep_parser.add_argument("--model-profile")
+    sweep_parser.add_argument("--set", action="append", dest="overrides")
+    sweep_parser.add_argument("--max-concurrency", type=int, default=4)
+    sweep_parser.add_argument("--budget-usd", type=float)
+
+    coordinate_parser = subparsers.add_parser("coordinate")
+    coordinate_parser.add_argument("--config", required=True)
+    coordinate_parser.add_argument("--model-profile")
+    coordinate_parser.add_argument("--set", action="append", dest="overrides")
+    coordinate_parser.add_argument("--resume", action="store_true")
+    coordinate_parser.add_argument("--resume-run-id")
+    coordinate_parser.add_argument("--run-id")
+    coordinate_parser.add_argument("--workers", type=int, default=0)
+    coordinate_parser.add_argument("--lease-seconds", type=float, default=DEFAULT_LEASE_SECONDS)
+    coordinate_parser.add_argument("--poll-seconds", type=float, default=DEFAULT_POLL_SECONDS)
+    coordinate_parser.add_argument("--max-wait-seconds", type=float)
+
+    worker_parser = subparsers.add_parser("worker")
+    worker_parser.add_argument("--run-dir", required=True)
+    worker_parser.add_argument("--worker-id")
+    worker_parser.add_argument("--lease-seconds", type=float)
+    worker_parser.add_argument("--poll-seconds", type=float)
+
+    scheduler_parser = subparsers.add_parser("scheduler")
+    scheduler_parser.add_argument("--poll-seconds", type=float, default=DEFAULT_SCHEDULER_POLL_SECONDS)
+    scheduler_parser.add_argument("--once", action="store_true")
+
+    compact_parser = subparsers.add_parser("compact-jobs")
+    compact_parser.add_argument("--jobs-path", default=str(DEFAULT_JOBS_PATH))
+    compact_parser.add_argument("--older-than-days", type=float)
+
+    leaderboard_parser = subparsers.add_parser("leaderboard")
+    leaderboard_parser.add_argument("--run", action="append", dest="runs", required=True)
+    leaderboard_parser.add_argument("--runs-root", default="results/runs")
+    leaderboard_parser.add_argument("--comparison-id")
+    leaderboard_parser.add_argument("--iterations", type=int, default=10_000)
+    leaderboard_parser.add_argument("--permutations", type=int, default=10_000)
+    leaderboard_parser.add_argument("--confidence", type=float, default=0.95)
+    leaderboard_parser.add_argument("--alpha", type=float, default=0.05)
+    leaderboard_parser.add_argument("--seed", type=int, default=42)
+    leaderboard_parser.add_argument("--correction", choices=["holm", "bh", "none"], default="holm")
+    leaderboard_parser.add_argument("--engine", choices=["auto", "numpy", "python"], default="auto")
+
+    export_moves_parser = subparsers.add_parser("export-moves")
+    export_moves_parser.add_argument("--runs-root", default="results/runs")
+    export_moves_parser.add_argument("--full", action="store_true")
+    export_moves_parser.add_argument("--by", action="append", default=[])
+
     env_parser = subparsers.add_parser("env-check")
     env_parser.add_argument("--config", required=True)
     env_parser.add_argument("--model-profile")
@@ -45,6 +128,37 @@ def _build_parser() -> argparse.ArgumentParser:
     eval_parser.add_argument("--elo-color-correction", type=float, default=0.0)
     eval_parser.add_argument("--output-filename", default="experiment_report_evaluated.json")
 
+    bench_parser = subparsers.add_parser("bench")
+    bench_parser.add_argument("--config", required=True)
+    bench_parser.add_argument("--model-profile")
+    bench_parser.add_argument("--set", action="append", dest="overrides")
+    bench_parser.add_argument("--games", type=int, default=4)
+    bench_parser.add_argument("--concurrency", type=int, default=1)
+    bench_parser.add_argument("--output-dir")
+
+    sim_server_parser = subparsers.add_parser("sim-server")
+    sim_server_parser.add_argument("--host", default=DEFAULT_SIM_HOST)
+    sim_server_parser.add_argument("--port", type=int, default=DEFAULT_SIM_PORT)
+    sim_server_parser.add_argument("--settings", help="YAML/JSON file of sim settings")
+    sim_server_parser.add_argument("--sim", action="append", dest="sim_settings", default=[])
+
+    profile_parser = subparsers.add_parser("profile")
+    profile_subparsers = profile_parser.add_subparsers(dest="profile_target", required=True)
+    profile_run_parser = profile_subparsers.add_parser("run")
+    profile_run_parser.add_argument("--config", required=True)
+    profile_run_parser.add_argument("--model-profile")
+    profile_run_parser.add_argument("--set", action="append", dest="overrides")
+    profile_run_parser.add_argument("--games", type=int, default=2)
+    profile_run_parser.add_argument("--max-plies", type=int, default=40)
+    profile_evaluate_parser = profile_subparsers.add_parser("evaluate")
+    profile_evaluate_parser.add_argument("--run-dir", required=True)
+    profile_evaluate_parser.add_argument("--engine", choices=["material", "stockfish"], default="material")
+    for target_parser in (profile_run_parser, profile_evaluate_parser):
+        target_parser.add_argument("--profiler", choices=["sampling", "cprofile"], default="sampling")
+        target_parser.add_argument("--interval-ms", type=float, default=DEFAULT_INTERVAL_MS)
+        target_parser.add_argument("--top", type=int, default=DEFAULT_TOP)
+        target_parser.add_argument("--output-dir")
+
     index_parser = subparsers.add_parser("index-knowledge")
     index_parser.add_argument(
         "--sources",
@@ -94,6 +208,130 @@ def _play_command(args: argparse.Namespace) -> int:
     return 0
 
 
+def _positions_command(args: argparse.Namespace) -> int:
+    overrides = list(args.overrides or [])
+    if args.suite:
+        overrides.append(f"position_suite.source={args.suite}")
+    if args.max_positions is not None:
+        overrides.append(f"position_suite.max_positions={args.max_positions}")
+    if args.concurrency is not None:
+        overrides.append(f"position_suite.concurrency={args.concurrency}")
+    runner = PositionSuiteRunner(
+        config_path=args.config,
+        model_profile_path=args.model_profile,
+        overrides=overrides,
+        run_id=getattr(args, "run_id", None),
+    )
+    print(json.dumps(runner.run(), indent=2))
+    return 0
+
+
+def _sweep_command(args: argparse.Namespace) -> int:
+    runner = SweepRunner(
+        config_paths=args.configs,
+        model_profile_path=args.model_profile,
+        overrides=args.overrides,
+        max_concurrency=args.max_concurrency,
+        budget_usd=args.budget_usd,
+    )
+    print(json.dumps(runner.run(), indent=2))
+    return 0
+
+
+def _coordinate_command(args: argparse.Namespace) -> int:
+    coordinator = DistributedCoordinator(
+        config_path=args.config,
+        model_profile_path=args.model_profile,
+        overrides=args.overrides,
+        resume=bool(args.resume),
+        resume_run_id=args.resume_run_id,
+        run_id=args.run_id,
+        lease_seconds=args.lease_seconds,
+        poll_seconds=args.poll_seconds,
+    )
+    payload = coordinator.run(local_workers=args.workers, max_wait_seconds=args.max_wait_seconds)
+    print(json.dumps(payload, indent=2))
+    return 0
+
+
+def _worker_command(args: argparse.Namespace) -> int:
+    worker = DistributedWorker(
+        run_dir=args.run_dir,
+        worker_id=args.worker_id,
+        lease_seconds=args.lease_seconds,
+        poll_seconds=args.poll_seconds,
+    )
+    print(json.dumps(worker.run(), indent=2))
+    return 0
+
+
+def _scheduler_command(args: argparse.Namespace) -> int:
+    daemon = SchedulerDaemon(poll_seconds=args.poll_seconds)
+    if args.once:
+        print(json.dumps({"batches_advanced": daemon.tick()}, indent=2))
+        return 0
+    try:
+        daemon.run_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _compact_jobs_command(args: argparse.Namespace) -> int:
+    cutoff = None
+    if args.older_than_days is not None:
+        cutoff = (datetime.now(UTC) - timedelta(days=args.older_than_days)).isoformat().replace("+00:00", "Z")
+    removed = compact_jobs(args.jobs_path, finished_before_utc=cutoff)
+    print(json.dumps({"jobs_removed": removed, "finished_before_utc": cutoff}, indent=2))
+    return 0
+
+
+def _leaderboard_command(args: argparse.Namespace) -> int:
+    leaderboard = compare_many(
+        args.runs,
+        runs_root=args.runs_root,
+        comparison_id=args.comparison_id,
+        iterations=args.iterations,
+        permutations=args.permutations,
+        confidence=args.confidence,
+        alpha=args.alpha,
+        seed=args.seed,
+        correction=args.correction,
+        engine=args.engine,
+    )
+    artifacts = ArtifactService(root=args.runs_root).save_comparison_artifacts(
+        comparison_id=leaderboard.comparison_id,
+        payload=leaderboard.to_dict(),
+        markdown_report=generate_leaderboard_markdown(leaderboard),
+    )
+    ranking = [
+        {
+            "rank": entry.rank,
+            "run_id": entry.run.run_id,
+            "win_rate": entry.win_rate.mean,
+            "acpl": entry.acpl.mean if entry.acpl is not None else None,
+        }
+        for entry in leaderboard.entries
+    ]
+    print(json.dumps({"comparison_id": leaderboard.comparison_id, "ranking": ranking, "artifacts": artifacts}, indent=2))
+    return 0
+
+
+def _export_moves_command(args: argparse.Namespace) -> int:
+    dataset = MoveDataset(args.runs_root)
+    result = dataset.sync(full=args.full)
+    payload: dict[str, object] = {
+        "store_dir": str(dataset.store_dir),
+        "runs_updated": result.updated,
+        "runs_removed": result.removed,
+        "runs_unchanged": result.unchanged,
+    }
+    if args.by:
+        payload["summary"] = summarize_moves(dataset, by=args.by)
+    print(json.dumps(payload, indent=2))
+    return 0
+
+
 def _env_check_command(args: argparse.Namespace) -> int:
     config = resolve_config(
         experiment_config_path=args.config,
@@ -122,6 +360,111 @@ def _evaluate_command(args: argparse.Namespace) -> int:
     return 0
 
 
+def _bench_command(args: argparse.Namespace) -> int:
+    try:
+        payload = run_bench(
+            args.config,
+            model_profile_path=args.model_profile,
+            overrides=args.overrides,
+            games=args.games,
+            concurrency=args.concurrency,
+            output_dir=args.output_dir,
+        )
+    except ValueError as exc:
+        print(f"Bench failed: {exc}")
+        return 2
+    print(json.dumps(payload, indent=2))
+    return 0
+
+
+def _sim_server_command(args: argparse.Namespace) -> int:
+    settings: dict[str, Any] = {}
+    if args.settings:
+        settings.update(load_yaml(args.settings))
+    for item in args.sim_settings:
+        if "=" not in item:
+            print(f"Invalid --sim '{item}'. Expected key=value")
+            return 2
+        key, raw_value = item.split("=", 1)
+        settings[key.strip()] = parse_override_value(raw_value.strip())
+
+    server = SimServer(host=args.host, port=args.port, settings=settings)
+    print(json.dumps({"url": server.url, "settings": server.settings, "env": server.provider_env()}, indent=2))
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _profile_command(args: argparse.Namespace) -> int:
+    stamp = datetime.now(tz=UTC).strftime("%Y%m%dT%H%M%SZ")
+    output_dir = Path(args.output_dir or f"results/profiles/{args.profile_target}-{stamp}")
+    try:
+        if args.profile_target == "run":
+            target = _profile_run_target(args, output_dir)
+        else:
+            target = _profile_evaluate_target(args, output_dir)
+        result = profile_call(
+            target,
+            output_dir=output_dir,
+            profiler=args.profiler,
+            interval_ms=args.interval_ms,
+            top=args.top,
+        )
+    except Exception as exc:
+        print(f"Profiling failed: {exc}")
+        return 2
+    print(json.dumps(result.to_dict(), indent=2))
+    return 0
+
+
+def _profile_run_target(args: argparse.Namespace, output_dir: Path) -> Callable[[], Any]:
+    config = resolve_config(
+        experiment_config_path=args.config,
+        model_profile_path=args.model_profile,
+        cli_overrides=args.overrides,
+    )
+    overrides = list(args.overrides or [])
+    # LLM players are pinned to the mock provider so profiles never touch the network.
+    for color, player in sorted(config.get("players", {}).items()):
+        if isinstance(player, dict) and player.get("type") == "llm":
+            overrides.extend([f"players.{color}.provider=mock", f"players.{color}.model=mock-1"])
+    overrides.extend(
+        [
+            f"experiment.target_valid_games={args.games}",
+            f"experiment.max_games={args.games}",
+            f"runtime.max_plies={args.max_plies}",
+            f"runtime.output_dir={(output_dir / 'runs').as_posix()}",
+            "evaluation.auto.enabled=false",
+        ]
+    )
+    runner = ExperimentRunner(
+        config_path=args.config,
+        model_profile_path=args.model_profile,
+        overrides=overrides,
+    )
+    return runner.run
+
+
+def _profile_evaluate_target(args: argparse.Namespace, output_dir: Path) -> Callable[[], Any]:
+    # Evaluate a copy so the profiled pass never overwrites the run's real reports.
+    source = Path(args.run_dir)
+    if not source.is_dir():
+        raise FileNotFoundError(f"Run directory not found: {source}")
+    run_copy = output_dir / "run" / source.name
+    if run_copy.exists():
+        shutil.rmtree(run_copy)
+    shutil.copytree(source, run_copy, ignore=shutil.ignore_patterns("transcripts", "trace.json"))
+    evaluator = MaterialEvaluator() if args.engine == "material" else None
+
+    def target() -> dict[str, Any]:
+        return evaluate_run_dir(run_dir=run_copy, evaluator=evaluator)
+
+    return target
+
+
 def _api_command(args: argparse.Namespace) -> int:
     try:
         import uvicorn
@@ -150,10 +493,32 @@ def main(argv: list[str] | None = None) -> int:
         return _run_command(args)
     if args.command == "play":
         return _play_command(args)
+    if args.command == "positions":
+        return _positions_command(args)
+    if args.command == "sweep":
+        return _sweep_command(args)
+    if args.command == "coordinate":
+        return _coordinate_command(args)
+    if args.command == "worker":
+        return _worker_command(args)
+    if args.command == "scheduler":
+        return _scheduler_command(args)
+    if args.command == "compact-jobs":
+        return _compact_jobs_command(args)
+    if args.command == "leaderboard":
+        return _leaderboard_command(args)
+    if args.command == "export-moves":
+        return _export_moves_command(args)
     if args.command == "env-check":
         return _env_check_command(args)
     if args.command == "evaluate":
         return _evaluate_command(args)
+    if args.command == "bench":
+        return _bench_command(args)
+    if args.command == "sim-server":
+        return _sim_server_command(args)
+    if args.command == "profile":
+        return _profile_command(args)
     if args.command == "api":
         return _api_command(args)
     if args.command == "index-knowledge":
@@ -8,6 +8,7 @@ from zugzwang.core.board import BoardManager
 from zugzwang.core.models import GameRecord, MoveRecord
 from zugzwang.core.players import PlayerInterface
 from zugzwang.infra.ids import timestamp_utc
+from zugzwang.infra.tracing import span
 
 
 def play_game(
@@ -20,29 +21,41 @@ def play_game(
     black_player: PlayerInterface,
     protocol_mode: str,
     max_plies: int,
+    initial_fen: str | None = None,
+    opening_moves: list[str] | None = None,
 ) -> GameRecord:
-    board = BoardManager()
-    rng = random.Random(seed)
+    board = BoardManager(initial_fen=initial_fen)
     history_uci: list[str] = []
+    for move_uci in opening_moves or []:
+        applied = board.apply_move(move_uci)
+        if not applied.ok:
+            raise ValueError(f"Opening move rejected: {applied.error}")
+        history_uci.append(move_uci)
+    rng = random.Random(seed)
     move_records: list[MoveRecord] = []
 
     started = time.perf_counter()
     termination = "max_moves"
 
     for _ in range(max_plies):
-        state = board.game_state(history_uci)
+        with span("board_state", category="board"):
+            state = board.game_state(history_uci)
         if state.is_terminal:
             termination = state.termination_reason or "draw_rule"
             break
+        # Absolute ply from the start position, as in prompt transcripts; opening
+        # moves pre-played from an opening suite count too.
+        ply_number = state.ply_number + 1
 
         actor = white_player if state.active_color == "white" else black_player
-        decision = actor.choose_move(state)
+        with span("choose_move", game=game_number, ply=ply_number, color=state.active_color):
+            decision = actor.choose_move(state)
 
         if protocol_mode == "research_strict" and (not decision.is_legal or not decision.move_uci):
             decision.error = decision.error or "retries_exhausted"
             move_records.append(
                 MoveRecord(
-                    ply_number=len(history_uci) + 1,
+                    ply_number=ply_number,
                     color=state.active_color,
                     fen_before=state.fen,
                     move_decision=decision,
@@ -58,7 +71,8 @@ def play_game(
             decision.parse_ok = False
             decision.error = decision.error or "missing_move_fallback"
 
-        apply_result = board.apply_move(decision.move_uci)
+        with span("board_update", category="board"):
+            apply_result = board.apply_move(decision.move_uci)
         if not apply_result.ok:
             if protocol_mode == "research_strict":
                 decision.error = decision.error or apply_result.error or "illegal_move_error"
@@ -66,7 +80,7 @@ def play_game(
                 decision.parse_ok = False
                 move_records.append(
                     MoveRecord(
-                        ply_number=len(history_uci) + 1,
+                        ply_number=ply_number,
                         color=state.active_color,
                         fen_before=state.fen,
                         move_decision=decision,
@@ -87,7 +101,7 @@ def play_game(
         history_uci.append(decision.move_uci)
         move_records.append(
             MoveRecord(
-                ply_number=len(history_uci),
+                ply_number=ply_number,
                 color=state.active_color,
                 fen_before=state.fen,
                 move_decision=decision,
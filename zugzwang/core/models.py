@@ -79,6 +79,7 @@ class GameRecord:
     cost_usd: float
     duration_seconds: float
     timestamp_utc: str
+    opening: dict[str, Any] | None = None
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -94,6 +95,7 @@ class GameRecord:
             "cost_usd": self.cost_usd,
             "duration_seconds": self.duration_seconds,
             "timestamp_utc": self.timestamp_utc,
+            "opening": self.opening,
         }
 
 
@@ -139,6 +141,12 @@ class ExperimentReport:
     )
     moa_move_share: float = 0.0
     retrieval_usefulness: dict[str, Any] = field(default_factory=dict)
+    stopped_due_to_sprt: bool = False
+    sprt_stop_reason: str | None = None
+    sprt: dict[str, Any] | None = None
+    duplicate_game_count: int = 0
+    duplicate_game_groups: list[list[int]] = field(default_factory=list)
+    stage_timings: dict[str, dict[str, float]] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         return asdict(self)
@@ -22,7 +22,9 @@ from zugzwang.core.protocol import (
     build_agentic_prompt,
     parse_agentic_action,
 )
+from zugzwang.core.resources import EnginePool, SharedResources
 from zugzwang.experiments.tracker import write_prompt_transcript
+from zugzwang.infra.tracing import span
 from zugzwang.providers.base import (
     ProviderError,
     ProviderInterface,
@@ -175,13 +177,14 @@ class LLMPlayer(PlayerInterface):
         }
 
         try:
-            write_prompt_transcript(
-                run_dir=run_dir,
-                game_number=game_number,
-                ply_number=game_state.ply_number + 1,
-                retry_index=retry_index,
-                payload=payload,
-            )
+            with span("artifact_write", category="io", artifact="prompt_transcript"):
+                write_prompt_transcript(
+                    run_dir=run_dir,
+                    game_number=game_number,
+                    ply_number=game_state.ply_number + 1,
+                    retry_index=retry_index,
+                    payload=payload,
+                )
         except Exception:
             # Transcript persistence must never break move selection.
             return
@@ -215,11 +218,12 @@ class LLMPlayer(PlayerInterface):
         decision_mode = "single_agent"
 
         for retry in range(move_retries + 1):
-            prompt_meta = build_direct_prompt_with_metadata(
-                game_state,
-                self.strategy_config,
-                retry_feedback=retry_feedback if retry > 0 else None,
-            )
+            with span("prompt_build", retry=retry):
+                prompt_meta = build_direct_prompt_with_metadata(
+                    game_state,
+                    self.strategy_config,
+                    retry_feedback=retry_feedback if retry > 0 else None,
+                )
             prompt = prompt_meta.prompt
             messages = self._build_messages(prompt_meta)
             last_prompt_meta = prompt_meta
@@ -227,12 +231,13 @@ class LLMPlayer(PlayerInterface):
             if self._is_multi_agent_enabled():
                 decision_mode = self._multi_agent_mode()
                 try:
-                    moa_result = self._run_multi_agent(
-                        mode=decision_mode,
-                        phase=game_state.phase,
-                        prompt=prompt,
-                        legal_moves_uci=game_state.legal_moves_uci,
-                    )
+                    with span("moa", mode=decision_mode, retry=retry):
+                        moa_result = self._run_multi_agent(
+                            mode=decision_mode,
+                            phase=game_state.phase,
+                            prompt=prompt,
+                            legal_moves_uci=game_state.legal_moves_uci,
+                        )
                 except ProviderError as exc:
                     last_error = _provider_error_code(exc)
                     retry_feedback = "Provider call failed. Return exactly one legal UCI move."
@@ -275,11 +280,12 @@ class LLMPlayer(PlayerInterface):
                     )
 
                 last_error = moa_result.error or "moa_validation_failed"
-                validation = validate_move_response(
-                    last_response,
-                    game_state.legal_moves_uci,
-                    fen=game_state.fen,
-                )
+                with span("validation"):
+                    validation = validate_move_response(
+                        last_response,
+                        game_state.legal_moves_uci,
+                        fen=game_state.fen,
+                    )
                 retry_feedback = build_retry_feedback(
                     validation=validation,
                     feedback_level=feedback_level,
@@ -322,11 +328,12 @@ class LLMPlayer(PlayerInterface):
             total_cost_usd += response.cost_usd
             last_response = response.text
 
-            validation = validate_move_response(
-                response.text,
-                game_state.legal_moves_uci,
-                fen=game_state.fen,
-            )
+            with span("validation"):
+                validation = validate_move_response(
+                    response.text,
+                    game_state.legal_moves_uci,
+                    fen=game_state.fen,
+                )
             self._record_prompt_transcript(
                 game_state=game_state,
                 retry_index=retry,
@@ -439,7 +446,8 @@ class LLMPlayer(PlayerInterface):
         last_error: str | None = None
 
         for retry in range(move_retries + 1):
-            conversation = [{"role": "user", "content": build_agentic_prompt(game_state)}]
+            with span("prompt_build", retry=retry):
+                conversation = [{"role": "user", "content": build_agentic_prompt(game_state)}]
             selected_move: str | None = None
             provider_model = self.model
             provider_hard_fail = False
@@ -541,12 +549,14 @@ class LLMPlayer(PlayerInterface):
         last_error: ProviderError | None = None
         for attempt in range(retries + 1):
             try:
-                return self.provider.complete(messages=messages, model_config=model_config)
+                with span("provider_call", category="provider", model=model_name, attempt=attempt):
+                    return self.provider.complete(messages=messages, model_config=model_config)
             except ProviderError as exc:
                 last_error = exc
                 if attempt >= retries or not should_retry_provider_error(exc):
                     break
-                time.sleep(backoff_seconds * (2**attempt))
+                with span("provider_backoff", category="provider", attempt=attempt):
+                    time.sleep(backoff_seconds * (2**attempt))
         if last_error is not None:
             raise last_error
         raise ProviderError("Unknown provider error")
@@ -646,6 +656,7 @@ class EnginePlayer(RandomPlayer):
         uci_limit_strength: bool | None = None,
         uci_elo: int | None = None,
         skill_level: int | None = None,
+        engine_pool: EnginePool | None = None,
     ) -> None:
         super().__init__(name=name, rng=rng)
         self.path = path or os.environ.get("STOCKFISH_PATH") or "stockfish"
@@ -656,13 +667,35 @@ class EnginePlayer(RandomPlayer):
         self.uci_limit_strength = uci_limit_strength
         self.uci_elo = uci_elo
         self.skill_level = skill_level
+        self.engine_pool = engine_pool
         self._engine: chess.engine.SimpleEngine | None = None
+        self._game: object | None = None
+
+    def _pool_key(self) -> tuple[Any, ...]:
+        return (
+            self.path,
+            self.threads,
+            self.hash_mb,
+            self.uci_limit_strength,
+            self.uci_elo,
+            self.skill_level,
+        )
 
     def _ensure_engine(self) -> chess.engine.SimpleEngine:
         if self._engine is not None:
             return self._engine
+        # A fresh game token makes python-chess send ucinewgame, so a pooled
+        # engine does not carry its hash table over from an earlier game.
+        self._game = object()
+        if self.engine_pool is not None:
+            self._engine = self.engine_pool.acquire(self._pool_key(), self._start_engine)
+            return self._engine
+        self._engine = self._start_engine()
+        return self._engine
+
+    def _start_engine(self) -> chess.engine.SimpleEngine:
         try:
-            self._engine = chess.engine.SimpleEngine.popen_uci(self.path)
+            engine = chess.engine.SimpleEngine.popen_uci(self.path)
         except FileNotFoundError as exc:
             raise ProviderError(
                 "Engine binary not found. Set STOCKFISH_PATH or players.<color>.path for type=engine.",
@@ -676,29 +709,28 @@ class EnginePlayer(RandomPlayer):
                 retryable=False,
             ) from exc
 
-        self._try_configure({"Threads": self.threads, "Hash": self.hash_mb})
+        self._try_configure(engine, {"Threads": self.threads, "Hash": self.hash_mb})
 
         if self.uci_limit_strength is not None:
-            self._try_configure({"UCI_LimitStrength": self.uci_limit_strength})
+            self._try_configure(engine, {"UCI_LimitStrength": self.uci_limit_strength})
         if self.skill_level is not None:
-            self._try_configure({"Skill Level": self.skill_level})
+            self._try_configure(engine, {"Skill Level": self.skill_level})
         if self.uci_elo is not None:
             # UCI_Elo only has effect when limit strength is enabled.
             if self.uci_limit_strength is not True:
-                self._try_configure({"UCI_LimitStrength": True})
-            self._try_configure({"UCI_Elo": self.uci_elo})
-        return self._engine
+                self._try_configure(engine, {"UCI_LimitStrength": True})
+            self._try_configure(engine, {"UCI_Elo": self.uci_elo})
+        return engine
 
     def _limit(self) -> chess.engine.Limit:
         if self.movetime_ms is not None:
             return chess.engine.Limit(time=max(0.001, self.movetime_ms / 1000))
         return chess.engine.Limit(depth=self.depth)
 
-    def _try_configure(self, options: dict[str, Any]) -> None:
-        if self._engine is None:
-            return
+    @staticmethod
+    def _try_configure(engine: chess.engine.SimpleEngine, options: dict[str, Any]) -> None:
         try:
-            self._engine.configure(options)
+            engine.configure(options)
         except chess.engine.EngineError:
             # Keep running with engine defaults if one of these options is unsupported.
             pass
@@ -706,11 +738,15 @@ class EnginePlayer(RandomPlayer):
     def close(self) -> None:
         if self._engine is None:
             return
+        engine = self._engine
+        self._engine = None
+        if self.engine_pool is not None:
+            self.engine_pool.release(self._pool_key(), engine)
+            return
         try:
-            self._engine.quit()
+            engine.quit()
         except Exception:
             pass
-        self._engine = None
 
     def __del__(self) -> None:  # pragma: no cover - cleanup only.
         self.close()
@@ -726,7 +762,8 @@ class EnginePlayer(RandomPlayer):
 
         try:
             board = chess.Board(game_state.fen)
-            result = self._ensure_engine().play(board, self._limit())
+            engine = self._ensure_engine()
+            result = engine.play(board, self._limit(), game=self._game)
             provider_calls = 1
             if result.move is None:
                 error = "engine_no_move"
@@ -765,6 +802,7 @@ def build_player(
     protocol_mode: str,
     strategy_config: dict[str, Any],
     rng: random.Random,
+    resources: SharedResources | None = None,
 ) -> PlayerInterface:
     player_type = player_config.get("type")
     name = player_config.get("name", player_type)
@@ -788,18 +826,23 @@ def build_player(
             uci_limit_strength=_safe_optional_bool(player_config.get("uci_limit_strength")),
             uci_elo=_safe_optional_positive_int(raw_uci_elo),
             skill_level=_safe_optional_bounded_int(raw_skill_level, minimum=0, maximum=20),
+            engine_pool=resources.engine_pool if resources is not None else None,
         )
     if player_type == "llm":
         provider_name = player_config.get("provider")
         model = player_config.get("model")
         resolved_provider, resolved_model = resolve_provider_and_model(provider_name, model)
-        provider = create_provider(resolved_provider)
+        if resources is not None:
+            provider = resources.provider(resolved_provider)
+        else:
+            provider = create_provider(resolved_provider)
         passthrough_keys = {
             "temperature",
             "top_p",
             "max_tokens",
             "pricing_mode",
             "thinking_type",
+            "sim",
         }
         model_config = {
             key: player_config[key]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Hashable
+
+import chess.engine
+
+from zugzwang.evaluation.stockfish import StockfishEvaluator
+from zugzwang.providers.base import ProviderInterface
+from zugzwang.providers.registry import create_provider
+
+
+class EnginePool:
+    """Idle UCI engine processes keyed by launch/configuration options."""
+
+    def __init__(self, max_idle_per_key: int = 4) -> None:
+        self.max_idle_per_key = max(0, max_idle_per_key)
+        self._idle: dict[Hashable, list[chess.engine.SimpleEngine]] = {}
+        self._lock = threading.Lock()
+        self.started = 0
+        self.reused = 0
+
+    def acquire(
+        self,
+        key: Hashable,
+        factory: Callable[[], chess.engine.SimpleEngine],
+    ) -> chess.engine.SimpleEngine:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self.reused += 1
+                return idle.pop()
+        engine = factory()
+        with self._lock:
+            self.started += 1
+        return engine
+
+    def release(self, key: Hashable, engine: chess.engine.SimpleEngine) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_key:
+                idle.append(engine)
+                return
+        _quit_engine(engine)
+
+    def close(self) -> None:
+        with self._lock:
+            engines = [engine for idle in self._idle.values() for engine in idle]
+            self._idle.clear()
+        for engine in engines:
+            _quit_engine(engine)
+
+
+class SharedResources:
+    """Process-wide providers, engines and evaluators reused across runs."""
+
+    def __init__(self, max_idle_engines_per_key: int = 4) -> None:
+        self.engine_pool = EnginePool(max_idle_per_key=max_idle_engines_per_key)
+        self._providers: dict[str, ProviderInterface] = {}
+        self._evaluators: dict[tuple[Any, ...], StockfishEvaluator] = {}
+        self._lock = threading.Lock()
+
+    def provider(self, name: str) -> ProviderInterface:
+        key = (name or "").lower()
+        with self._lock:
+            cached = self._providers.get(key)
+            if cached is None:
+                cached = create_provider(key)
+                self._providers[key] = cached
+            return cached
+
+    def evaluator(
+        self,
+        depth: int = 12,
+        path: str | None = None,
+        threads: int = 1,
+        hash_mb: int = 128,
+    ) -> StockfishEvaluator:
+        key = (depth, path, threads, hash_mb)
+        with self._lock:
+            cached = self._evaluators.get(key)
+            if cached is None:
+                cached = StockfishEvaluator(depth=depth, path=path, threads=threads, hash_mb=hash_mb)
+                self._evaluators[key] = cached
+            return cached
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "providers": sorted(self._providers),
+            "engines_started": self.engine_pool.started,
+            "engines_reused": self.engine_pool.reused,
+            "evaluators": len(self._evaluators),
+        }
+
+    def close(self) -> None:
+        self.engine_pool.close()
+        with self._lock:
+            evaluators = list(self._evaluators.values())
+            self._evaluators.clear()
+        for evaluator in evaluators:
+            try:
+                evaluator.close()
+            except Exception:
+                pass
+
+
+def _quit_engine(engine: chess.engine.SimpleEngine) -> None:
+    try:
+        engine.quit()
+    except Exception:
+        pass
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import Any
+
+import chess
+
+from zugzwang.evaluation.stockfish import MATE_SCORE_CP, StockfishEval
+
+
+_PIECE_VALUES = {
+    chess.PAWN: 100,
+    chess.KNIGHT: 320,
+    chess.BISHOP: 330,
+    chess.ROOK: 500,
+    chess.QUEEN: 900,
+    chess.KING: 0,
+}
+
+
+class MaterialEvaluator:
+    """Offline stand-in for ``StockfishEvaluator``: one-ply material eval.
+
+    Only meant for profiling and testing the evaluation pipeline without an
+    engine binary; its centipawn numbers are not comparable to Stockfish's.
+    """
+
+    path = "material"
+    depth = 1
+    threads = 1
+    hash_mb = 0
+
+    def __enter__(self) -> MaterialEvaluator:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+    def evaluate_move(self, fen: str, move_uci: str) -> StockfishEval:
+        board = chess.Board(fen)
+        mover = board.turn
+        best_move, best_score = move_uci, None
+        played_score = None
+        for move in board.legal_moves:
+            board.push(move)
+            score = _material(board, mover)
+            board.pop()
+            if best_score is None or score > best_score:
+                best_move, best_score = move.uci(), score
+            if move.uci() == move_uci:
+                played_score = score
+        if played_score is None:
+            raise ValueError(f"Illegal move '{move_uci}' for FEN '{fen}'")
+        best = best_score if best_score is not None else played_score
+        return StockfishEval(
+            best_move_uci=best_move,
+            centipawn_loss=max(0, best - played_score),
+            eval_before_cp=best,
+            eval_after_cp=played_score,
+        )
+
+
+def _material(board: chess.Board, color: chess.Color) -> int:
+    if board.is_checkmate():
+        return MATE_SCORE_CP if board.turn != color else -MATE_SCORE_CP
+    score = 0
+    for piece in board.piece_map().values():
+        value = _PIECE_VALUES[piece.piece_type]
+        score += value if piece.color == color else -value
+    return score
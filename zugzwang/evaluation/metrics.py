@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import math
-from typing import Iterable
+from typing import Any, Iterable
 
 from zugzwang.core.models import ExperimentReport, GameRecord
 
@@ -19,6 +19,9 @@ def summarize_experiment(
     budget_stop_reason: str | None = None,
     stopped_due_to_reliability: bool = False,
     reliability_stop_reason: str | None = None,
+    stopped_due_to_sprt: bool = False,
+    sprt_stop_reason: str | None = None,
+    sprt: dict[str, Any] | None = None,
 ) -> ExperimentReport:
     records = list(game_records)
     total_records = len(records)
@@ -130,6 +133,7 @@ def summarize_experiment(
         for phase in ("opening", "middlegame", "endgame")
     }
     moa_move_share = (moa_moves / total_moves) if total_moves else 0.0
+    duplicate_groups = duplicate_game_groups(records)
 
     return ExperimentReport(
         schema_version="1.0",
@@ -169,6 +173,29 @@ def summarize_experiment(
         avg_retrieval_latency_ms=avg_retrieval_latency_ms,
         retrieval_hit_rate_by_phase=retrieval_hit_rate_by_phase,
         moa_move_share=moa_move_share,
+        stopped_due_to_sprt=stopped_due_to_sprt,
+        sprt_stop_reason=sprt_stop_reason,
+        sprt=sprt,
+        duplicate_game_count=sum(len(group) - 1 for group in duplicate_groups),
+        duplicate_game_groups=duplicate_groups,
+    )
+
+
+def duplicate_game_groups(records: Iterable[GameRecord]) -> list[list[int]]:
+    """Game numbers grouped by identical start position, seating and move sequence."""
+    by_signature: dict[tuple[Any, ...], list[int]] = {}
+    for record in records:
+        by_signature.setdefault(game_signature(record), []).append(record.game_number)
+    return sorted(sorted(group) for group in by_signature.values() if len(group) > 1)
+
+
+def game_signature(record: GameRecord) -> tuple[Any, ...]:
+    opening = record.opening or {}
+    return (
+        opening.get("fen"),
+        tuple(opening.get("moves_uci") or ()),
+        bool(opening.get("colors_swapped", False)),
+        tuple(move.move_decision.move_uci for move in record.moves),
     )
 
 
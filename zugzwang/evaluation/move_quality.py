@@ -13,3 +13,17 @@ def classify_centipawn_loss(cp_loss: int) -> str:
     if cp_loss <= 200:
         return "mistake"
     return "blunder"
+
+
+def phase_from_fen(fen: str) -> str:
+    """Game phase from piece count and move number, read straight from the FEN fields."""
+    fields = fen.split()
+    if not fields:
+        raise ValueError(f"Invalid FEN: {fen!r}")
+    piece_count = sum(1 for char in fields[0] if char.isalpha())
+    if piece_count <= 10:
+        return "endgame"
+    fullmove_number = int(fields[5]) if len(fields) > 5 else 1
+    if fullmove_number <= 12:
+        return "opening"
+    return "middlegame"
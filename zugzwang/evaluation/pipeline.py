@@ -5,16 +5,23 @@ import json
 from pathlib import Path
 from typing import Any
 
-import chess
 import yaml
 
 from zugzwang.core.models import ExperimentReport, GameRecord
 from zugzwang.evaluation.elo import estimate_elo_mle
 from zugzwang.evaluation.metrics import summarize_experiment
-from zugzwang.evaluation.move_quality import classify_centipawn_loss
-from zugzwang.evaluation.player_color import infer_evaluation_player_color
+from zugzwang.evaluation.move_quality import classify_centipawn_loss, phase_from_fen
+from zugzwang.evaluation.player_color import (
+    infer_evaluation_player_color,
+    record_player_color,
+)
 from zugzwang.evaluation.stockfish import StockfishEvaluator
 from zugzwang.experiments.io import load_game_records
+from zugzwang.experiments.tracker import mark_run_changed, update_run_metadata
+from zugzwang.infra.memory import monitor_from_config
+
+
+MOVE_EVALUATIONS_FILENAME = "move_evaluations.jsonl"
 
 
 def evaluate_run_dir(
@@ -23,6 +30,7 @@ def evaluate_run_dir(
     opponent_elo: float | None = None,
     elo_color_correction: float = 0.0,
     output_filename: str = "experiment_report_evaluated.json",
+    evaluator: StockfishEvaluator | None = None,
 ) -> dict[str, Any]:
     run_path = Path(run_dir)
     if not run_path.exists():
@@ -30,73 +38,95 @@ def evaluate_run_dir(
 
     resolved_config = _load_resolved_config(run_path)
     config_hash = _load_config_hash(run_path)
-    games_dir = run_path / "games"
-    records = load_game_records(games_dir)
-    if not records:
-        raise ValueError(f"No game records found in {games_dir}")
-    resolved_player_color, player_color_resolution = infer_evaluation_player_color(
-        resolved_config=resolved_config,
-        requested_color=player_color,
-    )
-
-    existing_report = _load_existing_report(run_path / "experiment_report.json")
-    scheduled_games = (
-        int(existing_report.get("num_games_scheduled", 0))
-        if existing_report
-        else len(records)
-    )
-    if scheduled_games <= 0:
-        scheduled_games = len(records)
-
-    budget_cap = float(resolved_config["budget"]["max_total_usd"])
-    base_report = summarize_experiment(
-        experiment_id=records[0].experiment_id,
-        config_hash=config_hash,
-        target_games=int(resolved_config["experiment"]["target_valid_games"]),
-        scheduled_games=scheduled_games,
-        game_records=records,
-        budget_cap_usd=budget_cap,
-        stopped_due_to_budget=bool(existing_report.get("stopped_due_to_budget", False))
-        if existing_report
-        else False,
-        budget_stop_reason=existing_report.get("budget_stop_reason") if existing_report else None,
-    )
-
-    stockfish_cfg = resolved_config.get("evaluation", {}).get("stockfish", {})
-    evaluator = StockfishEvaluator(
-        depth=int(stockfish_cfg.get("depth", 12)),
-        path=stockfish_cfg.get("path"),
-        threads=int(stockfish_cfg.get("threads", 1)),
-        hash_mb=int(stockfish_cfg.get("hash_mb", 128)),
-    )
-    with evaluator:
-        move_quality = _evaluate_move_quality(
-            records=records,
-            evaluator=evaluator,
-            player_color=resolved_player_color,
+    # Opt-in via the run's tracking.memory_profile, like the run itself.
+    monitor = monitor_from_config(resolved_config)
+    if monitor is not None:
+        monitor.start()
+    try:
+        games_dir = run_path / "games"
+        records = load_game_records(games_dir)
+        if not records:
+            raise ValueError(f"No game records found in {games_dir}")
+        resolved_player_color, player_color_resolution = infer_evaluation_player_color(
+            resolved_config=resolved_config,
+            requested_color=player_color,
+        )
+
+        existing_report = _load_existing_report(run_path / "experiment_report.json")
+        scheduled_games = (
+            int(existing_report.get("num_games_scheduled", 0))
+            if existing_report
+            else len(records)
+        )
+        if scheduled_games <= 0:
+            scheduled_games = len(records)
+
+        budget_cap = float(resolved_config["budget"]["max_total_usd"])
+        base_report = summarize_experiment(
+            experiment_id=records[0].experiment_id,
+            config_hash=config_hash,
+            target_games=int(resolved_config["experiment"]["target_valid_games"]),
+            scheduled_games=scheduled_games,
+            game_records=records,
+            budget_cap_usd=budget_cap,
+            stopped_due_to_budget=bool(existing_report.get("stopped_due_to_budget", False))
+            if existing_report
+            else False,
+            budget_stop_reason=existing_report.get("budget_stop_reason") if existing_report else None,
+            stopped_due_to_sprt=bool(existing_report.get("stopped_due_to_sprt", False))
+            if existing_report
+            else False,
+            sprt_stop_reason=existing_report.get("sprt_stop_reason") if existing_report else None,
+            sprt=existing_report.get("sprt") if existing_report else None,
         )
 
-    elo_estimate = None
-    elo_ci = None
-    if opponent_elo is not None:
-        observations = [
-            (opponent_elo, _result_score(record.result, resolved_player_color)) for record in records
-        ]
-        elo = estimate_elo_mle(observations, color_correction_elo=elo_color_correction)
-        elo_estimate = float(elo.estimate)
-        elo_ci = [float(elo.ci_95[0]), float(elo.ci_95[1])]
-
-    enriched_report: ExperimentReport = replace(
-        base_report,
-        schema_version="2.0",
-        elo_estimate=elo_estimate,
-        elo_ci_95=elo_ci,
-        acpl_overall=move_quality["acpl_overall"],
-        acpl_by_phase=move_quality["acpl_by_phase"],
-        blunder_rate=move_quality["blunder_rate"],
-        best_move_agreement=move_quality["best_move_agreement"],
-        retrieval_usefulness=move_quality["retrieval_usefulness"],
-    )
+        if evaluator is not None:
+            # Shared evaluators (e.g. sweeps) stay open for the next run.
+            move_quality = _evaluate_move_quality(
+                records=records,
+                evaluator=evaluator,
+                player_color=resolved_player_color,
+            )
+        else:
+            stockfish_cfg = resolved_config.get("evaluation", {}).get("stockfish", {})
+            evaluator = StockfishEvaluator(
+                depth=int(stockfish_cfg.get("depth", 12)),
+                path=stockfish_cfg.get("path"),
+                threads=int(stockfish_cfg.get("threads", 1)),
+                hash_mb=int(stockfish_cfg.get("hash_mb", 128)),
+            )
+            with evaluator:
+                move_quality = _evaluate_move_quality(
+                    records=records,
+                    evaluator=evaluator,
+                    player_color=resolved_player_color,
+                )
+
+        elo_estimate = None
+        elo_ci = None
+        if opponent_elo is not None:
+            observations = [
+                (opponent_elo, _result_score(record.result, record_player_color(record, resolved_player_color)))
+                for record in records
+            ]
+            elo = estimate_elo_mle(observations, color_correction_elo=elo_color_correction)
+            elo_estimate = float(elo.estimate)
+            elo_ci = [float(elo.ci_95[0]), float(elo.ci_95[1])]
+
+        enriched_report: ExperimentReport = replace(
+            base_report,
+            schema_version="2.0",
+            elo_estimate=elo_estimate,
+            elo_ci_95=elo_ci,
+            acpl_overall=move_quality["acpl_overall"],
+            acpl_by_phase=move_quality["acpl_by_phase"],
+            blunder_rate=move_quality["blunder_rate"],
+            best_move_agreement=move_quality["best_move_agreement"],
+            retrieval_usefulness=move_quality["retrieval_usefulness"],
+            stage_timings=dict(existing_report.get("stage_timings") or {}) if existing_report else {},
+        )
+    finally:
+        memory = monitor.stop() if monitor is not None else None
 
     output = enriched_report.to_dict()
     output["evaluation"] = {
@@ -115,9 +145,14 @@ def evaluate_run_dir(
         "evaluated_move_count": move_quality["evaluated_move_count"],
         "retrieval_usefulness": move_quality["retrieval_usefulness"],
     }
+    if memory is not None:
+        output["memory"] = memory
+        update_run_metadata(run_path, {"evaluation_memory": memory})
 
     output_path = run_path / output_filename
     output_path.write_text(json.dumps(output, indent=2), encoding="utf-8")
+    _write_move_evaluations(run_path / MOVE_EVALUATIONS_FILENAME, move_quality["move_rows"])
+    mark_run_changed(run_path)
     return {
         "run_dir": str(run_path),
         "input_games": len(records),
@@ -131,6 +166,7 @@ def evaluate_run_dir(
         "elo_estimate": elo_estimate,
         "elo_ci_95": elo_ci,
         "retrieval_usefulness": move_quality["retrieval_usefulness"],
+        "peak_rss_mb": memory["peak_rss_mb"] if memory is not None else None,
     }
 
 
@@ -152,10 +188,11 @@ def _evaluate_move_quality(
     move_rows: list[dict[str, Any]] = []
 
     for record in records:
+        record_color = record_player_color(record, color_key)
         for move in record.moves:
-            if move.color.lower() != color_key:
+            if move.color.lower() != record_color:
                 continue
-            phase = _phase_from_fen(move.fen_before)
+            phase = phase_from_fen(move.fen_before)
             try:
                 evaluation = evaluator.evaluate_move(move.fen_before, move.move_decision.move_uci)
             except Exception:
@@ -176,6 +213,10 @@ def _evaluate_move_quality(
                 best_count += 1
             move_rows.append(
                 {
+                    "game_number": record.game_number,
+                    "ply_number": move.ply_number,
+                    "best_move_uci": evaluation.best_move_uci,
+                    "classification": classification,
                     "cp_loss": cp_loss,
                     "is_best": is_best,
                     "is_blunder": classification == "blunder",
@@ -202,9 +243,16 @@ def _evaluate_move_quality(
         "best_move_agreement": float(best_move_agreement),
         "evaluated_move_count": total_moves,
         "retrieval_usefulness": retrieval_usefulness,
+        "move_rows": move_rows,
     }
 
 
+def _write_move_evaluations(path: Path, move_rows: list[dict[str, Any]]) -> None:
+    """Per-move rows for the cross-run move dataset (``zugzwang.analysis.dataset``)."""
+    lines = [json.dumps(row, sort_keys=True) for row in move_rows]
+    path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+
+
 def _compute_retrieval_usefulness(move_rows: list[dict[str, Any]]) -> dict[str, Any]:
     retrieval_rows = [row for row in move_rows if row.get("retrieval_enabled")]
     hit_rows = [row for row in retrieval_rows if row.get("retrieval_hit")]
@@ -276,16 +324,6 @@ def _pearson_hit_count_cp_loss(rows: list[dict[str, Any]]) -> float | None:
     return float(cov / ((var_x**0.5) * (var_y**0.5)))
 
 
-def _phase_from_fen(fen: str) -> str:
-    board = chess.Board(fen)
-    piece_count = len(board.piece_map())
-    if piece_count <= 10:
-        return "endgame"
-    if board.fullmove_number <= 12:
-        return "opening"
-    return "middlegame"
-
-
 def _result_score(result: str, player_color: str) -> float:
     color = player_color.lower()
     if result == "1/2-1/2":
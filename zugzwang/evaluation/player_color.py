@@ -43,6 +43,15 @@ def infer_evaluation_player_color(
     return "black", "auto_tie_default_black"
 
 
+def record_player_color(record: Any, player_color: str) -> EvalPlayerColor:
+    """Seat of the evaluated player in one game, honoring opening-suite color swaps."""
+    color: EvalPlayerColor = "white" if player_color.lower() == "white" else "black"
+    opening = getattr(record, "opening", None)
+    if isinstance(opening, dict) and bool(opening.get("colors_swapped", False)):
+        return "black" if color == "white" else "white"
+    return color
+
+
 def _normalized_player_type(player_cfg: Any) -> str:
     if not isinstance(player_cfg, dict):
         return "missing"
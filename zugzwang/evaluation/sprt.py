@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any
+
+from zugzwang.evaluation.elo import logistic_expected
+
+
+SPRT_MODES = {"wdl", "elo"}
+
+# Pseudo-count added to every W/D/L bucket so the score variance stays positive
+# on short one-sided streaks (e.g. the first few games are all losses).
+_OUTCOME_PRIOR = 0.5
+
+
+@dataclass(frozen=True)
+class SprtConfig:
+    enabled: bool
+    mode: str
+    elo0: float
+    elo1: float
+    alpha: float
+    beta: float
+    opponent_elo: float | None
+    player_color: str
+    min_games: int
+
+    @property
+    def elo_diff0(self) -> float:
+        if self.mode == "elo":
+            return self.elo0 - float(self.opponent_elo or 0.0)
+        return self.elo0
+
+    @property
+    def elo_diff1(self) -> float:
+        if self.mode == "elo":
+            return self.elo1 - float(self.opponent_elo or 0.0)
+        return self.elo1
+
+
+@dataclass
+class SprtState:
+    config: SprtConfig
+    player_color: str
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+    llr: float = 0.0
+    status: str = "continue"
+    llr_trajectory: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.draws + self.losses
+
+    @property
+    def bounds(self) -> tuple[float, float]:
+        return sprt_bounds(self.config.alpha, self.config.beta)
+
+    def update(self, result: str, game_number: int, player_color: str | None = None) -> str:
+        score = result_score(result, player_color or self.player_color)
+        if score >= 1.0:
+            self.wins += 1
+        elif score <= 0.0:
+            self.losses += 1
+        else:
+            self.draws += 1
+
+        self.llr = sprt_llr(
+            self.wins,
+            self.draws,
+            self.losses,
+            elo0=self.config.elo_diff0,
+            elo1=self.config.elo_diff1,
+        )
+        self.llr_trajectory.append(
+            {
+                "game_number": game_number,
+                "result": result,
+                "wins": self.wins,
+                "draws": self.draws,
+                "losses": self.losses,
+                "llr": self.llr,
+            }
+        )
+
+        lower, upper = self.bounds
+        if self.games < self.config.min_games:
+            self.status = "continue"
+        elif self.llr >= upper:
+            self.status = "accept_h1"
+        elif self.llr <= lower:
+            self.status = "accept_h0"
+        else:
+            self.status = "continue"
+        return self.status
+
+    def to_dict(self) -> dict[str, Any]:
+        lower, upper = self.bounds
+        return {
+            "enabled": self.config.enabled,
+            "mode": self.config.mode,
+            "player_color": self.player_color,
+            "elo0": self.config.elo0,
+            "elo1": self.config.elo1,
+            "opponent_elo": self.config.opponent_elo,
+            "alpha": self.config.alpha,
+            "beta": self.config.beta,
+            "min_games": self.config.min_games,
+            "lower_bound": lower,
+            "upper_bound": upper,
+            "status": self.status,
+            "games": self.games,
+            "wins": self.wins,
+            "draws": self.draws,
+            "losses": self.losses,
+            "llr": self.llr,
+            "llr_trajectory": list(self.llr_trajectory),
+        }
+
+
+def sprt_config_from_dict(raw: Any) -> SprtConfig:
+    cfg = raw if isinstance(raw, dict) else {}
+    opponent_elo_raw = cfg.get("opponent_elo")
+    return SprtConfig(
+        enabled=bool(cfg.get("enabled", False)),
+        mode=str(cfg.get("mode", "wdl")).strip().lower(),
+        elo0=float(cfg.get("elo0", 0.0)),
+        elo1=float(cfg.get("elo1", 50.0)),
+        alpha=float(cfg.get("alpha", 0.05)),
+        beta=float(cfg.get("beta", 0.05)),
+        opponent_elo=float(opponent_elo_raw) if opponent_elo_raw is not None else None,
+        player_color=str(cfg.get("player_color", "auto")),
+        min_games=int(cfg.get("min_games", 4)),
+    )
+
+
+def sprt_bounds(alpha: float, beta: float) -> tuple[float, float]:
+    """Wald's (lower, upper) log-likelihood ratio thresholds."""
+    return math.log(beta / (1.0 - alpha)), math.log((1.0 - beta) / alpha)
+
+
+def sprt_llr(wins: int, draws: int, losses: int, elo0: float, elo1: float) -> float:
+    """Generalized SPRT log-likelihood ratio for W/D/L counts.
+
+    Uses the normal approximation over the per-game score, with H0/H1 expressed
+    as logistic Elo differences against the opponent.
+    """
+    if wins + draws + losses <= 0:
+        return 0.0
+
+    w = wins + _OUTCOME_PRIOR
+    d = draws + _OUTCOME_PRIOR
+    l = losses + _OUTCOME_PRIOR
+    n = w + d + l
+    mean = (w + 0.5 * d) / n
+    variance = (w * (1.0 - mean) ** 2 + d * (0.5 - mean) ** 2 + l * mean**2) / n
+    if variance <= 0:
+        return 0.0
+
+    score0 = logistic_expected(0.0, elo0)
+    score1 = logistic_expected(0.0, elo1)
+    games = wins + draws + losses
+    return games * (score1 - score0) * (2.0 * mean - score0 - score1) / (2.0 * variance)
+
+
+def result_score(result: str, player_color: str) -> float:
+    color = player_color.lower()
+    if result == "1-0":
+        return 1.0 if color == "white" else 0.0
+    if result == "0-1":
+        return 1.0 if color == "black" else 0.0
+    return 0.5
+
+
+def stop_reason_for_status(status: str) -> str | None:
+    if status == "accept_h0":
+        return "sprt_accept_h0"
+    if status == "accept_h1":
+        return "sprt_accept_h1"
+    return None
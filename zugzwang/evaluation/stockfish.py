@@ -8,6 +8,7 @@ import chess
 import chess.engine
 
 MATE_SCORE_CP = 100_000
+MOVE_CACHE_SIZE = 50_000
 
 
 @dataclass
@@ -33,6 +34,7 @@ class StockfishEvaluator:
         self.threads = threads
         self.hash_mb = hash_mb
         self._engine: chess.engine.SimpleEngine | None = None
+        self._move_cache: dict[tuple[str, str], StockfishEval] = {}
 
     def _ensure_engine(self) -> chess.engine.SimpleEngine:
         if self._engine is not None:
@@ -85,6 +87,17 @@ class StockfishEvaluator:
         return best_move, eval_cp
 
     def evaluate_move(self, fen: str, move_uci: str) -> StockfishEval:
+        cache_key = (fen, move_uci)
+        cached = self._move_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        evaluation = self._evaluate_move_uncached(fen, move_uci)
+        if len(self._move_cache) >= MOVE_CACHE_SIZE:
+            self._move_cache.pop(next(iter(self._move_cache)))
+        self._move_cache[cache_key] = evaluation
+        return evaluation
+
+    def _evaluate_move_uncached(self, fen: str, move_uci: str) -> StockfishEval:
         board_before = chess.Board(fen)
         mover = board_before.turn
         move = chess.Move.from_uci(move_uci)
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import math
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any
+
+from zugzwang.core.models import GameRecord
+from zugzwang.core.resources import SharedResources
+from zugzwang.experiments.runner import ExperimentRunner, RunSession
+from zugzwang.infra.config import resolve_config
+
+
+SIM_PROVIDER = "sim"
+SIM_MODEL = "sim-1"
+
+
+def run_bench(
+    config_path: str | Path,
+    *,
+    model_profile_path: str | Path | None = None,
+    overrides: list[str] | None = None,
+    games: int = 4,
+    concurrency: int = 1,
+    output_dir: str | Path | None = None,
+) -> dict[str, Any]:
+    """Play ``games`` games of a config against the ``sim`` provider and report throughput.
+
+    Every LLM player is routed to ``sim``; its latency and fault injection come
+    from the player's ``sim`` block (e.g. ``--set players.black.sim.rate_429=0.05``).
+    Games run ``concurrency`` at a time on one session, like a sweep does.
+    """
+    if games < 1:
+        raise ValueError("games must be >= 1")
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+
+    config = resolve_config(
+        experiment_config_path=config_path,
+        model_profile_path=model_profile_path,
+        cli_overrides=overrides,
+    )
+    llm_colors = [
+        color
+        for color, player in sorted(config.get("players", {}).items())
+        if isinstance(player, dict) and player.get("type") == "llm"
+    ]
+    if not llm_colors:
+        raise ValueError("bench needs at least one llm player in the config")
+
+    with tempfile.TemporaryDirectory(prefix="zugzwang-bench-") as tmp:
+        bench_overrides = list(overrides or [])
+        for color in llm_colors:
+            bench_overrides.append(f"players.{color}.provider={SIM_PROVIDER}")
+            bench_overrides.append(f"players.{color}.model={SIM_MODEL}")
+        bench_overrides.extend(
+            [
+                f"experiment.target_valid_games={games}",
+                f"experiment.max_games={games}",
+                f"runtime.output_dir={Path(output_dir or tmp).as_posix()}",
+                "evaluation.auto.enabled=false",
+                "tracking.trace_spans=true",
+            ]
+        )
+        runner = ExperimentRunner(
+            config_path=config_path,
+            model_profile_path=model_profile_path,
+            overrides=bench_overrides,
+        )
+        resources = SharedResources()
+        session = runner.start_session(resources)
+        try:
+            started = time.perf_counter()
+            _play_concurrently(session, concurrency)
+            wall_seconds = time.perf_counter() - started
+            finalized = session.finalize()
+        finally:
+            session.close()
+        provider = resources.provider(SIM_PROVIDER)
+        tracer = session.tracer
+
+    provider_stats = provider.stats()  # type: ignore[attr-defined]
+    llm_plies = _llm_plies(session.records)
+    move_latencies = sorted(
+        duration
+        for duration, args in (tracer.spans("choose_move") if tracer is not None else [])
+        if (args.get("game"), args.get("ply")) in llm_plies
+    )
+    llm_moves = [decision for record in session.records for decision in _llm_decisions(record)]
+    fallback_moves = sum(1 for decision in llm_moves if not decision.parse_ok)
+    games_played = len(session.records)
+
+    calls = provider_stats["calls"]
+    return {
+        "run_id": finalized["run_id"],
+        "run_dir": finalized["run_dir"] if output_dir is not None else None,
+        "games": games_played,
+        "valid_games": finalized["valid_games"],
+        "concurrency": concurrency,
+        "wall_seconds": round(wall_seconds, 3),
+        "games_per_hour": round(games_played * 3600 / wall_seconds, 1) if wall_seconds > 0 else None,
+        "provider_calls": calls,
+        "provider_calls_per_second": round(calls / wall_seconds, 2) if wall_seconds > 0 else None,
+        "calls_per_move": round(calls / len(llm_moves), 3) if llm_moves else None,
+        "wasted_calls": provider_stats["wasted_calls"],
+        "faults": provider_stats["faults"],
+        "rejected_responses": provider_stats["rejected"],
+        "llm_moves": len(llm_moves),
+        "fallback_moves": fallback_moves,
+        "move_latency_ms": {
+            "p50": _nearest_rank(move_latencies, 0.50),
+            "p95": _nearest_rank(move_latencies, 0.95),
+            "max": round(move_latencies[-1], 1) if move_latencies else None,
+        },
+    }
+
+
+def _play_concurrently(session: RunSession, concurrency: int) -> None:
+    in_flight: set[Future[GameRecord]] = set()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while True:
+            while len(in_flight) < concurrency:
+                game_number = session.next_game_number()
+                if game_number is None:
+                    break
+                in_flight.add(executor.submit(session.play_game, game_number))
+            if not in_flight:
+                return
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                session.record_game(future.result())
+
+
+def _llm_decisions(record: GameRecord) -> list[Any]:
+    return [
+        move.move_decision
+        for move in record.moves
+        if (record.players.get(move.color) or {}).get("type") == "llm"
+    ]
+
+
+def _llm_plies(records: list[GameRecord]) -> set[tuple[int, int]]:
+    return {
+        (record.game_number, move.ply_number)
+        for record in records
+        for move in record.moves
+        if (record.players.get(move.color) or {}).get("type") == "llm"
+    }
+
+
+def _nearest_rank(ordered: list[float], quantile: float) -> float | None:
+    if not ordered:
+        return None
+    index = max(0, math.ceil(quantile * len(ordered)) - 1)
+    return round(ordered[min(index, len(ordered) - 1)], 1)
@@ -36,6 +36,9 @@ ALLOWED_PLAYER_TYPES = {"random", "llm", "engine"}
 ALLOWED_PLAYER_COLORS = {"white", "black"}
 ALLOWED_EVAL_PLAYER_COLORS = {"white", "black", "auto"}
 ALLOWED_TIMEOUT_POLICY_ACTIONS = {"stop_run"}
+ALLOWED_SPRT_MODES = {"wdl", "elo"}
+ALLOWED_OPENING_SOURCES = {"eco"}
+ALLOWED_POSITION_SCORING = {"auto", "stored", "stockfish"}
 ALLOWED_RAG_SOURCES = {"eco", "lichess", "endgames"}
 ALLOWED_FEW_SHOT_SOURCES = {"builtin", "config"}
 ALLOWED_MULTI_AGENT_MODES = {"capability_moa", "specialist_moa", "hybrid_phase_router"}
@@ -184,6 +187,125 @@ def _validate_timeout_policy(config: dict[str, Any]) -> None:
         raise ConfigValidationError(f"runtime.timeout_policy.action must be one of [{allowed}]")
 
 
+def _validate_openings(config: dict[str, Any]) -> None:
+    openings_cfg = config.get("experiment", {}).get("openings")
+    if openings_cfg is None:
+        return
+    if not isinstance(openings_cfg, dict):
+        raise ConfigValidationError("experiment.openings must be a mapping when provided")
+
+    enabled = openings_cfg.get("enabled", False)
+    if not isinstance(enabled, bool):
+        raise ConfigValidationError("experiment.openings.enabled must be a boolean")
+
+    color_balance = openings_cfg.get("color_balance", True)
+    if not isinstance(color_balance, bool):
+        raise ConfigValidationError("experiment.openings.color_balance must be a boolean")
+
+    source = openings_cfg.get("source")
+    if source is not None and source not in ALLOWED_OPENING_SOURCES:
+        allowed = ", ".join(sorted(ALLOWED_OPENING_SOURCES))
+        raise ConfigValidationError(f"experiment.openings.source must be one of [{allowed}] or null")
+
+    positions = openings_cfg.get("positions", [])
+    if positions is None:
+        positions = []
+    if not isinstance(positions, list):
+        raise ConfigValidationError("experiment.openings.positions must be a list")
+    for entry in positions:
+        if isinstance(entry, str) and entry.strip():
+            continue
+        if isinstance(entry, dict) and (entry.get("fen") or entry.get("moves")):
+            continue
+        raise ConfigValidationError(
+            "experiment.openings.positions entries must be a FEN, a move line, or a mapping with fen/moves"
+        )
+
+    if enabled and not positions and source is None:
+        raise ConfigValidationError(
+            "experiment.openings requires positions or a source when experiment.openings.enabled=true"
+        )
+
+
+def _validate_sprt(config: dict[str, Any]) -> None:
+    sprt_cfg = config.get("runtime", {}).get("sprt")
+    if sprt_cfg is None:
+        return
+    if not isinstance(sprt_cfg, dict):
+        raise ConfigValidationError("runtime.sprt must be a mapping when provided")
+
+    enabled = sprt_cfg.get("enabled", False)
+    if not isinstance(enabled, bool):
+        raise ConfigValidationError("runtime.sprt.enabled must be a boolean")
+
+    mode = sprt_cfg.get("mode", "wdl")
+    if mode not in ALLOWED_SPRT_MODES:
+        allowed = ", ".join(sorted(ALLOWED_SPRT_MODES))
+        raise ConfigValidationError(f"runtime.sprt.mode must be one of [{allowed}]")
+
+    elo0 = sprt_cfg.get("elo0", 0.0)
+    elo1 = sprt_cfg.get("elo1", 50.0)
+    for key, value in (("elo0", elo0), ("elo1", elo1)):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ConfigValidationError(f"runtime.sprt.{key} must be numeric")
+    if elo1 <= elo0:
+        raise ConfigValidationError("runtime.sprt.elo1 must be greater than runtime.sprt.elo0")
+
+    for key in ("alpha", "beta"):
+        value = sprt_cfg.get(key, 0.05)
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0 or value >= 0.5:
+            raise ConfigValidationError(f"runtime.sprt.{key} must be in (0, 0.5)")
+
+    opponent_elo = sprt_cfg.get("opponent_elo")
+    if opponent_elo is not None and (
+        isinstance(opponent_elo, bool) or not isinstance(opponent_elo, (int, float))
+    ):
+        raise ConfigValidationError("runtime.sprt.opponent_elo must be numeric or null")
+    if enabled and mode == "elo" and opponent_elo is None:
+        raise ConfigValidationError("runtime.sprt.opponent_elo is required when runtime.sprt.mode=elo")
+
+    player_color = sprt_cfg.get("player_color", "auto")
+    if player_color not in ALLOWED_EVAL_PLAYER_COLORS:
+        allowed = ", ".join(sorted(ALLOWED_EVAL_PLAYER_COLORS))
+        raise ConfigValidationError(f"runtime.sprt.player_color must be one of [{allowed}]")
+
+    min_games = sprt_cfg.get("min_games", 4)
+    if isinstance(min_games, bool) or not isinstance(min_games, int) or min_games <= 0:
+        raise ConfigValidationError("runtime.sprt.min_games must be a positive int")
+
+
+def _validate_position_suite(config: dict[str, Any]) -> None:
+    suite_cfg = config.get("position_suite")
+    if suite_cfg is None:
+        return
+    if not isinstance(suite_cfg, dict):
+        raise ConfigValidationError("position_suite must be a mapping when provided")
+
+    source = suite_cfg.get("source", "tactics")
+    if not isinstance(source, str) or not source.strip():
+        raise ConfigValidationError("position_suite.source must be a non-empty string")
+
+    max_positions = suite_cfg.get("max_positions")
+    if max_positions is not None and (
+        isinstance(max_positions, bool) or not isinstance(max_positions, int) or max_positions <= 0
+    ):
+        raise ConfigValidationError("position_suite.max_positions must be a positive int or null")
+
+    concurrency = suite_cfg.get("concurrency", 4)
+    if isinstance(concurrency, bool) or not isinstance(concurrency, int) or concurrency <= 0:
+        raise ConfigValidationError("position_suite.concurrency must be a positive int")
+
+    scoring = suite_cfg.get("scoring", "auto")
+    if scoring not in ALLOWED_POSITION_SCORING:
+        allowed = ", ".join(sorted(ALLOWED_POSITION_SCORING))
+        raise ConfigValidationError(f"position_suite.scoring must be one of [{allowed}]")
+
+    player_color = suite_cfg.get("player_color", "auto")
+    if player_color not in ALLOWED_EVAL_PLAYER_COLORS:
+        allowed = ", ".join(sorted(ALLOWED_EVAL_PLAYER_COLORS))
+        raise ConfigValidationError(f"position_suite.player_color must be one of [{allowed}]")
+
+
 def _validate_strategy_rag(config: dict[str, Any]) -> None:
     rag_cfg = config.get("strategy", {}).get("rag")
     if rag_cfg is None:
@@ -445,10 +567,27 @@ def validate_config(config: dict[str, Any]) -> None:
         raise ConfigValidationError(
             "tracking.persist_prompt_transcripts must be a boolean when provided"
         )
+    trace_spans = config.get("tracking", {}).get("trace_spans")
+    if trace_spans is not None and not isinstance(trace_spans, bool):
+        raise ConfigValidationError("tracking.trace_spans must be a boolean when provided")
+    memory_profile = config.get("tracking", {}).get("memory_profile")
+    if memory_profile is not None and not isinstance(memory_profile, bool):
+        raise ConfigValidationError("tracking.memory_profile must be a boolean when provided")
+    memory_interval = config.get("tracking", {}).get("memory_interval_seconds")
+    if memory_interval is not None and (
+        isinstance(memory_interval, bool) or not isinstance(memory_interval, (int, float)) or memory_interval <= 0
+    ):
+        raise ConfigValidationError("tracking.memory_interval_seconds must be a positive number")
+    memory_top = config.get("tracking", {}).get("memory_top_allocators")
+    if memory_top is not None and (isinstance(memory_top, bool) or not isinstance(memory_top, int) or memory_top < 0):
+        raise ConfigValidationError("tracking.memory_top_allocators must be a non-negative integer")
 
     _validate_player_config(_get_by_path(config, "players"))
     _validate_evaluation_auto(config)
     _validate_timeout_policy(config)
+    _validate_openings(config)
+    _validate_sprt(config)
+    _validate_position_suite(config)
     _validate_strategy_rag(config)
     _validate_strategy_few_shot(config)
     _validate_strategy_multi_agent(config)
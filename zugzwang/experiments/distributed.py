@@ -0,0 +1,480 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from zugzwang.experiments.resume import ResolvedResumeState, load_existing_game_records
+from zugzwang.experiments.runner import ExperimentRunner, RunSession, build_prepared_run
+from zugzwang.experiments.tracker import update_run_metadata, write_game_record
+from zugzwang.infra.env import validate_environment
+
+
+LEASES_DIRNAME = "leases"
+STOP_FILENAME = "stop.json"
+DISTRIBUTED_FILENAME = "distributed.json"
+# Each worker's spans, merged into trace.json and stage_timings by the coordinator.
+WORKER_TRACE_GLOB = "trace.*.json"
+DEFAULT_LEASE_SECONDS = 300.0
+DEFAULT_POLL_SECONDS = 2.0
+
+
+@dataclass(frozen=True)
+class Lease:
+    game_number: int
+    worker_id: str
+    claimed_at: float
+    expires_at: float
+
+    def expired(self, now: float | None = None) -> bool:
+        return (now if now is not None else time.time()) >= self.expires_at
+
+
+class LeaseQueue:
+    """Claims game numbers through lease files under ``<run_dir>/leases``.
+
+    A claim is an ``O_CREAT | O_EXCL`` create of ``game_NNNN.lease``, which is
+    atomic on local filesystems and NFSv3+. Expired leases (dead workers) are
+    stolen by renaming them aside first, so only one worker wins the steal.
+    """
+
+    def __init__(self, run_dir: str | Path, worker_id: str, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> None:
+        self.run_dir = Path(run_dir)
+        self.leases_dir = self.run_dir / LEASES_DIRNAME
+        self.leases_dir.mkdir(parents=True, exist_ok=True)
+        self.worker_id = worker_id
+        self.lease_seconds = float(lease_seconds)
+        self.steals = 0
+
+    def lease_path(self, game_number: int) -> Path:
+        return self.leases_dir / f"game_{game_number:04d}.lease"
+
+    def read(self, game_number: int) -> Lease | None:
+        return _read_lease(self.lease_path(game_number))
+
+    def active_leases(self) -> list[Lease]:
+        now = time.time()
+        leases: list[Lease] = []
+        for path in sorted(self.leases_dir.glob("game_*.lease")):
+            lease = _read_lease(path)
+            if lease is not None and not lease.expired(now):
+                leases.append(lease)
+        return leases
+
+    def claim(self, game_number: int) -> bool:
+        path = self.lease_path(game_number)
+        if self._create(path, game_number):
+            return True
+
+        current = _read_lease(path)
+        if current is None:
+            # Unreadable: either mid-write or left empty by a crashed worker.
+            if not _older_than(path, self.lease_seconds):
+                return False
+        elif not current.expired():
+            return False
+        tombstone = path.with_name(f"{path.name}.stale-{self.worker_id}-{time.time_ns()}")
+        try:
+            os.rename(path, tombstone)
+        except FileNotFoundError:
+            return False
+        stolen = _read_lease(tombstone)
+        if stolen is not None and stolen != current:
+            # Another worker replaced the lease between our read and rename; put it back.
+            try:
+                os.link(tombstone, path)
+            except OSError:
+                pass
+            tombstone.unlink(missing_ok=True)
+            return False
+        tombstone.unlink(missing_ok=True)
+        if self._create(path, game_number):
+            self.steals += 1
+            return True
+        return False
+
+    def claim_next(self, completed: set[int], max_game_number: int) -> int | None:
+        for game_number in range(1, max_game_number + 1):
+            if game_number in completed:
+                continue
+            if self.claim(game_number):
+                return game_number
+        return None
+
+    def owns(self, game_number: int) -> bool:
+        lease = self.read(game_number)
+        return lease is not None and lease.worker_id == self.worker_id
+
+    def renew(self, game_number: int) -> bool:
+        if not self.owns(game_number):
+            return False
+        path = self.lease_path(game_number)
+        tmp_path = path.with_name(f".{path.name}.{self.worker_id}.tmp")
+        now = time.time()
+        current = self.read(game_number)
+        lease = Lease(
+            game_number=game_number,
+            worker_id=self.worker_id,
+            claimed_at=current.claimed_at if current is not None else now,
+            expires_at=now + self.lease_seconds,
+        )
+        tmp_path.write_text(json.dumps(asdict(lease)), encoding="utf-8")
+        os.replace(tmp_path, path)
+        return True
+
+    def release(self, game_number: int) -> None:
+        if self.owns(game_number):
+            self.lease_path(game_number).unlink(missing_ok=True)
+
+    def _create(self, path: Path, game_number: int) -> bool:
+        now = time.time()
+        lease = Lease(
+            game_number=game_number,
+            worker_id=self.worker_id,
+            claimed_at=now,
+            expires_at=now + self.lease_seconds,
+        )
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, "w", encoding="utf-8") as fp:
+            fp.write(json.dumps(asdict(lease)))
+        return True
+
+
+class _LeaseHeartbeat:
+    """Renews a lease in the background while its game is being played."""
+
+    def __init__(self, queue: LeaseQueue, game_number: int) -> None:
+        self.queue = queue
+        self.game_number = game_number
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+
+    def __enter__(self) -> _LeaseHeartbeat:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _loop(self) -> None:
+        interval = max(0.05, self.queue.lease_seconds / 3.0)
+        while not self._stop.wait(interval):
+            try:
+                if not self.queue.renew(self.game_number):
+                    return
+            except OSError:
+                continue
+
+
+def attach_session(run_dir: str | Path) -> RunSession:
+    """Open an already prepared run directory as a session for a worker."""
+    run_path = Path(run_dir)
+    config_path = run_path / "resolved_config.yaml"
+    hash_path = run_path / "config_hash.txt"
+    if not config_path.exists() or not hash_path.exists():
+        raise FileNotFoundError(f"Run directory is not prepared for workers: {run_path}")
+    config = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    config_hash = hash_path.read_text(encoding="utf-8").strip()
+    prepared = build_prepared_run(config, config_hash, run_path.name)
+    resume_state = ResolvedResumeState(
+        run_id=run_path.name,
+        run_dir=run_path,
+        resumed=True,
+        existing_records=load_existing_game_records(run_path),
+    )
+    return RunSession(
+        runner=ExperimentRunner(config_path=config_path),
+        prepared=prepared,
+        resume_state=resume_state,
+        run_dir=run_path,
+        metadata_path=run_path / "_run.json",
+    )
+
+
+def read_stop(run_dir: str | Path) -> dict[str, Any] | None:
+    path = Path(run_dir) / LEASES_DIRNAME / STOP_FILENAME
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def write_stop(run_dir: str | Path, kind: str, reason: str, worker_id: str) -> None:
+    """Record the first stop decision; later writers keep the original."""
+    path = Path(run_dir) / LEASES_DIRNAME / STOP_FILENAME
+    payload = {"kind": kind, "reason": reason, "worker_id": worker_id, "stopped_at": time.time()}
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+    except FileExistsError:
+        return
+    with os.fdopen(fd, "w", encoding="utf-8") as fp:
+        fp.write(json.dumps(payload))
+
+
+def evaluate_stop(session: RunSession) -> tuple[str, str] | None:
+    """Stop condition for the recorded games, as ``(kind, reason)``."""
+    if session.stopped_due_to_sprt and session.sprt_stop_reason:
+        return "sprt", session.sprt_stop_reason
+    if session.valid_games >= session.target_valid:
+        return "target", "target_valid_games_reached"
+    if session.check_reliability():
+        return "reliability", str(session.reliability_stop_reason)
+    budget_reason = session.budget_exceeded_reason()
+    if budget_reason is not None:
+        return "budget", budget_reason
+    return None
+
+
+class DistributedWorker:
+    """Plays games for a prepared run directory until the run is complete.
+
+    Several workers (processes or machines sharing the results directory) can
+    work on the same run; each game number is played by exactly one live lease
+    holder and keeps its usual ``game_seed(seed, game_number)``. With
+    ``tracking.memory_profile`` on, each worker saves its memory summary to
+    ``_run.json`` as ``memory_<worker_id>``, and with ``tracking.trace_spans``
+    on it writes its spans to ``trace.<worker_id>.json``.
+    """
+
+    def __init__(
+        self,
+        run_dir: str | Path,
+        worker_id: str | None = None,
+        lease_seconds: float | None = None,
+        poll_seconds: float | None = None,
+    ) -> None:
+        self.run_dir = Path(run_dir)
+        settings = read_distributed_settings(self.run_dir)
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.lease_seconds = float(lease_seconds or settings.get("lease_seconds", DEFAULT_LEASE_SECONDS))
+        self.poll_seconds = float(poll_seconds or settings.get("poll_seconds", DEFAULT_POLL_SECONDS))
+
+    def run(self) -> dict[str, Any]:
+        session = attach_session(self.run_dir)
+        try:
+            return self._work(session)
+        finally:
+            memory = session.close()
+            if memory is not None:
+                update_run_metadata(self.run_dir, {f"memory_{self.worker_id}": memory})
+            if session.tracer is not None:
+                session.tracer.write(worker_trace_path(self.run_dir, self.worker_id))
+
+    def _work(self, session: RunSession) -> dict[str, Any]:
+        validate_environment(session.config)
+        queue = LeaseQueue(self.run_dir, self.worker_id, self.lease_seconds)
+        played: list[int] = []
+        discarded: list[int] = []
+
+        while read_stop(self.run_dir) is None:
+            session.sync_records(load_existing_game_records(self.run_dir))
+            stop = evaluate_stop(session)
+            if stop is not None:
+                write_stop(self.run_dir, stop[0], stop[1], self.worker_id)
+                break
+
+            other_leases = [lease for lease in queue.active_leases() if lease.worker_id != self.worker_id]
+            if session.valid_games + len(other_leases) >= session.target_valid:
+                # In-flight games may still reach the target; wait for them.
+                time.sleep(self.poll_seconds)
+                continue
+
+            completed = {record.game_number for record in session.records}
+            game_number = queue.claim_next(completed, session.prepared.scheduled_games)
+            if game_number is None:
+                if not other_leases:
+                    break
+                time.sleep(self.poll_seconds)
+                continue
+            if (self.run_dir / "games" / f"game_{game_number:04d}.json").exists():
+                # Finished by another worker after our snapshot was taken.
+                queue.release(game_number)
+                continue
+
+            with _LeaseHeartbeat(queue, game_number):
+                record = session.play_game(game_number)
+            if queue.owns(game_number):
+                write_game_record(self.run_dir, record)
+                played.append(game_number)
+            else:
+                # Lease expired and was stolen mid-game; the new holder's record wins.
+                discarded.append(game_number)
+            queue.release(game_number)
+
+        return {
+            "worker_id": self.worker_id,
+            "run_dir": str(self.run_dir),
+            "games_played": played,
+            "games_discarded": discarded,
+            "lease_steals": queue.steals,
+        }
+
+
+class DistributedCoordinator:
+    """Prepares a run for workers, waits for completion and writes the report."""
+
+    def __init__(
+        self,
+        config_path: str | Path,
+        model_profile_path: str | Path | None = None,
+        overrides: list[str] | None = None,
+        resume: bool = False,
+        resume_run_id: str | None = None,
+        run_id: str | None = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+    ) -> None:
+        self.runner = ExperimentRunner(
+            config_path=config_path,
+            model_profile_path=model_profile_path,
+            overrides=overrides,
+            resume=resume,
+            resume_run_id=resume_run_id,
+            run_id=run_id,
+        )
+        self.lease_seconds = float(lease_seconds)
+        self.poll_seconds = float(poll_seconds)
+
+    def prepare(self) -> RunSession:
+        session = self.runner.start_session()
+        leases_dir = session.run_dir / LEASES_DIRNAME
+        leases_dir.mkdir(parents=True, exist_ok=True)
+        # A resumed run gets a fresh stop decision.
+        (leases_dir / STOP_FILENAME).unlink(missing_ok=True)
+        (session.run_dir / DISTRIBUTED_FILENAME).write_text(
+            json.dumps({"lease_seconds": self.lease_seconds, "poll_seconds": self.poll_seconds}, indent=2),
+            encoding="utf-8",
+        )
+        return session
+
+    def run(self, local_workers: int = 0, max_wait_seconds: float | None = None) -> dict[str, Any]:
+        session = self.prepare()
+        processes = [spawn_local_worker(session.run_dir) for _ in range(max(0, local_workers))]
+        try:
+            try:
+                self.wait(session, processes, max_wait_seconds=max_wait_seconds)
+            finally:
+                for process in processes:
+                    if process.poll() is None:
+                        process.terminate()
+                    process.wait()
+            return self.finalize(session, local_workers=len(processes))
+        finally:
+            session.close()
+
+    def wait(
+        self,
+        session: RunSession,
+        processes: list[subprocess.Popen[bytes]] | None = None,
+        max_wait_seconds: float | None = None,
+    ) -> None:
+        queue = LeaseQueue(session.run_dir, worker_id="coordinator", lease_seconds=self.lease_seconds)
+        started = time.monotonic()
+        while True:
+            session.sync_records(load_existing_game_records(session.run_dir))
+            in_flight = queue.active_leases()
+            stop = evaluate_stop(session)
+            if stop is not None:
+                write_stop(session.run_dir, stop[0], stop[1], queue.worker_id)
+            if not in_flight:
+                if read_stop(session.run_dir) is not None:
+                    return
+                completed = {record.game_number for record in session.records}
+                if all(n in completed for n in range(1, session.prepared.scheduled_games + 1)):
+                    return
+                if processes and all(process.poll() is not None for process in processes):
+                    return
+            if max_wait_seconds is not None and time.monotonic() - started >= max_wait_seconds:
+                return
+            time.sleep(self.poll_seconds)
+
+    def finalize(self, session: RunSession, local_workers: int = 0) -> dict[str, Any]:
+        session.sync_records(load_existing_game_records(session.run_dir))
+        stop = read_stop(session.run_dir)
+        kind = stop.get("kind") if stop else None
+        if kind == "budget":
+            session.stop_for_budget(str(stop.get("reason")))
+        elif kind == "reliability":
+            session.check_reliability()
+        if session.tracer is not None:
+            # The coordinator plays no games; the spans all come from the workers.
+            merge_worker_traces(session)
+        payload = session.finalize()
+        payload["distributed"] = {
+            "local_workers": local_workers,
+            "lease_seconds": self.lease_seconds,
+            "stop": stop,
+        }
+        return payload
+
+
+def worker_trace_path(run_dir: str | Path, worker_id: str) -> Path:
+    return Path(run_dir) / f"trace.{worker_id}.json"
+
+
+def merge_worker_traces(session: RunSession) -> int:
+    """Absorb every worker trace in the run directory into the session tracer."""
+    if session.tracer is None:
+        return 0
+    merged = 0
+    for path in sorted(session.run_dir.glob(WORKER_TRACE_GLOB)):
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        if not isinstance(payload, dict):
+            continue
+        worker_id = path.name[len("trace.") : -len(".json")]
+        session.tracer.absorb(payload, label=f"worker {worker_id}")
+        merged += 1
+    return merged
+
+
+def read_distributed_settings(run_dir: str | Path) -> dict[str, Any]:
+    path = Path(run_dir) / DISTRIBUTED_FILENAME
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def spawn_local_worker(run_dir: str | Path) -> subprocess.Popen[bytes]:
+    return subprocess.Popen(
+        [sys.executable, "-m", "zugzwang.cli", "worker", "--run-dir", str(run_dir)],
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def _older_than(path: Path, seconds: float) -> bool:
+    try:
+        return time.time() - path.stat().st_mtime >= seconds
+    except OSError:
+        return False
+
+
+def _read_lease(path: Path) -> Lease | None:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        return Lease(
+            game_number=int(payload["game_number"]),
+            worker_id=str(payload["worker_id"]),
+            claimed_at=float(payload["claimed_at"]),
+            expires_at=float(payload["expires_at"]),
+        )
+    except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError):
+        return None
@@ -82,6 +82,7 @@ def game_record_from_dict(payload: dict[str, Any]) -> GameRecord:
         cost_usd=float(payload.get("cost_usd", 0.0)),
         duration_seconds=float(payload.get("duration_seconds", 0.0)),
         timestamp_utc=str(payload.get("timestamp_utc", "")),
+        opening=payload.get("opening") if isinstance(payload.get("opening"), dict) else None,
     )
 
 
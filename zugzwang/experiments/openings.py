@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+import chess
+
+from zugzwang.knowledge.sources._shared import DATA_ROOT, as_text, load_yaml_entries
+
+
+OPENING_SOURCES = {
+    "eco": DATA_ROOT / "openings" / "eco_book.yaml",
+}
+_MOVE_NUMBER_PATTERN = re.compile(r"^\d+\.(\.\.)?")
+
+
+@dataclass(frozen=True)
+class OpeningLine:
+    opening_id: str
+    fen: str | None = None
+    moves_uci: tuple[str, ...] = field(default_factory=tuple)
+
+
+@dataclass(frozen=True)
+class OpeningAssignment:
+    opening_id: str
+    fen: str | None
+    moves_uci: list[str]
+    colors_swapped: bool
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def load_opening_suite(openings_cfg: Any) -> list[OpeningLine]:
+    if not isinstance(openings_cfg, dict) or not bool(openings_cfg.get("enabled", False)):
+        return []
+
+    lines: list[OpeningLine] = []
+    source = as_text(openings_cfg.get("source"))
+    if source:
+        path = OPENING_SOURCES.get(source.lower())
+        if path is None:
+            raise ValueError(f"Unknown opening source: {source}")
+        for index, entry in enumerate(load_yaml_entries(path)):
+            lines.append(_parse_opening_entry(entry, default_id=f"{source.lower()}-{index + 1:03d}"))
+
+    positions = openings_cfg.get("positions") or []
+    for index, entry in enumerate(positions):
+        lines.append(_parse_opening_entry(entry, default_id=f"opening-{index + 1:03d}"))
+    return lines
+
+
+def assign_opening(
+    openings: list[OpeningLine],
+    game_number: int,
+    color_balance: bool = True,
+) -> OpeningAssignment | None:
+    """Deterministic opening for a 1-based game number.
+
+    With color balancing, consecutive game pairs share an opening and the second
+    game of each pair swaps the seats of the configured players.
+    """
+    if not openings:
+        return None
+    index = game_number - 1
+    if color_balance:
+        opening = openings[(index // 2) % len(openings)]
+        swapped = index % 2 == 1
+    else:
+        opening = openings[index % len(openings)]
+        swapped = False
+    return OpeningAssignment(
+        opening_id=opening.opening_id,
+        fen=opening.fen,
+        moves_uci=list(opening.moves_uci),
+        colors_swapped=swapped,
+    )
+
+
+def _parse_opening_entry(entry: Any, default_id: str) -> OpeningLine:
+    if isinstance(entry, str):
+        text = entry.strip()
+        if "/" in text:
+            return OpeningLine(opening_id=default_id, fen=_normalize_fen(text))
+        return OpeningLine(opening_id=default_id, moves_uci=tuple(parse_move_line(text)))
+
+    if not isinstance(entry, dict):
+        raise ValueError(f"Opening entry '{default_id}' must be a FEN, a move line or a mapping")
+
+    opening_id = as_text(entry.get("id")) or default_id
+    fen_raw = as_text(entry.get("fen"))
+    fen = _normalize_fen(fen_raw) if fen_raw else None
+    moves_raw = entry.get("moves")
+    if isinstance(moves_raw, list):
+        moves_raw = " ".join(str(item) for item in moves_raw)
+    moves_text = as_text(moves_raw)
+    moves = parse_move_line(moves_text, fen=fen) if moves_text else []
+    return OpeningLine(opening_id=opening_id, fen=fen, moves_uci=tuple(moves))
+
+
+def parse_move_line(text: str, fen: str | None = None) -> list[str]:
+    """Parse '1.e4 e5 2.Nf3' (SAN) or 'e2e4 e7e5' (UCI) into UCI moves."""
+    board = chess.Board(fen) if fen else chess.Board()
+    moves: list[str] = []
+    for token in text.split():
+        cleaned = _MOVE_NUMBER_PATTERN.sub("", token.strip())
+        if not cleaned:
+            continue
+        try:
+            move = chess.Move.from_uci(cleaned.lower())
+            if move not in board.legal_moves:
+                raise ValueError(cleaned)
+        except ValueError:
+            try:
+                move = board.parse_san(cleaned)
+            except ValueError as exc:
+                raise ValueError(f"Illegal opening move '{cleaned}' in line '{text}'") from exc
+        moves.append(move.uci())
+        board.push(move)
+    return moves
+
+
+def _normalize_fen(fen: str) -> str:
+    try:
+        return chess.Board(fen).fen()
+    except ValueError as exc:
+        raise ValueError(f"Invalid opening FEN: {fen}") from exc
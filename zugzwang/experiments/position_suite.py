@@ -0,0 +1,401 @@
+from __future__ import annotations
+
+import copy
+import json
+import math
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import chess
+
+from zugzwang.core.board import BoardManager
+from zugzwang.core.players import build_player
+from zugzwang.evaluation.player_color import infer_evaluation_player_color
+from zugzwang.evaluation.stockfish import StockfishEvaluator
+from zugzwang.experiments.tracker import write_resolved_config, write_run_metadata
+from zugzwang.infra.config import resolve_with_hash
+from zugzwang.infra.env import validate_environment
+from zugzwang.infra.ids import game_seed, make_run_id, timestamp_utc
+from zugzwang.knowledge.sources._shared import DATA_ROOT, as_text, load_yaml_entries
+
+
+BUILTIN_SUITES: dict[str, Path] = {
+    "tactics": DATA_ROOT / "tactics" / "patterns.yaml",
+    "endgames": DATA_ROOT / "endgames" / "principles.yaml",
+}
+POSITIONS_FILENAME = "positions.jsonl"
+REPORT_FILENAME = "position_suite_report.json"
+
+
+@dataclass(frozen=True)
+class PositionCase:
+    position_id: str
+    fen: str
+    best_moves_uci: tuple[str, ...] = field(default_factory=tuple)
+    source: str = "custom"
+
+
+@dataclass
+class PositionResult:
+    position_id: str
+    source: str
+    fen: str
+    expected_moves: list[str]
+    move_uci: str | None
+    parse_ok: bool
+    is_legal: bool
+    retry_count: int
+    provider_calls: int
+    tokens_input: int
+    tokens_output: int
+    latency_ms: int
+    cost_usd: float
+    scoring: str = "unscored"
+    correct: bool | None = None
+    centipawn_loss: int | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def load_position_suite(source: str, max_positions: int | None = None) -> list[PositionCase]:
+    key = source.strip()
+    if key.lower() in BUILTIN_SUITES:
+        cases = _load_yaml_suite(BUILTIN_SUITES[key.lower()], source_name=key.lower())
+    else:
+        path = Path(key)
+        if not path.exists():
+            raise FileNotFoundError(f"Position suite not found: {path}")
+        if path.suffix.lower() == ".epd":
+            cases = _load_epd_suite(path)
+        else:
+            cases = _load_yaml_suite(path, source_name=path.stem)
+    if max_positions is not None and max_positions > 0:
+        cases = cases[:max_positions]
+    return cases
+
+
+def _load_yaml_suite(path: Path, source_name: str) -> list[PositionCase]:
+    cases: list[PositionCase] = []
+    for index, entry in enumerate(load_yaml_entries(path)):
+        fen = as_text(entry.get("fen")) or as_text(entry.get("example_fen"))
+        if not fen:
+            continue
+        try:
+            board = chess.Board(fen)
+        except ValueError:
+            continue
+        raw_moves: list[Any] = []
+        for key in ("best_moves", "best_move", "solution"):
+            value = entry.get(key)
+            if isinstance(value, list):
+                raw_moves.extend(value)
+            elif value is not None:
+                raw_moves.append(value)
+        cases.append(
+            PositionCase(
+                position_id=as_text(entry.get("id")) or f"{source_name}-{index + 1:03d}",
+                fen=board.fen(),
+                best_moves_uci=tuple(_normalize_moves(board, raw_moves)),
+                source=source_name,
+            )
+        )
+    return cases
+
+
+def _load_epd_suite(path: Path) -> list[PositionCase]:
+    cases: list[PositionCase] = []
+    for index, line in enumerate(path.read_text(encoding="utf-8").splitlines()):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        try:
+            board, ops = chess.Board.from_epd(stripped)
+        except ValueError:
+            continue
+        best = ops.get("bm") or []
+        best_moves = [move.uci() for move in best if isinstance(move, chess.Move)]
+        position_id = as_text(ops.get("id")) or f"{path.stem}-{index + 1:03d}"
+        cases.append(
+            PositionCase(
+                position_id=position_id,
+                fen=board.fen(),
+                best_moves_uci=tuple(best_moves),
+                source=path.stem,
+            )
+        )
+    return cases
+
+
+def _normalize_moves(board: chess.Board, raw_moves: list[Any]) -> list[str]:
+    output: list[str] = []
+    for raw in raw_moves:
+        text = as_text(raw)
+        if not text:
+            continue
+        move: chess.Move | None = None
+        try:
+            candidate = chess.Move.from_uci(text.lower())
+            if candidate in board.legal_moves:
+                move = candidate
+        except ValueError:
+            move = None
+        if move is None:
+            try:
+                move = board.parse_san(text)
+            except ValueError:
+                continue
+        if move.uci() not in output:
+            output.append(move.uci())
+    return output
+
+
+class PositionSuiteRunner:
+    """Single-move benchmark: one LLM decision per suite position, no full games."""
+
+    def __init__(
+        self,
+        config_path: str | Path,
+        model_profile_path: str | Path | None = None,
+        overrides: list[str] | None = None,
+        run_id: str | None = None,
+    ) -> None:
+        self.config_path = Path(config_path)
+        self.model_profile_path = Path(model_profile_path) if model_profile_path else None
+        self.overrides = overrides or []
+        self.run_id = run_id
+
+    def run(self) -> dict[str, Any]:
+        config, cfg_hash = resolve_with_hash(
+            experiment_config_path=self.config_path,
+            model_profile_path=self.model_profile_path,
+            cli_overrides=self.overrides,
+        )
+        validate_environment(config)
+
+        suite_cfg = config.get("position_suite", {})
+        if not isinstance(suite_cfg, dict):
+            suite_cfg = {}
+        source = str(suite_cfg.get("source", "tactics"))
+        max_positions_raw = suite_cfg.get("max_positions")
+        max_positions = int(max_positions_raw) if max_positions_raw is not None else None
+        concurrency = max(1, int(suite_cfg.get("concurrency", 4)))
+        scoring = str(suite_cfg.get("scoring", "auto"))
+        player_color, _ = infer_evaluation_player_color(
+            resolved_config=config,
+            requested_color=str(suite_cfg.get("player_color", "auto")),
+        )
+        player_cfg = config["players"][player_color]
+
+        cases = load_position_suite(source, max_positions=max_positions)
+        if not cases:
+            raise ValueError(f"Position suite '{source}' has no usable positions")
+
+        experiment_name = str(config["experiment"]["name"])
+        run_id = self.run_id or make_run_id(f"{experiment_name}-positions", cfg_hash)
+        run_dir = Path(config["runtime"].get("output_dir", "results/runs")) / run_id
+        run_dir.mkdir(parents=True, exist_ok=True)
+        write_resolved_config(run_dir, config, cfg_hash)
+        write_run_metadata(
+            run_dir,
+            {
+                "created_at_utc": timestamp_utc(),
+                "run_id": run_id,
+                "run_mode": "position_suite",
+                "config_hash": cfg_hash,
+                "paths": {
+                    "run_dir": str(run_dir),
+                    "config_path": str(self.config_path),
+                    "model_profile_path": str(self.model_profile_path)
+                    if self.model_profile_path
+                    else None,
+                },
+                "overrides": list(self.overrides),
+                "position_suite": {
+                    "source": source,
+                    "positions": len(cases),
+                    "concurrency": concurrency,
+                    "scoring": scoring,
+                    "player_color": player_color,
+                },
+                "resolved_config": config,
+            },
+        )
+
+        base_seed = int(config["runtime"].get("seed", 42))
+        protocol_mode = str(config["protocol"]["mode"])
+
+        def query_position(item: tuple[int, PositionCase]) -> PositionResult:
+            index, case = item
+            return _query_position(
+                case=case,
+                player_cfg=player_cfg,
+                protocol_mode=protocol_mode,
+                strategy_cfg=config["strategy"],
+                seed=game_seed(base_seed, index + 1),
+            )
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(query_position, enumerate(cases)))
+        query_seconds = time.perf_counter() - started
+
+        _score_results(results, scoring=scoring, config=config)
+
+        positions_path = run_dir / POSITIONS_FILENAME
+        with positions_path.open("w", encoding="utf-8") as handle:
+            for result in results:
+                handle.write(json.dumps(result.to_dict(), separators=(",", ":")))
+                handle.write("\n")
+
+        report = _build_report(
+            run_id=run_id,
+            config_hash=cfg_hash,
+            source=source,
+            results=results,
+            query_seconds=query_seconds,
+            concurrency=concurrency,
+        )
+        report_path = run_dir / REPORT_FILENAME
+        report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+        return {
+            "run_id": run_id,
+            "config_hash": cfg_hash,
+            "run_dir": str(run_dir),
+            "positions_path": str(positions_path),
+            "report_path": str(report_path),
+            **{key: report[key] for key in ("positions", "scored", "solved", "accuracy", "throughput")},
+        }
+
+
+def _query_position(
+    case: PositionCase,
+    player_cfg: dict[str, Any],
+    protocol_mode: str,
+    strategy_cfg: dict[str, Any],
+    seed: int,
+) -> PositionResult:
+    state = BoardManager(initial_fen=case.fen).game_state([])
+    player = build_player(
+        player_cfg,
+        protocol_mode,
+        # LLMPlayer mutates its strategy config, so every worker gets its own copy.
+        copy.deepcopy(strategy_cfg),
+        random.Random(seed),
+    )
+    try:
+        decision = player.choose_move(state)
+    finally:
+        close_fn = getattr(player, "close", None)
+        if callable(close_fn):
+            close_fn()
+
+    return PositionResult(
+        position_id=case.position_id,
+        source=case.source,
+        fen=case.fen,
+        expected_moves=list(case.best_moves_uci),
+        move_uci=decision.move_uci,
+        parse_ok=decision.parse_ok,
+        is_legal=decision.is_legal,
+        retry_count=decision.retry_count,
+        provider_calls=decision.provider_calls,
+        tokens_input=decision.tokens_input,
+        tokens_output=decision.tokens_output,
+        latency_ms=decision.latency_ms,
+        cost_usd=decision.cost_usd,
+        error=decision.error,
+    )
+
+
+def _score_results(results: list[PositionResult], scoring: str, config: dict[str, Any]) -> None:
+    needs_engine: list[PositionResult] = []
+    for result in results:
+        use_stored = scoring == "stored" or (scoring == "auto" and result.expected_moves)
+        if use_stored:
+            if not result.expected_moves:
+                continue
+            result.scoring = "stored"
+            result.correct = bool(result.is_legal and result.move_uci in result.expected_moves)
+        elif result.is_legal and result.move_uci:
+            needs_engine.append(result)
+
+    if not needs_engine:
+        return
+
+    stockfish_cfg = config.get("evaluation", {}).get("stockfish", {})
+    evaluator = StockfishEvaluator(
+        depth=int(stockfish_cfg.get("depth", 12)),
+        path=stockfish_cfg.get("path"),
+        threads=int(stockfish_cfg.get("threads", 1)),
+        hash_mb=int(stockfish_cfg.get("hash_mb", 128)),
+    )
+    try:
+        with evaluator:
+            for result in needs_engine:
+                evaluation = evaluator.evaluate_move(result.fen, str(result.move_uci))
+                result.scoring = "stockfish"
+                result.expected_moves = [evaluation.best_move_uci]
+                result.centipawn_loss = evaluation.centipawn_loss
+                result.correct = result.move_uci == evaluation.best_move_uci
+    except RuntimeError as exc:
+        if scoring == "stockfish":
+            raise
+        for result in needs_engine:
+            if result.scoring == "unscored":
+                result.error = result.error or f"stockfish_unavailable:{exc}"
+
+
+def _build_report(
+    run_id: str,
+    config_hash: str,
+    source: str,
+    results: list[PositionResult],
+    query_seconds: float,
+    concurrency: int,
+) -> dict[str, Any]:
+    scored = [result for result in results if result.correct is not None]
+    solved = sum(1 for result in scored if result.correct)
+    legal = sum(1 for result in results if result.is_legal)
+    cp_losses = [result.centipawn_loss for result in results if result.centipawn_loss is not None]
+    latencies = sorted(result.latency_ms for result in results)
+    provider_calls = sum(result.provider_calls for result in results)
+    return {
+        "schema_version": "1.0",
+        "run_id": run_id,
+        "config_hash": config_hash,
+        "source": source,
+        "positions": len(results),
+        "scored": len(scored),
+        "solved": solved,
+        "accuracy": (solved / len(scored)) if scored else None,
+        "legal_move_rate": (legal / len(results)) if results else 0.0,
+        "avg_centipawn_loss": (sum(cp_losses) / len(cp_losses)) if cp_losses else None,
+        "total_cost_usd": float(sum(result.cost_usd for result in results)),
+        "tokens": {
+            "input": sum(result.tokens_input for result in results),
+            "output": sum(result.tokens_output for result in results),
+        },
+        "throughput": {
+            "concurrency": concurrency,
+            "wall_seconds": query_seconds,
+            "positions_per_second": (len(results) / query_seconds) if query_seconds > 0 else None,
+            "provider_calls": provider_calls,
+            "p50_latency_ms": _percentile(latencies, 0.50),
+            "p95_latency_ms": _percentile(latencies, 0.95),
+        },
+    }
+
+
+def _percentile(sorted_values: list[int], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = math.ceil(fraction * len(sorted_values)) - 1
+    idx = max(0, min(idx, len(sorted_values) - 1))
+    return float(sorted_values[idx])
@@ -107,6 +107,37 @@ def resolve_resume_state(
     )
 
 
+def find_completed_run(output_root: str | Path, config_hash: str) -> Path | None:
+    """Latest run under ``output_root`` with this config hash and a finished report.
+
+    Finished means the report reached its valid-game target or was stopped by
+    SPRT; budget- or reliability-stopped runs do not count.
+    """
+    root = Path(output_root)
+    if not root.exists():
+        return None
+
+    candidates: list[Path] = []
+    for run_dir in root.iterdir():
+        if not run_dir.is_dir() or _read_config_hash(run_dir) != config_hash:
+            continue
+        report_path = run_dir / "experiment_report.json"
+        try:
+            report = json.loads(report_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        if not isinstance(report, dict):
+            continue
+        target = int(report.get("num_games_target") or 0)
+        valid = int(report.get("num_games_valid") or 0)
+        if (target > 0 and valid >= target) or bool(report.get("stopped_due_to_sprt")):
+            candidates.append(run_dir)
+
+    if not candidates:
+        return None
+    return max(candidates, key=lambda path: path.stat().st_mtime)
+
+
 def _find_latest_matching_run(output_root: Path, experiment_name: str, config_hash: str) -> Path | None:
     if not output_root.exists():
         return None
@@ -10,14 +10,27 @@ from typing import Any
 from zugzwang.core.game import play_game
 from zugzwang.core.models import GameRecord
 from zugzwang.core.players import build_player
+from zugzwang.core.resources import SharedResources
 from zugzwang.evaluation.pipeline import evaluate_run_dir
 from zugzwang.evaluation.metrics import summarize_experiment
+from zugzwang.evaluation.player_color import (
+    infer_evaluation_player_color,
+    record_player_color,
+)
+from zugzwang.evaluation.sprt import (
+    SprtState,
+    sprt_config_from_dict,
+    stop_reason_for_status,
+)
+from zugzwang.experiments.openings import assign_opening, load_opening_suite
 from zugzwang.experiments.resume import (
+    ResolvedResumeState,
     count_valid_games,
     resolve_resume_state,
 )
 from zugzwang.experiments.tracker import (
     ensure_run_dirs,
+    update_run_metadata,
     write_experiment_report,
     write_game_record,
     write_run_metadata,
@@ -26,6 +39,8 @@ from zugzwang.experiments.tracker import (
 from zugzwang.infra.config import resolve_with_hash
 from zugzwang.infra.env import PROVIDER_ENV_KEYS, validate_environment
 from zugzwang.infra.ids import game_seed, make_run_id, timestamp_utc
+from zugzwang.infra.memory import monitor_from_config
+from zugzwang.infra.tracing import TRACE_FILENAME, Tracer, span, use_tracer
 
 NON_VALID_TERMINATIONS = {"error", "timeout", "provider_failure"}
 
@@ -48,6 +63,25 @@ class TimeoutPolicy:
     action: str
 
 
+def build_prepared_run(resolved: dict[str, Any], cfg_hash: str, run_id: str) -> PreparedRun:
+    target_valid = int(resolved["experiment"]["target_valid_games"])
+    expected_completion = float(resolved["runtime"].get("expected_completion_rate", 1.0))
+    scheduled_games = math.ceil(target_valid / expected_completion)
+    max_games = int(resolved["experiment"].get("max_games", scheduled_games))
+    scheduled_games = min(scheduled_games, max_games)
+    estimated_avg_cost = float(resolved.get("budget", {}).get("estimated_avg_cost_per_game_usd", 0.0))
+    estimated_total_cost_usd = None
+    if estimated_avg_cost > 0:
+        estimated_total_cost_usd = estimated_avg_cost * scheduled_games
+    return PreparedRun(
+        config=resolved,
+        config_hash=cfg_hash,
+        run_id=run_id,
+        scheduled_games=scheduled_games,
+        estimated_total_cost_usd=estimated_total_cost_usd,
+    )
+
+
 class ExperimentRunner:
     def __init__(
         self,
@@ -73,22 +107,7 @@ class ExperimentRunner:
         )
         experiment_name = resolved["experiment"]["name"]
         run_id = self.run_id or make_run_id(experiment_name, cfg_hash)
-        target_valid = int(resolved["experiment"]["target_valid_games"])
-        expected_completion = float(resolved["runtime"].get("expected_completion_rate", 1.0))
-        scheduled_games = math.ceil(target_valid / expected_completion)
-        max_games = int(resolved["experiment"].get("max_games", scheduled_games))
-        scheduled_games = min(scheduled_games, max_games)
-        estimated_avg_cost = float(resolved.get("budget", {}).get("estimated_avg_cost_per_game_usd", 0.0))
-        estimated_total_cost_usd = None
-        if estimated_avg_cost > 0:
-            estimated_total_cost_usd = estimated_avg_cost * scheduled_games
-        return PreparedRun(
-            config=resolved,
-            config_hash=cfg_hash,
-            run_id=run_id,
-            scheduled_games=scheduled_games,
-            estimated_total_cost_usd=estimated_total_cost_usd,
-        )
+        return build_prepared_run(resolved, cfg_hash, run_id)
 
     def dry_run(self) -> dict[str, Any]:
         prepared = self.prepare()
@@ -118,6 +137,18 @@ class ExperimentRunner:
         }
 
     def run(self) -> dict[str, Any]:
+        session = self.start_session()
+        try:
+            while True:
+                game_number = session.next_game_number()
+                if game_number is None:
+                    break
+                session.record_game(session.play_game(game_number))
+            return session.finalize()
+        finally:
+            session.close()
+
+    def start_session(self, resources: SharedResources | None = None) -> RunSession:
         prepared = self.prepare()
         config = prepared.config
         validate_environment(config)
@@ -144,134 +175,15 @@ class ExperimentRunner:
                 existing_valid_games=resume_state.existing_valid_games,
             ),
         )
-
-        target_valid = int(config["experiment"]["target_valid_games"])
-        base_seed = int(config["runtime"].get("seed", 42))
-        max_plies = int(config["runtime"].get("max_plies", 200))
-        protocol_mode = str(config["protocol"]["mode"])
-        budget_cap_usd = float(config["budget"]["max_total_usd"])
-        estimated_avg_cost = float(config["budget"].get("estimated_avg_cost_per_game_usd", 0.0))
-        timeout_policy = _timeout_policy_from_config(config)
-
-        records = list(resume_state.existing_records)
-        valid_games = count_valid_games(records)
-        total_cost_usd = float(sum(record.cost_usd for record in records))
-        stopped_due_to_budget = False
-        budget_stop_reason: str | None = None
-        stopped_due_to_reliability = False
-        reliability_stop_reason: str | None = None
-
-        for game_number in range(resume_state.next_game_number, prepared.scheduled_games + 1):
-            if valid_games >= target_valid:
-                break
-
-            remaining_games = prepared.scheduled_games - len(records)
-            observed_avg_cost = (total_cost_usd / len(records)) if records else 0.0
-            projection_rate = max(estimated_avg_cost, observed_avg_cost)
-            projected_total_cost = total_cost_usd + (projection_rate * remaining_games)
-
-            if total_cost_usd >= budget_cap_usd:
-                stopped_due_to_budget = True
-                budget_stop_reason = "budget_cap_reached"
-                break
-            if projection_rate > 0 and projected_total_cost > budget_cap_usd:
-                stopped_due_to_budget = True
-                budget_stop_reason = "projected_budget_exceeded"
-                break
-
-            seed = game_seed(base_seed, game_number)
-            rng = random.Random(seed)
-            strategy_cfg = copy.deepcopy(config["strategy"])
-            tracking_cfg = config.get("tracking", {})
-            strategy_cfg["_tracking"] = {
-                "persist_prompt_transcripts": bool(
-                    isinstance(tracking_cfg, dict)
-                    and tracking_cfg.get("persist_prompt_transcripts", False)
-                ),
-                "run_dir": str(run_dir),
-                "game_number": game_number,
-            }
-
-            white_cfg = config["players"]["white"]
-            black_cfg = config["players"]["black"]
-            white_player = build_player(white_cfg, protocol_mode, strategy_cfg, rng)
-            black_player = build_player(black_cfg, protocol_mode, strategy_cfg, rng)
-
-            try:
-                record = play_game(
-                    experiment_id=resume_state.run_id,
-                    game_number=game_number,
-                    config_hash=prepared.config_hash,
-                    seed=seed,
-                    players_cfg=config["players"],
-                    white_player=white_player,
-                    black_player=black_player,
-                    protocol_mode=protocol_mode,
-                    max_plies=max_plies,
-                )
-            finally:
-                _close_player_safely(white_player)
-                if black_player is not white_player:
-                    _close_player_safely(black_player)
-            write_game_record(run_dir, record)
-            records.append(record)
-            total_cost_usd += record.cost_usd
-
-            if record.termination not in NON_VALID_TERMINATIONS:
-                valid_games += 1
-            if _should_stop_for_reliability(
-                records=records,
-                valid_games=valid_games,
-                timeout_policy=timeout_policy,
-            ):
-                stopped_due_to_reliability = True
-                if _provider_timeout_game_rate(records) > timeout_policy.max_provider_timeout_game_rate:
-                    reliability_stop_reason = "provider_timeout_rate_exceeded"
-                else:
-                    reliability_stop_reason = "completion_rate_below_threshold"
-                break
-            if valid_games >= target_valid:
-                break
-
-        report = summarize_experiment(
-            experiment_id=resume_state.run_id,
-            config_hash=prepared.config_hash,
-            target_games=target_valid,
-            scheduled_games=prepared.scheduled_games,
-            game_records=records,
-            budget_cap_usd=budget_cap_usd,
-            stopped_due_to_budget=stopped_due_to_budget,
-            budget_stop_reason=budget_stop_reason,
-            stopped_due_to_reliability=stopped_due_to_reliability,
-            reliability_stop_reason=reliability_stop_reason,
-        )
-        write_experiment_report(run_dir, report)
-        evaluation_summary = self._maybe_auto_evaluate(
-            config=config,
+        return RunSession(
+            runner=self,
+            prepared=prepared,
+            resume_state=resume_state,
             run_dir=run_dir,
-            games_written=len(records),
+            metadata_path=metadata_path,
+            resources=resources,
         )
 
-        return {
-            "run_id": resume_state.run_id,
-            "config_hash": prepared.config_hash,
-            "run_dir": str(run_dir),
-            "run_metadata": str(metadata_path),
-            "resumed": resume_state.resumed,
-            "existing_games_loaded": resume_state.existing_games,
-            "games_written": len(records),
-            "valid_games": report.num_games_valid,
-            "total_cost_usd": report.total_cost_usd,
-            "budget_cap_usd": budget_cap_usd,
-            "stopped_due_to_budget": stopped_due_to_budget,
-            "budget_stop_reason": budget_stop_reason,
-            "stopped_due_to_reliability": stopped_due_to_reliability,
-            "reliability_stop_reason": reliability_stop_reason,
-            "provider_timeout_game_rate": report.provider_timeout_game_rate,
-            "nonvalid_game_rate": report.nonvalid_game_rate,
-            "evaluation": evaluation_summary,
-        }
-
     def _build_run_metadata(
         self,
         prepared: PreparedRun,
@@ -304,6 +216,7 @@ class ExperimentRunner:
             },
             "runtime_guardrails": {
                 "timeout_policy": prepared.config.get("runtime", {}).get("timeout_policy", {}),
+                "sprt": prepared.config.get("runtime", {}).get("sprt", {}),
             },
             "required_env_vars": self._required_env_vars(prepared.config),
             "resolved_config": prepared.config,
@@ -328,6 +241,7 @@ class ExperimentRunner:
         config: dict[str, Any],
         run_dir: Path,
         games_written: int,
+        resources: SharedResources | None = None,
     ) -> dict[str, Any]:
         evaluation_cfg = config.get("evaluation", {})
         if not isinstance(evaluation_cfg, dict):
@@ -351,6 +265,15 @@ class ExperimentRunner:
             auto_cfg.get("output_filename", "experiment_report_evaluated.json")
         )
         fail_on_error = bool(auto_cfg.get("fail_on_error", False))
+        evaluate_kwargs: dict[str, Any] = {}
+        if resources is not None:
+            stockfish_cfg = evaluation_cfg.get("stockfish", {})
+            evaluate_kwargs["evaluator"] = resources.evaluator(
+                depth=int(stockfish_cfg.get("depth", 12)),
+                path=stockfish_cfg.get("path"),
+                threads=int(stockfish_cfg.get("threads", 1)),
+                hash_mb=int(stockfish_cfg.get("hash_mb", 128)),
+            )
 
         try:
             payload = evaluate_run_dir(
@@ -359,6 +282,7 @@ class ExperimentRunner:
                 opponent_elo=opponent_elo,
                 elo_color_correction=elo_color_correction,
                 output_filename=output_filename,
+                **evaluate_kwargs,
             )
         except Exception as exc:
             if fail_on_error:
@@ -377,6 +301,271 @@ class ExperimentRunner:
         }
 
 
+class RunSession:
+    """Game-by-game state of one run.
+
+    ``ExperimentRunner.run`` drives a session sequentially; sweeps interleave
+    several sessions. ``play_game`` touches no session state, so it may run in
+    a worker thread while ``next_game_number``/``record_game`` stay on the
+    driving thread.
+    """
+
+    def __init__(
+        self,
+        runner: ExperimentRunner,
+        prepared: PreparedRun,
+        resume_state: ResolvedResumeState,
+        run_dir: Path,
+        metadata_path: Path,
+        resources: SharedResources | None = None,
+    ) -> None:
+        config = prepared.config
+        self.runner = runner
+        self.prepared = prepared
+        self.config = config
+        self.resume_state = resume_state
+        self.run_id = resume_state.run_id
+        self.run_dir = run_dir
+        self.metadata_path = metadata_path
+        self.resources = resources
+        tracking_cfg = config.get("tracking", {})
+        trace_spans = isinstance(tracking_cfg, dict) and bool(tracking_cfg.get("trace_spans", False))
+        self.tracer = Tracer(label=self.run_id) if trace_spans else None
+        self.memory_monitor = monitor_from_config(config, tracer=self.tracer)
+        if self.memory_monitor is not None:
+            self.memory_monitor.start()
+
+        self.target_valid = int(config["experiment"]["target_valid_games"])
+        self.base_seed = int(config["runtime"].get("seed", 42))
+        self.max_plies = int(config["runtime"].get("max_plies", 200))
+        self.protocol_mode = str(config["protocol"]["mode"])
+        self.budget_cap_usd = float(config["budget"]["max_total_usd"])
+        self.estimated_avg_cost = float(config["budget"].get("estimated_avg_cost_per_game_usd", 0.0))
+        self.timeout_policy = _timeout_policy_from_config(config)
+        openings_cfg = config["experiment"].get("openings", {})
+        self.openings = load_opening_suite(openings_cfg)
+        self.color_balance = bool(
+            isinstance(openings_cfg, dict) and openings_cfg.get("color_balance", True)
+        )
+
+        self.stopped_due_to_budget = False
+        self.budget_stop_reason: str | None = None
+        self.stopped_due_to_reliability = False
+        self.reliability_stop_reason: str | None = None
+        self.sync_records(resume_state.existing_records)
+
+        self._cursor = resume_state.next_game_number
+        self.finished = False
+
+    def sync_records(self, records: list[GameRecord]) -> None:
+        """Replace the recorded games (e.g. re-read from disk) and replay SPRT."""
+        self.records = sorted(records, key=lambda record: record.game_number)
+        self.valid_games = count_valid_games(self.records)
+        self.total_cost_usd = float(sum(record.cost_usd for record in self.records))
+        self.sprt_state = _sprt_state_from_config(self.config)
+        self.stopped_due_to_sprt = False
+        self.sprt_stop_reason: str | None = None
+        if self.sprt_state is not None:
+            for record in self.records:
+                if record.termination not in NON_VALID_TERMINATIONS:
+                    self.sprt_state.update(
+                        record.result,
+                        record.game_number,
+                        record_player_color(record, self.sprt_state.player_color),
+                    )
+            self.sprt_stop_reason = stop_reason_for_status(self.sprt_state.status)
+            self.stopped_due_to_sprt = self.sprt_stop_reason is not None
+
+    def next_game_number(self) -> int | None:
+        if self.finished:
+            return None
+        if self._cursor > self.prepared.scheduled_games:
+            self.finished = True
+            return None
+        if self.valid_games >= self.target_valid or self.stopped_due_to_sprt:
+            self.finished = True
+            return None
+
+        budget_reason = self.budget_exceeded_reason()
+        if budget_reason is not None:
+            self.stop_for_budget(budget_reason)
+            return None
+
+        game_number = self._cursor
+        self._cursor += 1
+        return game_number
+
+    def budget_exceeded_reason(self) -> str | None:
+        remaining_games = self.prepared.scheduled_games - len(self.records)
+        observed_avg_cost = (self.total_cost_usd / len(self.records)) if self.records else 0.0
+        projection_rate = max(self.estimated_avg_cost, observed_avg_cost)
+        projected_total_cost = self.total_cost_usd + (projection_rate * remaining_games)
+
+        if self.total_cost_usd >= self.budget_cap_usd:
+            return "budget_cap_reached"
+        if projection_rate > 0 and projected_total_cost > self.budget_cap_usd:
+            return "projected_budget_exceeded"
+        return None
+
+    def stop_for_budget(self, reason: str) -> None:
+        self.stopped_due_to_budget = True
+        self.budget_stop_reason = reason
+        self.finished = True
+
+    def check_reliability(self) -> bool:
+        if not _should_stop_for_reliability(
+            records=self.records,
+            valid_games=self.valid_games,
+            timeout_policy=self.timeout_policy,
+        ):
+            return False
+        self.stopped_due_to_reliability = True
+        if _provider_timeout_game_rate(self.records) > self.timeout_policy.max_provider_timeout_game_rate:
+            self.reliability_stop_reason = "provider_timeout_rate_exceeded"
+        else:
+            self.reliability_stop_reason = "completion_rate_below_threshold"
+        self.finished = True
+        return True
+
+    def play_game(self, game_number: int) -> GameRecord:
+        config = self.config
+        seed = game_seed(self.base_seed, game_number)
+        rng = random.Random(seed)
+        strategy_cfg = copy.deepcopy(config["strategy"])
+        tracking_cfg = config.get("tracking", {})
+        strategy_cfg["_tracking"] = {
+            "persist_prompt_transcripts": bool(
+                isinstance(tracking_cfg, dict)
+                and tracking_cfg.get("persist_prompt_transcripts", False)
+            ),
+            "run_dir": str(self.run_dir),
+            "game_number": game_number,
+        }
+
+        opening = assign_opening(self.openings, game_number, color_balance=self.color_balance)
+        white_cfg = config["players"]["white"]
+        black_cfg = config["players"]["black"]
+        players_cfg = config["players"]
+        if opening is not None and opening.colors_swapped:
+            white_cfg, black_cfg = black_cfg, white_cfg
+            players_cfg = {**players_cfg, "white": white_cfg, "black": black_cfg}
+        with use_tracer(self.tracer), span("game", category="game", game=game_number):
+            white_player = build_player(white_cfg, self.protocol_mode, strategy_cfg, rng, self.resources)
+            black_player = build_player(black_cfg, self.protocol_mode, strategy_cfg, rng, self.resources)
+
+            try:
+                record = play_game(
+                    experiment_id=self.run_id,
+                    game_number=game_number,
+                    config_hash=self.prepared.config_hash,
+                    seed=seed,
+                    players_cfg=players_cfg,
+                    white_player=white_player,
+                    black_player=black_player,
+                    protocol_mode=self.protocol_mode,
+                    max_plies=self.max_plies,
+                    initial_fen=opening.fen if opening is not None else None,
+                    opening_moves=opening.moves_uci if opening is not None else None,
+                )
+            finally:
+                _close_player_safely(white_player)
+                if black_player is not white_player:
+                    _close_player_safely(black_player)
+        if opening is not None:
+            record.opening = opening.to_dict()
+        return record
+
+    def record_game(self, record: GameRecord) -> None:
+        with use_tracer(self.tracer), span("artifact_write", category="io", artifact="game_record"):
+            write_game_record(self.run_dir, record)
+        self.records.append(record)
+        self.total_cost_usd += record.cost_usd
+
+        if record.termination not in NON_VALID_TERMINATIONS:
+            self.valid_games += 1
+            if self.sprt_state is not None:
+                self.sprt_state.update(
+                    record.result,
+                    record.game_number,
+                    record_player_color(record, self.sprt_state.player_color),
+                )
+                self.sprt_stop_reason = stop_reason_for_status(self.sprt_state.status)
+                if self.sprt_stop_reason is not None:
+                    self.stopped_due_to_sprt = True
+                    self.finished = True
+                    return
+        if self.check_reliability():
+            return
+        if self.valid_games >= self.target_valid:
+            self.finished = True
+
+    def close(self) -> dict[str, Any] | None:
+        """Stop background sampling and return the memory summary, if any.
+
+        ``finalize`` does this too, so it is safe to call after it.
+        """
+        if self.memory_monitor is None:
+            return None
+        return self.memory_monitor.stop()
+
+    def finalize(self) -> dict[str, Any]:
+        self.finished = True
+        sprt_state = self.sprt_state
+        report = summarize_experiment(
+            experiment_id=self.run_id,
+            config_hash=self.prepared.config_hash,
+            target_games=self.target_valid,
+            scheduled_games=self.prepared.scheduled_games,
+            game_records=self.records,
+            budget_cap_usd=self.budget_cap_usd,
+            stopped_due_to_budget=self.stopped_due_to_budget,
+            budget_stop_reason=self.budget_stop_reason,
+            stopped_due_to_reliability=self.stopped_due_to_reliability,
+            reliability_stop_reason=self.reliability_stop_reason,
+            stopped_due_to_sprt=self.stopped_due_to_sprt,
+            sprt_stop_reason=self.sprt_stop_reason,
+            sprt=sprt_state.to_dict() if sprt_state is not None else None,
+        )
+        memory = self.memory_monitor.stop() if self.memory_monitor is not None else None
+        if memory is not None:
+            update_run_metadata(self.run_dir, {"memory": memory})
+        if self.tracer is not None:
+            report.stage_timings = self.tracer.stage_summary()
+            self.tracer.write(self.run_dir / TRACE_FILENAME)
+        write_experiment_report(self.run_dir, report)
+        evaluation_summary = self.runner._maybe_auto_evaluate(
+            config=self.config,
+            run_dir=self.run_dir,
+            games_written=len(self.records),
+            resources=self.resources,
+        )
+
+        return {
+            "run_id": self.run_id,
+            "config_hash": self.prepared.config_hash,
+            "run_dir": str(self.run_dir),
+            "run_metadata": str(self.metadata_path),
+            "resumed": self.resume_state.resumed,
+            "existing_games_loaded": self.resume_state.existing_games,
+            "games_written": len(self.records),
+            "valid_games": report.num_games_valid,
+            "total_cost_usd": report.total_cost_usd,
+            "budget_cap_usd": self.budget_cap_usd,
+            "stopped_due_to_budget": self.stopped_due_to_budget,
+            "budget_stop_reason": self.budget_stop_reason,
+            "stopped_due_to_reliability": self.stopped_due_to_reliability,
+            "reliability_stop_reason": self.reliability_stop_reason,
+            "stopped_due_to_sprt": self.stopped_due_to_sprt,
+            "sprt_stop_reason": self.sprt_stop_reason,
+            "sprt_llr": sprt_state.llr if sprt_state is not None else None,
+            "provider_timeout_game_rate": report.provider_timeout_game_rate,
+            "nonvalid_game_rate": report.nonvalid_game_rate,
+            "duplicate_game_count": report.duplicate_game_count,
+            "evaluation": evaluation_summary,
+            "peak_rss_mb": memory["peak_rss_mb"] if memory is not None else None,
+        }
+
+
 def _timeout_policy_from_config(config: dict[str, Any]) -> TimeoutPolicy:
     runtime_cfg = config.get("runtime", {})
     timeout_policy_cfg = runtime_cfg.get("timeout_policy", {})
@@ -395,6 +584,17 @@ def _timeout_policy_from_config(config: dict[str, Any]) -> TimeoutPolicy:
     )
 
 
+def _sprt_state_from_config(config: dict[str, Any]) -> SprtState | None:
+    sprt_config = sprt_config_from_dict(config.get("runtime", {}).get("sprt"))
+    if not sprt_config.enabled:
+        return None
+    player_color, _ = infer_evaluation_player_color(
+        resolved_config=config,
+        requested_color=sprt_config.player_color,
+    )
+    return SprtState(config=sprt_config, player_color=player_color)
+
+
 def _should_stop_for_reliability(
     records: list[GameRecord],
     valid_games: int,
@@ -4,6 +4,7 @@ from dataclasses import asdict, dataclass, field
 from typing import Any, Callable, Literal, Sequence
 
 from zugzwang.infra.ids import timestamp_utc
+from zugzwang.providers.model_routing import resolve_provider_and_model
 
 
 BatchStatus = Literal["queued", "running", "completed", "failed", "canceled", "dry_run"]
@@ -23,6 +24,10 @@ class BatchStepDefinition:
     model_profile: str | None = None
     overrides: list[str] = field(default_factory=list)
     depends_on: list[str] = field(default_factory=list)
+    # Resource tags; None means "infer from the resolved config".
+    providers: list[str] | None = None
+    engine_cores: int | None = None
+    force: bool = False
 
 
 @dataclass
@@ -41,6 +46,9 @@ class BatchStepState:
     started_at_utc: str | None = None
     finished_at_utc: str | None = None
     preview: dict[str, Any] | None = None
+    providers: list[str] = field(default_factory=list)
+    engine_cores: int = 0
+    force: bool = False
 
 
 @dataclass
@@ -52,6 +60,9 @@ class BatchState:
     created_at_utc: str
     updated_at_utc: str
     steps: list[BatchStepState]
+    max_parallel_steps: int = 1
+    provider_limits: dict[str, int] = field(default_factory=dict)
+    max_engine_cores: int | None = None
 
     def to_dict(self) -> dict[str, Any]:
         return asdict(self)
@@ -86,6 +97,11 @@ def normalize_step_definitions(raw_steps: Sequence[dict[str, Any]]) -> list[Batc
         model_profile = _as_optional_str(raw.get("model_profile"))
         overrides = _normalize_str_list(raw.get("overrides"), field_name=f"step {step_id}.overrides")
         depends_on = _normalize_str_list(raw.get("depends_on"), field_name=f"step {step_id}.depends_on")
+        providers = _normalize_providers(raw.get("providers"), field_name=f"step {step_id}.providers")
+        engine_cores = _as_optional_non_negative_int(
+            raw.get("engine_cores"),
+            field_name=f"step {step_id}.engine_cores",
+        )
 
         steps.append(
             BatchStepDefinition(
@@ -95,6 +111,9 @@ def normalize_step_definitions(raw_steps: Sequence[dict[str, Any]]) -> list[Batc
                 model_profile=model_profile,
                 overrides=overrides,
                 depends_on=depends_on,
+                providers=providers,
+                engine_cores=engine_cores,
+                force=bool(raw.get("force", False)),
             )
         )
 
@@ -102,6 +121,56 @@ def normalize_step_definitions(raw_steps: Sequence[dict[str, Any]]) -> list[Batc
     return steps
 
 
+def normalize_concurrency_limits(
+    *,
+    max_parallel_steps: Any = 1,
+    provider_limits: Any = None,
+    max_engine_cores: Any = None,
+) -> tuple[int, dict[str, int], int | None]:
+    parallel = _as_optional_non_negative_int(max_parallel_steps, field_name="max_parallel_steps")
+    if parallel is None or parallel < 1:
+        raise SchedulerError("max_parallel_steps must be >= 1")
+
+    limits: dict[str, int] = {}
+    if provider_limits is not None:
+        if not isinstance(provider_limits, dict):
+            raise SchedulerError("provider_limits must be an object of provider -> limit")
+        for name, raw_limit in provider_limits.items():
+            limit = _as_optional_non_negative_int(raw_limit, field_name=f"provider_limits.{name}")
+            if limit is None or limit < 1:
+                raise SchedulerError(f"provider_limits.{name} must be >= 1")
+            limits[str(name).strip().lower()] = limit
+
+    cores = _as_optional_non_negative_int(max_engine_cores, field_name="max_engine_cores")
+    if cores is not None and cores < 1:
+        raise SchedulerError("max_engine_cores must be >= 1")
+    return parallel, limits, cores
+
+
+def infer_step_resources(resolved_config: dict[str, Any] | None) -> tuple[list[str], int]:
+    """Providers used by LLM players and UCI engine threads of a resolved config."""
+    providers: list[str] = []
+    engine_cores = 0
+    players = resolved_config.get("players") if isinstance(resolved_config, dict) else None
+    if not isinstance(players, dict):
+        return providers, engine_cores
+    for color in ("white", "black"):
+        player = players.get(color)
+        if not isinstance(player, dict):
+            continue
+        player_type = player.get("type")
+        if player_type == "llm":
+            provider, _ = resolve_provider_and_model(player.get("provider"), player.get("model"))
+            if provider and provider not in providers:
+                providers.append(provider)
+        elif player_type == "engine":
+            try:
+                engine_cores += max(1, int(player.get("threads", 1)))
+            except (TypeError, ValueError):
+                engine_cores += 1
+    return providers, engine_cores
+
+
 def build_batch_state(
     *,
     batch_id: str,
@@ -109,11 +178,17 @@ def build_batch_state(
     fail_fast: bool,
     dry_run: bool,
     previews: dict[str, dict[str, Any]] | None = None,
+    inferred_resources: dict[str, tuple[list[str], int]] | None = None,
+    max_parallel_steps: int = 1,
+    provider_limits: dict[str, int] | None = None,
+    max_engine_cores: int | None = None,
 ) -> BatchState:
     now = timestamp_utc()
     preview_map = previews or {}
+    inferred_map = inferred_resources or {}
     steps: list[BatchStepState] = []
     for definition in definitions:
+        inferred_providers, inferred_cores = inferred_map.get(definition.step_id, ([], 0))
         status: BatchStepStatus = "dry_run" if dry_run else "pending"
         message = "validated (dry-run)" if dry_run else None
         steps.append(
@@ -127,6 +202,17 @@ def build_batch_state(
                 status=status,
                 message=message,
                 preview=preview_map.get(definition.step_id),
+                providers=(
+                    list(definition.providers)
+                    if definition.providers is not None
+                    else list(inferred_providers)
+                ),
+                engine_cores=(
+                    definition.engine_cores
+                    if definition.engine_cores is not None
+                    else inferred_cores
+                ),
+                force=definition.force,
             )
         )
 
@@ -139,6 +225,9 @@ def build_batch_state(
         created_at_utc=now,
         updated_at_utc=now,
         steps=steps,
+        max_parallel_steps=max(1, int(max_parallel_steps)),
+        provider_limits=dict(provider_limits or {}),
+        max_engine_cores=max_engine_cores,
     )
 
 
@@ -169,9 +258,17 @@ def batch_from_dict(payload: dict[str, Any]) -> BatchState:
                 started_at_utc=_as_optional_str(raw.get("started_at_utc")),
                 finished_at_utc=_as_optional_str(raw.get("finished_at_utc")),
                 preview=raw.get("preview") if isinstance(raw.get("preview"), dict) else None,
+                providers=_normalize_providers(raw.get("providers"), field_name="step.providers") or [],
+                engine_cores=_as_optional_non_negative_int(raw.get("engine_cores"), field_name="step.engine_cores") or 0,
+                force=bool(raw.get("force", False)),
             )
         )
 
+    max_parallel_steps, provider_limits, max_engine_cores = normalize_concurrency_limits(
+        max_parallel_steps=payload.get("max_parallel_steps", 1),
+        provider_limits=payload.get("provider_limits"),
+        max_engine_cores=payload.get("max_engine_cores"),
+    )
     return BatchState(
         batch_id=str(payload.get("batch_id", "")),
         status=_as_batch_status(payload.get("status", "queued")),
@@ -180,6 +277,9 @@ def batch_from_dict(payload: dict[str, Any]) -> BatchState:
         created_at_utc=str(payload.get("created_at_utc", "")),
         updated_at_utc=str(payload.get("updated_at_utc", "")),
         steps=steps,
+        max_parallel_steps=max_parallel_steps,
+        provider_limits=provider_limits,
+        max_engine_cores=max_engine_cores,
     )
 
 
@@ -262,25 +362,37 @@ def advance_batch_state(
             step.message = "dependency_not_completed"
             step.finished_at_utc = now
 
-    # If a step is currently running we keep sequential execution and stop here.
-    if any(step.status == "running" for step in batch.steps):
-        batch.status = "running"
-        batch.updated_at_utc = now
-        return batch
+    # Start every eligible step that fits the global, per-provider and engine-core limits.
+    running = [step for step in batch.steps if step.status == "running"]
+    # A cache hit completes a step mid-scan, which can unblock steps listed
+    # before it, so scan again until no step completes that way.
+    rescan = True
+    while rescan:
+        rescan = False
+        for step in batch.steps:
+            if step.status != "pending":
+                continue
+            if not all(step_map[dep].status == "completed" for dep in step.depends_on if dep in step_map):
+                continue
+            if not _fits_concurrency_limits(batch, running, step):
+                continue
+            handle = start_step(step)
+            step.job_id = _as_optional_str(handle.get("job_id"))
+            step.run_id = _as_optional_str(handle.get("run_id"))
+            step.run_dir = _as_optional_str(handle.get("run_dir"))
+            step.started_at_utc = now
+            if handle.get("status") == "completed":
+                # start_step linked an existing completed run instead of launching a job.
+                step.status = "completed"
+                step.message = _as_optional_str(handle.get("message")) or "completed"
+                step.finished_at_utc = now
+                rescan = True
+                continue
+            step.status = "running"
+            step.message = "started"
+            running.append(step)
 
-    # Start the next eligible step.
-    for step in batch.steps:
-        if step.status != "pending":
-            continue
-        if not all(step_map[dep].status == "completed" for dep in step.depends_on if dep in step_map):
-            continue
-        handle = start_step(step)
-        step.job_id = _as_optional_str(handle.get("job_id"))
-        step.run_id = _as_optional_str(handle.get("run_id"))
-        step.run_dir = _as_optional_str(handle.get("run_dir"))
-        step.status = "running"
-        step.message = "started"
-        step.started_at_utc = now
+    if running:
         batch.status = "running"
         batch.updated_at_utc = now
         return batch
@@ -302,6 +414,28 @@ def advance_batch_state(
     return batch
 
 
+def _fits_concurrency_limits(
+    batch: BatchState,
+    running: Sequence[BatchStepState],
+    step: BatchStepState,
+) -> bool:
+    if len(running) >= batch.max_parallel_steps:
+        return False
+    for provider in step.providers:
+        limit = batch.provider_limits.get(provider)
+        if limit is None:
+            continue
+        in_use = sum(1 for other in running if provider in other.providers)
+        if in_use >= limit:
+            return False
+    if batch.max_engine_cores is not None and running:
+        # A step that alone exceeds the core budget still runs once nothing else does.
+        cores_in_use = sum(other.engine_cores for other in running)
+        if cores_in_use + step.engine_cores > batch.max_engine_cores:
+            return False
+    return True
+
+
 def cancel_batch(batch: BatchState) -> BatchState:
     now = timestamp_utc()
     if batch.status in {"completed", "failed", "dry_run", "canceled"}:
@@ -356,6 +490,28 @@ def _normalize_str_list(raw: Any, *, field_name: str) -> list[str]:
     return values
 
 
+def _normalize_providers(raw: Any, *, field_name: str) -> list[str] | None:
+    if raw is None:
+        return None
+    if isinstance(raw, str):
+        raw = [raw]
+    return [item.lower() for item in _normalize_str_list(raw, field_name=field_name)]
+
+
+def _as_optional_non_negative_int(value: Any, *, field_name: str) -> int | None:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        raise SchedulerError(f"{field_name} must be an integer")
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError) as exc:
+        raise SchedulerError(f"{field_name} must be an integer") from exc
+    if parsed < 0:
+        raise SchedulerError(f"{field_name} must be >= 0")
+    return parsed
+
+
 def _as_optional_str(value: Any) -> str | None:
     if isinstance(value, str):
         parsed = value.strip()
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import glob
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any
+
+from zugzwang.core.models import GameRecord
+from zugzwang.core.resources import SharedResources
+from zugzwang.experiments.runner import ExperimentRunner, RunSession
+from zugzwang.knowledge.retriever import warm_cache
+
+
+class SweepRunner:
+    """Run several experiment configs in one process.
+
+    Every config keeps its own run directory and stopping rules, while providers,
+    UCI engines, Stockfish evaluators and knowledge indexes are shared. Games from
+    different configs are interleaved round-robin with at most one game in flight
+    per config, so per-run budget projections and SPRT stay sequential.
+    """
+
+    def __init__(
+        self,
+        config_paths: list[str | Path],
+        model_profile_path: str | Path | None = None,
+        overrides: list[str] | None = None,
+        max_concurrency: int = 4,
+        budget_usd: float | None = None,
+    ) -> None:
+        self.config_paths = expand_config_paths(config_paths)
+        if not self.config_paths:
+            raise ValueError("Sweep needs at least one config")
+        self.model_profile_path = model_profile_path
+        self.overrides = list(overrides or [])
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.budget_usd = float(budget_usd) if budget_usd is not None else None
+
+    def run(self) -> dict[str, Any]:
+        resources = SharedResources()
+        runs: dict[Path, dict[str, Any]] = {}
+        sessions: dict[Path, RunSession] = {}
+        try:
+            for config_path in self.config_paths:
+                runner = ExperimentRunner(
+                    config_path=config_path,
+                    model_profile_path=self.model_profile_path,
+                    overrides=self.overrides,
+                )
+                try:
+                    session = runner.start_session(resources)
+                except Exception as exc:
+                    runs[config_path] = _failed_run(config_path, exc)
+                    continue
+                warm_cache(session.config["strategy"].get("rag", {}))
+                sessions[config_path] = session
+
+            stopped_due_to_budget = self._play(sessions, runs)
+
+            for config_path, session in sessions.items():
+                if runs.get(config_path, {}).get("status") == "failed":
+                    # A crashed run gets no report and no auto-evaluation.
+                    continue
+                payload = session.finalize()
+                runs[config_path] = {"config": str(config_path), **runs.get(config_path, {}), **payload}
+            resource_stats = resources.stats()
+        finally:
+            for session in sessions.values():
+                session.close()
+            resources.close()
+
+        ordered = [runs[path] for path in self.config_paths if path in runs]
+        return {
+            "configs": len(self.config_paths),
+            "max_concurrency": self.max_concurrency,
+            "budget_usd": self.budget_usd,
+            "total_cost_usd": float(sum(float(run.get("total_cost_usd") or 0.0) for run in ordered)),
+            "stopped_due_to_budget": stopped_due_to_budget,
+            "runs": ordered,
+            "resources": resource_stats,
+        }
+
+    def _play(self, sessions: dict[Path, RunSession], runs: dict[Path, dict[str, Any]]) -> bool:
+        pending = deque(sessions.items())
+        in_flight: dict[Future[GameRecord], tuple[Path, RunSession]] = {}
+        stopped_due_to_budget = False
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            while pending or in_flight:
+                while pending and len(in_flight) < self.max_concurrency:
+                    config_path, session = pending.popleft()
+                    if self._budget_exhausted(sessions):
+                        stopped_due_to_budget = True
+                        session.stop_for_budget("sweep_budget_reached")
+                        continue
+                    game_number = session.next_game_number()
+                    if game_number is None:
+                        continue
+                    future = executor.submit(session.play_game, game_number)
+                    in_flight[future] = (config_path, session)
+
+                if not in_flight:
+                    continue
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    config_path, session = in_flight.pop(future)
+                    try:
+                        session.record_game(future.result())
+                    except Exception as exc:
+                        session.finished = True
+                        runs[config_path] = {
+                            **_failed_run(config_path, exc),
+                            "run_id": session.run_id,
+                            "run_dir": str(session.run_dir),
+                        }
+                        continue
+                    pending.append((config_path, session))
+        return stopped_due_to_budget
+
+    def _budget_exhausted(self, sessions: dict[Path, RunSession]) -> bool:
+        if self.budget_usd is None:
+            return False
+        spent = sum(session.total_cost_usd for session in sessions.values())
+        return spent >= self.budget_usd
+
+
+def expand_config_paths(patterns: list[str | Path]) -> list[Path]:
+    """Expand globs like ``configs/ablations/*.yaml`` and drop duplicates."""
+    paths: list[Path] = []
+    for pattern in patterns:
+        text = str(pattern)
+        matches = sorted(glob.glob(text)) if glob.has_magic(text) else [text]
+        for match in matches:
+            path = Path(match)
+            if path not in paths:
+                paths.append(path)
+    return paths
+
+
+def _failed_run(config_path: Path, exc: Exception) -> dict[str, Any]:
+    return {"config": str(config_path), "status": "failed", "error": str(exc)}
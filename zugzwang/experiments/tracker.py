@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Any
 
 import yaml
 
 from zugzwang.core.models import ExperimentReport, GameRecord
+from zugzwang.infra.locks import file_lock
 
 RUN_METADATA_SCHEMA_VERSION = "1.0"
+# Sibling of the run directories; holds the API run catalog and change markers.
+CATALOG_DIRNAME = "_catalog"
+CATALOG_DIRTY_DIRNAME = "dirty"
+# Distributed workers and their coordinator update one _run.json from separate processes.
+RUN_METADATA_LOCK_FILENAME = ".run_metadata.lock"
 REDACTED = "***REDACTED***"
 SENSITIVE_KEY_MARKERS = (
     "api_key",
@@ -58,18 +65,57 @@ def write_run_metadata(run_dir: str | Path, metadata: dict[str, Any]) -> Path:
     return path
 
 
+def update_run_metadata(run_dir: str | Path, updates: dict[str, Any]) -> Path | None:
+    """Merge top-level keys into an existing ``_run.json``; None when there is none."""
+    path = Path(run_dir) / "_run.json"
+    if not path.parent.is_dir():
+        return None
+    with file_lock(path.with_name(RUN_METADATA_LOCK_FILENAME)):
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(payload, dict):
+            return None
+        payload.update(sanitize_for_metadata(updates))
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(tmp_path, path)
+    return path
+
+
 def write_game_record(run_dir: str | Path, game_record: GameRecord) -> Path:
     path = Path(run_dir) / "games" / f"game_{game_record.game_number:04d}.json"
-    path.write_text(json.dumps(game_record.to_dict(), indent=2), encoding="utf-8")
+    # Write-then-rename so concurrent readers (resume, distributed workers) never
+    # see a partially written game.
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(game_record.to_dict(), indent=2), encoding="utf-8")
+    os.replace(tmp_path, path)
     return path
 
 
 def write_experiment_report(run_dir: str | Path, report: ExperimentReport) -> Path:
     path = Path(run_dir) / "experiment_report.json"
     path.write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
+    mark_run_changed(run_dir)
     return path
 
 
+def mark_run_changed(run_dir: str | Path) -> None:
+    """Flag a run whose reports changed so the run catalog re-reads it.
+
+    Best effort: without the marker the catalog's periodic full scan still
+    picks the change up.
+    """
+    run_path = Path(run_dir)
+    marker = run_path.parent / CATALOG_DIRNAME / CATALOG_DIRTY_DIRNAME / run_path.name
+    try:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+    except OSError:
+        pass
+
+
 def write_prompt_transcript(
     *,
     run_dir: str | Path,
@@ -22,6 +22,7 @@ PROVIDER_ENV_KEYS: dict[str, tuple[str, ...] | None] = {
     "kimicode": ("KIMI_CODE_API_KEY", "KIMI_API_KEY", "MOONSHOT_API_KEY"),
     "minimax": ("MINIMAX_API_KEY",),
     "mock": None,
+    "sim": None,
 }
 
 
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from zugzwang.infra.tracing import Tracer
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+
+DEFAULT_INTERVAL_SECONDS = 1.0
+DEFAULT_TOP_ALLOCATORS = 10
+# Long runs are thinned to roughly this many points in the saved timeline.
+MAX_TIMELINE_SAMPLES = 500
+
+_MB = 1024 * 1024
+_PROC_STATUS_PATH = Path("/proc/self/status")
+
+# tracemalloc is process-wide; monitors share it, first one in starts it, last one out stops it.
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_owners = 0
+
+
+def current_rss_bytes() -> int | None:
+    """Resident set size of this process, or None where it cannot be read cheaply."""
+    return _proc_status_bytes("VmRSS")
+
+
+def peak_rss_bytes() -> int | None:
+    """High-water RSS over the whole process lifetime."""
+    peak = _proc_status_bytes("VmHWM")
+    if peak is not None or resource is None:
+        return peak
+    maxrss = int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    # ru_maxrss is in bytes on macOS and kilobytes everywhere else.
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def current_memory() -> dict[str, Any]:
+    """Point-in-time memory of this process, for health endpoints and CLI output."""
+    payload: dict[str, Any] = {
+        "pid": os.getpid(),
+        "rss_mb": _to_mb(current_rss_bytes()),
+        "peak_rss_mb": _to_mb(peak_rss_bytes()),
+        "threads": threading.active_count(),
+        "tracemalloc": None,
+    }
+    if tracemalloc.is_tracing():
+        traced, traced_peak = tracemalloc.get_traced_memory()
+        payload["tracemalloc"] = {"current_mb": _to_mb(traced), "peak_mb": _to_mb(traced_peak)}
+    return payload
+
+
+class MemoryMonitor:
+    """Samples process RSS on a background thread while a run or evaluation is in progress.
+
+    With ``top_allocators > 0`` it also traces Python allocations with
+    ``tracemalloc`` and, on ``stop``, groups the live ones by module. Tracing
+    allocations slows allocation-heavy code noticeably, so it stays opt-in.
+    The trace is process-wide: overlapping monitors (concurrent sweep runs, an
+    evaluation inside a run) share one, so each summary covers allocations from
+    every thread, and tracing stops only when the last monitor stops.
+    When a ``tracer`` is given, every sample is also recorded as a Chrome trace
+    counter so memory lines up with the span timeline.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+        top_allocators: int = DEFAULT_TOP_ALLOCATORS,
+        tracer: Tracer | None = None,
+    ) -> None:
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be > 0")
+        self.interval_seconds = float(interval_seconds)
+        self.top_allocators = max(0, int(top_allocators))
+        self.tracer = tracer
+        self.samples: list[tuple[float, int]] = []
+        self._summary: dict[str, Any] | None = None
+        self._owns_tracemalloc = False
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started = 0.0
+
+    def start(self) -> MemoryMonitor:
+        if self._thread is not None:
+            return self
+        if self.top_allocators:
+            self._owns_tracemalloc = _acquire_tracemalloc()
+        self._started = time.perf_counter()
+        self._sample()
+        self._thread = threading.Thread(target=self._loop, name="zugzwang-memory", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> dict[str, Any]:
+        """Stop sampling and return the summary; later calls return the same summary."""
+        if self._summary is not None:
+            return self._summary
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._sample()
+
+        tracemalloc_summary = None
+        if self.top_allocators and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            traced, traced_peak = tracemalloc.get_traced_memory()
+            tracemalloc_summary = {
+                "current_mb": _to_mb(traced),
+                "peak_mb": _to_mb(traced_peak),
+                "top_modules": top_allocators_by_module(snapshot, top=self.top_allocators),
+            }
+        if self._owns_tracemalloc:
+            _release_tracemalloc()
+            self._owns_tracemalloc = False
+
+        rss_values = [rss for _, rss in self.samples]
+        self._summary = {
+            "interval_seconds": self.interval_seconds,
+            "duration_seconds": round(time.perf_counter() - self._started, 3),
+            "sample_count": len(self.samples),
+            "start_rss_mb": _to_mb(rss_values[0]) if rss_values else None,
+            "end_rss_mb": _to_mb(rss_values[-1]) if rss_values else None,
+            "peak_rss_mb": _to_mb(max(rss_values)) if rss_values else None,
+            "process_peak_rss_mb": _to_mb(peak_rss_bytes()),
+            "timeline": [[round(elapsed, 3), _to_mb(rss)] for elapsed, rss in _thin(self.samples)],
+            "tracemalloc": tracemalloc_summary,
+        }
+        return self._summary
+
+    def __enter__(self) -> MemoryMonitor:
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self._sample()
+
+    def _sample(self) -> None:
+        rss = current_rss_bytes()
+        if rss is None:
+            return
+        self.samples.append((time.perf_counter() - self._started, rss))
+        if self.tracer is not None:
+            self.tracer.counter("memory", rss_mb=_to_mb(rss))
+
+
+def monitor_from_config(config: dict[str, Any], tracer: Tracer | None = None) -> MemoryMonitor | None:
+    """A monitor for ``tracking.memory_*`` settings, or None when memory profiling is off."""
+    tracking_cfg = config.get("tracking", {})
+    if not isinstance(tracking_cfg, dict) or not tracking_cfg.get("memory_profile", False):
+        return None
+    return MemoryMonitor(
+        interval_seconds=float(tracking_cfg.get("memory_interval_seconds", DEFAULT_INTERVAL_SECONDS)),
+        top_allocators=int(tracking_cfg.get("memory_top_allocators", DEFAULT_TOP_ALLOCATORS)),
+        tracer=tracer,
+    )
+
+
+def _acquire_tracemalloc() -> bool:
+    """Join the shared trace; False when something outside the monitors already runs it."""
+    global _tracemalloc_owners
+    with _tracemalloc_lock:
+        if _tracemalloc_owners == 0:
+            if tracemalloc.is_tracing():
+                # Started by -X tracemalloc or the caller; leave stopping it to them.
+                return False
+            tracemalloc.start()
+        _tracemalloc_owners += 1
+        return True
+
+
+def _release_tracemalloc() -> None:
+    global _tracemalloc_owners
+    with _tracemalloc_lock:
+        _tracemalloc_owners -= 1
+        if _tracemalloc_owners == 0:
+            tracemalloc.stop()
+
+
+def top_allocators_by_module(
+    snapshot: tracemalloc.Snapshot, top: int = DEFAULT_TOP_ALLOCATORS
+) -> list[dict[str, Any]]:
+    """Live traced allocations grouped by the module that made them, largest first."""
+    # The monitor's own samples and the snapshot machinery are not part of the workload.
+    snapshot = snapshot.filter_traces(
+        [tracemalloc.Filter(False, __file__), tracemalloc.Filter(False, tracemalloc.__file__)]
+    )
+    sizes: dict[str, list[int]] = {}
+    for stat in snapshot.statistics("filename"):
+        module = _module_for_file(stat.traceback[0].filename)
+        entry = sizes.setdefault(module, [0, 0])
+        entry[0] += stat.size
+        entry[1] += stat.count
+    ordered = sorted(sizes.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    return [{"module": module, "size_kb": round(size / 1024, 1), "blocks": count} for module, (size, count) in ordered]
+
+
+def _module_for_file(filename: str) -> str:
+    if filename.startswith("<"):
+        return filename
+    path = os.path.normcase(os.path.abspath(filename))
+    best = ""
+    for entry in sys.path:
+        root = os.path.normcase(os.path.abspath(entry or os.curdir))
+        if path.startswith(root + os.sep) and len(root) > len(best):
+            best = root
+    relative = Path(path[len(best) + 1 :] if best else path)
+    parts = list(relative.with_suffix("").parts)
+    if parts and parts[-1] == "__init__":
+        parts.pop()
+    if not best:
+        return relative.stem
+    return ".".join(parts[:2]) if parts else relative.stem
+
+
+def _proc_status_bytes(field: str) -> int | None:
+    # Linux only; e.g. "VmRSS:\t  72840 kB". VmHWM is computed at read time, so it
+    # is never below the VmRSS read just before it.
+    try:
+        lines = _PROC_STATUS_PATH.read_bytes().splitlines()
+    except OSError:
+        return None
+    prefix = f"{field}:".encode("ascii")
+    for line in lines:
+        if line.startswith(prefix):
+            return int(line.split()[1]) * 1024
+    return None
+
+
+def _thin(samples: list[tuple[float, int]]) -> list[tuple[float, int]]:
+    if len(samples) <= MAX_TIMELINE_SAMPLES:
+        return samples
+    step = len(samples) / MAX_TIMELINE_SAMPLES
+    thinned = [samples[int(index * step)] for index in range(MAX_TIMELINE_SAMPLES - 1)]
+    thinned.append(samples[-1])
+    return thinned
+
+
+def _to_mb(value: int | None) -> float | None:
+    if value is None:
+        return None
+    return round(value / _MB, 2)
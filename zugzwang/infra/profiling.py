@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import cProfile
+import json
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Literal
+
+
+ProfilerKind = Literal["sampling", "cprofile"]
+
+DEFAULT_INTERVAL_MS = 1.0
+DEFAULT_TOP = 20
+COLLAPSED_FILENAME = "profile.collapsed"
+PSTATS_FILENAME = "profile.pstats"
+SUMMARY_FILENAME = "profile_summary.json"
+# cProfile only records caller edges, so collapsed stacks rebuilt from it are cut
+# off at this depth and drop branches worth less than a microsecond.
+_MAX_PSTATS_DEPTH = 64
+
+# Leaf frames of threads parked on a lock; sampling them would only measure waiting.
+_IDLE_LEAVES = frozenset(
+    {
+        "threading:Condition.wait",
+        "threading:Event.wait",
+        "threading:Thread.join",
+        "threading:Thread._wait_for_tstate_lock",
+        "queue:Queue.get",
+        "concurrent.futures._base:Future.result",
+        "concurrent.futures.thread:_worker",
+    }
+)
+
+
+@dataclass
+class ProfileResult:
+    profiler: str
+    wall_seconds: float
+    samples: int
+    hotspots: list[dict[str, Any]]
+    files: dict[str, str] = field(default_factory=dict)
+    result: Any = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "profiler": self.profiler,
+            "wall_seconds": self.wall_seconds,
+            "samples": self.samples,
+            "hotspots": self.hotspots,
+            "files": self.files,
+        }
+
+
+class SamplingProfiler:
+    """Samples Python stacks from a background thread.
+
+    Stdlib-only stand-in for py-spy: covers the starting thread and every
+    thread spawned while profiling (games may run on worker threads), skips
+    idle waits, and aggregates stacks as collapsed ``frame;frame count``
+    lines that flamegraph.pl and speedscope import directly.
+    """
+
+    def __init__(self, interval_ms: float = DEFAULT_INTERVAL_MS) -> None:
+        self.interval_seconds = max(0.0001, float(interval_ms) / 1000)
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self._ignored: set[int] = set()
+        self._switch_interval: float | None = None
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+
+    def __enter__(self) -> SamplingProfiler:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self._ignored = set(sys._current_frames()) - {threading.get_ident()}
+        # The sampler needs the GIL to read stacks; hand it over at least once per tick.
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval_seconds))
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._run, name="zugzwang-sampler", daemon=True)
+        self._sampler.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+        if self._switch_interval is not None:
+            sys.setswitchinterval(self._switch_interval)
+            self._switch_interval = None
+
+    @property
+    def sample_count(self) -> int:
+        return sum(self.stacks.values())
+
+    def collapsed_lines(self) -> list[str]:
+        return [f"{';'.join(stack)} {count}" for stack, count in sorted(self.stacks.items())]
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval_seconds):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or thread_id in self._ignored:
+                    continue
+                stack: list[str] = []
+                while frame is not None:
+                    stack.append(_frame_label(frame))
+                    frame = frame.f_back
+                if stack[0] in _IDLE_LEAVES:
+                    continue
+                stack.reverse()
+                self.stacks[tuple(stack)] += 1
+
+
+def profile_call(
+    func: Callable[[], Any],
+    *,
+    output_dir: str | Path,
+    profiler: ProfilerKind = "sampling",
+    interval_ms: float = DEFAULT_INTERVAL_MS,
+    top: int = DEFAULT_TOP,
+) -> ProfileResult:
+    """Run ``func`` under a profiler and write its artifacts to ``output_dir``."""
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    files: dict[str, str] = {}
+
+    started = time.perf_counter()
+    if profiler == "cprofile":
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            value = func()
+        finally:
+            profile.disable()
+        wall_seconds = time.perf_counter() - started
+        stats = pstats.Stats(profile)
+        stats.dump_stats(output / PSTATS_FILENAME)
+        files["pstats"] = str(output / PSTATS_FILENAME)
+        (output / COLLAPSED_FILENAME).write_text("\n".join(collapsed_from_pstats(stats)) + "\n", encoding="utf-8")
+        files["collapsed"] = str(output / COLLAPSED_FILENAME)
+        samples = int(sum(entry[1] for entry in stats.stats.values()))  # type: ignore[attr-defined]
+        hotspots = hotspots_from_pstats(stats, top=top)
+    elif profiler == "sampling":
+        sampler = SamplingProfiler(interval_ms=interval_ms)
+        with sampler:
+            value = func()
+        wall_seconds = time.perf_counter() - started
+        (output / COLLAPSED_FILENAME).write_text("\n".join(sampler.collapsed_lines()) + "\n", encoding="utf-8")
+        files["collapsed"] = str(output / COLLAPSED_FILENAME)
+        samples = sampler.sample_count
+        hotspots = hotspots_from_stacks(sampler.stacks, top=top)
+    else:
+        raise ValueError(f"Unknown profiler: {profiler}")
+
+    result = ProfileResult(
+        profiler=profiler,
+        wall_seconds=round(wall_seconds, 4),
+        samples=samples,
+        hotspots=hotspots,
+        files=files,
+        result=value,
+    )
+    files["summary"] = str(output / SUMMARY_FILENAME)
+    (output / SUMMARY_FILENAME).write_text(json.dumps(result.to_dict(), indent=2), encoding="utf-8")
+    return result
+
+
+def hotspots_from_stacks(stacks: Counter[tuple[str, ...]], *, top: int = DEFAULT_TOP) -> list[dict[str, Any]]:
+    """Per-module self and inclusive share of samples, by self share."""
+    total = sum(stacks.values())
+    if total == 0:
+        return []
+    self_counts: Counter[str] = Counter()
+    inclusive_counts: Counter[str] = Counter()
+    for stack, count in stacks.items():
+        self_counts[_label_module(stack[-1])] += count
+        for module in {_label_module(label) for label in stack}:
+            inclusive_counts[module] += count
+    ranked = sorted(inclusive_counts, key=lambda module: (-self_counts[module], -inclusive_counts[module], module))
+    return [
+        {
+            "module": module,
+            "self_samples": self_counts[module],
+            "self_pct": round(100 * self_counts[module] / total, 2),
+            "inclusive_pct": round(100 * inclusive_counts[module] / total, 2),
+        }
+        for module in ranked[: max(1, top)]
+    ]
+
+
+def hotspots_from_pstats(stats: pstats.Stats, *, top: int = DEFAULT_TOP) -> list[dict[str, Any]]:
+    """Per-module own time (tottime) and call counts from a cProfile run."""
+    module_names = _module_names_by_file()
+    own: Counter[str] = Counter()
+    calls: Counter[str] = Counter()
+    for (filename, _, _), (_, call_count, tottime, _, _) in stats.stats.items():  # type: ignore[attr-defined]
+        module = module_names.get(filename) or _fallback_module(filename)
+        own[module] += tottime
+        calls[module] += call_count
+    total = sum(own.values()) or 1.0
+    return [
+        {
+            "module": module,
+            "self_seconds": round(seconds, 4),
+            "self_pct": round(100 * seconds / total, 2),
+            "calls": calls[module],
+        }
+        for module, seconds in own.most_common(max(1, top))
+    ]
+
+
+def collapsed_from_pstats(stats: pstats.Stats) -> list[str]:
+    """Collapsed ``frame;frame microseconds`` lines rebuilt from a cProfile call graph.
+
+    cProfile keeps callers per function rather than whole stacks, so each
+    function's own time is split across its callers by their share of it and
+    walked up to the roots. Stacks are estimates; per-function totals are exact.
+    """
+    entries = stats.stats  # type: ignore[attr-defined]
+    module_names = _module_names_by_file()
+    labels = {
+        func: f"{module_names.get(func[0]) or _fallback_module(func[0])}:{func[2]}" for func in entries
+    }
+    stacks: Counter[tuple[str, ...]] = Counter()
+
+    def walk(path: list[tuple[str, int, str]], weight: float) -> None:
+        callers = {
+            caller: info[2]
+            for caller, info in entries[path[-1]][4].items()
+            if caller in entries and caller not in path
+        }
+        if not callers or len(path) >= _MAX_PSTATS_DEPTH:
+            stacks[tuple(labels[func] for func in reversed(path))] += weight
+            return
+        total = sum(callers.values())
+        for caller, caller_time in callers.items():
+            share = weight * caller_time / total if total > 0 else weight / len(callers)
+            if share >= 1:
+                walk([*path, caller], share)
+
+    for func, (_, _, tottime, _, _) in entries.items():
+        walk([func], tottime * 1_000_000)
+    return [f"{';'.join(stack)} {round(count)}" for stack, count in sorted(stacks.items()) if round(count) > 0]
+
+
+def _frame_label(frame: Any) -> str:
+    module = frame.f_globals.get("__name__", "?")
+    code = frame.f_code
+    return f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+def _label_module(label: str) -> str:
+    return label.split(":", 1)[0]
+
+
+def _module_names_by_file() -> dict[str, str]:
+    names: dict[str, str] = {}
+    for name, module in list(sys.modules.items()):
+        filename = getattr(module, "__file__", None)
+        if isinstance(filename, str):
+            names[filename] = name
+    return names
+
+
+def _fallback_module(filename: str) -> str:
+    # Builtins show up as "~"; keep them grouped rather than per function.
+    if filename == "~":
+        return "<builtins>"
+    return Path(filename).stem
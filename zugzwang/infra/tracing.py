@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import functools
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+
+TRACE_FILENAME = "trace.json"
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> _NoopSpan:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_category", "_args", "_started_ns")
+
+    def __init__(self, tracer: Tracer, name: str, category: str, args: dict[str, Any]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+        self._started_ns = 0
+
+    def __enter__(self) -> _Span:
+        self._started_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        ended_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self._args["error"] = exc_type.__name__
+        self._tracer._record(self._name, self._category, self._started_ns, ended_ns - self._started_ns, self._args)
+
+
+class Tracer:
+    """Collects timed spans for one run and exports them as Chrome trace events.
+
+    Spans are complete ("X") events keyed by thread, so games played on worker
+    threads show up as separate tracks in Perfetto / ``chrome://tracing``.
+    Counters ("C" events) such as sampled memory are kept apart from spans and
+    never show up in the stage summary. Traces written by other processes
+    (distributed workers) can be folded in with ``absorb``; each keeps its own
+    process track and its spans count towards the stage summary.
+    """
+
+    def __init__(self, label: str | None = None) -> None:
+        self.label = label
+        self._origin_ns = time.perf_counter_ns()
+        self._events: list[tuple[str, str, int, int, int, dict[str, Any]]] = []
+        self._counters: list[tuple[str, int, dict[str, float | None]]] = []
+        self._absorbed: list[list[dict[str, Any]]] = []
+        self._lock = threading.Lock()
+
+    def span(self, name: str, category: str = "move", **args: Any) -> _Span:
+        return _Span(self, name, category, args)
+
+    def _record(self, name: str, category: str, started_ns: int, duration_ns: int, args: dict[str, Any]) -> None:
+        event = (name, category, started_ns - self._origin_ns, duration_ns, threading.get_ident(), args)
+        with self._lock:
+            self._events.append(event)
+
+    def counter(self, name: str, **values: float | None) -> None:
+        """Record a counter sample (e.g. ``rss_mb``) at the current time."""
+        sample = (name, time.perf_counter_ns() - self._origin_ns, values)
+        with self._lock:
+            self._counters.append(sample)
+
+    def absorb(self, trace: dict[str, Any], label: str | None = None) -> None:
+        """Fold in a Chrome trace written by another process as a separate process track.
+
+        Timestamps from other processes (or machines) share no clock with this
+        one, so the tracks line up only roughly; durations are exact.
+        """
+        events = [event for event in trace.get("traceEvents", []) if isinstance(event, dict)]
+        with self._lock:
+            # Real pids can collide across machines; number absorbed tracks after our own.
+            pid = os.getpid() + len(self._absorbed) + 1
+            track: list[dict[str, Any]] = []
+            for event in events:
+                if event.get("ph") == "M" and event.get("name") == "process_name" and label:
+                    event = {**event, "args": {"name": label}}
+                track.append({**event, "pid": pid})
+            self._absorbed.append(track)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def durations_ms(self) -> dict[str, list[float]]:
+        output: dict[str, list[float]] = {}
+        for name, duration_ms, _ in self._all_spans():
+            output.setdefault(name, []).append(duration_ms)
+        return output
+
+    def spans(self, name: str) -> list[tuple[float, dict[str, Any]]]:
+        """Duration in milliseconds and args of every recorded ``name`` span."""
+        return [(duration_ms, args) for span_name, duration_ms, args in self._all_spans() if span_name == name]
+
+    def _all_spans(self) -> list[tuple[str, float, dict[str, Any]]]:
+        with self._lock:
+            events = list(self._events)
+            absorbed = [event for track in self._absorbed for event in track]
+        output = [(event[0], event[3] / 1_000_000, event[5]) for event in events]
+        for event in absorbed:
+            if event.get("ph") == "X":
+                output.append((str(event.get("name")), float(event.get("dur", 0.0)) / 1000, event.get("args") or {}))
+        return output
+
+    def stage_summary(self) -> dict[str, dict[str, float | int]]:
+        """Per-span-name count, total, p50, p95 and max in milliseconds."""
+        summary: dict[str, dict[str, float | int]] = {}
+        for name, values in sorted(self.durations_ms().items()):
+            ordered = sorted(values)
+            summary[name] = {
+                "count": len(ordered),
+                "total_ms": round(sum(ordered), 3),
+                "p50_ms": round(_nearest_rank(ordered, 0.50), 3),
+                "p95_ms": round(_nearest_rank(ordered, 0.95), 3),
+                "max_ms": round(ordered[-1], 3),
+            }
+        return summary
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        pid = os.getpid()
+        with self._lock:
+            events = list(self._events)
+            counters = list(self._counters)
+            absorbed = [event for track in self._absorbed for event in track]
+        thread_ids = {tid: index for index, tid in enumerate(dict.fromkeys(event[4] for event in events), start=1)}
+
+        trace_events: list[dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": self.label or "zugzwang"}},
+        ]
+        for tid, index in thread_ids.items():
+            trace_events.append(
+                {"name": "thread_name", "ph": "M", "pid": pid, "tid": index, "args": {"name": f"thread-{index}"}}
+            )
+        for name, category, started_ns, duration_ns, tid, args in events:
+            event: dict[str, Any] = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": started_ns / 1000,
+                "dur": duration_ns / 1000,
+                "pid": pid,
+                "tid": thread_ids[tid],
+            }
+            if args:
+                event["args"] = args
+            trace_events.append(event)
+        for name, at_ns, values in counters:
+            trace_events.append({"name": name, "ph": "C", "ts": at_ns / 1000, "pid": pid, "tid": 0, "args": values})
+        trace_events.extend(absorbed)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str | Path) -> Path:
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output.with_name(f".{output.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self.to_chrome_trace(), default=str), encoding="utf-8")
+        os.replace(tmp_path, output)
+        return output
+
+
+_current_tracer: ContextVar[Tracer | None] = ContextVar("zugzwang_tracer", default=None)
+
+
+def current_tracer() -> Tracer | None:
+    return _current_tracer.get()
+
+
+@contextmanager
+def use_tracer(tracer: Tracer | None) -> Iterator[Tracer | None]:
+    """Route ``span`` calls in this thread/context to ``tracer`` (None disables)."""
+    token = _current_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _current_tracer.reset(token)
+
+
+def span(name: str, category: str = "move", **args: Any) -> _Span | _NoopSpan:
+    """Time a block when a tracer is active; a shared no-op otherwise."""
+    tracer = _current_tracer.get()
+    if tracer is None:
+        return _NOOP_SPAN
+    return tracer.span(name, category, **args)
+
+
+def traced(name: str, category: str = "move") -> Callable[[_F], _F]:
+    """Decorator form of :func:`span` for whole functions."""
+
+    def decorator(func: _F) -> _F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = _current_tracer.get()
+            if tracer is None:
+                return func(*args, **kwargs)
+            with tracer.span(name, category):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _nearest_rank(ordered: list[float], quantile: float) -> float:
+    if not ordered:
+        return 0.0
+    index = max(0, math.ceil(quantile * len(ordered)) - 1)
+    return ordered[min(index, len(ordered) - 1)]
@@ -6,6 +6,7 @@ from time import perf_counter
 from typing import Any
 
 from zugzwang.core.models import GameState
+from zugzwang.infra.tracing import traced
 from zugzwang.knowledge.indexer import load_chunks, resolve_enabled_sources
 from zugzwang.knowledge.types import RetrievedChunk
 from zugzwang.knowledge.vectordb import InMemoryVectorDB
@@ -34,6 +35,7 @@ _DB_CACHE: dict[tuple[str, ...], InMemoryVectorDB] = {}
 _QUERY_CACHE: dict[str, RetrievalResult] = {}
 
 
+@traced("retrieval", category="retrieval")
 def query(game_state: GameState, retrieval_config: Any) -> RetrievalResult:
     if not _is_enabled(retrieval_config):
         return RetrievalResult(chunks=[], latency_ms=0, sources=[])
@@ -75,6 +77,20 @@ def query(game_state: GameState, retrieval_config: Any) -> RetrievalResult:
     return result
 
 
+def warm_cache(retrieval_config: Any) -> int:
+    """Build the vector DBs every phase route would need; returns the DB count."""
+    if not _is_enabled(retrieval_config):
+        return 0
+    enabled_sources = resolve_enabled_sources(retrieval_config)
+    built: set[tuple[str, ...]] = set()
+    for phase in PHASE_ROUTING:
+        routed_sources = _routed_sources(phase, enabled_sources)
+        if routed_sources:
+            _get_or_create_db(routed_sources)
+            built.add(tuple(sorted(routed_sources)))
+    return len(built)
+
+
 def clear_caches() -> None:
     _DB_CACHE.clear()
     _QUERY_CACHE.clear()
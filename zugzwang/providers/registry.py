@@ -12,11 +12,13 @@ from zugzwang.providers.kimicode import KimiCodeProvider
 from zugzwang.providers.minimax import MiniMaxProvider
 from zugzwang.providers.mock import MockProvider
 from zugzwang.providers.openai import OpenAIProvider
+from zugzwang.providers.sim import SimProvider
 from zugzwang.providers.zai import ZAIProvider
 
 
 _PROVIDERS: dict[str, type[ProviderInterface]] = {
     "mock": MockProvider,
+    "sim": SimProvider,
     "zai": ZAIProvider,
     "openai": OpenAIProvider,
     "anthropic": AnthropicProvider,
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import math
+import random
+import threading
+import time
+from typing import Any
+
+from zugzwang.providers.base import ProviderError, ProviderResponse
+from zugzwang.providers.mock import MockProvider
+
+
+DEFAULT_SIM_CONFIG: dict[str, Any] = {
+    "seed": 0,
+    # fixed | uniform | lognormal; latency_ms is the median for lognormal.
+    "latency_distribution": "lognormal",
+    "latency_ms": 800.0,
+    "latency_ms_min": 200.0,
+    "latency_ms_max": 2000.0,
+    "latency_sigma": 0.5,
+    "timeout_ms": 5000.0,
+    "output_tokens": None,
+    "rate_429": 0.0,
+    "rate_timeout": 0.0,
+    "rate_5xx": 0.0,
+    "rate_malformed": 0.0,
+    "rate_illegal": 0.0,
+}
+
+FAULT_KINDS = ("rate_limit", "timeout", "server")
+REJECT_KINDS = ("malformed", "illegal")
+OUTCOMES = ("ok", *FAULT_KINDS, *REJECT_KINDS)
+
+_MALFORMED_RESPONSE = "Hard to say. Developing pieces and keeping the king safe seems like the right plan here."
+_ILLEGAL_RESPONSE = "a1a8"
+
+
+class SimProvider(MockProvider):
+    """Mock provider with simulated latency, token counts and injected faults.
+
+    Settings come from the player's ``sim`` block (passed through in
+    ``model_config``) over ``DEFAULT_SIM_CONFIG``. Faults raise the same
+    ``ProviderError`` categories the HTTP providers use, so runner retries and
+    backoff behave as they would against a real API.
+    """
+
+    def __init__(self) -> None:
+        self._rng: random.Random | None = None
+        self._lock = threading.Lock()
+        self._counts: dict[str, int] = {}
+        self._simulated_ms = 0.0
+
+    def complete(
+        self, messages: list[dict[str, str]], model_config: dict[str, Any]
+    ) -> ProviderResponse:
+        settings = {**DEFAULT_SIM_CONFIG, **dict(model_config.get("sim") or {})}
+        latency_ms, outcome = self._draw(settings)
+
+        if outcome == "timeout":
+            self._sleep(float(settings["timeout_ms"]))
+            raise ProviderError("sim request timeout", category="timeout", retryable=True)
+        self._sleep(latency_ms)
+        if outcome == "rate_limit":
+            raise ProviderError(
+                "sim HTTP 429: too many requests", category="rate_limit", retryable=True, status_code=429
+            )
+        if outcome == "server":
+            raise ProviderError(
+                "sim HTTP 503: service unavailable", category="server", retryable=True, status_code=503
+            )
+
+        content = messages[-1]["content"] if messages else ""
+        if outcome == "malformed":
+            text = _MALFORMED_RESPONSE
+        elif outcome == "illegal":
+            text = _ILLEGAL_RESPONSE
+        else:
+            text = self._generate(content)
+        output_tokens = settings.get("output_tokens")
+        return ProviderResponse(
+            text=text,
+            model=str(model_config.get("model", "sim-1")),
+            # Roughly four characters per token, as with BPE tokenizers on English text.
+            input_tokens=max(1, sum(len(message.get("content", "")) for message in messages) // 4),
+            output_tokens=int(output_tokens) if output_tokens is not None else max(1, len(text) // 4),
+            latency_ms=int(latency_ms),
+            cost_usd=0.0,
+        )
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+            simulated_ms = self._simulated_ms
+        calls = counts.get("calls", 0)
+        return {
+            "calls": calls,
+            "ok": counts.get("ok", 0),
+            "faults": {kind: counts.get(kind, 0) for kind in FAULT_KINDS},
+            "rejected": {kind: counts.get(kind, 0) for kind in REJECT_KINDS},
+            "wasted_calls": calls - counts.get("ok", 0),
+            "simulated_latency_ms": round(simulated_ms, 1),
+        }
+
+    def _draw(self, settings: dict[str, Any]) -> tuple[float, str]:
+        with self._lock:
+            if self._rng is None:
+                self._rng = random.Random(int(settings["seed"]))
+            rng = self._rng
+            latency_ms = _draw_latency(rng, settings)
+            roll = rng.random()
+            outcome = "ok"
+            for kind, key in (
+                ("rate_limit", "rate_429"),
+                ("timeout", "rate_timeout"),
+                ("server", "rate_5xx"),
+                ("malformed", "rate_malformed"),
+                ("illegal", "rate_illegal"),
+            ):
+                rate = float(settings[key])
+                if roll < rate:
+                    outcome = kind
+                    break
+                roll -= rate
+            # An explicit "outcome" (e.g. from the sim server's X-Sim-Outcome header) skips the dice.
+            forced = settings.get("outcome")
+            if forced is not None:
+                if forced not in OUTCOMES:
+                    raise ProviderError(
+                        f"Unsupported sim outcome '{forced}'", category="invalid_request", retryable=False
+                    )
+                outcome = str(forced)
+            self._counts["calls"] = self._counts.get("calls", 0) + 1
+            self._counts[outcome] = self._counts.get(outcome, 0) + 1
+            self._simulated_ms += float(settings["timeout_ms"]) if outcome == "timeout" else latency_ms
+        return latency_ms, outcome
+
+    def _sleep(self, milliseconds: float) -> None:
+        if milliseconds > 0:
+            time.sleep(milliseconds / 1000)
+
+
+def _draw_latency(rng: random.Random, settings: dict[str, Any]) -> float:
+    distribution = str(settings["latency_distribution"]).lower()
+    if distribution == "fixed":
+        return max(0.0, float(settings["latency_ms"]))
+    if distribution == "uniform":
+        return rng.uniform(float(settings["latency_ms_min"]), float(settings["latency_ms_max"]))
+    if distribution == "lognormal":
+        median = float(settings["latency_ms"])
+        if median <= 0:
+            return 0.0
+        return rng.lognormvariate(math.log(median), float(settings["latency_sigma"]))
+    raise ProviderError(
+        f"Unsupported sim latency_distribution '{distribution}'",
+        category="invalid_request",
+        retryable=False,
+    )
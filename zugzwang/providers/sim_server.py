@@ -0,0 +1,375 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from zugzwang.providers.base import ProviderError, ProviderResponse
+from zugzwang.providers.sim import DEFAULT_SIM_CONFIG, SimProvider
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8700
+
+SERVER_DEFAULTS: dict[str, Any] = {
+    **DEFAULT_SIM_CONFIG,
+    "retry_after_seconds": 1,
+    # Delay between streamed chunks; the drawn latency is spent before the first one.
+    "stream_chunk_ms": 0.0,
+}
+
+# Base-URL env vars of the providers this server can stand in for.
+PROVIDER_BASE_URL_ENVS = {
+    "openai": ("OPENAI_BASE_URL", "/v1"),
+    "zai": ("ZAI_BASE_URL", "/v1"),
+    "deepseek": ("DEEPSEEK_BASE_URL", "/v1"),
+    "grok": ("XAI_BASE_URL", "/v1"),
+    "google": ("GEMINI_BASE_URL", "/v1"),
+    "kimi": ("MOONSHOT_BASE_URL", "/v1"),
+    "kimicode": ("KIMI_CODE_BASE_URL", "/v1"),
+    "anthropic": ("ANTHROPIC_BASE_URL", ""),
+    "minimax": ("MINIMAX_BASE_URL", ""),
+}
+
+_ERROR_STATUS = {"rate_limit": 429, "server": 503, "timeout": 504}
+_OPENAI_ERROR_TYPES = {429: "rate_limit_exceeded", 503: "server_error", 504: "timeout", 400: "invalid_request_error"}
+_ANTHROPIC_ERROR_TYPES = {
+    429: "rate_limit_error",
+    503: "overloaded_error",
+    504: "timeout_error",
+    400: "invalid_request_error",
+}
+
+
+class SimServer:
+    """Local stand-in for OpenAI chat-completions and Anthropic messages APIs.
+
+    Answers come from a :class:`SimProvider`, so latency and fault injection use
+    the same settings as the in-process ``sim`` provider. Point a real provider
+    at :attr:`url` through its ``*_BASE_URL`` variable to exercise its HTTP path.
+
+    Control endpoints: ``GET /_sim/stats``, ``POST /_sim/config`` (merge settings)
+    and ``POST /_sim/reset``. Per request, ``X-Sim-Outcome`` forces an outcome and
+    ``X-Sim-Latency-Ms`` fixes the latency.
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        settings: dict[str, Any] | None = None,
+    ) -> None:
+        self.settings: dict[str, Any] = {**SERVER_DEFAULTS, **(settings or {})}
+        self.provider = SimProvider()
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._httpd = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def provider_env(self) -> dict[str, str]:
+        """``*_BASE_URL`` values that route every supported provider here."""
+        return {env: f"{self.url}{suffix}" for env, suffix in PROVIDER_BASE_URL_ENVS.values()}
+
+    def configure(self, **updates: Any) -> dict[str, Any]:
+        with self._lock:
+            self.settings.update(updates)
+            return dict(self.settings)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.provider = SimProvider()
+            self.requests = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            provider, requests = self.provider, self.requests
+        return {"requests": requests, **provider.stats()}
+
+    def start(self) -> SimServer:
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="zugzwang-sim-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> SimServer:
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _complete(
+        self, messages: list[dict[str, str]], model: str, headers: Any
+    ) -> ProviderResponse:
+        with self._lock:
+            settings = dict(self.settings)
+            provider = self.provider
+            self.requests += 1
+        outcome = headers.get("X-Sim-Outcome")
+        if outcome:
+            settings["outcome"] = outcome.strip().lower()
+        latency = headers.get("X-Sim-Latency-Ms")
+        if latency:
+            try:
+                settings["latency_ms"] = float(latency)
+            except ValueError as exc:
+                raise ProviderError(
+                    f"Invalid X-Sim-Latency-Ms '{latency}'", category="invalid_request", retryable=False
+                ) from exc
+            settings["latency_distribution"] = "fixed"
+        return provider.complete(messages, {"model": model, "sim": settings})
+
+
+def _handler_for(server: SimServer) -> type[BaseHTTPRequestHandler]:
+    class _Handler(BaseHTTPRequestHandler):
+        # HTTP/1.1 keeps connections open, so clients that pool connections reuse them.
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802
+            path = self.path.split("?", 1)[0].rstrip("/")
+            if path == "/_sim/stats":
+                self._send_json(200, server.stats())
+            elif path == "/_sim/health":
+                self._send_json(200, {"status": "ok"})
+            else:
+                self._send_json(404, {"error": {"message": f"Unknown path: {self.path}"}})
+
+        def do_POST(self) -> None:  # noqa: N802
+            path = self.path.split("?", 1)[0].rstrip("/")
+            try:
+                payload = self._read_json()
+            except ValueError:
+                self._send_json(400, {"error": {"message": "Request body must be a JSON object"}})
+                return
+
+            if path == "/_sim/config":
+                self._send_json(200, server.configure(**payload))
+            elif path == "/_sim/reset":
+                server.reset()
+                self._send_json(200, server.stats())
+            elif path.endswith("/chat/completions"):
+                self._openai(payload)
+            elif path.endswith("/messages"):
+                self._anthropic(payload)
+            else:
+                self._send_json(404, {"error": {"message": f"Unknown path: {self.path}"}})
+
+        def _openai(self, payload: dict[str, Any]) -> None:
+            model = str(payload.get("model") or "sim-1")
+            messages = [
+                {"role": str(item.get("role", "user")), "content": _text(item.get("content"))}
+                for item in payload.get("messages", [])
+                if isinstance(item, dict)
+            ]
+            try:
+                response = server._complete(messages, model, self.headers)
+            except ProviderError as exc:
+                status = _status_for(exc)
+                error = {"message": str(exc), "type": _OPENAI_ERROR_TYPES.get(status, "api_error"), "code": status}
+                self._send_json(status, {"error": error}, retry_after=status == 429)
+                return
+
+            completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+            usage = {
+                "prompt_tokens": response.input_tokens,
+                "completion_tokens": response.output_tokens,
+                "total_tokens": response.input_tokens + response.output_tokens,
+            }
+            if not payload.get("stream"):
+                self._send_json(
+                    200,
+                    {
+                        "id": completion_id,
+                        "object": "chat.completion",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [
+                            {
+                                "index": 0,
+                                "message": {"role": "assistant", "content": response.text},
+                                "finish_reason": "stop",
+                            }
+                        ],
+                        "usage": usage,
+                    },
+                )
+                return
+
+            base = {"id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()), "model": model}
+            events: list[dict[str, Any]] = [
+                {**base, "choices": [{"index": 0, "delta": {"role": "assistant"}, "finish_reason": None}]}
+            ]
+            events.extend(
+                {**base, "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]}
+                for piece in _pieces(response.text)
+            )
+            events.append({**base, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]})
+            if (payload.get("stream_options") or {}).get("include_usage"):
+                events.append({**base, "choices": [], "usage": usage})
+            self._stream([(None, event) for event in events], done_marker=True)
+
+        def _anthropic(self, payload: dict[str, Any]) -> None:
+            model = str(payload.get("model") or "sim-1")
+            messages: list[dict[str, str]] = []
+            if payload.get("system"):
+                messages.append({"role": "system", "content": _text(payload["system"])})
+            messages.extend(
+                {"role": str(item.get("role", "user")), "content": _text(item.get("content"))}
+                for item in payload.get("messages", [])
+                if isinstance(item, dict)
+            )
+            try:
+                response = server._complete(messages, model, self.headers)
+            except ProviderError as exc:
+                status = _status_for(exc)
+                error = {"type": _ANTHROPIC_ERROR_TYPES.get(status, "api_error"), "message": str(exc)}
+                self._send_json(status, {"type": "error", "error": error}, retry_after=status == 429)
+                return
+
+            message_id = f"msg_{uuid.uuid4().hex[:12]}"
+            usage = {"input_tokens": response.input_tokens, "output_tokens": response.output_tokens}
+            if not payload.get("stream"):
+                self._send_json(
+                    200,
+                    {
+                        "id": message_id,
+                        "type": "message",
+                        "role": "assistant",
+                        "model": model,
+                        "content": [{"type": "text", "text": response.text}],
+                        "stop_reason": "end_turn",
+                        "stop_sequence": None,
+                        "usage": usage,
+                    },
+                )
+                return
+
+            events: list[tuple[str | None, dict[str, Any]]] = [
+                (
+                    "message_start",
+                    {
+                        "type": "message_start",
+                        "message": {
+                            "id": message_id,
+                            "type": "message",
+                            "role": "assistant",
+                            "model": model,
+                            "content": [],
+                            "stop_reason": None,
+                            "stop_sequence": None,
+                            "usage": {"input_tokens": response.input_tokens, "output_tokens": 0},
+                        },
+                    },
+                ),
+                (
+                    "content_block_start",
+                    {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}},
+                ),
+            ]
+            events.extend(
+                (
+                    "content_block_delta",
+                    {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": piece}},
+                )
+                for piece in _pieces(response.text)
+            )
+            events.extend(
+                [
+                    ("content_block_stop", {"type": "content_block_stop", "index": 0}),
+                    (
+                        "message_delta",
+                        {
+                            "type": "message_delta",
+                            "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                            "usage": {"output_tokens": response.output_tokens},
+                        },
+                    ),
+                    ("message_stop", {"type": "message_stop"}),
+                ]
+            )
+            self._stream(events, done_marker=False)
+
+        def _read_json(self) -> dict[str, Any]:
+            length = int(self.headers.get("Content-Length", "0") or 0)
+            raw = self.rfile.read(length).decode("utf-8") if length else "{}"
+            try:
+                payload = json.loads(raw or "{}")
+            except json.JSONDecodeError as exc:
+                raise ValueError("invalid JSON") from exc
+            if not isinstance(payload, dict):
+                raise ValueError("expected an object")
+            return payload
+
+        def _send_json(self, status: int, body: dict[str, Any], retry_after: bool = False) -> None:
+            encoded = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(encoded)))
+            if retry_after:
+                self.send_header("Retry-After", str(server.settings.get("retry_after_seconds", 1)))
+            self.end_headers()
+            self.wfile.write(encoded)
+
+        def _stream(self, events: list[tuple[str | None, dict[str, Any]]], *, done_marker: bool) -> None:
+            chunk_seconds = float(server.settings.get("stream_chunk_ms", 0.0)) / 1000
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            # No Content-Length for a stream, so the connection ends with it.
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+            for index, (event_name, data) in enumerate(events):
+                if index and chunk_seconds > 0:
+                    time.sleep(chunk_seconds)
+                prefix = f"event: {event_name}\n" if event_name else ""
+                self.wfile.write(f"{prefix}data: {json.dumps(data)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+            if done_marker:
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            return None
+
+    return _Handler
+
+
+def _status_for(error: ProviderError) -> int:
+    if error.status_code is not None:
+        return error.status_code
+    return _ERROR_STATUS.get(error.category or "", 400 if error.category == "invalid_request" else 500)
+
+
+def _text(content: Any) -> str:
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "\n".join(
+            str(block.get("text", "")) for block in content if isinstance(block, dict) and block.get("type") == "text"
+        )
+    return "" if content is None else str(content)
+
+
+def _pieces(text: str, size: int = 8) -> list[str]:
+    return [text[index : index + size] for index in range(0, len(text), size)] or [""]